@@ -0,0 +1,127 @@
+"""Clipboard action benchmark: per-capture dict loop versus precompiled action plans.
+
+Builds ``--actions`` notify/transform actions (a share of them disabled,
+all with a distinctive keyword in the pattern) and times, per captured
+text, the old loop (enabled check, regex search and json.loads(params) per
+matched action) against ClipboardActionManager.process() on the compiled
+plans, for text that no action matches and text that a few actions match.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from smartclipboard_core.automation.formatters import replacement_text_from_result  # noqa: E402
+from smartclipboard_core.automation.manager import ClipboardActionManager  # noqa: E402
+
+
+class _BenchDB:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def get_clipboard_actions(self):
+        return self._rows
+
+
+def _rows(count: int) -> list[tuple]:
+    rows = []
+    for index in range(count):
+        action_type, params = ("notify", json.dumps({"message": f"hit {index}"}))
+        if index % 4 == 0:
+            action_type, params = ("transform", json.dumps({"mode": "trim"}))
+        enabled = 0 if index % 5 == 0 else 1
+        rows.append((index + 1, f"action-{index}", rf"TICKET-{index:04d}\b", action_type, params, enabled, count - index))
+    return rows
+
+
+def _legacy_cache(rows: list[tuple]) -> list[dict]:
+    return [
+        {"name": name, "compiled": re.compile(pattern), "type": action_type, "params": params, "enabled": enabled}
+        for _aid, name, pattern, action_type, params, enabled, _priority in rows
+    ]
+
+
+def _legacy_process(manager: ClipboardActionManager, cache: list[dict], text: str) -> list:
+    results = []
+    current_text = text
+    for action in cache:
+        if not action["enabled"]:
+            continue
+        if not action["compiled"].search(current_text):
+            continue
+        params_json = action["params"]
+        try:
+            params = json.loads(params_json) if params_json else {}
+        except json.JSONDecodeError:
+            params = {}
+        result = manager.execute_action(action["type"], current_text, params, None)
+        if result:
+            results.append((action["name"], result))
+            replacement_text = replacement_text_from_result(result)
+            if replacement_text is not None:
+                current_text = replacement_text
+    return results
+
+
+def _inputs(count: int, size: int) -> dict[str, str]:
+    prose = ("회의록 정리: 다음 주 일정과 담당자를 확인합니다. " * (size // 30 + 1))[:size]
+    hits = " ".join(f"TICKET-{index:04d}" for index in range(1, count, max(count // 3, 1)))
+    return {"miss": prose, "hit": f"{prose} {hits}"}
+
+
+def _per_call_us(func, text: str, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - started) * 1_000_000 / repeat
+
+
+def run(action_counts: list[int], size: int = 2048, repeat: int = 200) -> list[dict]:
+    rows = []
+    for count in action_counts:
+        action_rows = _rows(count)
+        manager = ClipboardActionManager(_BenchDB(action_rows))
+        cache = _legacy_cache(action_rows)
+        for kind, text in _inputs(count, size).items():
+            legacy = _legacy_process(manager, cache, text)
+            planned = manager.process(text)
+            rows.append(
+                {
+                    "actions": count,
+                    "kind": kind,
+                    "legacy_us": _per_call_us(lambda value: _legacy_process(manager, cache, value), text, repeat),
+                    "plans_us": _per_call_us(manager.process, text, repeat),
+                    "matched": len(planned),
+                    "same": legacy == planned,
+                }
+            )
+        manager.shutdown()
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actions", type=int, nargs="+", default=[100, 300], help="number of configured actions")
+    parser.add_argument("--size", type=int, default=2048, help="captured text length in characters")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    for row in run(args.actions, args.size, args.repeat):
+        print(
+            f"{row['actions']:>4} actions {row['kind']:<4} legacy={row['legacy_us']:.1f}us "
+            f"plans={row['plans_us']:.1f}us matched={row['matched']} same={row['same']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Full-backup benchmark: JSON (base64 images) versus the zip archive format.
+
+Seeds a temporary database with text rows and one image row in every
+``--image-every`` (random bytes, as incompressible as real PNG data), exports
+it with metadata as JSON and as an archive, imports each into an empty
+database and reports file size plus export/import wall time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from smartclipboard_app.features.import_export.manager import ExportImportManager  # noqa: E402
+from smartclipboard_core.database import ClipboardDB  # noqa: E402
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet"]
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+
+def _seed(db: ClipboardDB, items: int, image_every: int, image_bytes: int) -> None:
+    with db.lock:
+        cursor = db.conn.cursor()
+        for i in range(items):
+            timestamp = f"2026-01-01 00:{(i // 60) % 60:02d}:{i % 60:02d}"
+            if image_every and i % image_every == 0:
+                cursor.execute(
+                    "INSERT INTO history (content, image_data, type, timestamp, file_path, file_signature) "
+                    "VALUES ('[이미지 캡처]', ?, 'IMAGE', ?, '', '')",
+                    (PNG_MAGIC + os.urandom(image_bytes), timestamp),
+                )
+                continue
+            text = f"{WORDS[i % len(WORDS)]} {WORDS[(i * 7) % len(WORDS)]} archive benchmark item {i}"
+            cursor.execute(
+                "INSERT INTO history (content, type, timestamp, tags, file_path, file_signature) "
+                "VALUES (?, 'TEXT', ?, ?, '', '')",
+                (text, timestamp, WORDS[i % 3]),
+            )
+        db.conn.commit()
+
+
+def _timed(func, *args) -> tuple[int, float]:
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def _round_trip(tmpdir: str, manager: ExportImportManager, fmt: str) -> dict:
+    path = os.path.join(tmpdir, f"backup.{'zip' if fmt == 'archive' else fmt}")
+    export = manager.export_archive if fmt == "archive" else manager.export_json
+    exported, export_seconds = _timed(lambda target: export(target, include_metadata=True), path)
+
+    app_dir = tempfile.mkdtemp(prefix=f"restore-{fmt}-", dir=tmpdir)
+    dst_db = ClipboardDB(db_file=os.path.join(app_dir, "restore.db"), app_dir=app_dir)
+    try:
+        dst_manager = ExportImportManager(dst_db)
+        importer = dst_manager.import_archive if fmt == "archive" else dst_manager.import_json
+        imported, import_seconds = _timed(importer, path)
+    finally:
+        dst_db.close()
+    return {
+        "exported": exported,
+        "imported": imported,
+        "file_mb": round(os.path.getsize(path) / 1024 / 1024, 2),
+        "export_seconds": round(export_seconds, 3),
+        "import_seconds": round(import_seconds, 3),
+    }
+
+
+def run(items: int, image_every: int = 10, image_bytes: int = 256 * 1024) -> dict:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = ClipboardDB(db_file=os.path.join(tmpdir, "bench.db"), app_dir=tmpdir)
+        try:
+            _seed(db, items, image_every, image_bytes)
+            manager = ExportImportManager(db)
+            return {
+                "items": items,
+                "json": _round_trip(tmpdir, manager, "json"),
+                "archive": _round_trip(tmpdir, manager, "archive"),
+            }
+        finally:
+            db.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[2_000])
+    parser.add_argument("--image-every", type=int, default=10, help="one IMAGE row per N rows (0 = none)")
+    parser.add_argument("--image-kb", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    for items in args.items:
+        result = run(items, args.image_every, args.image_kb * 1024)
+        print(f"items={result['items']}")
+        for fmt in ("json", "archive"):
+            stats = result[fmt]
+            print(
+                f"  {fmt:<7} file={stats['file_mb']}MB export={stats['export_seconds']}s "
+                f"import={stats['import_seconds']}s exported={stats['exported']} imported={stats['imported']}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
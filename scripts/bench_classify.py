@@ -0,0 +1,112 @@
+"""Content classifier benchmark: per-regex full-text scan versus the shared classifier.
+
+For prose, code and JSON inputs of each ``--sizes`` (KiB) it times the old
+capture check (four regexes plus one substring scan per code indicator over
+the whole text) and the old palette JSON check, against classify_content()
+with a cold cache and with a warm one (the palette re-reading a captured item).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from smartclipboard_core.classifier import (  # noqa: E402
+    CODE_INDICATORS,
+    JSON_DETECT_MAX_CHARS,
+    RE_HEX_COLOR,
+    RE_HSL_COLOR,
+    RE_RGB_COLOR,
+    RE_URL,
+    classify_content,
+    clear_classifier_cache,
+)
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet"]
+
+
+def _legacy_classify(text: str) -> tuple[str, bool]:
+    if RE_URL.match(text):
+        tag = "LINK"
+    elif RE_HEX_COLOR.match(text) or RE_RGB_COLOR.match(text) or RE_HSL_COLOR.match(text):
+        tag = "COLOR"
+    elif any(indicator in text for indicator in CODE_INDICATORS):
+        tag = "CODE"
+    else:
+        tag = "TEXT"
+    is_json = False
+    if len(text) <= JSON_DETECT_MAX_CHARS:
+        try:
+            json.loads(text)
+            is_json = True
+        except ValueError:
+            is_json = False
+    return tag, is_json
+
+
+def _inputs(size: int) -> dict[str, str]:
+    prose = " ".join(WORDS[i % len(WORDS)] for i in range(size // 6 + 1))[:size]
+    code_line = "const value = items.map((item) => item.id);\n"
+    records = [{"id": i, "name": WORDS[i % len(WORDS)]} for i in range(size // 28 + 1)]
+    return {
+        "prose": prose,
+        "code": (code_line * (size // len(code_line) + 1))[:size],
+        "json": json.dumps(records),
+    }
+
+
+def _per_call_ms(func, text: str, repeat: int, before=None) -> float:
+    total = 0.0
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        func(text)
+        total += time.perf_counter() - started
+    return total * 1000 / repeat
+
+
+def run(sizes_kib: list[int], repeat: int = 20) -> list[dict]:
+    rows = []
+    for size_kib in sizes_kib:
+        for kind, text in _inputs(size_kib * 1024).items():
+            clear_classifier_cache()
+            expected = _legacy_classify(text)
+            classified = classify_content(text)
+            rows.append(
+                {
+                    "kind": kind,
+                    "kib": size_kib,
+                    "legacy_ms": _per_call_ms(_legacy_classify, text, repeat),
+                    "cold_ms": _per_call_ms(classify_content, text, repeat, before=clear_classifier_cache),
+                    "warm_ms": _per_call_ms(classify_content, text, repeat),
+                    "tag": classified.type_tag,
+                    "same": (classified.type_tag, classified.is_json) == expected,
+                }
+            )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 64, 1024], help="input sizes in KiB")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    for row in run(args.sizes, args.repeat):
+        print(
+            f"{row['kind']:<5} {row['kib']:>5}KiB legacy={row['legacy_ms']:.3f}ms "
+            f"cold={row['cold_ms']:.3f}ms warm={row['warm_ms']:.3f}ms tag={row['tag']} same={row['same']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Time and peak-memory benchmark for the streaming export pipeline.
+
+Seeds a temporary database (text rows plus one image row in every
+``--image-every``) and exports it as JSON, JSONL and CSV, reporting wall time,
+output size and the tracemalloc peak of each run. Peak memory should stay
+roughly flat between 10k and 100k items.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from smartclipboard_app.features.import_export.manager import ExportImportManager  # noqa: E402
+from smartclipboard_core.database import ClipboardDB  # noqa: E402
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet"]
+
+
+def _seed(db: ClipboardDB, items: int, image_every: int, image_bytes: int) -> None:
+    image_blob = os.urandom(image_bytes)
+    with db.lock:
+        cursor = db.conn.cursor()
+        for i in range(items):
+            timestamp = f"2026-01-01 00:{(i // 60) % 60:02d}:{i % 60:02d}"
+            if image_every and i % image_every == 0:
+                cursor.execute(
+                    "INSERT INTO history (content, image_data, type, timestamp, file_path, file_signature) "
+                    "VALUES ('[이미지 캡처]', ?, 'IMAGE', ?, '', '')",
+                    (image_blob, timestamp),
+                )
+                continue
+            text = f"{WORDS[i % len(WORDS)]} {WORDS[(i * 7) % len(WORDS)]} export benchmark item {i}"
+            cursor.execute(
+                "INSERT INTO history (content, type, timestamp, tags, file_path, file_signature) "
+                "VALUES (?, 'TEXT', ?, ?, '', '')",
+                (text, timestamp, WORDS[i % 3]),
+            )
+        db.conn.commit()
+
+
+def _measure(export, path: str) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = export(path)
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "exported": count,
+        "seconds": round(elapsed, 3),
+        "items_per_second": round(count / elapsed) if elapsed and count > 0 else 0,
+        "file_mb": round(os.path.getsize(path) / 1024 / 1024, 2),
+        "peak_mb": round(peak / 1024 / 1024, 2),
+    }
+
+
+def run(items: int, image_every: int = 50, image_bytes: int = 64 * 1024) -> dict:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = ClipboardDB(db_file=os.path.join(tmpdir, "bench.db"), app_dir=tmpdir)
+        try:
+            _seed(db, items, image_every, image_bytes)
+            manager = ExportImportManager(db)
+            return {
+                "items": items,
+                "json": _measure(
+                    lambda path: manager.export_json(path, include_metadata=True), os.path.join(tmpdir, "out.json")
+                ),
+                "jsonl": _measure(
+                    lambda path: manager.export_incremental(path, "jsonl"), os.path.join(tmpdir, "out.jsonl")
+                ),
+                "csv": _measure(manager.export_csv, os.path.join(tmpdir, "out.csv")),
+            }
+        finally:
+            db.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--image-every", type=int, default=50, help="one IMAGE row per N rows (0 = none)")
+    parser.add_argument("--image-kb", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    for items in args.items:
+        result = run(items, args.image_every, args.image_kb * 1024)
+        print(f"items={result['items']}")
+        for fmt in ("json", "jsonl", "csv"):
+            stats = result[fmt]
+            print(
+                f"  {fmt:<5} exported={stats['exported']} time={stats['seconds']}s "
+                f"rate={stats['items_per_second']}/s file={stats['file_mb']}MB peak={stats['peak_mb']}MB"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
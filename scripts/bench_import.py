@@ -0,0 +1,151 @@
+"""Time and peak-memory benchmark for the batched JSON/JSONL/CSV importers.
+
+Writes synthetic export files (with a share of duplicates, as re-importing an
+older backup produces) and imports each into a fresh temporary database that
+already holds ``--existing`` rows, reporting wall time and tracemalloc peak,
+plus the wall time of a dry run (validation and dedupe matching only) of the
+same file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from smartclipboard_app.features.import_export.csv_codec import CSV_EXPORT_HEADER  # noqa: E402
+from smartclipboard_app.features.import_export.manager import ExportImportManager  # noqa: E402
+from smartclipboard_core.database import ClipboardDB  # noqa: E402
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet"]
+
+
+def _text(i: int) -> str:
+    return f"{WORDS[i % len(WORDS)]} {WORDS[(i * 7) % len(WORDS)]} import benchmark item {i}"
+
+
+def _payloads(items: int, duplicate_every: int):
+    for i in range(items):
+        source = i - 1 if duplicate_every and i % duplicate_every == 0 and i else i
+        yield {
+            "content": _text(source),
+            "type": "TEXT",
+            "timestamp": f"2026-01-01 00:{(i // 60) % 60:02d}:{i % 60:02d}",
+            "tags": WORDS[i % 3],
+            "use_count": i % 5,
+        }
+
+
+def _write_inputs(tmpdir: str, items: int, duplicate_every: int) -> dict[str, str]:
+    paths = {fmt: os.path.join(tmpdir, f"input.{fmt}") for fmt in ("json", "jsonl", "csv")}
+    with open(paths["json"], "w", encoding="utf-8") as fh:
+        fh.write('{"app": "SmartClipboard Pro", "version": "bench", "items": [\n')
+        for index, payload in enumerate(_payloads(items, duplicate_every)):
+            fh.write(",\n" if index else "")
+            fh.write(json.dumps(payload, ensure_ascii=False))
+        fh.write("\n]}\n")
+    with open(paths["jsonl"], "w", encoding="utf-8") as fh:
+        for payload in _payloads(items, duplicate_every):
+            fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
+    with open(paths["csv"], "w", encoding="utf-8-sig", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(CSV_EXPORT_HEADER)
+        for payload in _payloads(items, duplicate_every):
+            writer.writerow([payload["content"], "TEXT", payload["timestamp"], "아니오", payload["use_count"]])
+    return paths
+
+
+def _seed(db: ClipboardDB, existing: int) -> None:
+    with db.lock:
+        cursor = db.conn.cursor()
+        cursor.executemany(
+            "INSERT INTO history (content, type, timestamp, file_path, file_signature) VALUES (?, 'TEXT', ?, '', '')",
+            ((_text(i), "2025-12-31 00:00:00") for i in range(0, existing * 2, 2)),
+        )
+        db.conn.commit()
+
+
+def _import_once(tmpdir: str, fmt: str, path: str, existing: int, trace_memory: bool, dry_run: bool = False) -> dict:
+    app_dir = tempfile.mkdtemp(prefix=f"db-{fmt}-", dir=tmpdir)
+    db = ClipboardDB(db_file=os.path.join(app_dir, "bench.db"), app_dir=app_dir)
+    try:
+        _seed(db, existing)
+        manager = ExportImportManager(db)
+        importer = {"json": manager.import_json, "jsonl": manager.import_jsonl, "csv": manager.import_csv}[fmt]
+        if trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        imported = importer(path, dry_run=dry_run)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+        if trace_memory:
+            tracemalloc.stop()
+        return {
+            "imported": imported,
+            "rows": db.get_statistics().get("total"),
+            "seconds": elapsed,
+            "peak": peak,
+            "error": manager.last_import_report.get("error"),
+        }
+    finally:
+        db.close()
+
+
+def _measure(tmpdir: str, fmt: str, path: str, existing: int) -> dict:
+    # tracemalloc은 할당마다 비용이 커서 시간과 메모리는 따로 잰다.
+    timed = _import_once(tmpdir, fmt, path, existing, trace_memory=False)
+    traced = _import_once(tmpdir, fmt, path, existing, trace_memory=True)
+    dry = _import_once(tmpdir, fmt, path, existing, trace_memory=False, dry_run=True)
+    elapsed = timed["seconds"]
+    return {
+        "imported": timed["imported"],
+        "rows": timed["rows"],
+        "seconds": round(elapsed, 3),
+        "items_per_second": round(timed["imported"] / elapsed) if elapsed and timed["imported"] > 0 else 0,
+        "peak_mb": round(traced["peak"] / 1024 / 1024, 2),
+        "dry_run_seconds": round(dry["seconds"], 3),
+        "error": timed["error"],
+    }
+
+
+def run(items: int, existing: int = 10_000, duplicate_every: int = 10) -> dict:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = _write_inputs(tmpdir, items, duplicate_every)
+        result: dict = {"items": items, "existing": existing}
+        for fmt, path in paths.items():
+            result[fmt] = _measure(tmpdir, fmt, path, existing)
+        return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--existing", type=int, default=10_000, help="rows already in the database")
+    parser.add_argument("--duplicate-every", type=int, default=10, help="repeat the previous item every N rows")
+    args = parser.parse_args(argv)
+
+    for items in args.items:
+        result = run(items, args.existing, args.duplicate_every)
+        print(f"items={result['items']} existing={result['existing']}")
+        for fmt in ("json", "jsonl", "csv"):
+            stats = result[fmt]
+            print(
+                f"  {fmt:<5} imported={stats['imported']} rows={stats['rows']} time={stats['seconds']}s "
+                f"rate={stats['items_per_second']}/s peak={stats['peak_mb']}MB dry-run={stats['dry_run_seconds']}s"
+                + (f" error={stats['error']}" if stats["error"] else "")
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
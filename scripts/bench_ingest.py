@@ -0,0 +1,126 @@
+"""Headless clipboard ingest benchmark: ClipboardIngestor throughput without Qt.
+
+Feeds a mix of plain text, links, colors and code snippets into a temporary
+database, first one payload after another through ingest_text() and then
+through the same stage methods the app runs on its staged capture pipeline,
+and reports payloads per second plus per-stage latency percentiles.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from smartclipboard_core.database import ClipboardDB  # noqa: E402
+from smartclipboard_core.ingest import ClipboardIngestor  # noqa: E402
+from smartclipboard_core.staged_pipeline import StagedPipeline  # noqa: E402
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet"]
+
+
+def _payload(i: int, text_bytes: int) -> str:
+    kind = i % 4
+    if kind == 1:
+        return f"https://example.com/{WORDS[i % len(WORDS)]}/{i}"
+    if kind == 2:
+        return f"#{i % 0xFFFFFF:06x}"
+    line = f"{WORDS[i % len(WORDS)]} {WORDS[(i * 7) % len(WORDS)]} ingest benchmark item {i}"
+    if kind == 3:
+        line = f"def item_{i}():\n    return {line!r}"
+    return (line + "\n") * max(1, text_bytes // (len(line) + 1))
+
+
+def _open_db(tmpdir: str, name: str) -> ClipboardDB:
+    app_dir = tempfile.mkdtemp(prefix=f"{name}-", dir=tmpdir)
+    db = ClipboardDB(db_file=os.path.join(app_dir, "bench.db"), app_dir=app_dir)
+    db.add_copy_rule("trim", r".*", "trim")
+    return db
+
+
+def _sequential(db: ClipboardDB, payloads: list[str]) -> dict:
+    ingestor = ClipboardIngestor(db)
+    started = time.perf_counter()
+    stored = sum(1 for payload in payloads if ingestor.ingest_text(payload).stored)
+    seconds = time.perf_counter() - started
+    return {"stored": stored, "seconds": round(seconds, 3), "per_second": round(len(payloads) / seconds)}
+
+
+def _staged(db: ClipboardDB, payloads: list[str]) -> dict:
+    ingestor = ClipboardIngestor(db)
+    stored = []
+
+    def normalize(raw):
+        text, normalized = ingestor.normalize_text(raw)
+        return (text, normalized) if normalized else None
+
+    def classify(job):
+        return (*job, ingestor.classify(job[1]))
+
+    def persist(job):
+        return ingestor.store_text(job[0], job[2])
+
+    pipeline = StagedPipeline(
+        [("normalize", normalize), ("classify", classify), ("persist", persist)],
+        on_done=stored.append,
+        name="IngestBench",
+    )
+    started = time.perf_counter()
+    for payload in payloads:
+        # 벤치마크는 버리지 않고 큐가 빌 때까지 기다렸다 넣는다.
+        while not pipeline.submit(payload):
+            time.sleep(0.001)
+    pipeline.drain()
+    seconds = time.perf_counter() - started
+    metrics = pipeline.metrics()
+    pipeline.shutdown()
+    return {
+        "stored": len(stored),
+        "seconds": round(seconds, 3),
+        "per_second": round(len(payloads) / seconds),
+        "stages": metrics["stages"],
+    }
+
+
+def run(items: int, text_bytes: int = 200) -> dict:
+    payloads = [_payload(i, text_bytes) for i in range(items)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results = {"items": items}
+        for mode, runner in (("sequential", _sequential), ("staged", _staged)):
+            db = _open_db(tmpdir, mode)
+            try:
+                results[mode] = runner(db, payloads)
+            finally:
+                db.close()
+        return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[2_000])
+    parser.add_argument("--text-bytes", type=int, default=200, help="approximate size of the plain text payloads")
+    args = parser.parse_args(argv)
+
+    for items in args.items:
+        result = run(items, args.text_bytes)
+        print(f"items={result['items']}")
+        for mode in ("sequential", "staged"):
+            stats = result[mode]
+            print(f"  {mode:<10} stored={stats['stored']} {stats['seconds']}s ({stats['per_second']}/s)")
+        for stage, snapshot in result["staged"]["stages"].items():
+            print(
+                f"    {stage:<9} p50={snapshot['p50_ms']:.2f}ms p95={snapshot['p95_ms']:.2f}ms "
+                f"p99={snapshot['p99_ms']:.2f}ms max={snapshot['max_ms']:.2f}ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
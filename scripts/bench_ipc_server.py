@@ -0,0 +1,137 @@
+"""Throughput benchmark for the local JSON-RPC history server.
+
+Seeds a temporary database, starts ``HistoryRpcServer`` and drives it with
+concurrent clients doing single requests and batches, while a writer keeps
+adding items through the main connection (like the clipboard monitor does).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from smartclipboard_core.database import ClipboardDB  # noqa: E402
+from smartclipboard_core.ipc_server import HistoryRpcClient, HistoryRpcServer  # noqa: E402
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet"]
+
+
+def _seed(db: ClipboardDB, items: int) -> None:
+    with db.lock:
+        cursor = db.conn.cursor()
+        for i in range(items):
+            text = f"{WORDS[i % len(WORDS)]} {WORDS[(i * 7) % len(WORDS)]} benchmark item {i}"
+            cursor.execute(
+                "INSERT INTO history (content, type, timestamp, file_path, file_signature) VALUES (?, 'TEXT', ?, '', '')",
+                (text, f"2026-01-01 00:{(i // 60) % 60:02d}:{i % 60:02d}"),
+            )
+        db.conn.commit()
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _client_loop(endpoint: dict, duration: float, batch_size: int, latencies: list[float], counter: list[int]) -> None:
+    with HistoryRpcClient(endpoint) as client:
+        deadline = time.perf_counter() + duration
+        i = 0
+        while time.perf_counter() < deadline:
+            word = WORDS[i % len(WORDS)]
+            started = time.perf_counter()
+            if batch_size > 1:
+                client.batch([("search", {"query": word, "limit": 20})] * batch_size)
+                done = batch_size
+            else:
+                if i % 2:
+                    client.call("search", query=word, limit=20)
+                else:
+                    client.call("recent", limit=20)
+                done = 1
+            latencies.append((time.perf_counter() - started) * 1000)
+            counter[0] += done
+            i += 1
+
+
+def run(items: int, clients: int, duration: float, batch_size: int, write_interval: float) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = ClipboardDB(db_file=str(Path(tmp) / "bench.db"), app_dir=tmp)
+        _seed(db, items)
+        server = HistoryRpcServer(db, transport="tcp")
+        endpoint = server.start()
+        stop_writer = threading.Event()
+        writes = [0]
+
+        def writer() -> None:
+            while not stop_writer.wait(write_interval):
+                db.add_item(f"live write {writes[0]}", None, "TEXT")
+                writes[0] += 1
+
+        writer_thread = threading.Thread(target=writer, daemon=True)
+        if write_interval > 0:
+            writer_thread.start()
+
+        latencies: list[list[float]] = [[] for _ in range(clients)]
+        counters = [[0] for _ in range(clients)]
+        threads = [
+            threading.Thread(target=_client_loop, args=(endpoint, duration, batch_size, latencies[n], counters[n]))
+            for n in range(clients)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        stop_writer.set()
+        if write_interval > 0:
+            writer_thread.join()
+        server.stop()
+        pool = db.get_read_pool_stats()
+        db.close()
+
+    samples = [value for chunk in latencies for value in chunk]
+    total = sum(counter[0] for counter in counters)
+    return {
+        "requests": total,
+        "req_per_sec": total / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(samples) if samples else 0.0,
+        "p95_ms": _percentile(samples, 0.95),
+        "writes": writes[0],
+        "read_connections": pool["created"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the SmartClipboard IPC server")
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--batch", type=int, default=1, help="requests per batch line (1 = no batching)")
+    parser.add_argument("--write-interval", type=float, default=0.05, help="seconds between live writes (0 = off)")
+    args = parser.parse_args(argv)
+
+    result = run(args.items, args.clients, args.duration, args.batch, args.write_interval)
+    print(
+        f"items={args.items} clients={args.clients} batch={args.batch}: "
+        f"{result['requests']} requests, {result['req_per_sec']:.0f} req/s, "
+        f"p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms per call, "
+        f"{result['writes']} concurrent writes, {result['read_connections']} read connections"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
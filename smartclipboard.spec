@@ -156,6 +156,7 @@ OPTIONAL_HIDDEN_IMPORTS = [
     "qrcode",
     "PIL",
     "PIL.ImageQt",
+    "re2",
 ]
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import os
 import sys
 import traceback
@@ -27,6 +28,8 @@ def _global_exception_handler(exctype, value, tb):
 
 def run(argv: list[str] | None = None) -> int:
     """Run SmartClipboard application."""
+    # 정규식 샌드박스 작업 프로세스가 빌드된 exe로 다시 실행될 때 여기서 빠진다.
+    multiprocessing.freeze_support()
     argv = list(argv if argv is not None else sys.argv)
     sys.excepthook = _global_exception_handler
 
@@ -0,0 +1,361 @@
+"""Headless SmartClipboard CLI (no Qt imports).
+
+Usage: ``python -m smartclipboard_app.cli [--db PATH] <command> ...``
+
+Every command prints one JSON document to stdout. The database is opened
+through ``ClipboardDB`` with a busy timeout, so it is safe to run against the
+live WAL database while the GUI is open.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import sys
+from typing import Any, cast
+
+from smartclipboard_core.database import ClipboardDB
+from smartclipboard_core.db_parts.shared import APP_DIR, FILTER_TAG_MAP
+
+DB_ENV_VAR = "SMARTCLIPBOARD_DB"
+ITEM_TYPES = tuple(FILTER_TAG_MAP.values())
+TYPE_FILTER_LABELS = {type_tag: label for label, type_tag in FILTER_TAG_MAP.items()}
+EXPORT_FORMATS = ("json", "jsonl", "csv", "markdown", "archive")
+IMPORT_FORMATS = ("json", "jsonl", "csv", "archive")
+PREVIEW_CHARS = 200
+
+
+class CliError(Exception):
+    """Expected failure reported as JSON with exit code 1."""
+
+
+def _resolve_db_path(args) -> tuple[str, str]:
+    db_file = args.db or os.environ.get(DB_ENV_VAR) or os.path.join(APP_DIR, "clipboard_history_v6.db")
+    db_file = os.path.abspath(db_file)
+    app_dir = os.path.abspath(args.app_dir) if args.app_dir else os.path.dirname(db_file)
+    return db_file, app_dir
+
+
+def _open_db(args, create: bool = False) -> ClipboardDB:
+    db_file, app_dir = _resolve_db_path(args)
+    if not create and not os.path.exists(db_file):
+        raise CliError(f"database not found: {db_file}")
+    return ClipboardDB(db_file=db_file, app_dir=app_dir)
+
+
+def _row_to_dict(row, preview_chars: int = PREVIEW_CHARS) -> dict[str, Any]:
+    item_id, content, item_type, timestamp, pinned, use_count, pin_order = row
+    text = content or ""
+    return {
+        "id": item_id,
+        "type": item_type,
+        "timestamp": timestamp,
+        "pinned": bool(pinned),
+        "use_count": use_count,
+        "pin_order": pin_order,
+        "preview": text[:preview_chars] if preview_chars > 0 else text,
+        "truncated": 0 < preview_chars < len(text),
+    }
+
+
+def cmd_search(db: ClipboardDB, args) -> dict[str, Any]:
+    type_filter = TYPE_FILTER_LABELS.get(args.type, "전체") if args.type else "전체"
+    if args.pinned:
+        type_filter = "📌 고정"
+    rows = db.search_items(
+        args.query or "",
+        type_filter=type_filter,
+        tag_filter=args.tag,
+        bookmarked=args.bookmarked,
+        limit=args.limit,
+    )
+    return {
+        "query": args.query or "",
+        "count": len(rows),
+        "used_fts": bool(getattr(db, "_last_search_used_fts", False)),
+        "items": [_row_to_dict(row, args.preview) for row in rows],
+    }
+
+
+def cmd_get(db: ClipboardDB, args) -> dict[str, Any]:
+    data = db.get_content(args.id)
+    if not data:
+        raise CliError(f"item not found: {args.id}")
+    content, image_data, item_type = data
+    if args.image_out:
+        if not image_data:
+            raise CliError(f"item has no image data: {args.id}")
+        with open(args.image_out, "wb") as fh:
+            fh.write(image_data)
+
+    from smartclipboard_app.features.import_export.services import get_item_metadata
+
+    meta = get_item_metadata(db, args.id) or (None,) * 9
+    tags, note, bookmark, collection_id, pinned, _pin_order, use_count, timestamp, url_title = meta
+    return {
+        "id": args.id,
+        "type": item_type,
+        "content": content,
+        "timestamp": timestamp,
+        "pinned": bool(pinned),
+        "bookmark": bool(bookmark),
+        "use_count": use_count,
+        "tags": tags or "",
+        "note": note or "",
+        "url_title": url_title or "",
+        "collection_id": collection_id,
+        "image_bytes": len(image_data) if image_data else 0,
+        "image_out": args.image_out,
+    }
+
+
+def cmd_add(db: ClipboardDB, args) -> dict[str, Any]:
+    text = args.text
+    if text is None or text == "-":
+        text = sys.stdin.read()
+    if not text:
+        raise CliError("nothing to add (empty text)")
+    item_id = db.add_item(text, None, args.type)
+    if not item_id:
+        raise CliError("failed to add item")
+    if args.tags:
+        db.set_item_tags(item_id, args.tags)
+    return {"id": item_id, "type": args.type, "chars": len(text)}
+
+
+def _import_export_manager(db: ClipboardDB):
+    from smartclipboard_app.features.import_export import ExportImportManager
+    from smartclipboard_core.config import Config
+
+    return ExportImportManager(db, version=Config.VERSION)
+
+
+def _guess_format(path: str, allowed: tuple[str, ...]) -> str:
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    fmt = {"md": "markdown", "zip": "archive"}.get(ext, ext)
+    if fmt not in allowed:
+        raise CliError(f"cannot infer format from extension; use --format {{{','.join(allowed)}}}")
+    return fmt
+
+
+def _parse_cli_date(value: str | None, option: str):
+    from smartclipboard_app.features.import_export.services import parse_timestamp
+
+    if not value:
+        return None
+    parsed = parse_timestamp(value)
+    if parsed is None:
+        raise CliError(f"invalid {option} value: {value}")
+    return parsed.date()
+
+
+def cmd_export(db: ClipboardDB, args) -> dict[str, Any]:
+    from smartclipboard_core.db_parts.history.export_query import ExportQuery
+
+    fmt = args.format or _guess_format(args.path, EXPORT_FORMATS)
+    query = ExportQuery.create(
+        args.type or "all",
+        date_from=_parse_cli_date(args.since, "--since"),
+        date_to=_parse_cli_date(args.until, "--until"),
+        tags=args.tag or (),
+        bookmarked=True if args.bookmarked else None,
+        pinned=True if args.pinned else None,
+    )
+
+    manager = _import_export_manager(db)
+    filter_type = args.type or "all"
+    if args.incremental:
+        manager.export_incremental(
+            args.path,
+            fmt,
+            filter_type,
+            include_metadata=args.metadata,
+            target=args.target,
+            query=query,
+        )
+    elif fmt == "jsonl":
+        raise CliError("jsonl export is append-only; use --incremental")
+    elif fmt == "json":
+        manager.export_json(args.path, filter_type, include_metadata=args.metadata, query=query)
+    elif fmt == "archive":
+        manager.export_archive(args.path, filter_type, include_metadata=args.metadata, query=query)
+    elif fmt == "csv":
+        manager.export_csv(args.path, filter_type, query=query)
+    else:
+        manager.export_markdown(args.path, filter_type, query=query)
+    report = manager.last_export_report
+    if not report.get("success"):
+        raise CliError(report.get("error") or "export failed")
+    return report
+
+
+def cmd_import(db: ClipboardDB, args) -> dict[str, Any]:
+    if not os.path.exists(args.path):
+        raise CliError(f"file not found: {args.path}")
+    fmt = args.format or _guess_format(args.path, IMPORT_FORMATS)
+    manager = _import_export_manager(db)
+    if fmt == "json":
+        manager.import_json(args.path, dry_run=args.dry_run)
+    elif fmt == "jsonl":
+        manager.import_jsonl(args.path, dry_run=args.dry_run)
+    elif fmt == "archive":
+        manager.import_archive(args.path, dry_run=args.dry_run)
+    else:
+        manager.import_csv(args.path, dry_run=args.dry_run)
+    report = manager.last_import_report
+    if not report.get("success"):
+        raise CliError(report.get("error") or "import failed")
+    return report
+
+
+def cmd_stats(db: ClipboardDB, args) -> dict[str, Any]:
+    stats = db.get_statistics()
+    diagnostics = db.get_storage_diagnostics()
+    diagnostics.pop("checkpoints", None)  # 이 프로세스의 기록뿐이라 의미 없음
+    return {"db_file": db.db_file, **stats, "storage": diagnostics}
+
+
+def cmd_vacuum(db: ClipboardDB, args) -> dict[str, Any]:
+    result = db.vacuum_database()
+    if result is None:
+        raise CliError("vacuum failed")
+    return result
+
+
+def cmd_changes(db: ClipboardDB, args) -> dict[str, Any]:
+    if args.compact:
+        return db.compact_changes()
+    return db.changes_since(args.since, limit=args.limit, entities=args.entity or None)
+
+
+def cmd_sync(db: ClipboardDB, args) -> dict[str, Any]:
+    if args.export_only:
+        result = db.export_sync_bundle(args.folder)
+        if result.get("error"):
+            raise CliError(result["error"])
+        return result
+    if args.import_only:
+        return db.import_sync_bundles(args.folder)
+    return db.sync_with_folder(args.folder)
+
+
+COMMANDS = {
+    "search": (cmd_search, False),
+    "get": (cmd_get, False),
+    "add": (cmd_add, True),
+    "export": (cmd_export, False),
+    "import": (cmd_import, True),
+    "stats": (cmd_stats, False),
+    "vacuum": (cmd_vacuum, False),
+    "changes": (cmd_changes, False),
+    "sync": (cmd_sync, True),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="smartclipboard", description="SmartClipboard headless CLI (JSON output)")
+    parser.add_argument("--db", help=f"database file (default: ${DB_ENV_VAR} or the app data directory)")
+    parser.add_argument("--app-dir", help="directory for backups (default: the database directory)")
+    parser.add_argument("--pretty", action="store_true", help="indent JSON output")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    search = sub.add_parser("search", help="full-text search (empty query lists recent items)")
+    search.add_argument("query", nargs="?", default="")
+    search.add_argument("--type", choices=ITEM_TYPES)
+    search.add_argument("--tag")
+    search.add_argument("--bookmarked", action="store_true")
+    search.add_argument("--pinned", action="store_true")
+    search.add_argument("--limit", type=int, default=50)
+    search.add_argument("--preview", type=int, default=PREVIEW_CHARS, help="preview chars (0 = full content)")
+
+    get = sub.add_parser("get", help="full content and metadata of one item")
+    get.add_argument("id", type=int)
+    get.add_argument("--raw", action="store_true", help="print only the text content")
+    get.add_argument("--image-out", help="write IMAGE data to this file")
+
+    add = sub.add_parser("add", help="add a text item (reads stdin when TEXT is omitted or '-')")
+    add.add_argument("text", nargs="?")
+    add.add_argument("--type", choices=ITEM_TYPES, default="TEXT")
+    add.add_argument("--tags")
+
+    export = sub.add_parser("export", help="export history to JSON/JSONL/CSV/Markdown or a zip archive")
+    export.add_argument("path")
+    export.add_argument("--format", choices=EXPORT_FORMATS)
+    export.add_argument("--type", choices=ITEM_TYPES)
+    export.add_argument("--since", help="only items on/after this date (YYYY-MM-DD)")
+    export.add_argument("--until", help="only items on/before this date (YYYY-MM-DD)")
+    export.add_argument("--tag", action="append", help="only items carrying this tag (repeat to require several)")
+    export.add_argument("--bookmarked", action="store_true", help="only bookmarked items")
+    export.add_argument("--pinned", action="store_true", help="only pinned items")
+    export.add_argument(
+        "--metadata", action="store_true", help="include tags/notes/collections (JSON/JSONL/archive only)"
+    )
+    export.add_argument(
+        "--incremental",
+        action="store_true",
+        help="write only items changed since the last run for this target (JSONL/CSV are appended)",
+    )
+    export.add_argument("--target", help="watermark name for --incremental (default: the output path)")
+
+    import_ = sub.add_parser("import", help="import a JSON/JSONL/CSV export or zip archive")
+    import_.add_argument("path")
+    import_.add_argument("--format", choices=IMPORT_FORMATS)
+    import_.add_argument(
+        "--dry-run", action="store_true", help="validate and count would-insert/would-merge rows without writing"
+    )
+
+    sub.add_parser("stats", help="item counts and storage diagnostics")
+    sub.add_parser("vacuum", help="VACUUM and truncate the WAL")
+
+    changes = sub.add_parser("changes", help="change-log entries after a sequence number")
+    changes.add_argument("--since", type=int, default=0, help="last sequence number already applied")
+    changes.add_argument("--limit", type=int, default=1000)
+    changes.add_argument("--entity", action="append", choices=("history", "deleted_history", "collections"))
+    changes.add_argument("--compact", action="store_true", help="merge/trim the change log instead of reading it")
+
+    sync = sub.add_parser("sync", help="exchange op-log bundles with other devices through a shared folder")
+    sync.add_argument("folder")
+    sync_mode = sync.add_mutually_exclusive_group()
+    sync_mode.add_argument("--export-only", action="store_true")
+    sync_mode.add_argument("--import-only", action="store_true")
+    return parser
+
+
+def _write_json(payload: Any, pretty: bool, stream=None) -> None:
+    stream = stream or sys.stdout
+    stream.write(json.dumps(payload, ensure_ascii=False, indent=2 if pretty else None, default=str))
+    stream.write("\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    for stream in (sys.stdout, sys.stderr):
+        if hasattr(stream, "reconfigure"):
+            cast(Any, stream).reconfigure(encoding="utf-8")
+
+    handler, creates_db = COMMANDS[args.command]
+    db = None
+    try:
+        db = _open_db(args, create=creates_db)
+        result = handler(db, args)
+    except (CliError, sqlite3.Error, OSError) as exc:
+        _write_json({"error": str(exc)}, args.pretty, sys.stderr)
+        return 1
+    finally:
+        if db is not None:
+            db.close()
+
+    if args.command == "get" and args.raw:
+        sys.stdout.write(result["content"] or "")
+        return 0
+    _write_json(result, args.pretty)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,22 +4,32 @@ from .controller import ClipboardController
 from .pipeline import (
     analyze_text_impl,
     apply_copy_rules_impl,
+    capture_metrics_impl,
+    copy_rule_stats_impl,
     on_clipboard_change_impl,
     process_actions_impl,
     process_clipboard_impl,
     process_file_clipboard_impl,
     process_image_clipboard_impl,
     process_text_clipboard_impl,
+    request_thumbnail_backfill_impl,
+    reset_copy_rule_stats_impl,
+    shutdown_text_capture_impl,
 )
 
 __all__ = [
     "ClipboardController",
     "analyze_text_impl",
     "apply_copy_rules_impl",
+    "capture_metrics_impl",
+    "copy_rule_stats_impl",
     "on_clipboard_change_impl",
     "process_actions_impl",
     "process_clipboard_impl",
     "process_file_clipboard_impl",
     "process_image_clipboard_impl",
     "process_text_clipboard_impl",
+    "request_thumbnail_backfill_impl",
+    "reset_copy_rule_stats_impl",
+    "shutdown_text_capture_impl",
 ]
@@ -0,0 +1,203 @@
+"""Coalesces bursts of QClipboard.dataChanged into a single capture."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from typing import Any, Callable
+
+from PyQt6.QtCore import QTimer
+
+logger = logging.getLogger(__name__)
+
+CLIPBOARD_DEBOUNCE_SETTING = "clipboard_debounce_ms"
+CLIPBOARD_DEBOUNCE_MS = 100
+CLIPBOARD_DEBOUNCE_RANGE_MS = (20, 2000)
+# 계속 바뀌는 클립보드라도 첫 이벤트 후 이 시간 안에는 한 번 캡처한다.
+CLIPBOARD_MAX_WAIT_MS = 500
+# 캡처 후 한 묶음(최대 대기) 안에 같은 내용이 다시 들어오면 캡처하지 않는다 (같은 값을 연달아 쓰는 앱).
+# 그보다 늦은 재복사는 사용자가 의도한 것이라 다시 캡처해 맨 위로 올린다.
+CLIPBOARD_REPEAT_WINDOW_S = CLIPBOARD_MAX_WAIT_MS / 1000
+# 지문에는 페이로드 앞뒤 이만큼만 해시한다: 큰 텍스트·파일 목록도 비용이 일정하다.
+CLIPBOARD_FINGERPRINT_EDGE_BYTES = 4096
+
+_URI_LIST_FORMAT = "text/uri-list"
+_TEXT_FORMAT = "text/plain"
+
+
+def clipboard_fingerprint(mime_data: Any) -> tuple[tuple[str, ...], str, int, bytes] | None:
+    """(formats, format, size, digest) of the payload the capture would use; None to skip the repeat check.
+
+    The format is the one capture would pick (file list or plain text). Only
+    its size and its first and last CLIPBOARD_FINGERPRINT_EDGE_BYTES are
+    hashed, and the QByteArray is never copied whole, so the cost does not
+    grow with the payload. Two payloads with the same size and edges would
+    collide, which is acceptable for the short repeat window the fingerprint
+    is used in.
+
+    Images return None: reading any image format makes Qt encode the whole
+    image on the UI thread, and the format list alone cannot tell two
+    screenshots apart.
+    """
+    formats = tuple(mime_data.formats())
+    if mime_data.hasUrls() and _URI_LIST_FORMAT in formats:
+        fmt = _URI_LIST_FORMAT
+    elif mime_data.hasImage():
+        return None
+    elif mime_data.hasText():
+        fmt = _TEXT_FORMAT
+    else:
+        return None
+    edge = CLIPBOARD_FINGERPRINT_EDGE_BYTES
+    raw = mime_data.data(fmt)
+    size = raw.size()
+    if size:
+        sample = bytes(raw.left(edge)) + bytes(raw.right(min(edge, max(size - edge, 0))))
+    elif fmt == _TEXT_FORMAT:
+        text = mime_data.text()
+        size = len(text)
+        sample = (text[:edge] + text[max(size - edge, edge):]).encode("utf-8", errors="surrogatepass")
+    else:
+        sample = b""
+    return formats, fmt, size, hashlib.blake2b(sample, digest_size=16).digest()
+
+
+class ClipboardEventCoalescer:
+    """One reusable single-shot timer for clipboard change bursts.
+
+    Each dataChanged restarts the debounce, but a burst is never held back
+    longer than max_wait_ms after its first event. stats counts every event:
+    coalesced (folded into a pending capture), dropped (internal copy, privacy
+    mode) and unchanged (same payload as the capture just before, inside
+    repeat_window_s of it).
+    """
+
+    def __init__(
+        self,
+        parent: Any,
+        callback: Callable[[], Any],
+        debounce_ms: int = CLIPBOARD_DEBOUNCE_MS,
+        max_wait_ms: int = CLIPBOARD_MAX_WAIT_MS,
+        repeat_window_s: float = CLIPBOARD_REPEAT_WINDOW_S,
+        timer_cls: Any = QTimer,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._callback = callback
+        self._clock = clock
+        self.debounce_ms = CLIPBOARD_DEBOUNCE_MS
+        self.max_wait_ms = CLIPBOARD_MAX_WAIT_MS
+        self.configure(debounce_ms, max_wait_ms)
+        self.repeat_window_s = float(repeat_window_s)
+        self._burst_started_at: float | None = None
+        self._pending_events = 0
+        self._last_fingerprint: tuple[tuple[str, ...], str, int, bytes] | None = None
+        self._last_captured_at = 0.0
+        self.stats = {"events": 0, "coalesced": 0, "dropped": 0, "unchanged": 0, "flushed": 0}
+        self._timer = timer_cls(parent)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._flush)
+
+    def configure(self, debounce_ms: int | None = None, max_wait_ms: int | None = None) -> None:
+        low, high = CLIPBOARD_DEBOUNCE_RANGE_MS
+        if debounce_ms is not None:
+            self.debounce_ms = min(max(int(debounce_ms), low), high)
+        if max_wait_ms is not None:
+            self.max_wait_ms = int(max_wait_ms)
+        self.max_wait_ms = max(self.max_wait_ms, self.debounce_ms)
+
+    @property
+    def pending(self) -> bool:
+        return self._burst_started_at is not None
+
+    def notify(self) -> None:
+        """Schedule a capture for this change, folding it into a pending burst."""
+        now = self._clock()
+        self.stats["events"] += 1
+        if self._burst_started_at is None:
+            self._burst_started_at = now
+        else:
+            self.stats["coalesced"] += 1
+        self._pending_events += 1
+        waited_ms = (now - self._burst_started_at) * 1000
+        self._timer.start(int(max(0.0, min(self.debounce_ms, self.max_wait_ms - waited_ms))))
+
+    def discard(self) -> None:
+        """Ignore this change and drop any pending burst (internal copy, privacy mode)."""
+        self.stats["events"] += 1
+        self.stats["dropped"] += 1 + self._pending_events
+        # 클립보드가 그 사이 다른 값으로 바뀌었으므로 다음 복사는 반복이 아니다.
+        self._last_fingerprint = None
+        self.cancel()
+
+    def cancel(self) -> None:
+        self._timer.stop()
+        self._burst_started_at = None
+        self._pending_events = 0
+
+    @staticmethod
+    def fingerprint(mime_data: Any):
+        """clipboard_fingerprint(), or None when the payload cannot be read."""
+        try:
+            return clipboard_fingerprint(mime_data)
+        except Exception as exc:
+            logger.debug("Clipboard fingerprint failed: %s", exc)
+            return None
+
+    def is_repeat(self, fingerprint) -> bool:
+        """True if fingerprint is the last captured payload and repeat_window_s has not passed.
+
+        The window runs from that capture: a skipped repeat does not extend it.
+        """
+        if fingerprint is None or fingerprint != self._last_fingerprint:
+            return False
+        if self._clock() - self._last_captured_at > self.repeat_window_s:
+            return False
+        self.stats["unchanged"] += 1
+        return True
+
+    def remember(self, fingerprint) -> None:
+        """Record the payload a capture was just started for."""
+        self._last_fingerprint = fingerprint
+        self._last_captured_at = self._clock()
+
+    def _flush(self) -> None:
+        self._burst_started_at = None
+        self._pending_events = 0
+        self.stats["flushed"] += 1
+        self._callback()
+
+
+def _debounce_setting(db: Any) -> int:
+    if not callable(getattr(db, "get_setting", None)):
+        return CLIPBOARD_DEBOUNCE_MS
+    try:
+        return int(db.get_setting(CLIPBOARD_DEBOUNCE_SETTING, CLIPBOARD_DEBOUNCE_MS))
+    except (TypeError, ValueError):
+        return CLIPBOARD_DEBOUNCE_MS
+
+
+def get_clipboard_coalescer(window: Any, timer_cls: Any = QTimer) -> ClipboardEventCoalescer:
+    coalescer = getattr(window, "_clipboard_coalescer", None)
+    if not isinstance(coalescer, ClipboardEventCoalescer):
+        coalescer = ClipboardEventCoalescer(
+            window,
+            lambda: window.process_clipboard(),
+            debounce_ms=_debounce_setting(getattr(window, "db", None)),
+            timer_cls=timer_cls,
+        )
+        window._clipboard_coalescer = coalescer
+    return coalescer
+
+
+__all__ = [
+    "CLIPBOARD_DEBOUNCE_MS",
+    "CLIPBOARD_DEBOUNCE_RANGE_MS",
+    "CLIPBOARD_DEBOUNCE_SETTING",
+    "CLIPBOARD_FINGERPRINT_EDGE_BYTES",
+    "CLIPBOARD_MAX_WAIT_MS",
+    "CLIPBOARD_REPEAT_WINDOW_S",
+    "ClipboardEventCoalescer",
+    "clipboard_fingerprint",
+    "get_clipboard_coalescer",
+]
@@ -24,7 +24,8 @@ class ClipboardController(FeatureController):
         self.sync()
         return process_clipboard_impl(self.window, logger)
 
-    def process_image_clipboard(self, mime_data, logger, qbytearray_cls, qbuffer_cls, hashlib_mod, toast_cls):
+    def process_image_clipboard(self, mime_data, logger, qbytearray_cls, qbuffer_cls, _hashlib_mod, toast_cls):
+        # _hashlib_mod: 기존 MainWindow 호출 시그니처 호환용으로만 받는다 (해시는 수집기 스레드에서 계산).
         self.sync()
         return process_image_clipboard_impl(
             self.window,
@@ -32,7 +33,6 @@ class ClipboardController(FeatureController):
             logger,
             qbytearray_cls,
             qbuffer_cls,
-            hashlib_mod,
             toast_cls,
         )
 
@@ -0,0 +1,179 @@
+"""Storage codec for captured images: lossless WebP (default), optimized PNG, or opt-in JPEG for photos.
+
+Encoding runs on the capture thread (and the recompression worker); the UI
+thread only reads the setting. Blobs are decoded by format sniffing
+everywhere (QImage.fromData), so rows in different codecs can coexist.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Any, Callable
+
+from PyQt6.QtCore import QBuffer, QByteArray, Qt
+from PyQt6.QtGui import QImage, QImageWriter
+
+from smartclipboard_core.image_format import sniff_image_format
+
+logger = logging.getLogger(__name__)
+
+IMAGE_CODEC_SETTING = "image_codec"
+# 기본은 무손실. WebP를 쓸 수 없는 Qt 빌드에서는 PNG로 저장된다. 손실 압축(auto/jpeg)은 직접 골라야 한다.
+IMAGE_CODEC_DEFAULT = "webp"
+IMAGE_CODECS = {
+    "webp": "WebP 무손실 (기본)",
+    "png": "PNG (알파 채널 최적화)",
+    "auto": "자동 (사진은 JPEG 손실 압축, 그 외는 WebP 무손실)",
+    "jpeg": "JPEG (사진용, 손실 압축)",
+}
+JPEG_QUALITY = 85
+# Qt PNG 품질 값은 zlib 압축 수준의 반대 (0 = 최대 압축). 최대 압축은 스크린샷에서 ~1% 줄이는 데
+# 3배 이상 느려 기본값(-1)을 쓰고, 대신 불투명 이미지의 알파 채널을 떼어 낸다(~10%).
+PNG_OPTIMIZED_QUALITY = -1
+
+# 64x64 표본의 서로 다른 색 비율이 이 이상이면 사진으로 본다 (스크린샷은 단색 면이 많다).
+PHOTO_SAMPLE_SIDE = 64
+PHOTO_MIN_COLOR_RATIO = 0.5
+
+# Qt webp 읽기 플러그인은 헤더를 고정 길이로 읽어 40바이트 남짓한 파일(작은 단색 이미지)을 열지 못한다.
+WEBP_MIN_READABLE_BYTES = 64
+
+RECOMPRESS_BATCH_SIZE = 20
+
+
+@functools.lru_cache(maxsize=1)
+def webp_supported() -> bool:
+    return b"webp" in {fmt.data().lower() for fmt in QImageWriter.supportedImageFormats()}
+
+
+def normalize_image_codec(value: object) -> str:
+    codec = str(value or "").strip().lower()
+    return codec if codec in IMAGE_CODECS else IMAGE_CODEC_DEFAULT
+
+
+def is_opaque(image: QImage) -> bool:
+    if not image.hasAlphaChannel():
+        return True
+    alpha = image.convertToFormat(QImage.Format.Format_Alpha8)
+    bits = alpha.constBits()
+    if bits is None:
+        return False
+    data = bits.asstring(alpha.sizeInBytes())
+    stride, width = alpha.bytesPerLine(), alpha.width()
+    return not any(data[row * stride : row * stride + width].strip(b"\xff") for row in range(alpha.height()))
+
+
+def looks_like_photo(image: QImage) -> bool:
+    """Many distinct colors in a small sample: camera photos, renders, gradients."""
+    sample = image.scaled(
+        PHOTO_SAMPLE_SIDE,
+        PHOTO_SAMPLE_SIDE,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.FastTransformation,
+    ).convertToFormat(QImage.Format.Format_RGB32)
+    bits = sample.constBits()
+    if bits is None:
+        return False
+    pixels = memoryview(bits.asstring(sample.sizeInBytes())).cast("I")
+    return len(set(pixels)) >= PHOTO_SAMPLE_SIDE * PHOTO_SAMPLE_SIDE * PHOTO_MIN_COLOR_RATIO
+
+
+def _save(image: QImage, fmt: str, quality: int, qbytearray_cls: Any, qbuffer_cls: Any) -> bytes | None:
+    data = qbytearray_cls()
+    buffer = qbuffer_cls(data)
+    buffer.open(qbuffer_cls.OpenModeFlag.WriteOnly)
+    saved = image.save(buffer, fmt, quality)
+    buffer.close()
+    return data.data() if saved else None
+
+
+def _encode_lossless(image: QImage, codec: str, opaque: bool, qbytearray_cls: Any, qbuffer_cls: Any) -> bytes | None:
+    if codec != "png" and webp_supported():
+        # libwebp 무손실(quality 100)이 스크린샷류에서는 PNG보다 훨씬 작다.
+        encoded = _save(image, "WEBP", 100, qbytearray_cls, qbuffer_cls)
+        if encoded and len(encoded) >= WEBP_MIN_READABLE_BYTES:
+            return encoded
+    if opaque and image.hasAlphaChannel():
+        # 모든 픽셀이 불투명하면 알파 채널 없이 저장해도 같은 이미지다.
+        image = image.convertToFormat(QImage.Format.Format_RGB32)
+    return _save(image, "PNG", PNG_OPTIMIZED_QUALITY, qbytearray_cls, qbuffer_cls)
+
+
+def encode_image(
+    image: QImage,
+    codec: str = IMAGE_CODEC_DEFAULT,
+    qbytearray_cls: Any = QByteArray,
+    qbuffer_cls: Any = QBuffer,
+    lossy: bool = True,
+) -> bytes | None:
+    """Encode image for storage with codec; lossy=False never picks JPEG (recompression)."""
+    codec = normalize_image_codec(codec)
+    opaque = is_opaque(image)
+    # JPEG는 알파를 버리므로 불투명 이미지에만 쓴다.
+    if lossy and opaque and (codec == "jpeg" or (codec == "auto" and looks_like_photo(image))):
+        encoded = _save(image, "JPEG", JPEG_QUALITY, qbytearray_cls, qbuffer_cls)
+        if encoded:
+            return encoded
+    return _encode_lossless(image, codec, opaque, qbytearray_cls, qbuffer_cls)
+
+
+def recompress_images(
+    db,
+    codec: str = IMAGE_CODEC_DEFAULT,
+    batch_size: int = RECOMPRESS_BATCH_SIZE,
+    should_stop: Callable[[], bool] | None = None,
+) -> dict[str, int]:
+    """Losslessly re-encode stored images and keep the smaller blob; run on a worker thread.
+
+    Already-lossy rows (JPEG) are left as they are: re-encoding them would
+    only add another generation of loss. should_stop is checked between
+    batches so app shutdown does not wait for the whole table.
+    """
+    report = {"scanned": 0, "recompressed": 0, "skipped": 0, "bytes_before": 0, "bytes_after": 0}
+    after_id = 0
+    while not (should_stop and should_stop()):
+        blobs = db.get_image_blobs(after_id, batch_size)
+        if not blobs:
+            break
+        after_id = blobs[-1][0]
+        replacements = []
+        for item_id, blob in blobs:
+            report["scanned"] += 1
+            report["bytes_before"] += len(blob)
+            encoded = None
+            if sniff_image_format(blob) not in (None, "jpeg"):
+                image = QImage.fromData(blob)
+                if not image.isNull():
+                    encoded = encode_image(image, codec, lossy=False)
+            if encoded and len(encoded) < len(blob):
+                replacements.append((item_id, blob, encoded))
+            else:
+                report["skipped"] += 1
+                report["bytes_after"] += len(blob)
+        replaced = set(db.replace_image_blobs(replacements)) if replacements else set()
+        for item_id, previous, encoded in replacements:
+            if item_id in replaced:
+                report["recompressed"] += 1
+                report["bytes_after"] += len(encoded)
+            else:
+                # 그 사이 캡처로 바뀐 행 등은 건드리지 않는다.
+                report["skipped"] += 1
+                report["bytes_after"] += len(previous)
+    report["bytes_saved"] = report["bytes_before"] - report["bytes_after"]
+    logger.info("Image recompression: %s", report)
+    return report
+
+
+__all__ = [
+    "IMAGE_CODECS",
+    "IMAGE_CODEC_DEFAULT",
+    "IMAGE_CODEC_SETTING",
+    "JPEG_QUALITY",
+    "encode_image",
+    "is_opaque",
+    "looks_like_photo",
+    "normalize_image_codec",
+    "recompress_images",
+    "webp_supported",
+]
@@ -0,0 +1,53 @@
+"""Qt side of the perceptual image hash: QImage -> 9x8 grayscale -> dHash."""
+
+from __future__ import annotations
+
+import logging
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage
+
+from smartclipboard_core.image_hash import DHASH_HEIGHT, DHASH_WIDTH, dhash_from_gray
+
+logger = logging.getLogger(__name__)
+
+
+def qimage_dhash(image: QImage) -> int | None:
+    """dHash of image; None for a null image. Safe to call off the UI thread."""
+    if image.isNull():
+        return None
+    # SmoothTransformation은 축소 시 면적 평균이라 작은 노이즈/재인코딩 차이가 묻힌다.
+    thumb = image.scaled(
+        DHASH_WIDTH,
+        DHASH_HEIGHT,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    ).convertToFormat(QImage.Format.Format_Grayscale8)
+    bits = thumb.constBits()
+    if bits is None:
+        return None
+    data = bits.asstring(thumb.sizeInBytes())
+    stride = thumb.bytesPerLine()
+    pixels = b"".join(data[row * stride : row * stride + DHASH_WIDTH] for row in range(DHASH_HEIGHT))
+    return dhash_from_gray(pixels)
+
+
+def blob_dhash(blob: bytes) -> int | None:
+    image = QImage.fromData(blob)
+    return qimage_dhash(image)
+
+
+def backfill_image_hashes(db, limit: int = 50) -> int:
+    """Hash IMAGE rows stored without one (imports, restores, older versions); undecodable rows are marked."""
+    if not callable(getattr(db, "get_images_missing_hash", None)):
+        return 0
+    hashes: list[tuple[int, int | None]] = []
+    for item_id, blob in db.get_images_missing_hash(limit):
+        image_hash = blob_dhash(blob)
+        if image_hash is None:
+            logger.debug("Image hash backfill skipped undecodable item %s", item_id)
+        hashes.append((item_id, image_hash))
+    return db.set_image_hashes(hashes) if hashes else 0
+
+
+__all__ = ["backfill_image_hashes", "blob_dhash", "qimage_dhash"]
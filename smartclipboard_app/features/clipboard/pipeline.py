@@ -2,29 +2,113 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+import time
+from typing import Any, Callable, cast
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
 from smartclipboard_app.ui.clipboard_guard import extract_local_file_paths, mark_internal_copy
 from smartclipboard_app.ui.widgets.toast import ToastNotification
-from smartclipboard_core.automation.formatters import replacement_text_from_result
-from smartclipboard_core.file_paths import describe_file_paths, file_content_from_paths
-from smartclipboard_core.limits import IMAGE_CLIPBOARD_MAX_BYTES
-
-TEXT_CLIPBOARD_MAX_BYTES = 1 * 1024 * 1024
+from smartclipboard_core.classifier import (
+    CODE_INDICATORS,
+    RE_HEX_COLOR,
+    RE_HSL_COLOR,
+    RE_RGB_COLOR,
+    RE_URL,
+    classify_text,
+)
+from smartclipboard_core.copy_rules import CopyRuleProgram, compile_copy_rules
+from smartclipboard_core.file_paths import describe_file_paths
+from smartclipboard_core.ingest import (
+    INGEST_DUPLICATE,
+    INGEST_FAILED,
+    INGEST_TOO_LARGE,
+    TEXT_ROUTE_EMPTY,
+    TEXT_ROUTE_LARGE,
+    TEXT_ROUTE_TOO_LARGE,
+    ClipboardIngestor,
+    IngestResult,
+)
+from smartclipboard_core.limits import (
+    IMAGE_CLIPBOARD_MAX_BYTES,
+    LARGE_TEXT_CLIPBOARD_MAX_BYTES,
+    TEXT_CLIPBOARD_MAX_BYTES,
+)
+from smartclipboard_core.staged_pipeline import StagedPipeline
+from smartclipboard_core.worker import Worker
+
+from .coalescer import ClipboardEventCoalescer, get_clipboard_coalescer
+from .image_codec import IMAGE_CODEC_DEFAULT, IMAGE_CODEC_SETTING, encode_image, normalize_image_codec
+from .image_hash import qimage_dhash
+from .thumbnails import backfill_image_thumbnails, get_thumbnail_cache, qimage_thumbnail
+
+TEXT_CAPTURE_STAGES = ("read", "normalize", "classify", "persist", "post_actions", "notify")
+# 단계 사이 큐 크기. 첫 큐가 차면 UI 스레드를 막지 않고 그 복사를 건너뛴다.
+TEXT_CAPTURE_QUEUE_SIZE = 64
+
+
+def _get_ingestor(self) -> ClipboardIngestor:
+    """Window-bound ingestor: Qt-free capture logic fed with the window's rules, classifier and limits."""
+    db = getattr(self, "db", None)
+    actions = getattr(self, "action_manager", None)
+    ingestor = getattr(self, "_ingestor", None)
+    if not isinstance(ingestor, ClipboardIngestor) or ingestor.db is not db or ingestor.actions is not actions:
+        ingestor = ClipboardIngestor(
+            db,
+            classify=_window_classifier(self),
+            copy_rules=getattr(self, "apply_copy_rules", None),
+            actions=actions,
+        )
+        self._ingestor = ingestor
+    # 한도는 설정/테스트에서 창 속성으로 바뀔 수 있어 매번 맞춘다.
+    ingestor.max_text_bytes = int(getattr(self, "max_text_clipboard_bytes", TEXT_CLIPBOARD_MAX_BYTES))
+    ingestor.max_large_text_bytes = int(getattr(self, "max_large_text_clipboard_bytes", LARGE_TEXT_CLIPBOARD_MAX_BYTES))
+    ingestor.max_image_bytes = int(getattr(self, "max_image_clipboard_bytes", IMAGE_CLIPBOARD_MAX_BYTES))
+    return ingestor
+
+
+# MainWindow가 정의될 수 있는 모듈: 소스 구현과, 페이로드를 실행하는 로더.
+_MAIN_WINDOW_MODULES = ("smartclipboard_app.legacy_main_src", "smartclipboard_app.legacy_main")
+
+
+def _default_analyze_text_funcs() -> list[Any]:
+    """MainWindow.analyze_text function objects of the already loaded MainWindow modules (never imports one)."""
+    funcs = []
+    for module_name in _MAIN_WINDOW_MODULES:
+        main_window = getattr(sys.modules.get(module_name), "MainWindow", None)
+        func = getattr(main_window, "analyze_text", None)
+        if func is not None:
+            funcs.append(func)
+    return funcs
+
+
+def _window_classifier(self) -> Callable[[str], str] | None:
+    """Classifier for the window's ingestor, resolved once when the ingestor is built.
+
+    MainWindow.analyze_text only forwards the core patterns to
+    analyze_text_impl, so the ingestor's default (the shared classify_text)
+    is used directly. Only an override (subclass method or instance
+    attribute) is wrapped.
+    """
+    analyze = getattr(self, "analyze_text", None)
+    if not callable(analyze):
+        return None
+    func = getattr(analyze, "__func__", None)
+    if func is not None and any(func is default for default in _default_analyze_text_funcs()):
+        return None
+    return cast(Callable[[str], str], analyze)
 
 
 def on_clipboard_change_impl(self, qtimer_cls):
-    if self._clipboard_debounce_timer is not None:
-        self._clipboard_debounce_timer.stop()
-        self._clipboard_debounce_timer.deleteLater()
-        self._clipboard_debounce_timer = None
-
+    self._last_clipboard_activity = time.monotonic()
+    coalescer = get_clipboard_coalescer(self, qtimer_cls)
     if self.is_privacy_mode or self.is_internal_copy:
         self.is_internal_copy = False
+        coalescer.discard()
         return
-
-    self._clipboard_debounce_timer = qtimer_cls(self)
-    self._clipboard_debounce_timer.setSingleShot(True)
-    self._clipboard_debounce_timer.timeout.connect(self.process_clipboard)
-    self._clipboard_debounce_timer.start(100)
+    coalescer.notify()
 
 
 def process_clipboard_impl(self, logger):
@@ -33,62 +117,113 @@ def process_clipboard_impl(self, logger):
 
     try:
         mime_data = self.clipboard.mimeData()
-        if mime_data.hasUrls() and process_file_clipboard_impl(self, mime_data, logger):
-            return
-        if mime_data.hasImage():
-            self._process_image_clipboard(mime_data)
+        coalescer = getattr(self, "_clipboard_coalescer", None)
+        if not isinstance(coalescer, ClipboardEventCoalescer):
+            coalescer = None
+        fingerprint = coalescer.fingerprint(mime_data) if coalescer is not None else None
+        if coalescer is not None and coalescer.is_repeat(fingerprint):
+            logger.debug("Unchanged clipboard payload skipped")
             return
-        if mime_data.hasText():
-            self._process_text_clipboard(mime_data)
+        if mime_data.hasUrls() and process_file_clipboard_impl(self, mime_data, logger):
+            captured = True
+        elif mime_data.hasImage():
+            captured = self._process_image_clipboard(mime_data)
+        elif mime_data.hasText():
+            captured = self._process_text_clipboard(mime_data)
+        else:
+            captured = False
+        # 건너뛴 페이로드는 기억하지 않는다: 다음 복사를 반복으로 막지 않게.
+        if captured and coalescer is not None:
+            coalescer.remember(fingerprint)
     except Exception:
         logger.exception("Clipboard access error")
 
 
-def process_image_clipboard_impl(self, mime_data, logger, qbytearray_cls, qbuffer_cls, hashlib_mod, toast_cls):
+def process_image_clipboard_impl(self, mime_data, logger, qbytearray_cls, qbuffer_cls, toast_cls):
+    """Grab the QImage here; encoding, hashing, size check and insert run on the capture thread.
+
+    Returns True when the capture was started.
+    """
     try:
         image = self.clipboard.image()
         if image.isNull():
-            return
-
-        ba = qbytearray_cls()
-        buffer = qbuffer_cls(ba)
-        buffer.open(qbuffer_cls.OpenModeFlag.WriteOnly)
-        image.save(buffer, "PNG")
-        blob_data = ba.data()
-
-        max_image_size = int(getattr(self, "max_image_clipboard_bytes", IMAGE_CLIPBOARD_MAX_BYTES))
-        if len(blob_data) > max_image_size:
-            logger.warning(f"Image too large ({len(blob_data)} bytes), skipping")
-            toast_cls.show_toast(self, "이미지가 너무 큽니다(최대 5MB)", duration=2500, toast_type="warning")
-            return
+            return False
 
-        img_hash = hashlib_mod.md5(blob_data).hexdigest()
-        if hasattr(self, "_last_image_hash") and self._last_image_hash == img_hash:
-            logger.debug("Duplicate image skipped")
-            return
-        self._last_image_hash = img_hash
-
-        if self.db.add_item("[이미지 캡처]", blob_data, "IMAGE"):
-            if self.isVisible():
-                self.load_data()
-                self.update_status_bar()
-            else:
-                self.is_data_dirty = True
+        worker = Worker(
+            _encode_and_store_image,
+            _get_ingestor(self),
+            image,
+            qbytearray_cls,
+            qbuffer_cls,
+            _image_codec_setting(self),
+        )
+        worker.signals.result.connect(lambda result: _on_image_stored(self, result, logger, toast_cls))
+        worker.signals.error.connect(lambda error: logger.error("Image capture failed: %s", error[1]))
+        _get_capture_threadpool(self).start(worker)
+        return True
     except Exception:
         logger.exception("Image processing error")
+        return False
+
+
+def _image_codec_setting(self) -> str:
+    get_setting = getattr(self.db, "get_setting", None)
+    if not callable(get_setting):
+        return IMAGE_CODEC_DEFAULT
+    return normalize_image_codec(get_setting(IMAGE_CODEC_SETTING, IMAGE_CODEC_DEFAULT))
+
+
+def _encode_and_store_image(ingestor, image, qbytearray_cls, qbuffer_cls, codec=IMAGE_CODEC_DEFAULT):
+    """Encode on the capture thread and hand the blob to the ingestor; returns its IngestResult."""
+    blob_data = encode_image(image, codec, qbytearray_cls, qbuffer_cls)
+    if not blob_data:
+        return IngestResult(INGEST_FAILED, type_tag="IMAGE")
+    rejected = ingestor.check_image(blob_data)
+    if rejected is not None:
+        return rejected
+
+    # 같은 화면을 다시 캡처했거나 재인코딩된 이미지는 지각 해시로 기존 항목에 합친다.
+    return ingestor.store_image(blob_data, image_hash=qimage_dhash(image), thumbnail=qimage_thumbnail(image))
+
+
+def _on_image_stored(self, result: IngestResult, logger, toast_cls):
+    if result.status == INGEST_TOO_LARGE:
+        logger.warning(f"Image too large ({result.size} bytes), skipping")
+        toast_cls.show_toast(self, "이미지가 너무 큽니다(최대 5MB)", duration=2500, toast_type="warning")
+        return
+    if result.status == INGEST_DUPLICATE:
+        logger.debug("Duplicate image skipped")
+        return
+    if not result.stored or result.item_id is None or getattr(getattr(self, "db", None), "conn", None) is None:
+        return
+    # 거의 같은 이미지로 합쳐진 경우 같은 id의 썸네일이 바뀌었다.
+    get_thumbnail_cache(self).invalidate(result.item_id)
+    if self.isVisible():
+        self.load_data()
+        self.update_status_bar()
+    else:
+        self.is_data_dirty = True
 
 
 def process_text_clipboard_impl(self, mime_data, logger):
+    """Read the text here; normalize, classify, persist and actions run on the staged capture pipeline.
+
+    Returns True when the capture was started.
+    """
     try:
+        started = time.perf_counter()
         raw_text = mime_data.text()
-        if not raw_text:
-            return
-
-        max_text_size = int(getattr(self, "max_text_clipboard_bytes", TEXT_CLIPBOARD_MAX_BYTES))
-        raw_size = len(raw_text.encode("utf-8", errors="surrogatepass"))
-        if raw_size > max_text_size:
+        ingestor = _get_ingestor(self)
+        route, raw_size = ingestor.route_text(raw_text)
+        if route == TEXT_ROUTE_EMPTY:
+            return False
+        if route == TEXT_ROUTE_LARGE:
+            _capture_large_text_async(self, raw_text, raw_size, logger)
+            return True
+        if route == TEXT_ROUTE_TOO_LARGE:
             logger.warning("Text clipboard too large (%s bytes), skipping", raw_size)
-            message = "텍스트가 너무 큽니다(최대 1MB). 저장하지 않았습니다."
+            limit_mb = ingestor.text_limit() // (1024 * 1024)
+            message = f"텍스트가 너무 큽니다(최대 {limit_mb}MB). 저장하지 않았습니다."
             try:
                 self.statusBar().showMessage(message, 3000)
             except Exception:
@@ -97,24 +232,240 @@ def process_text_clipboard_impl(self, mime_data, logger):
                 ToastNotification.show_toast(self, message, duration=2500, toast_type="warning")
             except Exception:
                 pass
+            return False
+
+        capture = _get_text_capture(self, logger)
+        if not capture.pipeline.submit(_TextCaptureJob(ingestor, raw_text)):
+            logger.warning("Text capture queue full (%s pending), clipboard change skipped", capture.pipeline.in_flight)
+            try:
+                self.statusBar().showMessage("⚠️ 캡처 처리가 밀려 이번 복사는 저장하지 않았습니다.", 3000)
+            except Exception:
+                pass
+            return False
+        capture.pipeline.record("read", (time.perf_counter() - started) * 1000)
+        return True
+    except Exception:
+        logger.exception("Text processing error")
+        return False
+
+
+class _TextCaptureJob:
+    """One text clipboard change moving through the capture stages."""
+
+    __slots__ = ("ingestor", "raw_text", "text", "normalized", "tag", "item_id", "action_results", "replaced_text")
+
+    def __init__(self, ingestor: ClipboardIngestor, raw_text: str):
+        self.ingestor = ingestor
+        self.raw_text = raw_text
+        self.text = raw_text
+        self.normalized = ""
+        self.tag = "TEXT"
+        self.item_id: int | None = None
+        self.action_results: list = []
+        self.replaced_text: str | None = None
+
+
+class _TextCaptureSignals(QObject):
+    captured = pyqtSignal(object)  # _TextCaptureJob
+    idle = pyqtSignal()
+    rule_disabled = pyqtSignal(str)  # 안내 문구
+
+
+class _TextCapture:
+    """read (UI) → normalize → classify → persist → post_actions (stage threads) → notify (UI).
+
+    A burst refreshes the history view once, when the pipeline runs dry,
+    instead of once per captured item.
+    """
+
+    def __init__(self, window, logger, toast_cls=ToastNotification):
+        self.window = window
+        self.logger = logger
+        self.toast_cls = toast_cls
+        self._refresh_pending = False
+        self.signals = _TextCaptureSignals()
+        self.signals.captured.connect(self._on_captured)
+        self.signals.idle.connect(self._on_idle)
+        self.signals.rule_disabled.connect(self._on_rule_disabled)
+        self.pipeline = StagedPipeline(
+            [
+                ("normalize", self._normalize),
+                ("classify", self._classify),
+                ("persist", self._persist),
+                ("post_actions", self._post_actions),
+            ],
+            on_done=self.signals.captured.emit,
+            on_error=self._on_stage_error,
+            on_idle=self.signals.idle.emit,
+            queue_size=TEXT_CAPTURE_QUEUE_SIZE,
+            name="TextCapture",
+        )
+
+    @staticmethod
+    def _normalize(job: _TextCaptureJob):
+        job.text, job.normalized = job.ingestor.normalize_text(job.raw_text)
+        return job if job.normalized else None
+
+    @staticmethod
+    def _classify(job: _TextCaptureJob):
+        job.tag = job.ingestor.classify(job.normalized)
+        return job
+
+    @staticmethod
+    def _persist(job: _TextCaptureJob):
+        job.item_id = job.ingestor.store_text(job.text, job.tag)
+        return job if job.item_id else None
+
+    @staticmethod
+    def _post_actions(job: _TextCaptureJob):
+        if job.item_id is None:
+            return job
+        job.action_results, job.replaced_text = job.ingestor.run_actions(job.normalized, job.item_id)
+        return job
+
+    def _on_stage_error(self, stage: str, _job, exc: BaseException) -> None:
+        self.logger.error("Text capture %s stage failed: %s", stage, exc)
+
+    def _on_captured(self, job: _TextCaptureJob) -> None:
+        started = time.perf_counter()
+        if getattr(getattr(self.window, "db", None), "conn", None) is None:
             return
+        try:
+            apply_action_results_impl(self.window, job.action_results, job.replaced_text, self.toast_cls)
+        except Exception as exc:
+            self.logger.debug("Action result handling error: %s", exc)
+        self._refresh_pending = True
+        self.pipeline.record("notify", (time.perf_counter() - started) * 1000)
 
-        text = self.apply_copy_rules(raw_text)
-        normalized_text = text.strip()
-        if not normalized_text:
+    def _on_idle(self) -> None:
+        if not self._refresh_pending or getattr(getattr(self.window, "db", None), "conn", None) is None:
             return
+        self._refresh_pending = False
+        started = time.perf_counter()
+        window = self.window
+        if window.isVisible():
+            window.load_data()
+            window.update_status_bar()
+        else:
+            window.is_data_dirty = True
+        self.pipeline.record("refresh", (time.perf_counter() - started) * 1000)
 
-        tag = self.analyze_text(normalized_text)
-        item_id = self.db.add_item(text, None, tag)
-        if item_id:
-            self._process_actions(normalized_text, item_id)
-            if self.isVisible():
-                self.load_data()
-                self.update_status_bar()
-            else:
-                self.is_data_dirty = True
+    def _on_rule_disabled(self, message: str) -> None:
+        try:
+            self.window.statusBar().showMessage(message, 5000)
+        except Exception:
+            pass
+        try:
+            self.toast_cls.show_toast(self.window, message, duration=4000, toast_type="warning")
+        except Exception:
+            pass
+
+    def metrics(self) -> dict:
+        metrics = self.pipeline.metrics()
+        stages = metrics["stages"]
+        metrics["stages"] = {name: stages[name] for name in (*TEXT_CAPTURE_STAGES, "refresh") if name in stages}
+        return metrics
+
+
+def _get_text_capture(self, logger) -> _TextCapture:
+    capture = getattr(self, "_text_capture", None)
+    if not isinstance(capture, _TextCapture):
+        capture = self._text_capture = _TextCapture(self, logger)
+    return capture
+
+
+def capture_metrics_impl(self) -> dict:
+    """Per-stage latency histograms and queue counters of the text capture pipeline, plus event counters."""
+    capture = getattr(self, "_text_capture", None)
+    metrics = capture.metrics() if isinstance(capture, _TextCapture) else {}
+    coalescer = getattr(self, "_clipboard_coalescer", None)
+    if isinstance(coalescer, ClipboardEventCoalescer):
+        metrics["events"] = dict(coalescer.stats)
+    return metrics
+
+
+def shutdown_text_capture_impl(self, logger, timeout: float = 5.0) -> None:
+    """Let queued text captures reach the DB before it closes."""
+    capture = getattr(self, "_text_capture", None)
+    if not isinstance(capture, _TextCapture):
+        return
+    capture.pipeline.shutdown(timeout)
+    logger.debug("Text capture metrics: %s", capture.metrics())
+
+
+def _get_capture_threadpool(self):
+    """캡처 저장 전용 단일 스레드 풀 (저장 순서 보장)."""
+    pool = getattr(self, "_capture_threadpool", None)
+    if pool is None:
+        from PyQt6.QtCore import QThreadPool
+
+        pool = QThreadPool(self)
+        pool.setMaxThreadCount(1)
+        self._capture_threadpool = pool
+    return pool
+
+
+def request_thumbnail_backfill_impl(self, logger, limit: int = 200):
+    """Render missing thumbnails on the capture thread, then refresh the views once."""
+    if getattr(self, "_thumbnail_backfill_pending", False):
+        return
+    if not callable(getattr(self.db, "get_images_missing_thumbnail", None)):
+        return
+    self._thumbnail_backfill_pending = True
+
+    def _on_done(count):
+        self._thumbnail_backfill_pending = False
+        if not count or getattr(getattr(self, "db", None), "conn", None) is None:
+            return
+        if self.isVisible():
+            self.load_data()
+        else:
+            self.is_data_dirty = True
+
+    def _on_error(error):
+        self._thumbnail_backfill_pending = False
+        logger.error("Thumbnail backfill failed: %s", error[1])
+
+    worker = Worker(backfill_image_thumbnails, self.db, limit)
+    worker.signals.result.connect(_on_done)
+    worker.signals.error.connect(_on_error)
+    _get_capture_threadpool(self).start(worker)
+
+
+def _capture_large_text_async(self, raw_text, raw_size, logger):
+    """압축/해시/저장은 워커 스레드에서, UI 갱신만 메인 스레드에서 수행."""
+    logger.info("Large text clipboard (%s bytes) queued for chunked storage", raw_size)
+    try:
+        self.statusBar().showMessage("📦 대용량 텍스트를 압축 저장하는 중...", 3000)
     except Exception:
-        logger.exception("Text processing error")
+        pass
+
+    worker = Worker(_get_ingestor(self).ingest_large_text, raw_text)
+    worker.signals.result.connect(lambda result: _on_large_text_stored(self, result, logger))
+    worker.signals.error.connect(lambda error: logger.error("Large text capture failed: %s", error[1]))
+    _get_capture_threadpool(self).start(worker)
+
+
+def _on_large_text_stored(self, result: IngestResult, logger):
+    if getattr(getattr(self, "db", None), "conn", None) is None:
+        return
+    if not result.stored:
+        logger.warning("Large text clipboard was not stored")
+        return
+    ratio = result.stored_size / result.size if result.size else 1.0
+    logger.info("Large text stored: id=%s bytes=%s compressed=%.0f%%", result.item_id, result.size, ratio * 100)
+    try:
+        self.statusBar().showMessage(
+            f"📦 대용량 텍스트 저장됨 ({result.size / (1024 * 1024):.1f}MB → {result.stored_size / (1024 * 1024):.1f}MB)",
+            3000,
+        )
+    except Exception:
+        pass
+    if self.isVisible():
+        self.load_data()
+        self.update_status_bar()
+    else:
+        self.is_data_dirty = True
 
 
 def process_file_clipboard_impl(self, mime_data, logger):
@@ -123,12 +474,7 @@ def process_file_clipboard_impl(self, mime_data, logger):
         if not file_paths:
             return False
 
-        content = file_content_from_paths(file_paths)
-        if not content:
-            return False
-
-        item_id = self.db.add_item(content, None, "FILE")
-        if not item_id:
+        if not _get_ingestor(self).ingest_files(file_paths).stored:
             return False
 
         logger.debug("File clipboard captured: %s", describe_file_paths(file_paths))
@@ -143,103 +489,107 @@ def process_file_clipboard_impl(self, mime_data, logger):
         return False
 
 
-def _update_text_item_after_actions(self, item_id, new_text, logger):
-    normalized_text = str(new_text or "")
-    if not normalized_text:
-        return False
+def run_actions_impl(self, text, item_id, logger):
+    """Run matching actions and store a text replacement; worker-thread safe.
 
-    item_type = self.analyze_text(normalized_text.strip()) if normalized_text.strip() else "TEXT"
-    with self.db.lock:
-        try:
-            cursor = self.db.conn.cursor()
-            cursor.execute("SELECT 1 FROM history WHERE id = ? LIMIT 1", (item_id,))
-            if cursor.fetchone() is None:
-                return False
-            if hasattr(self.db, "replace_text_item_or_merge"):
-                return bool(self.db.replace_text_item_or_merge(item_id, normalized_text, item_type))
-            cursor.execute(
-                "UPDATE history SET content = ?, image_data = NULL, type = ?, file_path = '', file_signature = '', url_title = '' "
-                "WHERE id = ?",
-                (normalized_text, item_type, item_id),
+    Returns (action_results, replaced_text); replaced_text is None unless the
+    history item was updated and the clipboard should follow.
+    """
+    return _get_ingestor(self).run_actions(text, item_id)
+
+
+def apply_action_results_impl(self, action_results, replaced_text, toast_cls):
+    """UI-thread half of action processing: toasts and the clipboard replacement."""
+    for action_name, result in action_results:
+        if not isinstance(result, dict):
+            continue
+        result_type = result.get("type")
+        if result_type == "notify":
+            toast_cls.show_toast(
+                self,
+                f"⚡{action_name}: {result.get('message', '')}",
+                duration=3000,
+                toast_type="info",
             )
-            self.db.conn.commit()
-            return cursor.rowcount == 1
-        except Exception as exc:
-            self.db.conn.rollback()
-            logger.debug("Action text update error: %s", exc)
-            return False
+        elif result_type == "title":
+            title = result.get("title")
+            if title:
+                toast_cls.show_toast(self, f"🔗 {title[:50]}...", duration=2500, toast_type="info")
+    if replaced_text is not None:
+        mark_internal_copy(self)
+        self.clipboard.setText(replaced_text)
 
 
 def process_actions_impl(self, text, item_id, logger, toast_cls):
+    action_results, replaced_text = run_actions_impl(self, text, item_id, logger)
     try:
-        action_results = self.action_manager.process(text, item_id)
-        updated_text = text
-        updated_by_actions: list[str] = []
-        for action_name, result in action_results:
-            if not isinstance(result, dict):
-                continue
-            result_type = result.get("type")
-            if result_type == "notify":
-                toast_cls.show_toast(
-                    self,
-                    f"⚡{action_name}: {result.get('message', '')}",
-                    duration=3000,
-                    toast_type="info",
-                )
-            elif result_type == "title":
-                title = result.get("title")
-                if title:
-                    toast_cls.show_toast(self, f"🔗 {title[:50]}...", duration=2500, toast_type="info")
-            elif result_type == "replace_text":
-                replacement_text = replacement_text_from_result(result)
-                if replacement_text is None or replacement_text == updated_text:
-                    continue
-                updated_text = replacement_text
-                updated_by_actions.append(action_name)
-
-        if updated_by_actions and updated_text != text:
-            if _update_text_item_after_actions(self, item_id, updated_text, logger):
-                mark_internal_copy(self)
-                self.clipboard.setText(updated_text)
-                logger.info("Applied clipboard action text replacement: %s", ", ".join(updated_by_actions))
-            else:
-                logger.warning("Clipboard action text replacement skipped; item %s is unavailable", item_id)
+        apply_action_results_impl(self, action_results, replaced_text, toast_cls)
     except Exception as action_err:
         logger.debug(f"Action processing error: {action_err}")
 
 
 def apply_copy_rules_impl(self, text, logger, re_module):
-    if self._rules_cache_dirty or self._rules_cache is None:
-        self._rules_cache = self.db.get_copy_rules()
+    # _rules_cache는 컴파일된 규칙 프로그램. 규칙이 바뀌면 다시 컴파일하되 규칙별 통계는 이어 간다.
+    if self._rules_cache_dirty or not isinstance(self._rules_cache, CopyRuleProgram):
+        previous = self._rules_cache if isinstance(self._rules_cache, CopyRuleProgram) else None
+        # 규칙을 읽기 전에 표시를 지운다: 컴파일 중 UI 스레드가 invalidate_rules_cache()로 다시 세운
+        # 표시는 지워지지 않고 남아 다음 캡처에서 새 규칙으로 다시 컴파일된다.
         self._rules_cache_dirty = False
+        try:
+            self._rules_cache = compile_copy_rules(
+                self.db.get_copy_rules(),
+                re_module,
+                logger,
+                previous,
+                on_timeout=lambda rule, exc: _disable_slow_copy_rule(self, rule, exc, logger),
+            )
+        except Exception:
+            self._rules_cache_dirty = True
+            raise
         logger.debug("Copy rules cache refreshed")
+    return self._rules_cache.apply(text)
 
-    for rule in self._rules_cache:
-        rid, name, pattern, action, replacement, enabled, priority = rule
-        if not enabled:
-            continue
-        if not pattern:
-            logger.warning(f"Empty pattern in copy rule '{name}' (id={rid}), skipping")
-            continue
-        try:
-            if re_module.search(pattern, text):
-                if action == "trim":
-                    text = text.strip()
-                elif action == "lowercase":
-                    text = text.lower()
-                elif action == "uppercase":
-                    text = text.upper()
-                elif action == "remove_newlines":
-                    text = text.replace("\n", " ").replace("\r", "")
-                elif action == "custom_replace":
-                    text = re_module.sub(pattern, replacement or "", text)
-                logger.debug(f"Rule '{name}' applied")
-        except re_module.error as regex_exc:
-            logger.warning(f"Invalid regex in rule '{name}': {regex_exc}")
-    return text
+
+def _disable_slow_copy_rule(self, rule, exc, logger) -> None:
+    """Runs on the capture thread: turn the rule off in the DB and tell the user on the UI thread."""
+    try:
+        self.db.toggle_copy_rule(rule.rule_id, 0)
+    except Exception:
+        logger.exception("Failed to disable slow copy rule")
+    self._rules_cache_dirty = True
+    message = f"⏱️ 복사 규칙 '{rule.name}'이(가) 처리 시간 제한({exc.budget_ms:g}ms)을 넘어 비활성화되었습니다."
+    capture = getattr(self, "_text_capture", None)
+    if isinstance(capture, _TextCapture):
+        capture.signals.rule_disabled.emit(message)
+
+
+def copy_rule_stats_impl(self) -> dict:
+    """rule id -> evaluations/hits/total_ms/mean_ms of the compiled copy rules (empty before the first capture)."""
+    program = getattr(self, "_rules_cache", None)
+    return program.profile.snapshot() if isinstance(program, CopyRuleProgram) else {}
+
+
+def reset_copy_rule_stats_impl(self) -> None:
+    program = getattr(self, "_rules_cache", None)
+    if isinstance(program, CopyRuleProgram):
+        program.profile.reset()
+
+
+@functools.lru_cache(maxsize=8)
+def _is_default_classifier(re_url, re_hex_color, re_rgb_color, re_hsl_color, code_indicators) -> bool:
+    patterns = (re_url, re_hex_color, re_rgb_color, re_hsl_color)
+    defaults = (RE_URL, RE_HEX_COLOR, RE_RGB_COLOR, RE_HSL_COLOR)
+    return all(
+        getattr(pattern, "pattern", None) == default.pattern and getattr(pattern, "flags", None) == default.flags
+        for pattern, default in zip(patterns, defaults)
+    ) and frozenset(code_indicators) == CODE_INDICATORS
 
 
 def analyze_text_impl(text, re_url, re_hex_color, re_rgb_color, re_hsl_color, code_indicators):
+    # MainWindow는 core와 같은 패턴을 넘긴다. 그때는 공용 단일 패스 분류기(캐시 포함)를 쓴다.
+    # 같은 패턴 객체로 반복 호출되므로 비교 결과는 캐시한다.
+    if _is_default_classifier(re_url, re_hex_color, re_rgb_color, re_hsl_color, frozenset(code_indicators)):
+        return classify_text(text)
     if re_url.match(text):
         return "LINK"
     if re_hex_color.match(text):
@@ -5,21 +5,31 @@ from __future__ import annotations
 from .pipeline import (
     analyze_text_impl,
     apply_copy_rules_impl,
+    capture_metrics_impl,
+    copy_rule_stats_impl,
     on_clipboard_change_impl,
     process_actions_impl,
     process_clipboard_impl,
     process_file_clipboard_impl,
     process_image_clipboard_impl,
     process_text_clipboard_impl,
+    request_thumbnail_backfill_impl,
+    reset_copy_rule_stats_impl,
+    shutdown_text_capture_impl,
 )
 
 __all__ = [
     "analyze_text_impl",
     "apply_copy_rules_impl",
+    "capture_metrics_impl",
+    "copy_rule_stats_impl",
     "on_clipboard_change_impl",
     "process_actions_impl",
     "process_clipboard_impl",
     "process_file_clipboard_impl",
     "process_image_clipboard_impl",
     "process_text_clipboard_impl",
+    "request_thumbnail_backfill_impl",
+    "reset_copy_rule_stats_impl",
+    "shutdown_text_capture_impl",
 ]
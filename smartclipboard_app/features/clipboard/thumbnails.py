@@ -0,0 +1,139 @@
+"""Image thumbnails: rendered on the capture thread, served from a bounded QPixmapCache."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+from typing import Iterable
+
+from PyQt6.QtCore import QBuffer, QByteArray, Qt
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache
+
+logger = logging.getLogger(__name__)
+
+# 저장되는 썸네일의 긴 변. 상세 창은 이 크기까지, 표/미니 창은 축소본을 쓴다.
+THUMBNAIL_MAX_SIDE = 320
+# 표/미니 창 아이콘 크기
+THUMBNAIL_ICON_SIZE = 24
+# QPixmapCache 전체 예산 (KB). 320px 썸네일 약 400KB 기준 수십 장 + 아이콘 수백 개.
+THUMBNAIL_CACHE_LIMIT_KB = 24 * 1024
+
+_cache_ids = itertools.count(1)
+
+
+def qimage_thumbnail(image: QImage) -> bytes | None:
+    """PNG thumbnail (longest side THUMBNAIL_MAX_SIDE) of image. Safe to call off the UI thread."""
+    if image.isNull():
+        return None
+    if image.width() > THUMBNAIL_MAX_SIDE or image.height() > THUMBNAIL_MAX_SIDE:
+        image = image.scaled(
+            THUMBNAIL_MAX_SIDE,
+            THUMBNAIL_MAX_SIDE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QBuffer.OpenModeFlag.WriteOnly)
+    saved = image.save(buffer, "PNG")
+    buffer.close()
+    return data.data() if saved else None
+
+
+def blob_thumbnail(blob: bytes) -> bytes | None:
+    return qimage_thumbnail(QImage.fromData(blob))
+
+
+def backfill_image_thumbnails(db, limit: int = 50) -> int:
+    """Render thumbnails for IMAGE rows stored without one; undecodable rows are marked empty."""
+    if not callable(getattr(db, "get_images_missing_thumbnail", None)):
+        return 0
+    thumbnails = []
+    for item_id, blob in db.get_images_missing_thumbnail(limit):
+        thumbnail = blob_thumbnail(blob)
+        if thumbnail is None:
+            logger.debug("Thumbnail backfill skipped undecodable item %s", item_id)
+        thumbnails.append((item_id, thumbnail))
+    return db.set_image_thumbnails(thumbnails) if thumbnails else 0
+
+
+class ThumbnailCache:
+    """Decoded thumbnails per (item id, size) in the global QPixmapCache.
+
+    QPixmapCache evicts least-recently-used pixmaps once the explicit budget is
+    reached, so memory stays bounded however many images the history holds.
+    Misses are fetched from the thumbnail column in one query per call; the
+    full image blob is never touched. Must be used on the UI thread.
+    """
+
+    def __init__(self, db, limit_kb: int = THUMBNAIL_CACHE_LIMIT_KB):
+        self.db = db
+        self._prefix = f"smartclipboard-thumb-{next(_cache_ids)}"
+        self._sizes: set[int] = {0}
+        QPixmapCache.setCacheLimit(int(limit_kb))
+
+    def _key(self, item_id: int, size: int) -> str:
+        return f"{self._prefix}:{item_id}:{size}"
+
+    def pixmap(self, item_id: int, size: int = 0) -> QPixmap | None:
+        return self.pixmaps([item_id], size).get(int(item_id))
+
+    def pixmaps(self, item_ids: Iterable[int], size: int = 0) -> dict[int, QPixmap]:
+        """{item_id: pixmap} scaled to fit size x size (0 = stored thumbnail); missing ids are left out."""
+        result: dict[int, QPixmap] = {}
+        base: dict[int, QPixmap] = {}
+        misses: list[int] = []
+        for item_id in dict.fromkeys(int(item_id) for item_id in item_ids):
+            cached = QPixmapCache.find(self._key(item_id, size))
+            if cached is not None and not cached.isNull():
+                result[item_id] = cached
+                continue
+            stored = QPixmapCache.find(self._key(item_id, 0)) if size else None
+            if stored is not None and not stored.isNull():
+                base[item_id] = stored
+            else:
+                misses.append(item_id)
+
+        if misses:
+            has_thumbnails = callable(getattr(self.db, "get_thumbnails", None))
+            fetched = self.db.get_thumbnails(misses) if has_thumbnails else {}
+            for item_id, data in fetched.items():
+                pixmap = QPixmap()
+                if data and pixmap.loadFromData(data):
+                    QPixmapCache.insert(self._key(item_id, 0), pixmap)
+                    base[item_id] = pixmap
+
+        for item_id, pixmap in base.items():
+            if size:
+                self._sizes.add(size)
+                pixmap = pixmap.scaled(
+                    size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+                )
+                QPixmapCache.insert(self._key(item_id, size), pixmap)
+            result[item_id] = pixmap
+        return result
+
+    def invalidate(self, item_id: int) -> None:
+        """Drop every cached size of item_id (its image was replaced)."""
+        for size in self._sizes:
+            QPixmapCache.remove(self._key(int(item_id), size))
+
+
+def get_thumbnail_cache(owner) -> ThumbnailCache:
+    """The ThumbnailCache bound to owner.db, created on first use."""
+    cache = getattr(owner, "_thumbnail_cache", None)
+    if cache is None or cache.db is not owner.db:
+        cache = owner._thumbnail_cache = ThumbnailCache(owner.db)
+    return cache
+
+
+__all__ = [
+    "THUMBNAIL_CACHE_LIMIT_KB",
+    "THUMBNAIL_ICON_SIZE",
+    "THUMBNAIL_MAX_SIDE",
+    "ThumbnailCache",
+    "backfill_image_thumbnails",
+    "blob_thumbnail",
+    "get_thumbnail_cache",
+    "qimage_thumbnail",
+]
@@ -1,8 +1,15 @@
 """History feature package."""
 
 from .controller import HistoryController
-from .menu import build_google_search_url, init_menu_impl, show_context_menu_impl
-from .view import get_display_items_impl, load_data_impl, on_selection_changed_impl, populate_table_impl, show_empty_state_impl
+from .menu import build_google_search_url, init_menu_impl, show_context_menu_impl, show_similar_images_impl
+from .view import (
+    get_display_items_impl,
+    load_data_impl,
+    on_selection_changed_impl,
+    populate_table_impl,
+    show_empty_state_impl,
+    show_full_image_impl,
+)
 
 __all__ = [
     "HistoryController",
@@ -14,4 +21,6 @@ __all__ = [
     "populate_table_impl",
     "show_context_menu_impl",
     "show_empty_state_impl",
+    "show_full_image_impl",
+    "show_similar_images_impl",
 ]
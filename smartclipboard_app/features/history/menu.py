@@ -46,6 +46,16 @@ def _sync_context_menu_selection(self, pos):
     return item
 
 
+def show_similar_images_impl(self, item_id=None, THEMES=None):
+    """Open the similar-images view for item_id, or every near-duplicate group."""
+    from smartclipboard_app.ui.dialogs.similar_images import SimilarImagesDialog
+
+    dialog = SimilarImagesDialog(self, self.db, item_id, themes=THEMES)
+    dialog.exec()
+    if dialog.deleted_count:
+        self.update_status_bar()
+
+
 def init_menu_impl(self, THEMES):
     menubar = _ensure(self.menuBar())
     file_menu = _ensure(menubar.addMenu("파일"))
@@ -89,6 +99,9 @@ def init_menu_impl(self, THEMES):
     action_stats = QAction("📊 히스토리 통계...", self)
     action_stats.triggered.connect(self.show_statistics)
     view_menu.addAction(action_stats)
+    action_similar = QAction("🖼️ 비슷한 이미지 찾기...", self)
+    action_similar.triggered.connect(lambda: show_similar_images_impl(self, THEMES=THEMES))
+    view_menu.addAction(action_similar)
     action_mini = QAction("📋 빠른 클립보드 (미니 창)", self)
     action_mini.setShortcut("Alt+V")
     action_mini.triggered.connect(self.toggle_mini_window)
@@ -251,5 +264,9 @@ def show_context_menu_impl(self, pos, THEMES, webbrowser):
             normalize_action.triggered.connect(lambda: self.transform_text("normalize"))
             json_action = _ensure(transform_menu.addAction("{ } JSON 포맷팅"))
             json_action.triggered.connect(lambda: self.transform_text("json"))
+        elif data:
+            menu.addSeparator()
+            similar_action = _ensure(menu.addAction("🖼️ 비슷한 이미지 찾기"))
+            similar_action.triggered.connect(lambda: show_similar_images_impl(self, pid, THEMES))
 
     menu.exec(_ensure(self.table.viewport()).mapToGlobal(pos))
@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 import datetime
+import logging
 
-from PyQt6.QtCore import QSize, Qt
-from PyQt6.QtGui import QColor, QPixmap
-from PyQt6.QtWidgets import QTableWidgetItem
+from PyQt6.QtCore import QSize, Qt, QTimer
+from PyQt6.QtGui import QColor, QIcon, QPixmap, QTextCursor
+from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
 
+from smartclipboard_app.features.clipboard.pipeline import request_thumbnail_backfill_impl
+from smartclipboard_app.features.clipboard.thumbnails import THUMBNAIL_ICON_SIZE, get_thumbnail_cache
 from smartclipboard_core.file_paths import (
     build_file_paths_detail_text,
     build_file_paths_tooltip,
     describe_file_paths_with_status,
     file_paths_from_content,
 )
+from smartclipboard_core.limits import LARGE_TEXT_PREVIEW_MAX_CHARS
+
+logger = logging.getLogger(__name__)
 
 
 def load_data_impl(self, THEMES, logger):
@@ -155,6 +161,15 @@ def populate_table_impl(self, items, theme, TYPE_ICONS):
     today = datetime.date.today()
     yesterday = today - datetime.timedelta(days=1)
 
+    image_ids = [item_data[0] for item_data in items if item_data[2] == "IMAGE"]
+    thumbnails = {}
+    if image_ids:
+        # 표에는 저장된 썸네일의 축소본만 쓴다 (원본 이미지는 디코딩하지 않음).
+        thumbnails = get_thumbnail_cache(self).pixmaps(image_ids, THUMBNAIL_ICON_SIZE)
+        self.table.setIconSize(QSize(THUMBNAIL_ICON_SIZE, THUMBNAIL_ICON_SIZE))
+        if len(thumbnails) < len(image_ids):
+            request_thumbnail_backfill_impl(self, logger)
+
     for row_idx, item_data in enumerate(items):
         pid, content, ptype, timestamp, pinned, use_count, pin_order = item_data
         self.table.insertRow(row_idx)
@@ -182,6 +197,9 @@ def populate_table_impl(self, items, theme, TYPE_ICONS):
 
         if ptype == "IMAGE":
             content_item.setToolTip("🖼️ 이미지 항목 - 더블클릭으로 미리보기")
+            thumbnail = thumbnails.get(pid)
+            if thumbnail is not None:
+                content_item.setIcon(QIcon(thumbnail))
         elif ptype == "FILE":
             file_paths = file_paths_from_content(content)
             content_item.setToolTip(build_file_paths_tooltip(file_paths))
@@ -238,25 +256,34 @@ def on_selection_changed_impl(self, HAS_QRCODE, THEMES):
     self.update_status_bar(selected_count)
 
     pid = self.get_selected_id()
+    # 이전 대용량 미리보기 스트리밍 중단
+    self._large_preview_token = getattr(self, "_large_preview_token", 0) + 1
+    _set_view_image_visible(self, False)
     if not pid:
         self.update_ui_state(False)
         return
 
-    data = self.db.get_content(pid)
+    type_item = self.table.item(self.table.currentRow(), 1)
+    row_type = type_item.data(Qt.ItemDataRole.UserRole + 1) if type_item is not None else None
+    has_large_info = callable(getattr(self.db, "get_large_clip_info", None))
+    large_info = self.db.get_large_clip_info(pid) if has_large_info and row_type != "IMAGE" else None
+    if row_type == "IMAGE":
+        # 상세 창은 썸네일로 충분하다. 원본 blob은 "원본 보기"에서만 불러온다.
+        data = ("", None, "IMAGE")
+    elif large_info is not None:
+        # 전체 본문을 한 번에 복원하지 않고 앞부분부터 표시
+        data = (large_info["prefix"], None, large_info["type"])
+    else:
+        data = self.db.get_content(pid)
     if data:
         content, blob, ptype = data
         theme = THEMES.get(self.current_theme, THEMES["dark"])
-        if ptype == "IMAGE" and blob:
+        if ptype == "IMAGE":
             self.detail_stack.setCurrentIndex(1)
-            pixmap = QPixmap()
-            pixmap.loadFromData(blob)
-            w, h = self.detail_image_lbl.width(), self.detail_image_lbl.height()
-            if w > 0 and h > 0:
-                self.detail_image_lbl.setPixmap(pixmap.scaled(QSize(w - 10, h - 10), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-            else:
-                self.detail_image_lbl.setPixmap(pixmap)
+            _show_image_thumbnail(self, pid, blob)
             self.tools_layout_visible(False)
             self.btn_save_img.setVisible(True)
+            _set_view_image_visible(self, True)
             self.btn_link.setEnabled(False)
             self.btn_google.setEnabled(False)
             if HAS_QRCODE:
@@ -279,7 +306,9 @@ def on_selection_changed_impl(self, HAS_QRCODE, THEMES):
             self.btn_link.setEnabled(ptype == "LINK")
             self.btn_google.setEnabled(True)
             if HAS_QRCODE:
-                self.btn_qr.setEnabled(True)
+                self.btn_qr.setEnabled(large_info is None)
+            if large_info is not None:
+                _start_large_text_preview(self, large_info)
             if ptype == "COLOR" and content.startswith("#"):
                 self.detail_text.setStyleSheet(f"background-color: {content}; color: {'black' if self.is_light_color(content) else 'white'};")
             else:
@@ -290,3 +319,85 @@ def on_selection_changed_impl(self, HAS_QRCODE, THEMES):
         self.btn_del.setEnabled(True)
         is_pinned = self.table.item(self.table.currentRow(), 0).text() == "📌"
         self.btn_pin.setText("📌 해제" if is_pinned else "📌 고정")
+
+
+def _set_view_image_visible(self, visible: bool) -> None:
+    button = getattr(self, "btn_view_img", None)
+    if button is not None:
+        button.setVisible(visible)
+
+
+def _show_image_thumbnail(self, pid, blob=None):
+    pixmap = get_thumbnail_cache(self).pixmap(pid)
+    if pixmap is None and blob:
+        pixmap = QPixmap()
+        pixmap.loadFromData(blob)
+    if pixmap is None or pixmap.isNull():
+        self.detail_image_lbl.setText("🖼️ 미리보기를 준비하는 중입니다...\n(원본 보기로 바로 열 수 있습니다)")
+        request_thumbnail_backfill_impl(self, logger)
+        return
+    w, h = self.detail_image_lbl.width() - 10, self.detail_image_lbl.height() - 10
+    # 썸네일보다 큰 창에서는 확대하지 않는다 (흐려짐 방지).
+    if w > 0 and h > 0 and (pixmap.width() > w or pixmap.height() > h):
+        pixmap = pixmap.scaled(QSize(w, h), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    self.detail_image_lbl.setPixmap(pixmap)
+
+
+def show_full_image_impl(self):
+    """Decode the selected image's full blob, only on explicit request."""
+    from smartclipboard_app.ui.dialogs.image_preview import ImagePreviewDialog
+
+    pid = self.get_selected_id()
+    data = self.db.get_content(pid) if pid else None
+    if not data or data[2] != "IMAGE" or not data[1]:
+        return
+    pixmap = QPixmap()
+    if not pixmap.loadFromData(data[1]):
+        QMessageBox.warning(self, "오류", "이미지를 불러올 수 없습니다.")
+        return
+    ImagePreviewDialog(self, pixmap, title=f"🖼️ 이미지 #{pid}").exec()
+
+
+def _start_large_text_preview(self, large_info):
+    total_chars = int(large_info.get("total_chars", 0))
+    stored_mb = int(large_info.get("stored_bytes", 0)) / (1024 * 1024)
+    try:
+        self.statusBar().showMessage(f"📦 대용량 텍스트: {total_chars:,}자 (압축 {stored_mb:.1f}MB)", 5000)
+    except Exception:
+        pass
+
+    chunks = self.db.iter_large_text_chunks(large_info["digest"])
+    state = {
+        "token": self._large_preview_token,
+        "skip": len(large_info.get("prefix") or ""),
+        "shown": len(large_info.get("prefix") or ""),
+    }
+
+    def _append_next_chunk():
+        if state["token"] != getattr(self, "_large_preview_token", None):
+            return
+        chunk = next(chunks, None)
+        if chunk is None:
+            return
+        if state["skip"]:
+            skipped = min(state["skip"], len(chunk))
+            chunk = chunk[skipped:]
+            state["skip"] -= skipped
+        remaining = LARGE_TEXT_PREVIEW_MAX_CHARS - state["shown"]
+        truncated = len(chunk) > remaining
+        if truncated:
+            chunk = chunk[:remaining]
+        if chunk:
+            cursor = self.detail_text.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(chunk)
+            state["shown"] += len(chunk)
+        if truncated or state["shown"] >= LARGE_TEXT_PREVIEW_MAX_CHARS:
+            if state["shown"] < total_chars:
+                cursor = self.detail_text.textCursor()
+                cursor.movePosition(QTextCursor.MoveOperation.End)
+                cursor.insertText(f"\n\n… (미리보기는 {state['shown']:,}자까지만 표시합니다. 복사 시 전체 {total_chars:,}자가 사용됩니다)")
+            return
+        QTimer.singleShot(0, _append_next_chunk)
+
+    QTimer.singleShot(0, _append_next_chunk)
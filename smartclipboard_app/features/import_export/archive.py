@@ -0,0 +1,169 @@
+"""Zip archive export format: manifest + JSON-lines metadata + raw image entries.
+
+Unlike the JSON export, images are stored as their original bytes (no base64
+inflation, no encode/decode pass) in uncompressed zip entries, and
+``items.jsonl`` refers to them by entry name. Both sides stream: the writer
+keeps only one item in memory (item lines are spooled while image entries go
+straight into the zip) and the reader pulls items line by line and each image
+from its own entry through the zip central directory.
+"""
+
+from __future__ import annotations
+
+import datetime
+import io
+import json
+import shutil
+import tempfile
+import zipfile
+from typing import Any, Iterator
+
+from smartclipboard_core.image_format import IMAGE_FILE_EXTENSIONS, sniff_image_format
+from smartclipboard_core.limits import IMAGE_CLIPBOARD_MAX_BYTES
+
+from .json_stream import iter_jsonl_items
+from .streaming import ExportRowStream, build_item_fields, collection_payloads, write_json_object
+
+ARCHIVE_FORMAT = "smartclipboard-archive"
+ARCHIVE_VERSION = 1
+ARCHIVE_MANIFEST = "manifest.json"
+ARCHIVE_ITEMS = "items.jsonl"
+ARCHIVE_IMAGE_DIR = "images/"
+# 이 크기를 넘는 items.jsonl만 디스크 임시 파일로 넘긴다.
+ARCHIVE_SPOOL_BYTES = 8 * 1024 * 1024
+
+
+def image_entry_name(item_id: int, data: bytes) -> str:
+    extension = IMAGE_FILE_EXTENSIONS.get(sniff_image_format(data) or "", ".bin")
+    return f"{ARCHIVE_IMAGE_DIR}{int(item_id):08d}{extension}"
+
+
+def write_archive_export(
+    path: str,
+    db,
+    stream: ExportRowStream,
+    include_metadata: bool,
+    version: str,
+    report: dict[str, Any],
+) -> None:
+    image_count = 0
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as zf, tempfile.SpooledTemporaryFile(
+        max_size=ARCHIVE_SPOOL_BYTES
+    ) as spool:
+        items_fh = io.TextIOWrapper(spool, encoding="utf-8", newline="\n")
+        for row in stream:
+            fields = build_item_fields(stream, row, include_metadata, report)
+            if fields is None:
+                continue
+            # build_item_fields()가 바이너리 없는 IMAGE 행은 이미 건너뛰었다.
+            if row.type == "IMAGE" and row.image_data is not None:
+                name = image_entry_name(row.id, row.image_data)
+                # PNG/JPEG는 이미 압축돼 있어 다시 deflate하면 시간만 든다.
+                zf.writestr(name, row.image_data, compress_type=zipfile.ZIP_STORED)
+                fields = [("image_entry", name) if key == "image_data_b64" else (key, value) for key, value in fields]
+                image_count += 1
+            fields.append(("id", row.id))
+            write_json_object(items_fh, fields)
+            items_fh.write("\n")
+            report["exported"] += 1
+        items_fh.flush()
+        spool.seek(0)
+        with zf.open(ARCHIVE_ITEMS, "w", force_zip64=True) as dst:
+            shutil.copyfileobj(spool, dst)
+        items_fh.detach()
+
+        manifest: dict[str, Any] = {
+            "format": ARCHIVE_FORMAT,
+            "archive_version": ARCHIVE_VERSION,
+            "app": "SmartClipboard Pro",
+            "version": version,
+            "exported_at": datetime.datetime.now().isoformat(),
+            "migration_mode": bool(include_metadata),
+            "item_count": report["exported"],
+            "image_count": image_count,
+            "items": ARCHIVE_ITEMS,
+        }
+        if include_metadata:
+            manifest["collections"] = collection_payloads(db, report)
+        zf.writestr(ARCHIVE_MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=2))
+
+
+class ArchiveReader:
+    """Read side of the archive; entries are opened lazily from the zip directory."""
+
+    def __init__(self, path: str):
+        self._zf = zipfile.ZipFile(path, "r")
+        try:
+            self.manifest = self._read_manifest()
+            self._items_entry = str(self.manifest.get("items") or ARCHIVE_ITEMS)
+            if self._items_entry not in self._zf.NameToInfo:
+                raise ValueError(f"archive is missing {self._items_entry}")
+        except Exception:
+            self._zf.close()
+            raise
+
+    def _read_manifest(self) -> dict[str, Any]:
+        try:
+            with self._zf.open(ARCHIVE_MANIFEST) as fh:
+                manifest = json.load(io.TextIOWrapper(fh, encoding="utf-8"))
+        except KeyError as exc:
+            raise ValueError("archive manifest.json is missing") from exc
+        if not isinstance(manifest, dict) or manifest.get("format") != ARCHIVE_FORMAT:
+            raise ValueError("not a SmartClipboard archive")
+        try:
+            archive_version = int(manifest.get("archive_version", 0))
+        except (TypeError, ValueError):
+            archive_version = 0
+        if not 1 <= archive_version <= ARCHIVE_VERSION:
+            raise ValueError(f"unsupported archive version: {manifest.get('archive_version')}")
+        return manifest
+
+    def close(self) -> None:
+        self._zf.close()
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def iter_items(self) -> Iterator[Any]:
+        with self._zf.open(self._items_entry) as raw:
+            yield from iter_jsonl_items(io.TextIOWrapper(raw, encoding="utf-8"))
+
+    def _image_info(self, payload: dict[str, Any]) -> zipfile.ZipInfo | None:
+        name = payload.get("image_entry")
+        if not isinstance(name, str) or not name.startswith(ARCHIVE_IMAGE_DIR):
+            return None
+        return self._zf.NameToInfo.get(name)
+
+    def image_size(self, payload: dict[str, Any]) -> int | None:
+        """Size of payload["image_entry"] from the zip directory, without reading it."""
+        info = self._image_info(payload)
+        return None if info is None else info.file_size
+
+    def load_image(self, payload: dict[str, Any]) -> bytes | None:
+        """Raw bytes of payload["image_entry"]; None when the entry is missing.
+
+        Oversized entries are read only up to one byte past the import limit
+        so the size check rejects them without inflating the whole entry.
+        """
+        info = self._image_info(payload)
+        if info is None:
+            return None
+        with self._zf.open(info) as fh:
+            if info.file_size > IMAGE_CLIPBOARD_MAX_BYTES:
+                return fh.read(IMAGE_CLIPBOARD_MAX_BYTES + 1)
+            try:
+                return fh.read()
+            except zipfile.BadZipFile as exc:
+                raise ValueError(str(exc)) from exc
+
+
+__all__ = [
+    "ARCHIVE_FORMAT",
+    "ARCHIVE_VERSION",
+    "ArchiveReader",
+    "image_entry_name",
+    "write_archive_export",
+]
@@ -125,6 +125,63 @@ def validate_restore_database(path: str, mode: str = "full") -> tuple[bool, str
     return True, None
 
 
+def find_latest_good_backup(app_dir: str) -> tuple[str, str] | None:
+    """Return (path, profile) of the newest backup that passes integrity_check."""
+    backup_dir = os.path.join(app_dir, "backups")
+    try:
+        names = [
+            name
+            for name in os.listdir(backup_dir)
+            if name.endswith(".db") and name.startswith(("clipboard_history_", "pre_import_", "pre_restore_"))
+        ]
+    except OSError:
+        return None
+
+    candidates = sorted(
+        (os.path.join(backup_dir, name) for name in names),
+        key=lambda path: os.path.getmtime(path),
+        reverse=True,
+    )
+    fallback: tuple[str, str] | None = None
+    for path in candidates:
+        is_valid, _error, profile = inspect_restore_database(path)
+        if not is_valid:
+            continue
+        if profile == "full":
+            return path, profile
+        if fallback is None:
+            fallback = (path, profile)
+    return fallback
+
+
+def preserve_corrupt_database(db_path: str, app_dir: str) -> str | None:
+    """Copy a damaged DB aside before it is replaced, for later inspection.
+
+    The DB must already be closed. The -wal/-shm sidecars are copied next to
+    the .db, because transactions not yet checkpointed live only in the WAL.
+    Returns None (and leaves no partial copy) if any file could not be copied.
+    """
+    backup_dir = os.path.join(app_dir, "backups")
+    target = os.path.join(backup_dir, f"corrupt_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.db")
+    copied: list[str] = []
+    try:
+        os.makedirs(backup_dir, exist_ok=True)
+        for suffix in ("", "-wal", "-shm"):
+            source = f"{db_path}{suffix}"
+            if suffix and not os.path.exists(source):
+                continue
+            shutil.copy2(source, f"{target}{suffix}")
+            copied.append(f"{target}{suffix}")
+    except OSError:
+        for path in copied:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return None
+    return target
+
+
 def _remove_sqlite_sidecars(db_path: str) -> None:
     for suffix in ("-wal", "-shm"):
         sidecar = f"{db_path}{suffix}"
@@ -156,7 +213,9 @@ def replace_database_from_backup(source_path: str, target_path: str) -> None:
 __all__ = [
     "create_pre_import_backup",
     "create_pre_restore_backup",
+    "find_latest_good_backup",
     "inspect_restore_database",
+    "preserve_corrupt_database",
     "replace_database_from_backup",
     "validate_restore_database",
 ]
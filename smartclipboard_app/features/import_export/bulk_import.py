@@ -0,0 +1,100 @@
+"""Batched writer used by the JSON/JSONL/CSV importers."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, NamedTuple
+
+IMPORT_BATCH_SIZE = 1000
+
+# collection_id 키가 없는 항목 (None은 "연결 해제"라는 뜻이라 구분한다)
+NO_COLLECTION = object()
+
+
+class ImportRecord(NamedTuple):
+    content: str
+    image_data: bytes | None
+    type: str
+    timestamp: str
+    metadata: dict[str, Any]
+    collection: Any = NO_COLLECTION
+
+
+class BulkImporter:
+    """Buffer validated records and write them a batch at a time inside the caller's transaction.
+
+    Duplicates are resolved against a digest index built once up front;
+    collection links are resolved in finish() because a JSON export may list
+    its collections after the items. An optional image_stage (see
+    image_prepare.ImagePrepareStage) decodes images on worker threads before
+    they reach the batch; writes stay on the caller's thread.
+    """
+
+    def __init__(self, db, cursor, report: dict[str, Any], batch_size: int | None = None, image_stage: Any = None):
+        self.db = db
+        self.cursor = cursor
+        self.report = report
+        self.batch_size = max(int(batch_size or IMPORT_BATCH_SIZE), 1)
+        self.image_stage = image_stage
+        self.index = db._build_dedupe_index_locked(cursor)
+        self._batch: list[ImportRecord] = []
+        self._collections: list[tuple[int, Any]] = []
+        self._next_pin_order: int | None = None
+
+    def add(self, record: ImportRecord) -> None:
+        if self.image_stage is None:
+            self._append(record)
+            return
+        for ready in self.image_stage.push(record):
+            self._append(ready)
+
+    def _append(self, record: ImportRecord) -> None:
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        results = self.db._add_items_bulk_locked(
+            self.cursor,
+            [(record.content, record.image_data, record.type, record.timestamp, record.metadata) for record in batch],
+            self.index,
+        )
+        for record, (item_id, _updated_existing) in zip(batch, results):
+            if not item_id:
+                self.report["skipped"] += 1
+                continue
+            if record.collection is not NO_COLLECTION:
+                self._collections.append((item_id, record.collection))
+            self.report["imported"] += 1
+
+    def next_pin_order(self) -> int:
+        if self._next_pin_order is None:
+            self.cursor.execute("SELECT COALESCE(MAX(pin_order), -1) + 1 FROM history WHERE pinned = 1")
+            row = self.cursor.fetchone()
+            self._next_pin_order = int(row[0] or 0) if row else 0
+        order = self._next_pin_order
+        self._next_pin_order += 1
+        return order
+
+    def finish(self, resolve_collection: Callable[[Any], int | None] | None = None) -> None:
+        if self.image_stage is not None:
+            for ready in self.image_stage.drain():
+                self._append(ready)
+        self.flush()
+        if not self._collections:
+            return
+        resolve = resolve_collection or (lambda _value: None)
+        self.db._set_items_metadata_bulk_locked(
+            self.cursor,
+            [(item_id, {"collection_id": resolve(value)}) for item_id, value in self._collections],
+        )
+        self._collections = []
+
+    def close(self) -> None:
+        if self.image_stage is not None:
+            self.image_stage.close()
+
+
+__all__ = ["IMPORT_BATCH_SIZE", "NO_COLLECTION", "BulkImporter", "ImportRecord"]
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import os
 
+from smartclipboard_core.classifier import classify_text
 from smartclipboard_core.file_paths import (
     file_content_from_paths,
     file_paths_from_content,
     normalize_import_file_path,
 )
 
+from .bulk_import import ImportRecord
 from .reports import append_warning
 
 
@@ -25,8 +27,12 @@ def _parse_csv_nonnegative_int(value: str) -> int:
     return max(parsed, 0)
 
 
-def export_csv_rows(writer, items, report: dict, logger):
-    writer.writerow(["내용", "유형", "시간", "고정", "사용횟수"])
+CSV_EXPORT_HEADER = ["내용", "유형", "시간", "고정", "사용횟수"]
+
+
+def export_csv_rows(writer, items, report: dict, logger, write_header: bool = True):
+    if write_header:
+        writer.writerow(CSV_EXPORT_HEADER)
     for item in items:
         _pid, content, item_type, timestamp, pinned, use_count, _pin_order = item
         if item_type == "IMAGE":
@@ -44,19 +50,27 @@ def export_csv_rows(writer, items, report: dict, logger):
         report["exported"] += 1
 
 
-def import_csv_row_locked(db, cursor, row: list[str], report: dict, valid_item_types: set[str], normalize_timestamp):
+def build_csv_import_record(
+    row: list[str],
+    report: dict,
+    valid_item_types: set[str],
+    normalize_timestamp,
+    next_pin_order,
+) -> ImportRecord | None:
+    """Validate one CSV row; None (with the report updated) when it has to be skipped."""
     if len(row) < 2:
         report["skipped"] += 1
-        return
+        return None
 
     content, item_type = row[0], row[1]
     if item_type not in valid_item_types:
-        item_type = "TEXT"
+        # 유형 열이 비었거나 알 수 없으면 캡처와 같은 분류기로 정한다.
+        item_type = classify_text(str(content or "").strip())
 
     if item_type == "IMAGE":
         report["skipped"] += 1
         append_warning(report, "CSV import는 IMAGE 바이너리를 복원하지 않아 이미지 행을 건너뜁니다.")
-        return
+        return None
 
     if item_type == "FILE":
         file_paths = []
@@ -77,34 +91,27 @@ def import_csv_row_locked(db, cursor, row: list[str], report: dict, valid_item_t
         if not file_paths:
             report["skipped"] += 1
             append_warning(report, "CSV의 FILE 행 중 유효한 경로가 없는 항목을 건너뛰었습니다.")
-            return
+            return None
         content = file_content_from_paths(file_paths)
 
     if not content:
         report["skipped"] += 1
-        return
+        return None
 
     timestamp = row[2] if len(row) > 2 else None
-    normalized_timestamp = normalize_timestamp(timestamp)
-    item_id, _updated_existing = db._add_item_locked(cursor, content, None, item_type, timestamp=normalized_timestamp)
-    if not item_id:
-        report["skipped"] += 1
-        return
     pinned = _parse_csv_bool(row[3]) if len(row) > 3 else False
     use_count = _parse_csv_nonnegative_int(row[4]) if len(row) > 4 else 0
-    pin_order = 0
-    if pinned:
-        cursor.execute("SELECT COALESCE(MAX(pin_order), -1) + 1 FROM history WHERE pinned = 1 AND id != ?", (item_id,))
-        pin_order_row = cursor.fetchone()
-        pin_order = int(pin_order_row[0] or 0) if pin_order_row else 0
-    db._set_item_metadata_locked(
-        cursor,
-        int(item_id),
-        pinned=1 if pinned else 0,
-        pin_order=pin_order,
-        use_count=use_count,
+    return ImportRecord(
+        content=content,
+        image_data=None,
+        type=item_type,
+        timestamp=normalize_timestamp(timestamp),
+        metadata={
+            "pinned": 1 if pinned else 0,
+            "pin_order": next_pin_order() if pinned else 0,
+            "use_count": use_count,
+        },
     )
-    report["imported"] += 1
 
 
-__all__ = ["export_csv_rows", "import_csv_row_locked"]
+__all__ = ["CSV_EXPORT_HEADER", "build_csv_import_record", "export_csv_rows"]
@@ -0,0 +1,132 @@
+"""Dry-run counterpart of BulkImporter: classify records without writing.
+
+Records go through the same validation as a real import; instead of being
+written they are matched against the dedupe index (built on a read-only
+connection) and counted as would-insert or would-merge.
+"""
+
+from __future__ import annotations
+
+import binascii
+import hashlib
+from typing import Any, Callable
+
+from smartclipboard_core.db_parts.history.bulk import content_digest
+from smartclipboard_core.file_paths import file_paths_from_content, file_signature_from_paths
+from smartclipboard_core.large_text import is_large_text
+
+from .bulk_import import NO_COLLECTION, ImportRecord
+
+# base64 알파벳 (bytes.translate로 지우고 남는 글자가 있으면 손상된 값, 패딩은 끝에만)
+_B64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+
+class ValidatedImage:
+    """Stand-in for image bytes whose size is known but which were not decoded."""
+
+    __slots__ = ("size",)
+
+    def __init__(self, size: int):
+        self.size = int(size)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+
+def validate_image_b64(payload: dict[str, Any]) -> ValidatedImage | None:
+    """Check image_data_b64 without decoding it; ValueError when it is damaged."""
+    text = payload.get("image_data_b64")
+    if not text:
+        return None
+    if not isinstance(text, str) or not text.isascii() or len(text) % 4:
+        raise binascii.Error("invalid base64 image data")
+    data = text.encode("ascii")
+    stripped = data.rstrip(b"=")
+    padding = len(data) - len(stripped)
+    if padding > 2 or stripped.translate(None, _B64_ALPHABET):
+        raise binascii.Error("invalid base64 image data")
+    return ValidatedImage(len(data) // 4 * 3 - padding)
+
+
+def archive_image_validator(archive) -> Callable[[dict[str, Any]], ValidatedImage | None]:
+    """image_loader for ArchiveReader payloads that only looks at the zip directory."""
+
+    def validate(payload: dict[str, Any]) -> ValidatedImage | None:
+        size = archive.image_size(payload)
+        return None if size is None else ValidatedImage(size)
+
+    return validate
+
+
+class DryRunImporter:
+    """Same interface as BulkImporter; fills report["dry_run"] instead of the DB."""
+
+    def __init__(self, db, cursor, report: dict[str, Any], batch_size: int | None = None):
+        self.db = db
+        self.cursor = cursor
+        self.report = report
+        self.stats = report.setdefault("dry_run", {"would_insert": 0, "would_merge": 0})
+        self.index = db._build_dedupe_index_locked(cursor)
+        self._large_digests: set[str] = set()
+        self._collections: list[Any] = []
+        self._next_pin_order: int | None = None
+
+    def _is_duplicate(self, record: ImportRecord) -> bool | None:
+        """True/False for a merge/insert, None when the record would be dropped."""
+        if record.type == "IMAGE":
+            return False
+        if record.type == "FILE":
+            paths = file_paths_from_content(record.content)
+            if not paths:
+                return None
+            signature = file_signature_from_paths(paths)
+            if signature in self.index.files:
+                return True
+            self.index.files[signature] = 0
+            return False
+        if is_large_text(record.content):
+            digest = hashlib.sha256(record.content.encode("utf-8", errors="surrogatepass")).hexdigest()
+            if digest in self._large_digests:
+                return True
+            self._large_digests.add(digest)
+            self.cursor.execute("SELECT 1 FROM history WHERE large_digest = ? LIMIT 1", (digest,))
+            return self.cursor.fetchone() is not None
+        key = content_digest(record.content)
+        if key in self.index.text:
+            return True
+        self.index.text[key] = 0
+        return False
+
+    def add(self, record: ImportRecord) -> None:
+        duplicate = self._is_duplicate(record)
+        if duplicate is None:
+            self.report["skipped"] += 1
+            return
+        self.stats["would_merge" if duplicate else "would_insert"] += 1
+        if record.collection is not NO_COLLECTION:
+            self._collections.append(record.collection)
+
+    def flush(self) -> None:
+        pass
+
+    def next_pin_order(self) -> int:
+        if self._next_pin_order is None:
+            self.cursor.execute("SELECT COALESCE(MAX(pin_order), -1) + 1 FROM history WHERE pinned = 1")
+            row = self.cursor.fetchone()
+            self._next_pin_order = int(row[0] or 0) if row else 0
+        order = self._next_pin_order
+        self._next_pin_order += 1
+        return order
+
+    def finish(self, resolve_collection: Callable[[Any], int | None] | None = None) -> None:
+        # collection_summary 집계만 하고 결과는 버린다.
+        if resolve_collection is not None:
+            for value in self._collections:
+                resolve_collection(value)
+        self._collections = []
+
+
+__all__ = ["DryRunImporter", "ValidatedImage", "archive_image_validator", "validate_image_b64"]
@@ -0,0 +1,95 @@
+"""Parallel decode/verify stage for imported images, feeding the single DB writer in order.
+
+Decoding a blob (QImage.fromData), scaling it for the perceptual hash and
+rendering the thumbnail all release the GIL inside Qt, so a small thread
+pool overlaps that work across cores while the import thread keeps every
+DB write in one transaction. Records leave the stage in the order they were
+pushed; at most `window` of them are in flight, which bounds memory.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator
+
+from PyQt6.QtGui import QImage
+
+from smartclipboard_app.features.clipboard.image_hash import qimage_dhash
+from smartclipboard_app.features.clipboard.thumbnails import qimage_thumbnail
+from smartclipboard_core.image_hash import IMAGE_HASH_UNDECODABLE
+
+from .bulk_import import ImportRecord
+
+logger = logging.getLogger(__name__)
+
+# 작업 스레드 수. 스레드마다 처리 중인 이미지(최대 5MB)를 두 장까지 들고 있는다.
+IMPORT_IMAGE_WORKERS = min(os.cpu_count() or 1, 8)
+
+
+def prepare_image_record(record: ImportRecord) -> ImportRecord:
+    """record with image_hash and thumbnail filled in; undecodable images get the empty markers.
+
+    Runs on a worker thread and never touches the DB.
+    """
+    image = QImage.fromData(record.image_data or b"")
+    if image.isNull():
+        logger.debug("Imported image could not be decoded; storing it without hash or thumbnail")
+        image_hash, thumbnail = IMAGE_HASH_UNDECODABLE, b""
+    else:
+        image_hash = qimage_dhash(image)
+        thumbnail = qimage_thumbnail(image) or b""
+        if image_hash is None:
+            image_hash = IMAGE_HASH_UNDECODABLE
+    return record._replace(metadata={**record.metadata, "image_hash": image_hash, "thumbnail": thumbnail})
+
+
+class ImagePrepareStage:
+    """Ordered, bounded window over a lazily started ThreadPoolExecutor.
+
+    Non-image records pass straight through but still wait behind earlier
+    images, so the writer sees records in file order.
+    """
+
+    def __init__(self, workers: int = IMPORT_IMAGE_WORKERS, window: int | None = None):
+        self.workers = max(int(workers), 1)
+        self.window = max(int(window or self.workers * 2), 1)
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: deque[Future] = deque()
+
+    def push(self, record: ImportRecord) -> list[ImportRecord]:
+        """Queue record; returns the records that are ready to be written, in order."""
+        if record.type == "IMAGE" and record.image_data:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ImportImage")
+            self._pending.append(self._executor.submit(prepare_image_record, record))
+        elif not self._pending:
+            return [record]
+        else:
+            done: Future = Future()
+            done.set_result(record)
+            self._pending.append(done)
+        ready = []
+        # 창이 가득 차면 가장 오래된 이미지를 기다린다 (역압).
+        while self._pending and (len(self._pending) > self.window or self._pending[0].done()):
+            ready.append(self._pending.popleft().result())
+        return ready
+
+    def drain(self) -> Iterator[ImportRecord]:
+        """Yield every remaining record in order."""
+        while self._pending:
+            yield self._pending.popleft().result()
+
+    def close(self) -> None:
+        """Stop the workers; records still queued are discarded (the import failed)."""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+__all__ = ["IMPORT_IMAGE_WORKERS", "ImagePrepareStage", "prepare_image_record"]
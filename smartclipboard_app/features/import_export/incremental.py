@@ -0,0 +1,70 @@
+"""Watermarks for incremental (delta) exports."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+from typing import Any
+
+WATERMARK_SETTING_PREFIX = "export_watermark:"
+APPENDABLE_FORMATS = ("jsonl", "csv")
+INCREMENTAL_FORMATS = ("jsonl", "csv", "json", "markdown")
+CHANGE_FEED_PAGE = 5000
+
+
+def default_target(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def watermark_key(target: str) -> str:
+    """Settings key for an export target (an output path or a caller-chosen name)."""
+    return f"{WATERMARK_SETTING_PREFIX}{target}"
+
+
+def load_watermark(db, target: str) -> dict[str, Any] | None:
+    raw = db.get_setting(watermark_key(target), "")
+    if not raw:
+        return None
+    try:
+        data = json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("seq"), int):
+        return None
+    return data
+
+
+def save_watermark(db, target: str, seq: int, fmt: str, exported: int) -> bool:
+    payload = {
+        "seq": int(seq),
+        "format": fmt,
+        "exported": int(exported),
+        "updated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    return db.set_setting(watermark_key(target), json.dumps(payload)) is not False
+
+
+def collect_changed_item_ids(db, since_seq: int) -> list[int] | None:
+    """History ids inserted/updated after since_seq, or None when a full export is needed."""
+    changed: set[int] = set()
+    seq = int(since_seq)
+    while True:
+        feed = db.changes_since(seq, limit=CHANGE_FEED_PAGE, entities=["history"])
+        if feed.get("reset"):
+            return None
+        changed.update(change["id"] for change in feed["changes"] if change["op"] != "delete")
+        seq = feed["last_seq"]
+        if not feed.get("has_more"):
+            return sorted(changed)
+
+
+__all__ = [
+    "APPENDABLE_FORMATS",
+    "INCREMENTAL_FORMATS",
+    "collect_changed_item_ids",
+    "default_target",
+    "load_watermark",
+    "save_watermark",
+    "watermark_key",
+]
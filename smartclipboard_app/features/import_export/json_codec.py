@@ -4,17 +4,24 @@ from __future__ import annotations
 
 import base64
 import binascii
-import datetime
-from typing import Any
+from typing import Any, Callable
 
+from smartclipboard_core.classifier import classify_text
 from smartclipboard_core.file_paths import file_content_from_paths
 from smartclipboard_core.limits import IMAGE_CLIPBOARD_MAX_BYTES
 
+from .bulk_import import NO_COLLECTION, ImportRecord
 from .reports import append_warning
 
 
-def import_collections_locked(db, cursor, payload, report: dict[str, Any]) -> dict[int, int]:
+def import_collections_locked(db, cursor, payload, report: dict[str, Any], dry_run: bool = False) -> dict[int, int]:
+    """Create/reuse collections by name; legacy_id -> local id.
+
+    A dry run only looks names up: collections it would create are mapped to
+    negative placeholder ids so item links still count as remapped.
+    """
     collection_id_map: dict[int, int] = {}
+    planned: dict[str, int] = {}
     if not isinstance(payload, list):
         return collection_id_map
 
@@ -32,15 +39,19 @@ def import_collections_locked(db, cursor, payload, report: dict[str, Any]) -> di
             continue
 
         existing = db._get_collection_by_name_locked(cursor, name)
-        if existing:
+        existing_id = int(existing[0]) if existing else planned.get(name)
+        if existing_id is not None:
             if legacy_id is not None:
-                collection_id_map[legacy_id] = int(existing[0])
+                collection_id_map[legacy_id] = existing_id
             report["collection_summary"]["reused"] += 1
             continue
 
         icon = entry.get("icon") or "📁"
         color = entry.get("color") or "#6366f1"
-        new_id = db._add_collection_locked(cursor, name, icon, color)
+        if dry_run:
+            new_id = planned[name] = -(len(planned) + 1)
+        else:
+            new_id = db._add_collection_locked(cursor, name, icon, color)
         if isinstance(new_id, int) and legacy_id is not None:
             collection_id_map[legacy_id] = new_id
         if isinstance(new_id, int):
@@ -87,7 +98,8 @@ def _normalize_nonnegative_int_metadata(key: str, value: Any, report: dict[str,
     return parsed
 
 
-def build_item_metadata(payload: dict[str, Any], collection_id_map: dict[int, int], collections_payload_present: bool, report: dict[str, Any]) -> dict[str, Any]:
+def build_item_metadata(payload: dict[str, Any], report: dict[str, Any]) -> dict[str, Any]:
+    """Metadata columns from payload (collection_id is resolved separately)."""
     metadata: dict[str, Any] = {}
     for key in ("tags", "note", "url_title"):
         if key in payload and payload.get(key) is not None:
@@ -105,162 +117,96 @@ def build_item_metadata(payload: dict[str, Any], collection_id_map: dict[int, in
             if normalized_int is not None:
                 metadata[key] = normalized_int
 
-    if "collection_id" in payload:
-        remapped_collection_id = None
-        lookup_key = normalize_collection_lookup_key(payload.get("collection_id"))
-        if collections_payload_present and lookup_key in collection_id_map:
-            remapped_collection_id = collection_id_map[lookup_key]
-            report["collection_summary"]["remapped"] += 1
-        else:
-            report["collection_summary"]["cleared"] += 1
-            if lookup_key is not None:
-                append_warning(report, "일부 항목의 collection 연결을 찾지 못해 해제했습니다.")
-            elif payload.get("collection_id") is not None:
-                append_warning(report, "일부 항목의 collection_id 값이 잘못되어 해제했습니다.")
-        metadata["collection_id"] = remapped_collection_id
-
     return metadata
 
 
-def import_json_item_locked(
-    db,
-    cursor,
-    payload: dict[str, Any],
+def resolve_collection_id(
+    value: Any,
     collection_id_map: dict[int, int],
     collections_payload_present: bool,
     report: dict[str, Any],
+) -> int | None:
+    lookup_key = normalize_collection_lookup_key(value)
+    if collections_payload_present and lookup_key in collection_id_map:
+        report["collection_summary"]["remapped"] += 1
+        return collection_id_map[lookup_key]
+    report["collection_summary"]["cleared"] += 1
+    if lookup_key is not None:
+        append_warning(report, "일부 항목의 collection 연결을 찾지 못해 해제했습니다.")
+    elif value is not None:
+        append_warning(report, "일부 항목의 collection_id 값이 잘못되어 해제했습니다.")
+    return None
+
+
+def decode_image_data_b64(payload: dict[str, Any]) -> bytes | None:
+    image_data_b64 = payload.get("image_data_b64")
+    if not image_data_b64:
+        return None
+    return base64.b64decode(image_data_b64, validate=True)
+
+
+def build_json_import_record(
+    payload: dict[str, Any],
+    report: dict[str, Any],
     valid_item_types: set[str],
     normalize_timestamp,
     resolve_file_paths,
-) -> None:
+    image_loader: Callable[[dict[str, Any]], bytes | None] | None = None,
+) -> ImportRecord | None:
+    """Validate one JSON item; None (with the report updated) when it has to be skipped.
+
+    image_loader returns the raw bytes of an IMAGE item (None when absent,
+    ValueError when damaged); the default decodes image_data_b64.
+    """
     content = payload.get("content", "")
-    item_type = payload.get("type", "TEXT")
+    item_type = payload.get("type")
     if item_type not in valid_item_types:
-        item_type = "TEXT"
+        # 유형이 없거나 알 수 없으면 캡처와 같은 분류기로 정한다.
+        item_type = classify_text(str(content or "").strip()) if isinstance(content, str) else "TEXT"
 
     image_data = None
     if item_type == "IMAGE":
-        image_data_b64 = payload.get("image_data_b64")
-        if not image_data_b64:
-            report["skipped"] += 1
-            append_warning(report, "이미지 바이너리가 없는 IMAGE 항목을 건너뛰었습니다.")
-            return
         try:
-            image_data = base64.b64decode(image_data_b64, validate=True)
+            image_data = (image_loader or decode_image_data_b64)(payload)
         except (ValueError, TypeError, binascii.Error):
             report["skipped"] += 1
-            append_warning(report, "손상된 image_data_b64 항목을 건너뛰었습니다.")
-            return
+            append_warning(report, "손상된 이미지 데이터 항목을 건너뛰었습니다.")
+            return None
+        if not image_data:
+            report["skipped"] += 1
+            append_warning(report, "이미지 바이너리가 없는 IMAGE 항목을 건너뛰었습니다.")
+            return None
         if len(image_data) > IMAGE_CLIPBOARD_MAX_BYTES:
             report["skipped"] += 1
             append_warning(report, "이미지 항목이 너무 커서 건너뛰었습니다(최대 5MB).")
-            return
+            return None
         content = content or "[이미지 캡처]"
     elif item_type == "FILE":
         file_paths = resolve_file_paths(payload, report=report)
         if not file_paths:
             report["skipped"] += 1
             append_warning(report, "유효한 로컬 경로가 없는 FILE 항목을 건너뛰었습니다.")
-            return
+            return None
         content = file_content_from_paths(file_paths)
     elif not content:
         report["skipped"] += 1
-        return
-
-    timestamp = normalize_timestamp(payload.get("timestamp"))
-    item_id, _updated_existing = db._add_item_locked(cursor, content, image_data, item_type, timestamp=timestamp)
-    if not item_id:
-        report["skipped"] += 1
-        return
-
-    metadata = build_item_metadata(payload, collection_id_map, collections_payload_present, report)
-    if metadata:
-        db._set_item_metadata_locked(cursor, item_id, **metadata)
-    report["imported"] += 1
-
+        return None
 
-def build_json_export_payload(
-    db,
-    items,
-    include_metadata: bool,
-    version: str,
-    report: dict[str, Any],
-    get_item_image_blob,
-    get_item_metadata,
-) -> dict[str, Any]:
-    from smartclipboard_core.file_paths import file_paths_from_content
-
-    export_data = {
-        "app": "SmartClipboard Pro",
-        "version": version,
-        "exported_at": datetime.datetime.now().isoformat(),
-        "migration_mode": bool(include_metadata),
-        "items": [],
-    }
-    if include_metadata:
-        export_data["collections"] = []
-        if hasattr(db, "get_collections"):
-            try:
-                for cid, cname, cicon, ccolor, _created_at in db.get_collections():
-                    export_data["collections"].append(
-                        {
-                            "legacy_id": int(cid),
-                            "name": cname,
-                            "icon": cicon,
-                            "color": ccolor,
-                        }
-                    )
-            except Exception:
-                append_warning(report, "컬렉션 메타데이터를 일부 내보내지 못했습니다.")
-
-    for item in items:
-        pid, content, item_type, timestamp, pinned, use_count, pin_order = item
-        payload = {
-            "content": content,
-            "type": item_type,
-            "timestamp": timestamp,
-            "pinned": bool(pinned),
-            "use_count": use_count,
-            "pin_order": pin_order,
-        }
-        if item_type == "IMAGE":
-            image_data = get_item_image_blob(pid)
-            if not image_data:
-                report["skipped"] += 1
-                append_warning(report, "이미지 바이너리가 없는 IMAGE 항목을 건너뛰었습니다.")
-                continue
-            payload["image_data_b64"] = base64.b64encode(image_data).decode("ascii")
-        elif item_type == "FILE":
-            file_paths = file_paths_from_content(content)
-            if file_paths:
-                payload["file_paths"] = file_paths
-                payload["file_path"] = file_paths[0]
-
-        if include_metadata:
-            meta = get_item_metadata(pid)
-            if meta:
-                payload.update(
-                    {
-                        "tags": meta[0] or "",
-                        "note": meta[1] or "",
-                        "bookmark": int(meta[2] or 0),
-                        "collection_id": meta[3],
-                        "pinned": bool(meta[4] or 0),
-                        "pin_order": int(meta[5] or 0),
-                        "use_count": int(meta[6] or 0),
-                        "timestamp": meta[7] or timestamp,
-                        "url_title": meta[8] or "",
-                    }
-                )
-        export_data["items"].append(payload)
-        report["exported"] += 1
-
-    return export_data
+    return ImportRecord(
+        content=content,
+        image_data=image_data,
+        type=item_type,
+        timestamp=normalize_timestamp(payload.get("timestamp")),
+        metadata=build_item_metadata(payload, report),
+        collection=payload.get("collection_id") if "collection_id" in payload else NO_COLLECTION,
+    )
 
 
 __all__ = [
-    "build_json_export_payload",
+    "build_item_metadata",
+    "build_json_import_record",
+    "decode_image_data_b64",
     "import_collections_locked",
-    "import_json_item_locked",
     "normalize_collection_lookup_key",
+    "resolve_collection_id",
 ]
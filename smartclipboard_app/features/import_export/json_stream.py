@@ -0,0 +1,144 @@
+"""Incremental readers for JSON exports and JSON-lines archives.
+
+The JSON reader walks the top-level export object with a bounded buffer and
+yields the entries of its ``items`` array one at a time, so an import never
+holds more than one item (plus the read chunk) in memory.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator
+
+READ_CHUNK_CHARS = 1 << 20
+_WHITESPACE = " \t\r\n"
+_TRUNCATION_WINDOW = 64
+
+# ("items", ITEMS_STREAM) 다음에 ("item", payload)가 배열 원소 수만큼 이어진다.
+ITEMS_STREAM = object()
+
+
+class JsonStreamReader:
+    """Pull JSON values out of a text file without reading it whole."""
+
+    def __init__(self, fh, chunk_chars: int = READ_CHUNK_CHARS):
+        self._fh = fh
+        self._chunk_chars = chunk_chars
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_chars: int = 0) -> bool:
+        if self._eof:
+            return False
+        data = self._fh.read(max(self._chunk_chars, min_chars))
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at the end of input."""
+        while True:
+            buf, pos = self._buf, self._pos
+            end = len(buf)
+            while pos < end and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < end:
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"invalid JSON: expected {char!r}, found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        want = self._chunk_chars
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                # 잘린 입력의 오류는 버퍼 끝 근처에서 나거나(리터럴/숫자 포함) 닫히지 않은 문자열이다.
+                truncated = (
+                    exc.pos >= len(self._buf) - _TRUNCATION_WINDOW
+                    or exc.msg.startswith("Unterminated string")
+                )
+                if not truncated or not self._fill(want):
+                    raise
+                want *= 2  # 큰 항목(이미지 base64 등)은 읽는 단위를 늘려 재시도 횟수를 줄인다.
+                continue
+            if end >= len(self._buf) and self._fill():
+                continue  # 버퍼 끝에서 잘린 숫자/리터럴일 수 있다.
+            self._pos = end
+            return value
+
+
+def iter_json_export(fh) -> Iterator[tuple[str, Any]]:
+    """Top-level (key, value) pairs of an export object, streaming its "items" array.
+
+    Raises ValueError immediately when the document is not an object.
+    """
+    reader = JsonStreamReader(fh)
+    if reader.peek() != "{":
+        raise ValueError("JSON import payload must be an object")
+    return _iter_object(reader)
+
+
+def _iter_object(reader: JsonStreamReader) -> Iterator[tuple[str, Any]]:
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise ValueError("invalid JSON: object keys must be strings")
+            reader.expect(":")
+            if key == "items" and reader.peek() == "[":
+                yield key, ITEMS_STREAM
+                yield from _iter_array(reader)
+            else:
+                yield key, reader.value()
+            if reader.peek() == ",":
+                reader.expect(",")
+                continue
+            reader.expect("}")
+            break
+    if reader.peek():
+        raise ValueError("invalid JSON: extra data after the export object")
+
+
+def _iter_array(reader: JsonStreamReader) -> Iterator[tuple[str, Any]]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+    while True:
+        yield "item", reader.value()
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("]")
+        return
+
+
+def iter_jsonl_items(fh) -> Iterator[Any]:
+    """One decoded value per non-empty line."""
+    for line_no, line in enumerate(fh, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSON on line {line_no}: {exc.msg}") from exc
+
+
+__all__ = ["ITEMS_STREAM", "JsonStreamReader", "iter_json_export", "iter_jsonl_items"]
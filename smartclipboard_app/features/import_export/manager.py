@@ -3,16 +3,32 @@
 from __future__ import annotations
 
 import csv
-import json
 import logging
-from typing import Any
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from smartclipboard_core.db_parts.history.export_query import ExportQuery
 
 from . import services
+from .archive import ArchiveReader, write_archive_export
 from .backup import create_pre_import_backup
-from .csv_codec import export_csv_rows, import_csv_row_locked
-from .json_codec import build_json_export_payload, import_collections_locked, import_json_item_locked
+from .bulk_import import BulkImporter
+from .csv_codec import build_csv_import_record, export_csv_rows
+from .dry_run import DryRunImporter, archive_image_validator, validate_image_b64
+from .incremental import (
+    APPENDABLE_FORMATS,
+    INCREMENTAL_FORMATS,
+    collect_changed_item_ids,
+    default_target,
+    load_watermark,
+    save_watermark,
+)
+from .json_codec import build_json_import_record, import_collections_locked, resolve_collection_id
+from .json_stream import ITEMS_STREAM, iter_json_export, iter_jsonl_items
 from .markdown_codec import export_markdown_document
 from .reports import append_warning, new_export_report, new_import_report
+from .streaming import ExportRowStream, write_json_export, write_jsonl_export
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +45,12 @@ VALID_ITEM_TYPES = {"TEXT", "LINK", "IMAGE", "CODE", "COLOR", "FILE"}
 
 
 class ExportImportManager:
-    """Import/export clipboard data in JSON/CSV/Markdown formats."""
+    """Import/export clipboard data in JSON/JSONL/CSV/Markdown and zip archive formats."""
 
-    def __init__(self, db, version="10.6", type_icons=None, logger_=None):
+    def __init__(self, db, version="10.6", type_icons=None, logger_=None, image_stage_factory=None):
         self.db = db
+        # 이미지 디코딩/해시/썸네일 병렬 단계 (image_prepare.ImagePrepareStage). Qt가 필요해 CLI는 쓰지 않는다.
+        self.image_stage_factory = image_stage_factory
         self.version = version
         self.type_icons = type_icons or DEFAULT_TYPE_ICONS
         self.logger = logger_ or logger
@@ -55,35 +73,38 @@ class ExportImportManager:
     def _resolve_file_paths(payload: dict, report: dict[str, Any] | None = None) -> list[str]:
         return services.resolve_file_paths(payload, report=report)
 
-    def _get_filtered_items(self, filter_type="all", date_from=None):
-        return services.get_filtered_items(self.db, filter_type, date_from)
-
-    def _get_item_image_blob(self, item_id: int):
-        return services.get_item_image_blob(self.db, item_id)
+    @staticmethod
+    def _export_query(filter_type="all", date_from=None, query: ExportQuery | None = None) -> ExportQuery:
+        return query if query is not None else ExportQuery.create(filter_type, date_from=date_from)
 
-    def _get_item_metadata(self, item_id: int):
-        return services.get_item_metadata(self.db, item_id)
+    def _export_stream(self, query: ExportQuery, item_ids=None) -> ExportRowStream:
+        return ExportRowStream(self.db, item_ids=item_ids, query=query)
 
-    def export_json(self, path, filter_type="all", date_from=None, include_metadata=False):
-        report = new_export_report("json", path)
+    @staticmethod
+    def _start_export_report(fmt, path, filter_type, query: ExportQuery) -> dict[str, Any]:
+        report = new_export_report(fmt, path)
         report["filter_type"] = filter_type
-        report["date_from"] = str(date_from) if date_from else None
+        report["date_from"] = str(query.date_from) if query.date_from else None
+        report["filters"] = query.to_dict()
+        return report
+
+    def count_export_items(self, filter_type="all", date_from=None, query: ExportQuery | None = None) -> int:
+        """Rows an export with these filters would read (-1 on error), counted in SQL."""
+        query = self._export_query(filter_type, date_from, query)
+        if hasattr(self.db, "count_export_items"):
+            return self.db.count_export_items(query)
+        return sum(1 for _row in self._export_stream(query))
+
+    def export_json(self, path, filter_type="all", date_from=None, include_metadata=False, query=None):
+        query = self._export_query(filter_type, date_from, query)
+        report = self._start_export_report("json", path, filter_type, query)
         report["include_metadata"] = bool(include_metadata)
         self.last_export_report = report
 
         try:
-            items = self._get_filtered_items(filter_type, date_from=date_from)
-            export_data = build_json_export_payload(
-                self.db,
-                items,
-                include_metadata,
-                self.version,
-                report,
-                self._get_item_image_blob,
-                self._get_item_metadata,
-            )
+            stream = self._export_stream(query)
             with open(path, "w", encoding="utf-8") as fh:
-                json.dump(export_data, fh, ensure_ascii=False, indent=2)
+                write_json_export(fh, self.db, stream, include_metadata, self.version, report)
             report["success"] = True
             return report["exported"]
         except Exception as exc:
@@ -91,14 +112,13 @@ class ExportImportManager:
             self.logger.error("JSON Export Error: %s", exc)
             return -1
 
-    def export_csv(self, path, filter_type="all", date_from=None):
-        report = new_export_report("csv", path)
-        report["filter_type"] = filter_type
-        report["date_from"] = str(date_from) if date_from else None
+    def export_csv(self, path, filter_type="all", date_from=None, query=None):
+        query = self._export_query(filter_type, date_from, query)
+        report = self._start_export_report("csv", path, filter_type, query)
         self.last_export_report = report
 
         try:
-            items = self._get_filtered_items(filter_type, date_from=date_from)
+            items = self._export_stream(query).iter_items()
             with open(path, "w", encoding="utf-8-sig", newline="") as fh:
                 writer = csv.writer(fh)
                 export_csv_rows(writer, items, report, self.logger)
@@ -109,14 +129,13 @@ class ExportImportManager:
             self.logger.error("CSV Export Error: %s", exc)
             return -1
 
-    def export_markdown(self, path, filter_type="all", date_from=None):
-        report = new_export_report("markdown", path)
-        report["filter_type"] = filter_type
-        report["date_from"] = str(date_from) if date_from else None
+    def export_markdown(self, path, filter_type="all", date_from=None, query=None):
+        query = self._export_query(filter_type, date_from, query)
+        report = self._start_export_report("markdown", path, filter_type, query)
         self.last_export_report = report
 
         try:
-            items = self._get_filtered_items(filter_type, date_from=date_from)
+            items = self._export_stream(query).iter_items()
             with open(path, "w", encoding="utf-8") as fh:
                 export_markdown_document(fh, items, self.type_icons, report)
             report["success"] = True
@@ -126,86 +145,258 @@ class ExportImportManager:
             self.logger.error("Markdown Export Error: %s", exc)
             return -1
 
-    def import_json(self, path):
+    def export_archive(self, path, filter_type="all", date_from=None, include_metadata=False, query=None):
+        """Zip archive export: items.jsonl plus raw image entries (no base64)."""
+        query = self._export_query(filter_type, date_from, query)
+        report = self._start_export_report("archive", path, filter_type, query)
+        report["include_metadata"] = bool(include_metadata)
+        self.last_export_report = report
+
+        try:
+            write_archive_export(path, self.db, self._export_stream(query), include_metadata, self.version, report)
+            report["success"] = True
+            return report["exported"]
+        except Exception as exc:
+            report["error"] = str(exc)
+            self.logger.error("Archive Export Error: %s", exc)
+            return -1
+
+    def export_incremental(
+        self,
+        path,
+        fmt="jsonl",
+        filter_type="all",
+        date_from=None,
+        include_metadata=False,
+        target=None,
+        query=None,
+    ):
+        """Export only items added/changed since the last run for this target.
+
+        JSONL and CSV archives are appended to; JSON and Markdown get a delta
+        file. The first run (or a run after the change log was trimmed) writes
+        everything.
+        """
+        query = self._export_query(filter_type, date_from, query)
+        report = self._start_export_report(fmt, path, filter_type, query)
+        report["include_metadata"] = bool(include_metadata)
+        self.last_export_report = report
+
+        try:
+            if fmt not in INCREMENTAL_FORMATS:
+                raise ValueError(f"unsupported incremental format: {fmt}")
+            target_key = target or default_target(path)
+            watermark = load_watermark(self.db, target_key)
+            latest_seq = self.db.get_latest_change_seq()
+            changed_ids = None
+            since_seq = None
+            if watermark and watermark.get("format") == fmt and (fmt not in APPENDABLE_FORMATS or os.path.exists(path)):
+                since_seq = watermark["seq"]
+                changed_ids = collect_changed_item_ids(self.db, since_seq)
+            full = changed_ids is None
+            append = not full and fmt in APPENDABLE_FORMATS
+            report["incremental"] = {
+                "target": target_key,
+                "since_seq": None if full else since_seq,
+                "seq": latest_seq,
+                "full": full,
+                "appended": append,
+            }
+
+            stream = self._export_stream(query, item_ids=None if full else changed_ids)
+
+            if fmt == "jsonl":
+                with open(path, "a" if append else "w", encoding="utf-8") as fh:
+                    write_jsonl_export(fh, stream, include_metadata, report)
+            elif fmt == "csv":
+                with open(path, "a" if append else "w", encoding="utf-8" if append else "utf-8-sig", newline="") as fh:
+                    export_csv_rows(csv.writer(fh), stream.iter_items(), report, self.logger, write_header=not append)
+            elif fmt == "json":
+                with open(path, "w", encoding="utf-8") as fh:
+                    write_json_export(fh, self.db, stream, include_metadata, self.version, report)
+            else:
+                with open(path, "w", encoding="utf-8") as fh:
+                    export_markdown_document(fh, stream.iter_items(), self.type_icons, report)
+
+            if not save_watermark(self.db, target_key, latest_seq, fmt, report["exported"]):
+                raise RuntimeError("export watermark could not be saved")
+            report["success"] = True
+            return report["exported"]
+        except Exception as exc:
+            report["error"] = str(exc)
+            self.logger.error("Incremental Export Error: %s", exc)
+            return -1
+
+    @contextmanager
+    def _import_session(self, report: dict[str, Any], dry_run: bool) -> Iterator[tuple[Any, Any]]:
+        """(cursor, importer) for one import.
+
+        A real import takes the pre-import backup and writes inside one
+        transaction (images are decoded, hashed and thumbnailed on worker
+        threads when image_stage_factory is set); a dry run skips all of that
+        and only reads, through a pooled
+        query-only connection, so the UI thread is never blocked on the lock.
+        """
+        if dry_run:
+            with self.db.read_connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    yield cursor, DryRunImporter(self.db, cursor, report)
+                finally:
+                    cursor.close()
+            return
+
+        report["backup_path"] = create_pre_import_backup(self.db)
+        with self.db.lock:
+            cursor = self.db.conn.cursor()
+            cursor.execute("BEGIN")
+            image_stage = self.image_stage_factory() if self.image_stage_factory is not None else None
+            importer = BulkImporter(self.db, cursor, report, image_stage=image_stage)
+            try:
+                yield cursor, importer
+                self.db.conn.commit()
+            except Exception:
+                self.db.conn.rollback()
+                raise
+            finally:
+                importer.close()
+
+    @staticmethod
+    def _import_result(report: dict[str, Any]) -> int:
+        # dry run은 실제로 쓴 건수 대신 쓰게 될 건수(새 항목 + 병합)를 돌려준다.
+        report["success"] = True
+        dry_run = report.get("dry_run")
+        if dry_run is not None:
+            return dry_run["would_insert"] + dry_run["would_merge"]
+        return report["imported"]
+
+    def _import_json_payload(self, importer: BulkImporter, payload, report: dict[str, Any], image_loader=None) -> None:
+        if not isinstance(payload, dict):
+            report["skipped"] += 1
+            append_warning(report, "일부 item payload가 잘못된 형식이라 건너뛰었습니다.")
+            return
+        record = build_json_import_record(
+            payload,
+            report,
+            VALID_ITEM_TYPES,
+            self._normalize_timestamp,
+            self._resolve_file_paths,
+            image_loader=image_loader,
+        )
+        if record is not None:
+            importer.add(record)
+
+    def import_json(self, path, dry_run=False):
+        """Import a JSON export; the items array is read and written in batches.
+
+        With dry_run the file is validated and matched against the dedupe
+        index without a backup or any write (see report["dry_run"]).
+        """
         report = new_import_report("json", path)
         self.last_import_report = report
 
         try:
             with open(path, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
-            if not isinstance(data, dict):
-                raise ValueError("JSON import payload must be an object")
-            items_payload = data.get("items")
-            if not isinstance(items_payload, list):
-                raise ValueError("JSON import payload must contain an items list")
-
-            report["backup_path"] = create_pre_import_backup(self.db)
-            collections_payload = data.get("collections", [])
-            collections_payload_present = bool(collections_payload)
-
-            with self.db.lock:
-                cursor = self.db.conn.cursor()
-                cursor.execute("BEGIN")
-                try:
-                    collection_id_map = import_collections_locked(self.db, cursor, collections_payload, report)
-                    for item in items_payload:
-                        if not isinstance(item, dict):
-                            report["skipped"] += 1
-                            append_warning(report, "일부 item payload가 잘못된 형식이라 건너뛰었습니다.")
-                            continue
-                        import_json_item_locked(
-                            self.db,
-                            cursor,
-                            item,
-                            collection_id_map,
-                            collections_payload_present,
-                            report,
-                            VALID_ITEM_TYPES,
-                            self._normalize_timestamp,
-                            self._resolve_file_paths,
-                        )
-                    self.db.conn.commit()
-                except Exception:
-                    self.db.conn.rollback()
-                    raise
+                events = iter_json_export(fh)
+                image_loader = validate_image_b64 if dry_run else None
+
+                with self._import_session(report, dry_run) as (cursor, importer):
+                    items_present = False
+                    collection_id_map: dict[int, int] = {}
+                    collections_payload_present = False
+                    for key, value in events:
+                        if key == "item":
+                            self._import_json_payload(importer, value, report, image_loader=image_loader)
+                        elif key == "items":
+                            if value is not ITEMS_STREAM:
+                                raise ValueError("JSON import payload must contain an items list")
+                            items_present = True
+                        elif key == "collections":
+                            collections_payload_present = bool(value)
+                            collection_id_map.update(
+                                import_collections_locked(self.db, cursor, value, report, dry_run=dry_run)
+                            )
+                    if not items_present:
+                        raise ValueError("JSON import payload must contain an items list")
+                    importer.finish(
+                        lambda value: resolve_collection_id(value, collection_id_map, collections_payload_present, report)
+                    )
 
-            report["success"] = True
-            return report["imported"]
+            return self._import_result(report)
         except Exception as exc:
             report["error"] = str(exc)
             self.logger.error("JSON Import Error: %s", exc)
             return -1
 
-    def import_csv(self, path):
+    def import_jsonl(self, path, dry_run=False):
+        """Import a JSON-lines archive (one item object per line, see export_incremental)."""
+        report = new_import_report("jsonl", path)
+        self.last_import_report = report
+
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                image_loader = validate_image_b64 if dry_run else None
+                with self._import_session(report, dry_run) as (_cursor, importer):
+                    for payload in iter_jsonl_items(fh):
+                        self._import_json_payload(importer, payload, report, image_loader=image_loader)
+                    # JSONL에는 컬렉션 목록이 없어 collection 연결은 해제된다.
+                    importer.finish(lambda value: resolve_collection_id(value, {}, False, report))
+
+            return self._import_result(report)
+        except Exception as exc:
+            report["error"] = str(exc)
+            self.logger.error("JSONL Import Error: %s", exc)
+            return -1
+
+    def import_archive(self, path, dry_run=False):
+        """Import a zip archive written by export_archive."""
+        report = new_import_report("archive", path)
+        self.last_import_report = report
+
+        try:
+            with ArchiveReader(path) as archive:
+                # dry run은 이미지 엔트리를 풀지 않고 zip 디렉터리의 크기만 본다.
+                image_loader = archive_image_validator(archive) if dry_run else archive.load_image
+                with self._import_session(report, dry_run) as (cursor, importer):
+                    collections = archive.manifest.get("collections")
+                    collection_id_map = import_collections_locked(
+                        self.db, cursor, collections, report, dry_run=dry_run
+                    )
+                    for payload in archive.iter_items():
+                        self._import_json_payload(importer, payload, report, image_loader=image_loader)
+                    importer.finish(
+                        lambda value: resolve_collection_id(value, collection_id_map, bool(collections), report)
+                    )
+
+            return self._import_result(report)
+        except Exception as exc:
+            report["error"] = str(exc)
+            self.logger.error("Archive Import Error: %s", exc)
+            return -1
+
+    def import_csv(self, path, dry_run=False):
         report = new_import_report("csv", path)
         self.last_import_report = report
 
         try:
-            report["backup_path"] = create_pre_import_backup(self.db)
             with open(path, "r", encoding="utf-8-sig", newline="") as fh:
                 reader = csv.reader(fh)
                 next(reader, None)
 
-                with self.db.lock:
-                    cursor = self.db.conn.cursor()
-                    cursor.execute("BEGIN")
-                    try:
-                        for row in reader:
-                            import_csv_row_locked(
-                                self.db,
-                                cursor,
-                                row,
-                                report,
-                                VALID_ITEM_TYPES,
-                                self._normalize_timestamp,
-                            )
-                        self.db.conn.commit()
-                    except Exception:
-                        self.db.conn.rollback()
-                        raise
+                with self._import_session(report, dry_run) as (_cursor, importer):
+                    for row in reader:
+                        record = build_csv_import_record(
+                            row,
+                            report,
+                            VALID_ITEM_TYPES,
+                            self._normalize_timestamp,
+                            importer.next_pin_order,
+                        )
+                        if record is not None:
+                            importer.add(record)
+                    importer.finish()
 
-            report["success"] = True
-            return report["imported"]
+            return self._import_result(report)
         except Exception as exc:
             report["error"] = str(exc)
             self.logger.error("CSV Import Error: %s", exc)
@@ -22,7 +22,12 @@ def parse_timestamp(timestamp):
             return None
 
         try:
-            parsed = datetime.datetime.strptime(raw_value, "%Y-%m-%d %H:%M:%S")
+            # 정규 형식은 C 구현인 fromisoformat이 훨씬 빠르다 (대량 가져오기 경로).
+            parsed = (
+                datetime.datetime.fromisoformat(raw_value)
+                if len(raw_value) == 19 and raw_value[10] == " "
+                else datetime.datetime.strptime(raw_value, "%Y-%m-%d %H:%M:%S")
+            )
         except ValueError:
             iso_value = raw_value[:-1] + "+00:00" if raw_value.endswith("Z") else raw_value
             try:
@@ -85,27 +90,6 @@ def resolve_file_paths(payload: dict, report: dict | None = None) -> list[str]:
     return normalized_paths
 
 
-def get_filtered_items(db, filter_type="all", date_from=None):
-    items = db.get_items("", "전체")
-    filtered = []
-    for item in items:
-        _pid, _content, ptype, timestamp, *_rest = item
-        if filter_type != "all" and filter_type != ptype:
-            continue
-        if not matches_date_filter(timestamp, date_from):
-            continue
-        filtered.append(item)
-    return filtered
-
-
-def get_item_image_blob(db, item_id: int):
-    with db.lock:
-        cursor = db.conn.cursor()
-        cursor.execute("SELECT image_data FROM history WHERE id = ?", (item_id,))
-        row = cursor.fetchone()
-    return row[0] if row else None
-
-
 def get_item_metadata(db, item_id: int):
     with db.lock:
         cursor = db.conn.cursor()
@@ -118,8 +102,6 @@ def get_item_metadata(db, item_id: int):
 
 
 __all__ = [
-    "get_filtered_items",
-    "get_item_image_blob",
     "get_item_metadata",
     "matches_date_filter",
     "normalize_timestamp",
@@ -0,0 +1,294 @@
+"""Streaming export pipeline.
+
+Rows come from one cursor on a pooled read-only connection (image blob and
+metadata in the same SELECT, every filter pushed down into its WHERE clause),
+chunked large text is read chunk by chunk and image blobs are base64-encoded
+in slices, so the peak memory of an export is bounded by the largest single
+item instead of the whole history.
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import datetime
+import json
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from smartclipboard_core.db_parts.history.export_query import (
+    EXPORT_QUERY_COLUMNS,
+    ExportQuery,
+    build_export_select,
+)
+from smartclipboard_core.file_paths import file_paths_from_content
+from smartclipboard_core.large_text import decode_large_chunk
+
+from .reports import append_warning
+
+EXPORT_FETCH_SIZE = 256
+# base64는 3바이트 단위로 끊어야 조각을 이어 붙여도 전체 인코딩과 같다.
+BASE64_CHUNK_BYTES = 3 * 16 * 1024
+
+# json.dumps(..., ensure_ascii=False)는 호출마다 인코더를 새로 만든다: 행 단위 출력에서는 재사용한다.
+_ENCODE = json.JSONEncoder(ensure_ascii=False).encode
+_ENCODE_INDENTED = json.JSONEncoder(ensure_ascii=False, indent=2).encode
+
+EXPORT_ROW_COLUMNS = EXPORT_QUERY_COLUMNS
+
+
+class ExportRow(NamedTuple):
+    id: int
+    content: str
+    type: str
+    timestamp: str
+    pinned: int
+    use_count: int
+    pin_order: int
+    image_data: bytes | None
+    tags: str | None
+    note: str | None
+    bookmark: int
+    collection_id: int | None
+    url_title: str | None
+    large_digest: str | None
+
+
+class StreamedString:
+    """A JSON string value written piece by piece (already-escaped pieces when raw=True)."""
+
+    __slots__ = ("pieces", "raw")
+
+    def __init__(self, pieces: Iterable[str], raw: bool = False):
+        self.pieces = pieces
+        self.raw = raw
+
+
+@contextmanager
+def _export_cursor(db, query: ExportQuery):
+    if hasattr(db, "export_cursor"):
+        with db.export_cursor(query, EXPORT_ROW_COLUMNS) as cursor:
+            yield cursor
+        return
+    sql, params = build_export_select(query, EXPORT_ROW_COLUMNS)
+    with db.lock:
+        cursor = db.conn.cursor()
+        cursor.execute(sql, params)
+        yield cursor
+
+
+class ExportRowStream:
+    """Iterate history rows for an export without materializing them.
+
+    query carries every filter; filter_type/date_from/item_ids are the
+    exporters' legacy arguments folded into it. item_ids limits the stream to
+    those ids (in id order, as incremental exports expect); otherwise rows
+    follow the history list order.
+    """
+
+    def __init__(
+        self,
+        db,
+        filter_type: str = "all",
+        date_from=None,
+        item_ids: Iterable[int] | None = None,
+        query: ExportQuery | None = None,
+    ):
+        self.db = db
+        query = query if query is not None else ExportQuery.create(filter_type, date_from=date_from)
+        if item_ids is not None:
+            query = dataclasses.replace(query, item_ids=tuple(sorted({int(item_id) for item_id in item_ids})))
+        self.query = query
+        self._conn = None
+
+    def __iter__(self) -> Iterator[ExportRow]:
+        with _export_cursor(self.db, self.query) as cursor:
+            self._conn = cursor.connection
+            try:
+                yield from self._drain(cursor)
+            finally:
+                self._conn = None
+
+    @staticmethod
+    def _drain(cursor) -> Iterator[ExportRow]:
+        while True:
+            rows = cursor.fetchmany(EXPORT_FETCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield ExportRow(*row)
+
+    def iter_text(self, row: ExportRow) -> Iterator[str]:
+        """Content of row; chunked large text is yielded one chunk at a time."""
+        if not row.large_digest or self._conn is None:
+            yield row.content or ""
+            return
+        cursor = self._conn.cursor()
+        seq = 0
+        while True:
+            chunk = self.db._fetch_large_chunk(cursor, row.large_digest, seq)
+            if not chunk:
+                break
+            yield decode_large_chunk(chunk[0], chunk[1])
+            seq += 1
+        if seq == 0:
+            # 청크가 사라진 행은 색인용 앞부분이라도 내보낸다.
+            yield row.content or ""
+
+    def full_text(self, row: ExportRow) -> str:
+        return "".join(self.iter_text(row)) if row.large_digest else (row.content or "")
+
+    def iter_items(self) -> Iterator[tuple]:
+        """Legacy (id, content, type, timestamp, pinned, use_count, pin_order) tuples with full text."""
+        for row in self:
+            yield (row.id, self.full_text(row), row.type, row.timestamp, row.pinned, row.use_count, row.pin_order)
+
+
+def iter_base64_chunks(data: bytes, chunk_bytes: int | None = None) -> Iterator[str]:
+    chunk_bytes = chunk_bytes or BASE64_CHUNK_BYTES
+    if chunk_bytes % 3:
+        raise ValueError("chunk_bytes must be a multiple of 3")
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_bytes):
+        yield base64.b64encode(view[start:start + chunk_bytes]).decode("ascii")
+
+
+def build_item_fields(stream: ExportRowStream, row: ExportRow, include_metadata: bool, report: dict[str, Any]):
+    """Ordered (key, value) pairs of one exported item, or None when it has to be skipped."""
+    fields: dict[str, Any] = {
+        "content": StreamedString(stream.iter_text(row)),
+        "type": row.type,
+        "timestamp": row.timestamp,
+        "pinned": bool(row.pinned),
+        "use_count": row.use_count,
+        "pin_order": row.pin_order,
+    }
+    if row.type == "IMAGE":
+        if not row.image_data:
+            report["skipped"] += 1
+            append_warning(report, "이미지 바이너리가 없는 IMAGE 항목을 건너뛰었습니다.")
+            return None
+        fields["image_data_b64"] = StreamedString(iter_base64_chunks(row.image_data), raw=True)
+    elif row.type == "FILE":
+        file_paths = file_paths_from_content(stream.full_text(row))
+        if file_paths:
+            fields["file_paths"] = file_paths
+            fields["file_path"] = file_paths[0]
+
+    if include_metadata:
+        fields.update(
+            {
+                "tags": row.tags or "",
+                "note": row.note or "",
+                "bookmark": int(row.bookmark or 0),
+                "collection_id": row.collection_id,
+                "pinned": bool(row.pinned or 0),
+                "pin_order": int(row.pin_order or 0),
+                "use_count": int(row.use_count or 0),
+                "timestamp": row.timestamp,
+                "url_title": row.url_title or "",
+            }
+        )
+    return list(fields.items())
+
+
+def write_json_value(fh, value: Any, indent: str | None) -> None:
+    if isinstance(value, StreamedString):
+        fh.write('"')
+        for piece in value.pieces:
+            fh.write(piece if value.raw else _ENCODE(piece)[1:-1])
+        fh.write('"')
+    elif indent is None or not isinstance(value, (list, dict)):
+        fh.write(_ENCODE(value))
+    else:
+        fh.write(_ENCODE_INDENTED(value).replace("\n", "\n" + indent))
+
+
+def write_json_object(fh, fields: list[tuple[str, Any]], indent: str | None = None) -> None:
+    """Write fields as one JSON object; indent=None gives a single JSON-lines record."""
+    if indent is None:
+        # 한 줄짜리 레코드는 조각을 모아 한 번에 쓴다 (스트리밍 값만 따로 흘려 쓴다).
+        parts = ["{"]
+        for index, (key, value) in enumerate(fields):
+            parts.append(", " if index else "")
+            parts.append(_ENCODE(key) + ": ")
+            if isinstance(value, StreamedString):
+                fh.write("".join(parts))
+                parts = []
+                write_json_value(fh, value, None)
+            else:
+                parts.append(_ENCODE(value))
+        parts.append("}")
+        fh.write("".join(parts))
+        return
+    inner = indent + "  "
+    fh.write("{")
+    for index, (key, value) in enumerate(fields):
+        fh.write(",\n" if index else "\n")
+        fh.write(inner + _ENCODE(key) + ": ")
+        write_json_value(fh, value, inner)
+    fh.write("\n" + indent + "}" if fields else "}")
+
+
+def collection_payloads(db, report: dict[str, Any]) -> list[dict[str, Any]]:
+    collections: list[dict[str, Any]] = []
+    if not hasattr(db, "get_collections"):
+        return collections
+    try:
+        for cid, cname, cicon, ccolor, _created_at in db.get_collections():
+            collections.append({"legacy_id": int(cid), "name": cname, "icon": cicon, "color": ccolor})
+    except Exception:
+        append_warning(report, "컬렉션 메타데이터를 일부 내보내지 못했습니다.")
+    return collections
+
+
+def write_json_export(fh, db, stream: ExportRowStream, include_metadata: bool, version: str, report: dict[str, Any]) -> None:
+    """Stream the JSON export document (same shape json.load sees as the old dict export)."""
+    header: list[tuple[str, Any]] = [
+        ("app", "SmartClipboard Pro"),
+        ("version", version),
+        ("exported_at", datetime.datetime.now().isoformat()),
+        ("migration_mode", bool(include_metadata)),
+    ]
+    if include_metadata:
+        header.append(("collections", collection_payloads(db, report)))
+    fh.write("{")
+    for key, value in header:
+        fh.write("\n  " + json.dumps(key) + ": ")
+        write_json_value(fh, value, "  ")
+        fh.write(",")
+    fh.write('\n  "items": [')
+    first = True
+    for row in stream:
+        fields = build_item_fields(stream, row, include_metadata, report)
+        if fields is None:
+            continue
+        fh.write("\n    " if first else ",\n    ")
+        write_json_object(fh, fields, "    ")
+        first = False
+        report["exported"] += 1
+    fh.write("]\n}" if first else "\n  ]\n}")
+
+
+def write_jsonl_export(fh, stream: ExportRowStream, include_metadata: bool, report: dict[str, Any]) -> None:
+    for row in stream:
+        fields = build_item_fields(stream, row, include_metadata, report)
+        if fields is None:
+            continue
+        fields.append(("id", row.id))
+        write_json_object(fh, fields)
+        fh.write("\n")
+        report["exported"] += 1
+
+
+__all__ = [
+    "BASE64_CHUNK_BYTES",
+    "ExportRow",
+    "ExportRowStream",
+    "StreamedString",
+    "build_item_fields",
+    "iter_base64_chunks",
+    "write_json_export",
+    "write_json_object",
+    "write_jsonl_export",
+]
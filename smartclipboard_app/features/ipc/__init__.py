@@ -0,0 +1,7 @@
+"""Local IPC (JSON-RPC) server feature package."""
+
+from __future__ import annotations
+
+from .controller import IPC_SETTING_KEY, IpcServerController
+
+__all__ = ["IPC_SETTING_KEY", "IpcServerController"]
@@ -0,0 +1,78 @@
+"""Opt-in local JSON-RPC server lifecycle for SmartClipboard."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from smartclipboard_core.ipc_server import HistoryRpcServer
+
+logger = logging.getLogger(__name__)
+
+IPC_SETTING_KEY = "ipc_server_enabled"
+
+
+def _is_enabled(raw_value: Any) -> bool:
+    return str(raw_value).strip().lower() in {"1", "true", "yes", "on"}
+
+
+class IpcServerController(QObject):
+    """Starts/stops the history RPC server according to the settings flag."""
+
+    item_added = pyqtSignal(int)  # item id, emitted from server threads
+
+    def __init__(self, window: Any = None, server_factory: Callable[..., Any] = HistoryRpcServer) -> None:
+        super().__init__()
+        self.window = window
+        self._server_factory = server_factory
+        self.server: HistoryRpcServer | None = None
+        self.item_added.connect(self._on_item_added)
+
+    def _get_db(self):
+        db = getattr(self.window, "db", None)
+        if db is None or getattr(db, "conn", None) is None:
+            return None
+        return db
+
+    @property
+    def running(self) -> bool:
+        return self.server is not None and self.server.running
+
+    def apply_setting(self) -> bool:
+        """설정값에 맞춰 서버를 시작/중지. 실행 여부를 반환."""
+        db = self._get_db()
+        enabled = db is not None and _is_enabled(db.get_setting(IPC_SETTING_KEY, "false"))
+        if enabled and not self.running:
+            try:
+                server = self.server = self._server_factory(db, on_write=self.item_added.emit)
+                server.start()
+            except (OSError, ValueError) as exc:
+                logger.warning("IPC server start failed: %s", exc)
+                self.server = None
+        elif not enabled and self.server is not None:
+            self.shutdown()
+        return self.running
+
+    @pyqtSlot(int)
+    def _on_item_added(self, _item_id: int) -> None:
+        window = self.window
+        if window is None:
+            return
+        is_visible_getter = getattr(window, "isVisible", None)
+        is_visible = is_visible_getter() if callable(is_visible_getter) else True
+        if is_visible and hasattr(window, "load_data"):
+            window.load_data()
+            if hasattr(window, "update_status_bar"):
+                window.update_status_bar()
+        elif hasattr(window, "is_data_dirty"):
+            window.is_data_dirty = True
+
+    def shutdown(self) -> None:
+        server, self.server = self.server, None
+        if server is not None:
+            server.stop()
+
+
+__all__ = ["IPC_SETTING_KEY", "IpcServerController"]
@@ -0,0 +1,7 @@
+"""Storage maintenance feature package."""
+
+from __future__ import annotations
+
+from .controller import MaintenanceController
+
+__all__ = ["MaintenanceController"]
@@ -0,0 +1,416 @@
+"""Idle-time storage maintenance for SmartClipboard."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtWidgets import QMessageBox, QWidget
+
+from smartclipboard_app.features.clipboard.image_codec import (
+    IMAGE_CODEC_DEFAULT,
+    IMAGE_CODEC_SETTING,
+    normalize_image_codec,
+    recompress_images,
+)
+from smartclipboard_app.features.clipboard.image_hash import backfill_image_hashes
+from smartclipboard_app.features.import_export.backup import (
+    find_latest_good_backup,
+    preserve_corrupt_database,
+    replace_database_from_backup,
+)
+from smartclipboard_core.database import ClipboardDB
+from smartclipboard_core.db_parts.storage.integrity import (
+    INTEGRITY_STATUS_DB_CORRUPT,
+    INTEGRITY_STATUS_FTS_CORRUPT,
+)
+
+logger = logging.getLogger(__name__)
+
+IDLE_MAINTENANCE_INTERVAL_MS = 60_000
+IDLE_AFTER_SECONDS = 30.0
+INTEGRITY_CHECK_INTERVAL_SECONDS = 6 * 3600
+INTEGRITY_FIRST_CHECK_DELAY_SECONDS = 120
+CHANGE_LOG_COMPACT_INTERVAL_SECONDS = 3600
+FOLDER_SYNC_INTERVAL_SECONDS = 300
+SYNC_FOLDER_SETTING = "sync_folder"
+IMAGE_HASH_BACKFILL_BATCH = 50
+
+
+class _MaintenanceSignals(QObject):
+    integrity_checked = pyqtSignal(object)  # result dict
+    folder_synced = pyqtSignal(object)  # sync_with_folder() result
+    images_recompressed = pyqtSignal(object)  # recompress_images() report
+
+
+class MaintenanceController(QObject):
+    """Runs WAL checkpoints, change-log compaction, folder sync, integrity checks and the one-time image hash
+    backfill while the clipboard is quiet."""
+
+    def __init__(self, window: Any = None) -> None:
+        super().__init__()
+        self.window = window
+        self._checkpoint_thread: threading.Thread | None = None
+        self._integrity_thread: threading.Thread | None = None
+        self._sync_thread: threading.Thread | None = None
+        self._recompress_thread: threading.Thread | None = None
+        self._hash_backfill_thread: threading.Thread | None = None
+        self._image_hashes_backfilled = False
+        self._next_integrity_check_at = time.monotonic() + INTEGRITY_FIRST_CHECK_DELAY_SECONDS
+        self._next_change_compaction_at = time.monotonic() + CHANGE_LOG_COMPACT_INTERVAL_SECONDS
+        self._next_folder_sync_at = time.monotonic()
+        self._seen_search_fallbacks = 0
+        self._restore_prompted = False
+        self._signals = _MaintenanceSignals()
+        self._signals.integrity_checked.connect(self._on_integrity_checked)
+        self._signals.folder_synced.connect(self._on_folder_synced)
+        self._signals.images_recompressed.connect(self._on_images_recompressed)
+        self._idle_timer = QTimer(self)
+        self._idle_timer.timeout.connect(self.run_idle_maintenance)
+
+    def start(self, interval_ms: int = IDLE_MAINTENANCE_INTERVAL_MS) -> None:
+        self._idle_timer.start(interval_ms)
+
+    def _get_db(self):
+        db = getattr(self.window, "db", None)
+        if db is None or getattr(db, "conn", None) is None:
+            return None
+        return db
+
+    def _get_dialog_parent(self) -> QWidget | None:
+        return self.window if isinstance(self.window, QWidget) else None
+
+    def _show_status(self, message: str, timeout_ms: int = 4000) -> None:
+        if self.window and hasattr(self.window, "statusBar"):
+            status_bar = getattr(self.window, "statusBar")()
+            if status_bar:
+                status_bar.showMessage(message, timeout_ms)
+
+    def is_idle(self) -> bool:
+        last_activity = getattr(self.window, "_last_clipboard_activity", None)
+        if last_activity is None:
+            return True
+        return time.monotonic() - float(last_activity) >= IDLE_AFTER_SECONDS
+
+    def run_idle_maintenance(self) -> None:
+        if not self.is_idle():
+            return
+        db = self._get_db()
+        if db is None:
+            return
+        if hasattr(db, "maybe_checkpoint_wal") and not self._thread_alive(self._checkpoint_thread):
+            compact_changes = hasattr(db, "compact_changes") and time.monotonic() >= self._next_change_compaction_at
+            if compact_changes:
+                self._next_change_compaction_at = time.monotonic() + CHANGE_LOG_COMPACT_INTERVAL_SECONDS
+            # 별도 연결로 체크포인트하므로 UI 스레드의 DB 잠금과 경합하지 않는다.
+            self._checkpoint_thread = threading.Thread(
+                target=self._run_checkpoint,
+                args=(db, compact_changes),
+                daemon=True,
+                name="WalCheckpointThread",
+            )
+            self._checkpoint_thread.start()
+        if hasattr(db, "run_integrity_check"):
+            self.start_integrity_check()
+        if hasattr(db, "sync_with_folder"):
+            self.start_folder_sync()
+        if hasattr(db, "get_images_missing_hash"):
+            self.start_image_hash_backfill()
+
+    @staticmethod
+    def _thread_alive(thread: threading.Thread | None) -> bool:
+        return thread is not None and thread.is_alive()
+
+    @staticmethod
+    def _run_checkpoint(db, compact_changes: bool = False) -> None:
+        if compact_changes:
+            try:
+                db.compact_changes()
+            except Exception as exc:
+                logger.warning("Idle change-log compaction failed: %s", exc)
+        try:
+            db.maybe_checkpoint_wal()
+        except Exception as exc:
+            logger.warning("Idle WAL checkpoint failed: %s", exc)
+
+    def start_image_hash_backfill(self) -> bool:
+        """해시 없이 저장된 이미지(가져오기, 복원, 이전 버전)의 지각 해시를 세션당 한 번 백그라운드로 채운다."""
+        db = self._get_db()
+        if db is None or self._image_hashes_backfilled or self._thread_alive(self._hash_backfill_thread):
+            return False
+        self._image_hashes_backfilled = True
+        self._hash_backfill_thread = threading.Thread(
+            target=self._run_image_hash_backfill,
+            args=(db,),
+            daemon=True,
+            name="ImageHashBackfillThread",
+        )
+        self._hash_backfill_thread.start()
+        return True
+
+    @staticmethod
+    def _run_image_hash_backfill(db) -> None:
+        # 디코딩 실패도 표시되어 다시 조회되지 않으므로 배치가 가득 차지 않으면 끝이다.
+        try:
+            while getattr(db, "conn", None) is not None:
+                if backfill_image_hashes(db, IMAGE_HASH_BACKFILL_BATCH) < IMAGE_HASH_BACKFILL_BATCH:
+                    break
+        except Exception as exc:
+            logger.warning("Image hash backfill failed: %s", exc)
+
+    def start_folder_sync(self, force: bool = False) -> bool:
+        """동기화 폴더가 설정되어 있으면 번들 가져오기/내보내기를 백그라운드로 실행."""
+        db = self._get_db()
+        if db is None or self._thread_alive(self._sync_thread):
+            return False
+        folder = db.get_setting(SYNC_FOLDER_SETTING, "")
+        if not isinstance(folder, str) or not folder.strip():
+            return False
+        if not force and time.monotonic() < self._next_folder_sync_at:
+            return False
+
+        self._next_folder_sync_at = time.monotonic() + FOLDER_SYNC_INTERVAL_SECONDS
+        self._sync_thread = threading.Thread(
+            target=self._run_folder_sync,
+            args=(db, folder.strip()),
+            daemon=True,
+            name="FolderSyncThread",
+        )
+        self._sync_thread.start()
+        return True
+
+    def _run_folder_sync(self, db, folder: str) -> None:
+        try:
+            result = db.sync_with_folder(folder)
+        except Exception as exc:
+            logger.warning("Folder sync failed: %s", exc)
+            return
+        self._signals.folder_synced.emit(result)
+
+    @pyqtSlot(object)
+    def _on_folder_synced(self, result: dict[str, Any]) -> None:
+        imported = result.get("imported") or {}
+        errors = list(imported.get("errors") or [])
+        if (result.get("exported") or {}).get("error"):
+            errors.append(result["exported"]["error"])
+        if errors:
+            self._show_status(f"⚠️ 폴더 동기화 오류: {errors[0]}", 6000)
+        applied = sum(int(imported.get(key, 0) or 0) for key in ("inserted", "updated", "merged", "deleted"))
+        if not applied:
+            return
+        window = self.window
+        is_visible_getter = getattr(window, "isVisible", None)
+        is_visible = is_visible_getter() if callable(is_visible_getter) else True
+        if is_visible and hasattr(window, "load_data"):
+            window.load_data()
+            if hasattr(window, "update_status_bar"):
+                window.update_status_bar()
+        elif hasattr(window, "is_data_dirty"):
+            window.is_data_dirty = True
+        if not errors:
+            self._show_status(f"🔄 폴더 동기화: {applied}건 반영")
+
+    def start_image_recompression(self, codec: str | None = None) -> bool:
+        """저장된 이미지를 codec(기본: 현재 설정)으로 무손실 재압축하는 작업을 백그라운드로 시작."""
+        db = self._get_db()
+        if db is None or not hasattr(db, "get_image_blobs") or self._thread_alive(self._recompress_thread):
+            return False
+        if codec is None:
+            codec = db.get_setting(IMAGE_CODEC_SETTING, IMAGE_CODEC_DEFAULT)
+        self._recompress_thread = threading.Thread(
+            target=self._run_image_recompression,
+            args=(db, normalize_image_codec(codec)),
+            daemon=True,
+            name="ImageRecompressThread",
+        )
+        self._recompress_thread.start()
+        self._show_status("🗜️ 저장된 이미지를 백그라운드에서 재압축하는 중...")
+        return True
+
+    def _run_image_recompression(self, db, codec: str) -> None:
+        started = time.perf_counter()
+        try:
+            # 앱 종료로 연결이 닫히면 다음 배치 전에 멈춘다.
+            report: dict[str, Any] = recompress_images(db, codec, should_stop=lambda: getattr(db, "conn", None) is None)
+        except Exception as exc:
+            logger.warning("Image recompression failed: %s", exc)
+            report = {"error": str(exc)}
+        report["codec"] = codec
+        report["duration_ms"] = (time.perf_counter() - started) * 1000
+        self._signals.images_recompressed.emit(report)
+
+    @pyqtSlot(object)
+    def _on_images_recompressed(self, report: dict[str, Any]) -> None:
+        db = self._get_db()
+        error = report.get("error")
+        if db is not None:
+            db.record_maintenance_event(
+                "image_recompress", "failed" if error else "ok", report, report.get("duration_ms", 0.0)
+            )
+        if error:
+            self._show_status(f"⚠️ 이미지 재압축 오류: {error}", 6000)
+            return
+        saved_mb = int(report.get("bytes_saved", 0) or 0) / (1024 * 1024)
+        self._show_status(
+            f"🗜️ 이미지 재압축 완료: {int(report.get('recompressed', 0) or 0)}/{int(report.get('scanned', 0) or 0)}개, "
+            f"{saved_mb:.1f}MB 절약 (DB 파일 크기는 최적화(VACUUM) 후 줄어듭니다)",
+            10000,
+        )
+
+    def start_integrity_check(self, force: bool = False) -> bool:
+        """주기가 되었거나 FTS 검색이 LIKE로 폴백했으면 백그라운드 검사 시작."""
+        db = self._get_db()
+        if db is None or self._thread_alive(self._integrity_thread):
+            return False
+        fallback_count = getattr(db, "_search_fallback_count", 0)
+        if not isinstance(fallback_count, int):
+            fallback_count = 0
+        fts_suspect = fallback_count > self._seen_search_fallbacks
+        self._seen_search_fallbacks = fallback_count
+        if not force and not fts_suspect and time.monotonic() < self._next_integrity_check_at:
+            return False
+
+        self._next_integrity_check_at = time.monotonic() + INTEGRITY_CHECK_INTERVAL_SECONDS
+        self._integrity_thread = threading.Thread(
+            target=self._run_integrity_check,
+            args=(db,),
+            daemon=True,
+            name="IntegrityCheckThread",
+        )
+        self._integrity_thread.start()
+        return True
+
+    def _run_integrity_check(self, db) -> None:
+        try:
+            result = db.run_integrity_check()
+        except Exception as exc:
+            result = {"status": "error", "error": str(exc), "duration_ms": 0.0}
+        self._signals.integrity_checked.emit(result)
+
+    @pyqtSlot(object)
+    def _on_integrity_checked(self, result: dict[str, Any]) -> None:
+        db = self._get_db()
+        if db is None:
+            return
+        status = str(result.get("status") or "error")
+        db.record_maintenance_event("integrity_check", status, result, result.get("duration_ms", 0.0))
+        if status == INTEGRITY_STATUS_FTS_CORRUPT:
+            self._repair_search_index(db, result)
+        elif status == INTEGRITY_STATUS_DB_CORRUPT:
+            self._offer_backup_restore(db, result)
+
+    def _repair_search_index(self, db, result: dict[str, Any]) -> None:
+        logger.warning("FTS integrity problem detected (%s); rebuilding", result.get("fts_error"))
+        started = time.perf_counter()
+        rebuilt = db.rebuild_search_index()
+        db.record_maintenance_event(
+            "fts_rebuild",
+            "ok" if rebuilt else "failed",
+            {"reason": result.get("fts_error", "")},
+            (time.perf_counter() - started) * 1000,
+        )
+        if rebuilt:
+            self._show_status("🔧 검색 색인을 복구했습니다.")
+
+    def _offer_backup_restore(self, db, result: dict[str, Any]) -> None:
+        if self._restore_prompted:
+            return
+        self._restore_prompted = True
+        parent = self._get_dialog_parent()
+        details = "\n".join(str(line) for line in (result.get("quick_check") or [])[:3])
+        candidate = find_latest_good_backup(getattr(db, "app_dir", ""))
+        if candidate is None:
+            db.record_maintenance_event("restore", "no_backup", result)
+            QMessageBox.critical(
+                parent,
+                "데이터베이스 손상 감지",
+                "데이터베이스 무결성 검사에 실패했지만 사용할 수 있는 정상 백업이 없습니다.\n"
+                "'파일 > 데이터 백업'으로 현재 데이터를 내보내 두는 것을 권장합니다.\n\n"
+                f"{details}",
+            )
+            return
+
+        backup_path, profile = candidate
+        reply = QMessageBox.warning(
+            parent,
+            "데이터베이스 손상 감지",
+            "데이터베이스 무결성 검사에 실패했습니다.\n\n"
+            f"{details}\n\n"
+            f"가장 최근의 정상 백업으로 복원할까요?\n{backup_path}\n\n"
+            "백업 이후의 변경 내용은 사라지며, 손상된 파일은 backups 폴더에 따로 보관됩니다.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            db.record_maintenance_event("restore", "declined", {"backup": backup_path})
+            return
+        self.restore_from_backup(db, backup_path, profile)
+
+    def restore_from_backup(self, db, backup_path: str, profile: str = "full") -> bool:
+        db_path = db.db_file
+        app_dir = db.app_dir
+        window = self.window
+        action_manager = getattr(window, "action_manager", None)
+        if action_manager is not None:
+            try:
+                action_manager.action_completed.disconnect(window.on_action_completed)
+            except Exception:
+                pass
+            action_manager.shutdown()
+
+        try:
+            # 연결을 닫아 WAL을 반영한 뒤 .db/-wal/-shm을 함께 보관한다. 보관하지 못하면 덮어쓰지 않는다.
+            db.close()
+            preserved = preserve_corrupt_database(db_path, app_dir)
+            if preserved is None:
+                raise OSError("손상된 데이터베이스를 backups 폴더에 보관하지 못해 복원을 중단했습니다.")
+            replace_database_from_backup(backup_path, db_path)
+            restored_db = ClipboardDB(db_file=db_path, app_dir=app_dir)
+            try:
+                restored_db.record_maintenance_event(
+                    "restore",
+                    "ok",
+                    {"backup": backup_path, "profile": profile, "preserved": preserved},
+                )
+            finally:
+                restored_db.close()
+        except Exception as exc:
+            logger.exception("Automatic restore failed")
+            QMessageBox.critical(self._get_dialog_parent(), "복원 오류", f"백업 복원 중 오류가 발생했습니다:\n{exc}")
+            if window is not None and hasattr(window, "quit_app"):
+                window.quit_app()
+            return False
+
+        QMessageBox.information(
+            self._get_dialog_parent(),
+            "복원 완료",
+            "정상 백업으로 복원했습니다.\n앱을 종료합니다. 다시 실행해주세요.",
+        )
+        if window is not None and hasattr(window, "quit_app"):
+            window.quit_app()
+        return True
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        self._idle_timer.stop()
+        for thread in (
+            self._checkpoint_thread,
+            self._integrity_thread,
+            self._sync_thread,
+            self._recompress_thread,
+            self._hash_backfill_thread,
+        ):
+            if thread is not None and thread.is_alive():
+                thread.join(timeout)
+
+
+__all__ = [
+    "CHANGE_LOG_COMPACT_INTERVAL_SECONDS",
+    "FOLDER_SYNC_INTERVAL_SECONDS",
+    "IDLE_AFTER_SECONDS",
+    "IMAGE_HASH_BACKFILL_BATCH",
+    "IDLE_MAINTENANCE_INTERVAL_MS",
+    "INTEGRITY_CHECK_INTERVAL_SECONDS",
+    "MaintenanceController",
+]
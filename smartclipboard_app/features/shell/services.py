@@ -147,6 +147,16 @@ def quit_app_impl(self, logger, keyboard, qapplication_cls):
             self.backup_timer.stop()
             logger.debug("백업 타이머 중지됨")
 
+        maintenance_controller = getattr(self, "maintenance_controller", None)
+        if maintenance_controller is not None:
+            maintenance_controller.shutdown()
+            logger.debug("유지보수 작업 중지됨")
+
+        ipc_controller = getattr(self, "ipc_controller", None)
+        if ipc_controller is not None:
+            ipc_controller.shutdown()
+            logger.debug("IPC 서버 종료")
+
         if hasattr(self, "mini_window") and self.mini_window:
             self.mini_window.close()
             logger.debug("미니 창 종료")
@@ -158,6 +168,12 @@ def quit_app_impl(self, logger, keyboard, qapplication_cls):
         except Exception:
             pass
 
+        from smartclipboard_app.features.clipboard.pipeline import shutdown_text_capture_impl
+
+        # 대기 중인 텍스트 캡처를 액션 매니저/DB 종료 전에 끝낸다.
+        shutdown_text_capture_impl(self, logger)
+        logger.debug("텍스트 캡처 파이프라인 정리 완료")
+
         if hasattr(self, "action_manager") and self.action_manager:
             try:
                 self.action_manager.action_completed.disconnect(self.on_action_completed)
@@ -165,9 +181,32 @@ def quit_app_impl(self, logger, keyboard, qapplication_cls):
                 pass
             self.action_manager.shutdown()
             logger.debug("비동기 액션 정리 완료")
+
+        from smartclipboard_core.regex_guard import shutdown_regex_sandbox
+
+        shutdown_regex_sandbox()
+
+        capture_pool = getattr(self, "_capture_threadpool", None)
+        if capture_pool is not None:
+            # 진행 중인 캡처 저장이 끝난 뒤 DB를 닫는다.
+            capture_pool.waitForDone(5000)
+            logger.debug("캡처 저장 작업 정리 완료")
     except Exception as cleanup_exc:
         logger.warning(f"Cleanup warning: {cleanup_exc}")
 
+    try:
+        if hasattr(self.db, "checkpoint_wal"):
+            # 종료 시 WAL을 본 DB에 반영하고 파일을 비운다.
+            checkpoint = self.db.checkpoint_wal("TRUNCATE")
+            if checkpoint:
+                logger.debug(
+                    "종료 체크포인트: %s pages, %.2fms",
+                    checkpoint["checkpointed_pages"],
+                    checkpoint["duration_ms"],
+                )
+    except Exception as checkpoint_exc:
+        logger.warning(f"Shutdown checkpoint warning: {checkpoint_exc}")
+
     try:
         self.db.close()
         logger.debug("DB 연결 종료됨")
@@ -9,6 +9,8 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
+from smartclipboard_app.features.import_export.image_prepare import ImagePrepareStage
+
 
 def bootstrap_main_window(self: Any, start_minimized: bool, namespace: Mapping[str, Any]) -> None:
     ClipboardDB = namespace["ClipboardDB"]
@@ -47,7 +49,7 @@ def bootstrap_main_window(self: Any, start_minimized: bool, namespace: Mapping[s
         # v8.0: 새 매니저들 초기화
         self.vault_manager = SecureVaultManager(self.db)
         self.action_manager = ClipboardActionManager(self.db)
-        self.export_manager = ExportImportManager(self.db)
+        self.export_manager = ExportImportManager(self.db, image_stage_factory=ImagePrepareStage)
 
         # v10.5: 비동기 액션 시그널 연결
         self.action_manager.action_completed.connect(self.on_action_completed)
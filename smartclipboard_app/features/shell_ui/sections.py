@@ -22,6 +22,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from smartclipboard_app.features.history.view import show_full_image_impl
+
 T = TypeVar("T")
 
 
@@ -173,6 +175,12 @@ def build_main_ui(self, HAS_QRCODE):
     self.btn_save_img.clicked.connect(self.save_image_to_file)
     self.btn_save_img.setVisible(False)
 
+    self.btn_view_img = QPushButton("🔍 원본")
+    self.btn_view_img.setObjectName("ToolBtn")
+    self.btn_view_img.setToolTip("원본 크기로 보기")
+    self.btn_view_img.clicked.connect(lambda: show_full_image_impl(self))
+    self.btn_view_img.setVisible(False)
+
     self.btn_google = QPushButton("🔍 구글")
     self.btn_google.setObjectName("ToolBtn")
     self.btn_google.setToolTip("구글에서 검색")
@@ -209,6 +217,7 @@ def build_main_ui(self, HAS_QRCODE):
     self.btn_json.clicked.connect(lambda: self.transform_text("json"))
 
     self.tools_layout.addWidget(self.btn_save_img)
+    self.tools_layout.addWidget(self.btn_view_img)
     self.tools_layout.addWidget(self.btn_google)
     if HAS_QRCODE:
         self.tools_layout.addWidget(self.btn_qr)
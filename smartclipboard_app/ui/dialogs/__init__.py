@@ -8,9 +8,11 @@ if TYPE_CHECKING:
     from .copy_rules import CopyRulesDialog
     from .export_dialog import ExportDialog
     from .hotkeys import HotkeySettingsDialog
+    from .image_preview import ImagePreviewDialog
     from .import_dialog import ImportDialog
     from .secure_vault import SecureVaultDialog
     from .settings import SettingsDialog
+    from .similar_images import SimilarImagesDialog
     from .snippets import SnippetDialog, SnippetManagerDialog
     from .statistics import StatisticsDialog
     from .tags import TagEditDialog
@@ -31,6 +33,8 @@ __all__ = [
     "TagEditDialog",
     "StatisticsDialog",
     "CopyRulesDialog",
+    "SimilarImagesDialog",
+    "ImagePreviewDialog",
 ]
 
 
@@ -91,4 +95,12 @@ def __getattr__(name: str):
         from .copy_rules import CopyRulesDialog
 
         return CopyRulesDialog
+    if name == "SimilarImagesDialog":
+        from .similar_images import SimilarImagesDialog
+
+        return SimilarImagesDialog
+    if name == "ImagePreviewDialog":
+        from .image_preview import ImagePreviewDialog
+
+        return ImagePreviewDialog
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
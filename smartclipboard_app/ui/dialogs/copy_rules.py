@@ -6,6 +6,7 @@ import re
 from typing import Protocol, TypeVar, cast
 
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
@@ -23,6 +24,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from smartclipboard_app.features.clipboard.pipeline import copy_rule_stats_impl, reset_copy_rule_stats_impl
+
 T = TypeVar("T")
 
 
@@ -175,8 +178,8 @@ class CopyRulesDialog(QDialog):
         layout.addLayout(top_layout)
 
         self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["활성", "이름", "패턴", "동작", "치환값", "순서"])
+        self.table.setColumnCount(8)
+        self.table.setHorizontalHeaderLabels(["활성", "이름", "패턴", "동작", "치환값", "적중", "누적(ms)", "순서"])
         header = _ensure(self.table.horizontalHeader())
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
@@ -184,11 +187,15 @@ class CopyRulesDialog(QDialog):
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(7, QHeaderView.ResizeMode.Fixed)
         self.table.setColumnWidth(0, 50)
         self.table.setColumnWidth(1, 130)
         self.table.setColumnWidth(3, 120)
         self.table.setColumnWidth(4, 120)
         self.table.setColumnWidth(5, 60)
+        self.table.setColumnWidth(6, 80)
+        self.table.setColumnWidth(7, 60)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.cellDoubleClicked.connect(lambda *_args: self.edit_rule())
@@ -200,9 +207,13 @@ class CopyRulesDialog(QDialog):
         bottom_layout = QHBoxLayout()
         btn_delete = QPushButton("❌ 삭제")
         btn_delete.clicked.connect(self.delete_rule)
+        btn_reset_stats = QPushButton("📊 통계 초기화")
+        btn_reset_stats.setToolTip("규칙별 적중 횟수와 누적 처리 시간을 0으로 되돌립니다.")
+        btn_reset_stats.clicked.connect(self.reset_stats)
         btn_close = QPushButton("닫기")
         btn_close.clicked.connect(self.close)
         bottom_layout.addWidget(btn_delete)
+        bottom_layout.addWidget(btn_reset_stats)
         bottom_layout.addStretch()
         bottom_layout.addWidget(btn_close)
         layout.addLayout(bottom_layout)
@@ -225,10 +236,19 @@ class CopyRulesDialog(QDialog):
             return None
         return self.rules[row]
 
+    def _rule_stats(self) -> dict:
+        parent = self.parent()
+        return copy_rule_stats_impl(parent) if parent is not None else {}
+
     def load_rules(self):
         self.rules = list(self.db.get_copy_rules())
         self.table.setRowCount(0)
         action_labels = CopyRuleEditDialog.ACTIONS
+        stats = self._rule_stats()
+        # 가장 오래 걸린 규칙을 굵게 표시해 느린 패턴을 찾기 쉽게 한다.
+        costliest = max(stats, key=lambda rule_id: stats[rule_id]["total_ms"], default=None)
+        if costliest is not None and stats[costliest]["total_ms"] <= 0:
+            costliest = None
         for row_idx, (rid, name, pattern, action, replacement, enabled, _priority) in enumerate(self.rules):
             self.table.insertRow(row_idx)
 
@@ -248,9 +268,27 @@ class CopyRulesDialog(QDialog):
             self.table.setItem(row_idx, 2, QTableWidgetItem(pattern))
             self.table.setItem(row_idx, 3, QTableWidgetItem(action_labels.get(action, action)))
             self.table.setItem(row_idx, 4, QTableWidgetItem(replacement or "-"))
+            rule_stats = stats.get(rid)
+            hits_item = QTableWidgetItem(str(rule_stats["hits"]) if rule_stats else "-")
+            time_item = QTableWidgetItem(f"{rule_stats['total_ms']:.1f}" if rule_stats else "-")
+            for stat_item in (hits_item, time_item):
+                stat_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                if rule_stats:
+                    stat_item.setToolTip(
+                        f"평가 {rule_stats['evaluations']}회, 적중 {rule_stats['hits']}회, "
+                        f"평균 {rule_stats['mean_ms']:.3f}ms"
+                    )
+                else:
+                    stat_item.setToolTip("비활성 규칙이거나 아직 복사에 적용되지 않았습니다.")
+            if rid == costliest:
+                bold = QFont(time_item.font())
+                bold.setBold(True)
+                time_item.setFont(bold)
+            self.table.setItem(row_idx, 5, hits_item)
+            self.table.setItem(row_idx, 6, time_item)
             order_item = QTableWidgetItem(str(row_idx + 1))
             order_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 5, order_item)
+            self.table.setItem(row_idx, 7, order_item)
 
     def add_rule(self):
         dialog = CopyRuleEditDialog(self, self.db)
@@ -282,6 +320,12 @@ class CopyRulesDialog(QDialog):
             self.table.selectRow(target)
             self._notify_parent()
 
+    def reset_stats(self):
+        parent = self.parent()
+        if parent is not None:
+            reset_copy_rule_stats_impl(parent)
+        self.load_rules()
+
     def toggle_rule(self, rule_id, state):
         self.db.toggle_copy_rule(rule_id, 1 if state else 0)
         self._notify_parent()
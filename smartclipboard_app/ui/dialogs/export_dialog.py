@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import datetime
 
-from PyQt6.QtCore import QDate
+from PyQt6.QtCore import QDate, QTimer
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -14,11 +14,27 @@ from PyQt6.QtWidgets import (
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
+    QLabel,
+    QLineEdit,
     QMessageBox,
     QPushButton,
     QVBoxLayout,
 )
 
+from smartclipboard_core.db_parts.history.export_query import ExportQuery
+
+TYPE_FILTER_MAP = {
+    "전체": "all",
+    "텍스트만": "TEXT",
+    "링크만": "LINK",
+    "이미지만": "IMAGE",
+    "코드만": "CODE",
+    "색상만": "COLOR",
+    "파일만": "FILE",
+}
+# 컬렉션 콤보의 itemData: 전체는 None, 미분류는 이 값
+UNCATEGORIZED_COLLECTION = -1
+
 
 class ExportDialog(QDialog):
     """Advanced export dialog."""
@@ -27,7 +43,7 @@ class ExportDialog(QDialog):
         super().__init__(parent)
         self.export_manager = export_manager
         self.setWindowTitle("고급 내보내기")
-        self.setMinimumSize(420, 320)
+        self.setMinimumSize(420, 420)
         self.init_ui()
 
     def init_ui(self):
@@ -39,11 +55,13 @@ class ExportDialog(QDialog):
         self.format_json = QCheckBox("JSON (.json) - 전체 데이터")
         self.format_csv = QCheckBox("CSV (.csv) - 텍스트 호환")
         self.format_md = QCheckBox("Markdown (.md) - 문서형")
+        self.format_archive = QCheckBox("아카이브 (.zip) - 이미지 원본 포함 백업")
         self.format_json.setChecked(True)
         format_layout.addWidget(self.format_json)
         format_layout.addWidget(self.format_csv)
         format_layout.addWidget(self.format_md)
-        self.json_migration_mode = QCheckBox("JSON migration 모드 (히스토리 메타데이터 + 컬렉션 포함)")
+        format_layout.addWidget(self.format_archive)
+        self.json_migration_mode = QCheckBox("JSON/아카이브 migration 모드 (히스토리 메타데이터 + 컬렉션 포함)")
         self.json_migration_mode.setToolTip(
             "태그, 메모, 북마크, 컬렉션 정보를 함께 내보냅니다. 보안 보관함과 앱 설정은 포함되지 않습니다."
         )
@@ -53,7 +71,7 @@ class ExportDialog(QDialog):
         filter_group = QGroupBox("필터")
         filter_layout = QFormLayout(filter_group)
         self.type_combo = QComboBox()
-        self.type_combo.addItems(["전체", "텍스트만", "링크만", "이미지만", "코드만", "색상만", "파일만"])
+        self.type_combo.addItems(list(TYPE_FILTER_MAP))
         filter_layout.addRow("유형:", self.type_combo)
         self.date_filter_enabled = QCheckBox("시작일 이후 항목만 내보내기")
         self.date_from_input = QDateEdit()
@@ -63,8 +81,50 @@ class ExportDialog(QDialog):
         self.date_filter_enabled.toggled.connect(self.date_from_input.setEnabled)
         filter_layout.addRow(self.date_filter_enabled)
         filter_layout.addRow("시작일:", self.date_from_input)
+        self.date_to_enabled = QCheckBox("종료일까지의 항목만 내보내기")
+        self.date_to_input = QDateEdit()
+        self.date_to_input.setDate(QDate.currentDate())
+        self.date_to_input.setCalendarPopup(True)
+        self.date_to_input.setEnabled(False)
+        self.date_to_enabled.toggled.connect(self.date_to_input.setEnabled)
+        filter_layout.addRow(self.date_to_enabled)
+        filter_layout.addRow("종료일:", self.date_to_input)
+        self.collection_combo = QComboBox()
+        self.collection_combo.addItem("전체 컬렉션", None)
+        self.collection_combo.addItem("미분류", UNCATEGORIZED_COLLECTION)
+        for collection in self._load_collections():
+            self.collection_combo.addItem(f"{collection[2]} {collection[1]}".strip(), int(collection[0]))
+        filter_layout.addRow("컬렉션:", self.collection_combo)
+        self.tags_input = QLineEdit()
+        self.tags_input.setPlaceholderText("쉼표로 구분 (모든 태그 포함)")
+        filter_layout.addRow("태그:", self.tags_input)
+        self.bookmark_only = QCheckBox("북마크한 항목만")
+        self.pinned_only = QCheckBox("고정된 항목만")
+        filter_layout.addRow(self.bookmark_only)
+        filter_layout.addRow(self.pinned_only)
+        self.preview_label = QLabel()
+        filter_layout.addRow("대상:", self.preview_label)
         layout.addWidget(filter_group)
 
+        # 태그 입력 중에는 COUNT 쿼리를 몰아서 한 번만 실행한다.
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(200)
+        self._preview_timer.timeout.connect(self.update_preview_count)
+        for signal in (
+            self.type_combo.currentIndexChanged,
+            self.date_filter_enabled.toggled,
+            self.date_from_input.dateChanged,
+            self.date_to_enabled.toggled,
+            self.date_to_input.dateChanged,
+            self.collection_combo.currentIndexChanged,
+            self.tags_input.textChanged,
+            self.bookmark_only.toggled,
+            self.pinned_only.toggled,
+        ):
+            signal.connect(self._preview_timer.start)
+        self.update_preview_count()
+
         btn_layout = QHBoxLayout()
         btn_export = QPushButton("내보내기")
         btn_export.clicked.connect(self.do_export)
@@ -75,6 +135,39 @@ class ExportDialog(QDialog):
         btn_layout.addWidget(btn_cancel)
         layout.addLayout(btn_layout)
 
+    def _load_collections(self) -> list:
+        db = getattr(self.export_manager, "db", None)
+        if db is None or not hasattr(db, "get_collections"):
+            return []
+        try:
+            return list(db.get_collections())
+        except Exception:
+            return []
+
+    def build_export_query(self) -> ExportQuery:
+        """ExportQuery for the current filter controls."""
+        collection = self.collection_combo.currentData()
+        collection_ids = None
+        if collection is not None:
+            collection_ids = [None if collection == UNCATEGORIZED_COLLECTION else int(collection)]
+        return ExportQuery.create(
+            TYPE_FILTER_MAP.get(self.type_combo.currentText(), "all"),
+            date_from=self.date_from_input.date().toPyDate() if self.date_filter_enabled.isChecked() else None,
+            date_to=self.date_to_input.date().toPyDate() if self.date_to_enabled.isChecked() else None,
+            collection_ids=collection_ids,
+            tags=self.tags_input.text(),
+            bookmarked=True if self.bookmark_only.isChecked() else None,
+            pinned=True if self.pinned_only.isChecked() else None,
+        )
+
+    def update_preview_count(self):
+        counter = getattr(self.export_manager, "count_export_items", None)
+        if counter is None:
+            self.preview_label.setText("")
+            return
+        count = counter(query=self.build_export_query())
+        self.preview_label.setText(f"{count}개 항목" if count >= 0 else "개수를 계산하지 못했습니다")
+
     @staticmethod
     def _build_export_summary(reports: list[dict]) -> str:
         lines = []
@@ -105,19 +198,11 @@ class ExportDialog(QDialog):
         return "\n".join(lines).strip()
 
     def do_export(self):
-        type_map = {
-            "전체": "all",
-            "텍스트만": "TEXT",
-            "링크만": "LINK",
-            "이미지만": "IMAGE",
-            "코드만": "CODE",
-            "색상만": "COLOR",
-            "파일만": "FILE",
-        }
-        filter_type = type_map.get(self.type_combo.currentText(), "all")
-        date_from = self.date_from_input.date().toPyDate() if self.date_filter_enabled.isChecked() else None
-
-        if not any([self.format_json.isChecked(), self.format_csv.isChecked(), self.format_md.isChecked()]):
+        filter_type = TYPE_FILTER_MAP.get(self.type_combo.currentText(), "all")
+        query = self.build_export_query()
+
+        formats = (self.format_json, self.format_csv, self.format_md, self.format_archive)
+        if not any(checkbox.isChecked() for checkbox in formats):
             QMessageBox.warning(self, "경고", "하나 이상의 내보내기 형식을 선택하세요.")
             return
 
@@ -135,8 +220,8 @@ class ExportDialog(QDialog):
                 count = self.export_manager.export_json(
                     path,
                     filter_type,
-                    date_from=date_from,
                     include_metadata=self.json_migration_mode.isChecked(),
+                    query=query,
                 )
                 report = dict(getattr(self.export_manager, "last_export_report", {}) or {})
                 if count >= 0 and report.get("success"):
@@ -152,7 +237,7 @@ class ExportDialog(QDialog):
                 "CSV Files (*.csv)",
             )
             if path:
-                count = self.export_manager.export_csv(path, filter_type, date_from=date_from)
+                count = self.export_manager.export_csv(path, filter_type, query=query)
                 report = dict(getattr(self.export_manager, "last_export_report", {}) or {})
                 if count >= 0 and report.get("success"):
                     success_reports.append(report)
@@ -167,7 +252,27 @@ class ExportDialog(QDialog):
                 "Markdown Files (*.md)",
             )
             if path:
-                count = self.export_manager.export_markdown(path, filter_type, date_from=date_from)
+                count = self.export_manager.export_markdown(path, filter_type, query=query)
+                report = dict(getattr(self.export_manager, "last_export_report", {}) or {})
+                if count >= 0 and report.get("success"):
+                    success_reports.append(report)
+                else:
+                    failed_reports.append(report)
+
+        if self.format_archive.isChecked():
+            path, _ = QFileDialog.getSaveFileName(
+                self,
+                "아카이브 저장",
+                f"clipboard_export_{datetime.date.today()}.zip",
+                "Zip Archive (*.zip)",
+            )
+            if path:
+                count = self.export_manager.export_archive(
+                    path,
+                    filter_type,
+                    include_metadata=self.json_migration_mode.isChecked(),
+                    query=query,
+                )
                 report = dict(getattr(self.export_manager, "last_export_report", {}) or {})
                 if count >= 0 and report.get("success"):
                     success_reports.append(report)
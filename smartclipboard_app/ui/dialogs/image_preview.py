@@ -0,0 +1,36 @@
+"""Full-size image preview dialog module."""
+
+from __future__ import annotations
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QDialog, QHBoxLayout, QLabel, QPushButton, QScrollArea, QVBoxLayout
+
+
+class ImagePreviewDialog(QDialog):
+    """Original-resolution view of one image item, scrollable when larger than the screen."""
+
+    def __init__(self, parent, pixmap: QPixmap, title: str = "🖼️ 이미지 미리보기"):
+        super().__init__(parent)
+        self.pixmap = pixmap
+        self.setWindowTitle(f"{title} ({pixmap.width()}x{pixmap.height()})")
+        self.resize(min(pixmap.width() + 40, 1200), min(pixmap.height() + 80, 900))
+
+        layout = QVBoxLayout(self)
+        self.image_label = QLabel()
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setPixmap(pixmap)
+        scroll = QScrollArea()
+        scroll.setWidget(self.image_label)
+        scroll.setWidgetResizable(True)
+        layout.addWidget(scroll)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        btn_close = QPushButton("닫기")
+        btn_close.clicked.connect(self.close)
+        btn_layout.addWidget(btn_close)
+        layout.addLayout(btn_layout)
+
+
+__all__ = ["ImagePreviewDialog"]
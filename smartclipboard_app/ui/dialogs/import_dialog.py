@@ -46,10 +46,14 @@ class ImportDialog(QDialog):
         layout.addLayout(file_layout)
 
         btn_layout = QHBoxLayout()
+        btn_check = QPushButton("미리 검사")
+        btn_check.setToolTip("DB에 쓰지 않고 파일을 검사해 추가/병합/건너뛸 항목 수를 보여줍니다.")
+        btn_check.clicked.connect(self.do_dry_run)
         btn_import = QPushButton("불러오기")
         btn_import.clicked.connect(self.do_import)
         btn_cancel = QPushButton("취소")
         btn_cancel.clicked.connect(self.reject)
+        btn_layout.addWidget(btn_check)
         btn_layout.addStretch()
         btn_layout.addWidget(btn_import)
         btn_layout.addWidget(btn_cancel)
@@ -57,10 +61,14 @@ class ImportDialog(QDialog):
 
     def _set_format_hint(self, path: str) -> None:
         lower_path = path.lower()
-        if lower_path.endswith(".json"):
+        if lower_path.endswith((".json", ".jsonl")):
             self.format_hint.setText(
                 "JSON은 이미지 바이너리와 메타데이터를 포함해 가장 충실하게 복원합니다."
             )
+        elif lower_path.endswith(".zip"):
+            self.format_hint.setText(
+                "아카이브는 이미지 원본과 메타데이터를 그대로 담고 있어 큰 백업도 빠르게 복원합니다."
+            )
         elif lower_path.endswith(".csv"):
             self.format_hint.setText(
                 "CSV는 텍스트 위주 형식입니다. 이미지 바이너리와 일부 메타데이터는 복원되지 않을 수 있습니다."
@@ -71,10 +79,18 @@ class ImportDialog(QDialog):
     @staticmethod
     def _build_import_summary(report: dict) -> str:
         collection_summary = report.get("collection_summary", {})
-        lines = [
-            f"가져온 항목: {report.get('imported', 0)}개",
-            f"건너뛴 항목: {report.get('skipped', 0)}개",
-        ]
+        dry_run = report.get("dry_run")
+        if dry_run is not None:
+            lines = [
+                f"추가될 항목: {dry_run.get('would_insert', 0)}개",
+                f"병합될 항목(중복): {dry_run.get('would_merge', 0)}개",
+                f"건너뛸 항목: {report.get('skipped', 0)}개",
+            ]
+        else:
+            lines = [
+                f"가져온 항목: {report.get('imported', 0)}개",
+                f"건너뛴 항목: {report.get('skipped', 0)}개",
+            ]
         backup_path = report.get("backup_path")
         if backup_path:
             lines.append(f"사전 백업: {backup_path}")
@@ -111,33 +127,61 @@ class ImportDialog(QDialog):
             self,
             "파일 선택",
             "",
-            "지원 파일 (*.json *.csv);;JSON (*.json);;CSV (*.csv)",
+            "지원 파일 (*.json *.jsonl *.csv *.zip);;JSON (*.json);;JSON Lines (*.jsonl);;CSV (*.csv);;아카이브 (*.zip)",
         )
         if path:
             self.file_path.setText(path)
             self._set_format_hint(path)
 
-    def do_import(self):
+    def _run_import(self, path: str, dry_run: bool = False) -> int | None:
+        """Call the importer for path's format; None when nothing was run."""
+        lower_path = path.lower()
+        if lower_path.endswith(".json"):
+            return self.export_manager.import_json(path, dry_run=dry_run)
+        if lower_path.endswith(".jsonl"):
+            return self.export_manager.import_jsonl(path, dry_run=dry_run)
+        if lower_path.endswith(".zip"):
+            return self.export_manager.import_archive(path, dry_run=dry_run)
+        if lower_path.endswith(".csv"):
+            if not dry_run:
+                confirm = QMessageBox.question(
+                    self,
+                    "CSV 가져오기 확인",
+                    "CSV는 이미지 바이너리와 일부 메타데이터를 복원하지 못할 수 있습니다.\n계속할까요?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                )
+                if confirm != QMessageBox.StandardButton.Yes:
+                    return None
+            return self.export_manager.import_csv(path, dry_run=dry_run)
+        QMessageBox.warning(self, "경고", "지원하지 않는 파일 형식입니다.")
+        return None
+
+    def _selected_path(self) -> str:
         path = self.file_path.text().strip()
         if not path:
             QMessageBox.warning(self, "경고", "파일을 선택하세요.")
-            return
+        return path
 
-        lower_path = path.lower()
-        if lower_path.endswith(".json"):
-            count = self.export_manager.import_json(path)
-        elif lower_path.endswith(".csv"):
-            confirm = QMessageBox.question(
-                self,
-                "CSV 가져오기 확인",
-                "CSV는 이미지 바이너리와 일부 메타데이터를 복원하지 못할 수 있습니다.\n계속할까요?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            )
-            if confirm != QMessageBox.StandardButton.Yes:
-                return
-            count = self.export_manager.import_csv(path)
+    def do_dry_run(self):
+        """Validate the file and show would-insert/merge counts without writing."""
+        path = self._selected_path()
+        if not path:
+            return
+        count = self._run_import(path, dry_run=True)
+        if count is None:
+            return
+        report = getattr(self.export_manager, "last_import_report", {}) or {}
+        if count >= 0 and report.get("success"):
+            QMessageBox.information(self, "미리 검사 결과", self._build_import_summary(report))
         else:
-            QMessageBox.warning(self, "경고", "지원하지 않는 파일 형식입니다.")
+            QMessageBox.critical(self, "오류", self._build_import_error(report))
+
+    def do_import(self):
+        path = self._selected_path()
+        if not path:
+            return
+        count = self._run_import(path)
+        if count is None:
             return
 
         report = getattr(self.export_manager, "last_import_report", {}) or {}
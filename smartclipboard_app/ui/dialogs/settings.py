@@ -9,10 +9,12 @@ from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
     QDialog,
+    QFileDialog,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
     QLabel,
+    QLineEdit,
     QPushButton,
     QSpinBox,
     QTabWidget,
@@ -21,6 +23,18 @@ from PyQt6.QtWidgets import (
     QMessageBox,
 )
 
+from smartclipboard_app.features.clipboard.coalescer import (
+    CLIPBOARD_DEBOUNCE_MS,
+    CLIPBOARD_DEBOUNCE_RANGE_MS,
+    CLIPBOARD_DEBOUNCE_SETTING,
+)
+from smartclipboard_app.features.clipboard.image_codec import (
+    IMAGE_CODEC_DEFAULT,
+    IMAGE_CODEC_SETTING,
+    IMAGE_CODECS,
+    normalize_image_codec,
+)
+
 logger = logging.getLogger(__name__)
 
 FALLBACK_THEMES = {
@@ -187,8 +201,59 @@ class SettingsDialog(QDialog):
         self.max_history_warning = QLabel("값을 줄이면 제한을 초과한 고정되지 않은 오래된 항목이 영구 삭제됩니다.")
         self.max_history_warning.setWordWrap(True)
         history_layout.addRow("", self.max_history_warning)
+        self.large_clip_enabled = QCheckBox("1MB를 넘는 텍스트도 압축해서 저장 (최대 64MB)")
+        self.large_clip_enabled.setChecked(_parse_bool_setting(self.db.get_setting("large_clip_mode", "true"), default=True))
+        self.large_clip_enabled.setToolTip(
+            "대용량 텍스트는 압축 청크로 저장되고 검색에는 앞부분만 사용됩니다.\n"
+            "복사 규칙과 자동 액션은 적용되지 않고 원문 그대로 저장됩니다."
+        )
+        history_layout.addRow(self.large_clip_enabled)
+        self.clipboard_debounce_spin = QSpinBox()
+        self.clipboard_debounce_spin.setRange(*CLIPBOARD_DEBOUNCE_RANGE_MS)
+        self.clipboard_debounce_spin.setSuffix(" ms")
+        self.clipboard_debounce_spin.setValue(
+            _parse_int_setting(
+                self.db.get_setting(CLIPBOARD_DEBOUNCE_SETTING, CLIPBOARD_DEBOUNCE_MS),
+                CLIPBOARD_DEBOUNCE_MS,
+                *CLIPBOARD_DEBOUNCE_RANGE_MS,
+            )
+        )
+        self.clipboard_debounce_spin.setToolTip("클립보드가 연달아 바뀌면 이 시간 동안 잠잠해진 뒤 한 번만 저장합니다.")
+        history_layout.addRow("변경 감지 지연:", self.clipboard_debounce_spin)
+        self.ipc_server_enabled = QCheckBox("다른 프로그램의 로컬 히스토리 조회 허용 (JSON-RPC)")
+        self.ipc_server_enabled.setChecked(_parse_bool_setting(self.db.get_setting("ipc_server_enabled", "false"), default=False))
+        self.ipc_server_enabled.setToolTip(
+            "이 PC의 다른 도구가 앱 폴더의 ipc_endpoint.json 토큰으로 검색/조회/추가할 수 있습니다."
+        )
+        history_layout.addRow(self.ipc_server_enabled)
+        self.sync_folder_input = QLineEdit(str(self.db.get_setting("sync_folder", "") or ""))
+        self.sync_folder_input.setPlaceholderText("비워두면 동기화하지 않음")
+        self.sync_folder_input.setToolTip(
+            "여러 PC가 같은 공유 폴더(네트워크 드라이브, 클라우드 폴더)를 지정하면 변경분만 번들로 주고받습니다."
+        )
+        sync_folder_row = QHBoxLayout()
+        sync_folder_row.addWidget(self.sync_folder_input)
+        sync_folder_browse = QPushButton("찾아보기")
+        sync_folder_browse.clicked.connect(self._browse_sync_folder)
+        sync_folder_row.addWidget(sync_folder_browse)
+        history_layout.addRow("동기화 폴더:", sync_folder_row)
         general_layout.addWidget(history_group)
 
+        image_group = QGroupBox("🖼️ 이미지 저장")
+        image_layout = QFormLayout(image_group)
+        self.image_codec_combo = QComboBox()
+        for key, label in IMAGE_CODECS.items():
+            self.image_codec_combo.addItem(label, key)
+        current_codec = normalize_image_codec(self.db.get_setting(IMAGE_CODEC_SETTING, IMAGE_CODEC_DEFAULT))
+        self.image_codec_combo.setCurrentIndex(list(IMAGE_CODECS).index(current_codec))
+        self.image_codec_combo.setToolTip("새로 캡처하는 이미지의 저장 형식입니다. 5MB 제한은 압축된 크기에 적용됩니다.")
+        image_layout.addRow("저장 형식:", self.image_codec_combo)
+        recompress_button = QPushButton("🗜️ 기존 이미지 재압축")
+        recompress_button.setToolTip("저장된 PNG 이미지를 선택한 형식으로 무손실 재압축합니다. JPEG 이미지는 그대로 둡니다.")
+        recompress_button.clicked.connect(self._start_image_recompression)
+        image_layout.addRow("", recompress_button)
+        general_layout.addWidget(image_group)
+
         mini_window_group = QGroupBox("🔲 미니 창")
         mini_window_layout = QFormLayout(mini_window_group)
         self.mini_window_enabled = QCheckBox("미니 클립보드 창 활성화")
@@ -253,6 +318,23 @@ class SettingsDialog(QDialog):
         btn_layout.addWidget(btn_cancel)
         layout.addLayout(btn_layout)
 
+    def _browse_sync_folder(self) -> None:
+        folder = QFileDialog.getExistingDirectory(self, "동기화 폴더 선택", self.sync_folder_input.text().strip())
+        if folder:
+            self.sync_folder_input.setText(folder)
+
+    def _start_image_recompression(self) -> None:
+        maintenance_controller = getattr(self.parent(), "maintenance_controller", None)
+        codec = cast(str, self.image_codec_combo.currentData() or IMAGE_CODEC_DEFAULT)
+        if maintenance_controller is None or not maintenance_controller.start_image_recompression(codec):
+            QMessageBox.information(self, "이미지 재압축", "재압축을 시작할 수 없습니다. 이미 진행 중인지 확인해주세요.")
+            return
+        QMessageBox.information(
+            self,
+            "이미지 재압축",
+            "백그라운드에서 재압축을 시작했습니다.\n완료되면 상태 표시줄에 절약된 용량이 표시됩니다.",
+        )
+
     @staticmethod
     def _setting_value_matches(expected: object, actual: object) -> bool:
         return str(actual) == str(expected)
@@ -294,6 +376,11 @@ class SettingsDialog(QDialog):
             self._show_setting_save_error("max_history")
             return
 
+        selected_codec = cast(str, self.image_codec_combo.currentData() or IMAGE_CODEC_DEFAULT)
+        if not self._save_and_verify_setting(IMAGE_CODEC_SETTING, selected_codec):
+            self._show_setting_save_error(IMAGE_CODEC_SETTING)
+            return
+
         selected_log_level = cast(str, self.log_level_combo.currentData() or "INFO")
         if not self._save_and_verify_setting("log_level", selected_log_level):
             self._show_setting_save_error("log_level")
@@ -314,6 +401,36 @@ class SettingsDialog(QDialog):
             for handler in self.logger.handlers:
                 handler.setLevel(level)
 
+        large_clip_mode = "true" if self.large_clip_enabled.isChecked() else "false"
+        if not self._save_and_verify_setting("large_clip_mode", large_clip_mode):
+            self._show_setting_save_error("large_clip_mode")
+            return
+
+        debounce_ms = self.clipboard_debounce_spin.value()
+        if not self._save_and_verify_setting(CLIPBOARD_DEBOUNCE_SETTING, debounce_ms):
+            self._show_setting_save_error(CLIPBOARD_DEBOUNCE_SETTING)
+            return
+        coalescer = getattr(self.parent(), "_clipboard_coalescer", None)
+        if coalescer is not None:
+            coalescer.configure(debounce_ms=debounce_ms)
+
+        ipc_enabled = "true" if self.ipc_server_enabled.isChecked() else "false"
+        if not self._save_and_verify_setting("ipc_server_enabled", ipc_enabled):
+            self._show_setting_save_error("ipc_server_enabled")
+            return
+        ipc_controller = getattr(self.parent(), "ipc_controller", None)
+        if ipc_controller is not None:
+            ipc_controller.apply_setting()
+
+        sync_folder = self.sync_folder_input.text().strip()
+        if sync_folder != str(self.db.get_setting("sync_folder", "") or ""):
+            if not self._save_and_verify_setting("sync_folder", sync_folder):
+                self._show_setting_save_error("sync_folder")
+                return
+            maintenance_controller = getattr(self.parent(), "maintenance_controller", None)
+            if sync_folder and maintenance_controller is not None:
+                maintenance_controller.start_folder_sync(force=True)
+
         mini_enabled = "true" if self.mini_window_enabled.isChecked() else "false"
         hotkey_parent = _hotkey_parent(self.parent())
         hotkey_warning = ""
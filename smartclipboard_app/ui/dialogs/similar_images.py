@@ -0,0 +1,190 @@
+"""Similar images dialog module."""
+
+from __future__ import annotations
+
+from typing import TypeVar
+
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QHBoxLayout,
+    QLabel,
+    QMessageBox,
+    QPushButton,
+    QSpinBox,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QVBoxLayout,
+)
+
+from smartclipboard_app.features.clipboard.image_hash import backfill_image_hashes
+from smartclipboard_app.features.clipboard.thumbnails import backfill_image_thumbnails, get_thumbnail_cache
+from smartclipboard_core.image_hash import IMAGE_HASH_BITS, IMAGE_SIMILAR_MAX_DISTANCE
+
+from .trash_dialog import FALLBACK_THEMES
+
+T = TypeVar("T")
+
+THUMBNAIL_SIZE = 64
+# 대화상자를 열 때 해시가 없는 이미지(가져오기/복원분)를 이만큼까지 채운다.
+BACKFILL_LIMIT = 500
+
+
+def _ensure(value: T | None) -> T:
+    assert value is not None
+    return value
+
+
+class SimilarImagesDialog(QDialog):
+    """Images near one item, or every group of near-duplicate images, by perceptual hash."""
+
+    def __init__(self, parent, db, item_id: int | None = None, themes=None):
+        super().__init__(parent)
+        self.db = db
+        self.parent_window = parent
+        self.item_id = item_id
+        self.themes = themes or FALLBACK_THEMES
+        self.current_theme = parent.current_theme if hasattr(parent, "current_theme") else "dark"
+        self.deleted_count = 0
+        # 메인 창과 같은 DB면 썸네일 캐시를 공유한다.
+        self.thumbnails = get_thumbnail_cache(parent if getattr(parent, "db", None) is db else self)
+        self.setWindowTitle("🖼️ 비슷한 이미지")
+        self.setMinimumSize(480, 420)
+        self.apply_dialog_theme()
+        self.init_ui()
+        backfill_image_hashes(self.db, BACKFILL_LIMIT)
+        backfill_image_thumbnails(self.db, BACKFILL_LIMIT)
+        self.load_items()
+
+    def apply_dialog_theme(self):
+        theme = self.themes.get(self.current_theme, self.themes["dark"])
+        self.setStyleSheet(
+            f"""
+            QDialog {{
+                background-color: {theme["background"]};
+                color: {theme["text"]};
+            }}
+            QTreeWidget {{
+                background-color: {theme["surface"]};
+                border: 1px solid {theme["border"]};
+                border-radius: 8px;
+                color: {theme["text"]};
+            }}
+            QTreeWidget::item:selected {{
+                background-color: {theme["primary"]};
+            }}
+            QLabel {{
+                color: {theme["text_secondary"]};
+            }}
+            QPushButton {{
+                background-color: {theme["surface_variant"]};
+                border: none;
+                border-radius: 6px;
+                padding: 10px 16px;
+                color: {theme["text"]};
+            }}
+            QPushButton:hover {{
+                background-color: {theme["primary"]};
+                color: white;
+            }}
+            """
+        )
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+
+        if self.item_id is None:
+            info_text = "지각 해시가 가까운 이미지끼리 묶어 보여줍니다. 중복 캡처를 골라 휴지통으로 옮길 수 있습니다."
+        else:
+            info_text = f"이미지 #{self.item_id}와 비슷한 이미지입니다 (거리가 작을수록 비슷함)."
+        info = QLabel(info_text)
+        info.setWordWrap(True)
+        layout.addWidget(info)
+
+        distance_layout = QHBoxLayout()
+        distance_layout.addWidget(QLabel("최대 거리"))
+        self.distance_spin = QSpinBox()
+        self.distance_spin.setRange(0, IMAGE_HASH_BITS // 4)
+        self.distance_spin.setValue(IMAGE_SIMILAR_MAX_DISTANCE)
+        self.distance_spin.valueChanged.connect(self.load_items)
+        distance_layout.addWidget(self.distance_spin)
+        distance_layout.addStretch()
+        layout.addLayout(distance_layout)
+
+        self.tree = QTreeWidget()
+        self.tree.setColumnCount(2)
+        self.tree.setHeaderLabels(["이미지", "거리"])
+        self.tree.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        layout.addWidget(self.tree)
+
+        btn_layout = QHBoxLayout()
+        btn_delete = QPushButton("🗑️ 선택 항목 삭제 (휴지통)")
+        btn_delete.clicked.connect(self.delete_selected)
+        btn_close = QPushButton("닫기")
+        btn_close.clicked.connect(self.close)
+        btn_layout.addWidget(btn_delete)
+        btn_layout.addStretch()
+        btn_layout.addWidget(btn_close)
+        layout.addLayout(btn_layout)
+
+    def _image_item(self, parent_item: QTreeWidgetItem, item_id: int, distance_text: str) -> QTreeWidgetItem:
+        tree_item = QTreeWidgetItem(parent_item, [f"#{item_id}", distance_text])
+        tree_item.setData(0, Qt.ItemDataRole.UserRole, item_id)
+        pixmap = self.thumbnails.pixmap(item_id, THUMBNAIL_SIZE)
+        if pixmap is not None:
+            tree_item.setIcon(0, QIcon(pixmap))
+        return tree_item
+
+    def load_items(self):
+        self.tree.clear()
+        max_distance = self.distance_spin.value()
+        root = _ensure(self.tree.invisibleRootItem())
+        if self.item_id is not None:
+            group = QTreeWidgetItem(root, ["기준 이미지", ""])
+            self._image_item(group, self.item_id, "0")
+            for match_id, distance in self.db.find_similar_images(self.item_id, max_distance):
+                self._image_item(group, match_id, str(distance))
+            empty = group.childCount() <= 1
+        else:
+            groups = self.db.find_similar_image_groups(max_distance)
+            for index, members in enumerate(groups, start=1):
+                group = QTreeWidgetItem(root, [f"그룹 {index} ({len(members)}개)", ""])
+                for item_id in members:
+                    self._image_item(group, item_id, "")
+            empty = not groups
+
+        if empty:
+            self.tree.clear()
+            QTreeWidgetItem(root, ["비슷한 이미지가 없습니다", ""]).setFlags(Qt.ItemFlag.NoItemFlags)
+        self.tree.expandAll()
+
+    def selected_item_ids(self) -> list[int]:
+        ids = []
+        for tree_item in self.tree.selectedItems():
+            item_id = tree_item.data(0, Qt.ItemDataRole.UserRole)
+            if item_id:
+                ids.append(int(item_id))
+        return ids
+
+    def delete_selected(self):
+        item_ids = self.selected_item_ids()
+        if not item_ids:
+            QMessageBox.information(self, "알림", "삭제할 이미지를 선택하세요.")
+            return
+        deleted = sum(1 for item_id in item_ids if self.db.soft_delete(item_id))
+        if not deleted:
+            return
+        self.deleted_count += deleted
+        if self.item_id in item_ids:
+            self.item_id = None
+        self.load_items()
+        load_data = getattr(self.parent_window, "load_data", None)
+        if callable(load_data):
+            load_data()
+
+
+__all__ = ["SimilarImagesDialog"]
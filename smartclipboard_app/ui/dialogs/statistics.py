@@ -60,9 +60,60 @@ class StatisticsDialog(QDialog):
             top_layout.addWidget(QLabel("사용 기록 없음"))
         layout.addWidget(top_group)
 
+        if hasattr(self.db, "get_storage_diagnostics"):
+            layout.addWidget(self._build_storage_group(self.db.get_storage_diagnostics()))
+
         btn_close = QPushButton("닫기")
         btn_close.clicked.connect(self.close)
         layout.addWidget(btn_close)
 
+    @staticmethod
+    def _format_bytes(size) -> str:
+        size = float(size or 0)
+        for unit in ("B", "KB", "MB"):
+            if size < 1024:
+                return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+            size /= 1024
+        return f"{size:.1f}GB"
+
+    def _build_storage_group(self, diagnostics) -> QGroupBox:
+        storage_group = QGroupBox("🩺 저장소 진단")
+        storage_layout = QVBoxLayout(storage_group)
+        storage_layout.addWidget(
+            QLabel(
+                f"DB {self._format_bytes(diagnostics.get('db_bytes'))} · "
+                f"WAL {self._format_bytes(diagnostics.get('wal_bytes'))} · "
+                f"빈 페이지 {diagnostics.get('freelist_count', 0)}개"
+            )
+        )
+        checkpoints = diagnostics.get("checkpoints") or {}
+        last = checkpoints.get("last")
+        if last:
+            storage_layout.addWidget(
+                QLabel(
+                    f"마지막 체크포인트: {last['mode']} · {last['checkpointed_pages']}/{last['log_pages']} 페이지 · "
+                    f"{last['duration_ms']:.1f}ms ({last['at']})"
+                )
+            )
+            storage_layout.addWidget(
+                QLabel(
+                    f"체크포인트 {checkpoints.get('count', 0)}회 · 평균 {checkpoints.get('avg_ms', 0.0):.1f}ms · "
+                    f"최대 {checkpoints.get('max_ms', 0.0):.1f}ms · 지연 {checkpoints.get('busy', 0)}회"
+                )
+            )
+        else:
+            storage_layout.addWidget(QLabel("체크포인트 기록 없음"))
+        integrity = diagnostics.get("last_integrity_check")
+        if integrity:
+            status_label = {"ok": "정상", "fts_corrupt": "검색 색인 손상", "db_corrupt": "DB 손상"}.get(
+                integrity["status"], integrity["status"]
+            )
+            storage_layout.addWidget(
+                QLabel(f"마지막 무결성 검사: {status_label} · {float(integrity['duration_ms'] or 0):.1f}ms ({integrity['at']})")
+            )
+        else:
+            storage_layout.addWidget(QLabel("무결성 검사 기록 없음"))
+        return storage_group
+
 
 __all__ = ["StatisticsDialog"]
@@ -1,4 +1,6 @@
 from smartclipboard_app.features.shared import bind_window_facets
+from smartclipboard_app.features.ipc import IpcServerController
+from smartclipboard_app.features.maintenance import MaintenanceController
 from smartclipboard_app.features.updater import UpdaterController
 from smartclipboard_app.legacy_main import MainWindow as LegacyMainWindow
 
@@ -20,6 +22,10 @@ class MainWindow(LegacyMainWindow):
         self.lifecycle_controller = getattr(self, "lifecycle_controller", LifecycleController(self))
         self.updater_controller = getattr(self, "updater_controller", UpdaterController(self))
         self.updater_controller.notify_pending_update_result()
+        self.maintenance_controller = getattr(self, "maintenance_controller", MaintenanceController(self))
+        self.maintenance_controller.start()
+        self.ipc_controller = getattr(self, "ipc_controller", IpcServerController(self))
+        self.ipc_controller.apply_setting()
         from PyQt6.QtCore import QTimer
 
         QTimer.singleShot(3000, lambda: self.check_for_updates(interactive=False))
@@ -35,5 +41,7 @@ class MainWindow(LegacyMainWindow):
             "tray_hotkey": self.tray_hotkey_controller,
             "lifecycle": self.lifecycle_controller,
             "updater": self.updater_controller,
+            "maintenance": self.maintenance_controller,
+            "ipc": self.ipc_controller,
         }
 
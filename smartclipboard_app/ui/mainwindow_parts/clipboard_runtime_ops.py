@@ -30,14 +30,13 @@ def process_clipboard_impl(self, logger):
         logger.exception("Clipboard access error")
 
 
-def process_image_clipboard_impl(self, mime_data, logger, qbytearray_cls, qbuffer_cls, hashlib_mod, toast_cls):
+def process_image_clipboard_impl(self, mime_data, logger, qbytearray_cls, qbuffer_cls, toast_cls):
     return _pipeline.process_image_clipboard_impl(
         self,
         mime_data,
         logger,
         qbytearray_cls,
         qbuffer_cls,
-        hashlib_mod,
         toast_cls,
     )
 
@@ -5,8 +5,8 @@ from __future__ import annotations
 import logging
 from typing import Any, Protocol, cast
 
-from PyQt6.QtCore import QPoint, QTimer, Qt, pyqtSignal
-from PyQt6.QtGui import QMouseEvent, QPixmap, QShowEvent
+from PyQt6.QtCore import QPoint, QSize, QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QIcon, QMouseEvent, QPixmap, QShowEvent
 from PyQt6.QtWidgets import (
     QApplication,
     QFrame,
@@ -19,6 +19,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from smartclipboard_app.features.clipboard.thumbnails import THUMBNAIL_ICON_SIZE, get_thumbnail_cache
 from smartclipboard_app.ui.clipboard_guard import mark_internal_copy, restore_file_clipboard
 from smartclipboard_core.file_paths import (
     build_file_paths_tooltip,
@@ -117,6 +118,7 @@ class FloatingMiniWindow(QWidget):
 
         self.list_widget = QListWidget()
         self.list_widget.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.list_widget.setIconSize(QSize(THUMBNAIL_ICON_SIZE, THUMBNAIL_ICON_SIZE))
         layout.addWidget(self.list_widget)
 
         btn_layout = QHBoxLayout()
@@ -215,6 +217,9 @@ class FloatingMiniWindow(QWidget):
             self.list_widget.addItem(empty_item)
             return
 
+        image_ids = [item[0] for item in items if item[2] == "IMAGE"]
+        thumbnails = self._thumbnail_cache().pixmaps(image_ids, THUMBNAIL_ICON_SIZE) if image_ids else {}
+
         for pid, content, ptype, _timestamp, pinned, _use_count, _pin_order in items:
             icon = self.type_icons.get(ptype, "📝")
             pin_mark = "📌 " if pinned else ""
@@ -229,8 +234,16 @@ class FloatingMiniWindow(QWidget):
                 item.setToolTip(build_file_paths_tooltip(file_paths))
             else:
                 item.setToolTip(content[:200])
+            thumbnail = thumbnails.get(pid)
+            if thumbnail is not None:
+                item.setIcon(QIcon(thumbnail))
             self.list_widget.addItem(item)
 
+    def _thumbnail_cache(self):
+        # 메인 창과 같은 DB면 캐시(와 캡처 시 무효화)를 공유한다.
+        owner = self.parent_window if getattr(self.parent_window, "db", None) is self.db else self
+        return get_thumbnail_cache(owner)
+
     def on_item_double_clicked(self, item):
         pid = item.data(Qt.ItemDataRole.UserRole)
         if not pid:
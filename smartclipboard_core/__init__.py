@@ -1,27 +1,64 @@
-from .database import ClipboardDB
-from .actions import ClipboardActionManager, extract_first_url
-from .worker import Worker, WorkerSignals
-from .config import Config
-from .update_manifest import (
-    NoUpdateAvailableError,
-    ReleaseManifest,
-    canonical_manifest_payload,
-    download_release_manifest,
-    is_newer_version,
-    verify_release_manifest,
-)
-from .update_installer import (
-    UpdateApplyError,
-    apply_staged_update,
-    cleanup_update_backups,
-    consume_update_result,
-    launch_update_helper,
-    prepare_staged_update,
-    resolve_update_staging_root,
-    stream_update_artifact,
-    update_result_path,
-    write_update_result,
-)
+"""Core (Qt-free where possible) building blocks for SmartClipboard.
+
+Exports are resolved lazily so that lightweight entry points such as the CLI
+can import ``smartclipboard_core.database`` without pulling in PyQt/requests.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .database import ClipboardDB
+    from .actions import ClipboardActionManager, extract_first_url
+    from .worker import Worker, WorkerSignals
+    from .config import Config
+    from .update_manifest import (
+        NoUpdateAvailableError,
+        ReleaseManifest,
+        canonical_manifest_payload,
+        download_release_manifest,
+        is_newer_version,
+        verify_release_manifest,
+    )
+    from .update_installer import (
+        UpdateApplyError,
+        apply_staged_update,
+        cleanup_update_backups,
+        consume_update_result,
+        launch_update_helper,
+        prepare_staged_update,
+        resolve_update_staging_root,
+        stream_update_artifact,
+        update_result_path,
+        write_update_result,
+    )
+
+_LAZY_EXPORTS = {
+    "ClipboardDB": ".database",
+    "ClipboardActionManager": ".actions",
+    "extract_first_url": ".actions",
+    "Worker": ".worker",
+    "WorkerSignals": ".worker",
+    "Config": ".config",
+    "NoUpdateAvailableError": ".update_manifest",
+    "ReleaseManifest": ".update_manifest",
+    "canonical_manifest_payload": ".update_manifest",
+    "download_release_manifest": ".update_manifest",
+    "is_newer_version": ".update_manifest",
+    "verify_release_manifest": ".update_manifest",
+    "UpdateApplyError": ".update_installer",
+    "apply_staged_update": ".update_installer",
+    "cleanup_update_backups": ".update_installer",
+    "consume_update_result": ".update_installer",
+    "launch_update_helper": ".update_installer",
+    "prepare_staged_update": ".update_installer",
+    "resolve_update_staging_root": ".update_installer",
+    "stream_update_artifact": ".update_installer",
+    "update_result_path": ".update_installer",
+    "write_update_result": ".update_installer",
+}
 
 __all__ = [
     "ClipboardDB",
@@ -47,3 +84,12 @@ __all__ = [
     "update_result_path",
     "write_update_result",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,18 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any, Mapping
 from urllib.parse import urlparse
 
 from smartclipboard_core.automation.fetch_title import extract_first_url
 from smartclipboard_core.automation.formatters import format_phone
+from smartclipboard_core.classifier import JSON_DETECT_MAX_CHARS, ContentClass, classify_content
 
 from .models import ActionContext
 
-JSON_DETECT_MAX_CHARS = 256 * 1024
-
 _SENSITIVE_WORD_RE = re.compile(
     r"(?i)(?<![a-z0-9_])(password|secret|api[_-]?key|비밀번호)(?![a-z0-9_])"
 )
@@ -27,16 +25,6 @@ _SENSITIVE_BODY_PATTERNS = (
 )
 
 
-def _looks_like_json(text: str) -> bool:
-    if not text or len(text) > JSON_DETECT_MAX_CHARS:
-        return False
-    try:
-        json.loads(text)
-    except (TypeError, ValueError):
-        return False
-    return True
-
-
 def _looks_like_phone(text: str) -> bool:
     return format_phone(text) is not None
 
@@ -56,18 +44,18 @@ def _infer_content_type(
     stored_type: str,
     file_paths: tuple[str, ...],
     url: str | None,
-    is_valid_json: bool,
+    classified: ContentClass,
 ) -> str:
     stored = (stored_type or "").upper()
     if stored == "IMAGE":
         return "image"
     if stored == "FILE":
         return "files" if len(file_paths) > 1 else "file"
-    if url and (stored == "LINK" or re.match(r"^https?://", raw_text.strip())):
+    if url and (stored == "LINK" or classified.type_tag == "LINK"):
         return "url"
     if _looks_like_phone(raw_text):
         return "phone"
-    if is_valid_json:
+    if classified.is_json:
         return "json"
     if stored == "COLOR":
         return "color"
@@ -105,8 +93,9 @@ def build_context(
             extra.setdefault("url_title", extra.get("url_title"))
 
     paths = tuple(file_paths or ())
-    valid_json = _looks_like_json(text.strip())
-    content_type = _infer_content_type(text, stored_type, paths, url, valid_json)
+    # 캡처 때와 같은 분류기·캐시를 쓴다. 방금 캡처한 항목이면 해시 한 번으로 끝난다.
+    classified = classify_content(text.strip())
+    content_type = _infer_content_type(text, stored_type, paths, url, classified)
     return ActionContext(
         item_id=item_id,
         raw_text=text,
@@ -116,7 +105,7 @@ def build_context(
         domain=domain,
         file_paths=paths,
         is_multiline=("\n" in text) or ("\r" in text),
-        is_valid_json=valid_json,
+        is_valid_json=classified.is_json,
         is_sensitive=_is_sensitive(
             str(extra.get("tags", tags) or ""),
             str(extra.get("note", note) or ""),
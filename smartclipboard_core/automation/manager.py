@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 import time
 from collections import OrderedDict
+from typing import Any, cast
 
-from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, QThread, QThreadPool, pyqtSignal
 
 from .cache import TITLE_CACHE_MAX_ENTRIES, TITLE_CACHE_TTL_SECONDS, TITLE_FETCH_MAX_THREADS
 from .fetch_title import (
@@ -19,6 +19,8 @@ from .fetch_title import (
     validate_title_fetch_url,
 )
 from .formatters import format_email, format_phone, replacement_text_from_result, transform_text
+from .plans import ActionPlan, ActionProgram, compile_action_plans
+from ..regex_guard import RegexBudgetExceeded
 from ..worker import Worker
 
 logger = logging.getLogger(__name__)
@@ -28,11 +30,12 @@ class ClipboardActionManager(QObject):
     """복사된 내용에 따라 자동 액션을 수행하는 관리자."""
 
     action_completed = pyqtSignal(str, object)
+    _title_fetch_requested = pyqtSignal(str, object, str)  # url, item_id, action_name
 
     def __init__(self, db):
         super().__init__()
         self.db = db
-        self.actions_cache = []
+        self._program = ActionProgram()
         self._is_shutting_down = False
         self._title_cache: OrderedDict[str, str] = OrderedDict()
         self._title_cache_times: dict[str, float] = {}
@@ -44,62 +47,47 @@ class ClipboardActionManager(QObject):
         self.reload_actions()
         self.threadpool = QThreadPool()
         self.threadpool.setMaxThreadCount(TITLE_FETCH_MAX_THREADS)
+        # PyQt6 스텁의 connect()에는 연결 종류 인자가 없다.
+        cast(Any, self._title_fetch_requested).connect(self.fetch_url_title_async, Qt.ConnectionType.QueuedConnection)
+
+    @property
+    def actions_cache(self) -> tuple[ActionPlan, ...]:
+        """Enabled action plans in priority order (read-only; rebuilt by reload_actions())."""
+        return self._program.plans
 
     def reload_actions(self):
-        raw_actions = self.db.get_clipboard_actions()
-        self.actions_cache = []
-        for action in raw_actions:
-            aid, name, pattern, action_type, params_json, enabled, priority = action
-            if not pattern:
-                continue
-            try:
-                compiled_pattern = re.compile(pattern)
-                self.actions_cache.append(
-                    {
-                        "id": aid,
-                        "name": name,
-                        "pattern": pattern,
-                        "compiled": compiled_pattern,
-                        "type": action_type,
-                        "params": params_json,
-                        "enabled": enabled,
-                        "priority": priority,
-                    }
-                )
-            except re.error as exc:
-                logger.warning("Invalid regex in action '%s': %s", name, exc)
+        self._program = compile_action_plans(self.db.get_clipboard_actions(), logger)
 
     def process(self, text, item_id=None):
         results = []
+        program = self._program
+        found = program.literals_in(text)
+        if not found and not program.has_unconditional:
+            return results
         current_text = text
         pending_fetch_actions: list[str] = []
-        for action in self.actions_cache:
-            if not action["enabled"]:
-                continue
+        for plan in program.plans:
             try:
-                if not action["compiled"].search(current_text):
+                if not program.is_candidate(plan, found):
                     continue
-                params_json = action["params"]
-                try:
-                    params = json.loads(params_json) if params_json else {}
-                except json.JSONDecodeError:
-                    params = {}
-
-                action_type = action["type"]
-                name = action["name"]
-                if action_type == "fetch_title":
-                    pending_fetch_actions.append(name)
+                if not plan.literal_only and not plan.regex.search(current_text):
+                    continue
+                if plan.action_type == "fetch_title":
+                    pending_fetch_actions.append(plan.name)
                 else:
-                    result = self.execute_action(action_type, current_text, params, item_id)
+                    result = self.execute_action(plan.action_type, current_text, plan.params, item_id)
                     if result:
-                        results.append((name, result))
+                        results.append((plan.name, result))
                         replacement_text = replacement_text_from_result(result)
                         if replacement_text is not None:
                             current_text = replacement_text
+                            found = program.literals_in(current_text)
             except re.error as exc:
-                logger.warning("Invalid regex in action '%s': %s", action["name"], exc)
+                logger.warning("Invalid regex in action '%s': %s", plan.name, exc)
+            except RegexBudgetExceeded as exc:
+                results.append((plan.name, self._disable_slow_action(plan, exc)))
             except Exception as exc:
-                logger.warning("Action processing error '%s': %s", action["name"], exc)
+                logger.warning("Action processing error '%s': %s", plan.name, exc)
 
         for name in pending_fetch_actions:
             url = extract_first_url(current_text)
@@ -109,6 +97,19 @@ class ClipboardActionManager(QObject):
             self.fetch_url_title_async(url, item_id, name)
         return results
 
+    def _disable_slow_action(self, plan: ActionPlan, exc: RegexBudgetExceeded) -> dict:
+        """Turn off an action whose pattern exceeded the regex budget; returns the notify result."""
+        logger.warning("Action '%s' exceeded %gms regex budget, disabling", plan.name, exc.budget_ms)
+        self._program = self._program.without(plan.action_id)
+        try:
+            self.db.toggle_clipboard_action(plan.action_id, 0)
+        except Exception as db_exc:
+            logger.warning("Failed to disable action '%s': %s", plan.name, db_exc)
+        return {
+            "type": "notify",
+            "message": f"⏱️ 패턴이 처리 시간 제한({exc.budget_ms:g}ms)을 넘어 이 액션을 비활성화했습니다.",
+        }
+
     def execute_action(self, action_type, text, params, item_id):
         if action_type == "fetch_title":
             return None
@@ -123,6 +124,10 @@ class ClipboardActionManager(QObject):
         return None
 
     def fetch_url_title_async(self, url, item_id, action_name):
+        if QThread.currentThread() != self.thread():
+            # process()는 캡처 단계 스레드(이벤트 루프 없음)에서 돈다. Worker 생성과 대기 목록은 매니저 스레드에서만 다룬다.
+            self._title_fetch_requested.emit(url, item_id, action_name)
+            return
         if self._is_shutting_down:
             return
         if not HAS_WEB:
@@ -164,6 +169,8 @@ class ClipboardActionManager(QObject):
         self._pending_action_name_by_url[url] = action_name
         worker = Worker(fetch_title_logic, url)
         worker.signals.result.connect(lambda res, request_url=url: self._handle_title_result(res, request_url))
+        # 실패해도 대기 목록을 비워 같은 URL의 다음 요청이 막히지 않게 한다.
+        worker.signals.error.connect(lambda _error, request_url=url: self._handle_title_result({}, request_url))
         self.threadpool.start(worker)
 
     def _update_title_for_current_item(self, item_id: int, request_url: str, title: str) -> bool:
@@ -0,0 +1,155 @@
+"""Precompiled clipboard action plans.
+
+reload_actions() turns the rows of get_clipboard_actions() into an
+ActionProgram once: disabled and invalid actions are dropped, params JSON
+is parsed into a read-only mapping, and each pattern becomes a
+GuardedPattern plus, where every match must contain a fixed substring, that
+literal. The literals of all actions are joined into one alternation regex:
+one search rejects a text none of them occurs in (when every action has a
+literal), and one overlapped scan from the first hit tells which literals
+occur, so only those actions run their regex.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Sequence
+
+from ..copy_rules import required_literal
+from ..regex_guard import GuardedPattern
+
+logger = logging.getLogger(__name__)
+
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+
+def parse_action_params(params_json: str | None) -> Mapping[str, Any]:
+    """params column -> read-only dict; missing, invalid or non-object JSON gives an empty mapping."""
+    if not params_json:
+        return _EMPTY_PARAMS
+    try:
+        params = json.loads(params_json)
+    except (TypeError, ValueError):
+        return _EMPTY_PARAMS
+    return MappingProxyType(params) if isinstance(params, dict) else _EMPTY_PARAMS
+
+
+@dataclass(frozen=True)
+class ActionPlan:
+    action_id: int
+    name: str
+    pattern: str
+    action_type: str
+    params: Mapping[str, Any]
+    priority: int
+    regex: Any = field(compare=False)
+    literal: str | None = None
+    # 패턴 전체가 literal이면 정규식 없이 `in`만으로 판단한다.
+    literal_only: bool = False
+
+    # 레거시 payload의 ClipboardActionManager 하위 클래스는 actions_cache 항목을 dict처럼 읽는다.
+    _LEGACY_KEYS = {
+        "id": "action_id",
+        "name": "name",
+        "pattern": "pattern",
+        "compiled": "regex",
+        "type": "action_type",
+        "params": "params",
+        "priority": "priority",
+    }
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "enabled":
+            return 1
+        attr = self._LEGACY_KEYS.get(key)
+        return getattr(self, attr) if attr is not None else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key != "enabled" and key not in self._LEGACY_KEYS:
+            raise KeyError(key)
+        return self.get(key)
+
+
+class ActionProgram:
+    """Enabled actions (priority order) with a combined literal prefilter."""
+
+    def __init__(self, plans: Iterable[ActionPlan] = ()) -> None:
+        self.plans: tuple[ActionPlan, ...] = tuple(plans)
+        literals = sorted({plan.literal for plan in self.plans if plan.literal is not None}, key=len, reverse=True)
+        self.has_unconditional = any(plan.literal is None for plan in self.plans)
+        self._gate = None
+        self._scanner = None
+        # 긴 literal을 먼저 두므로 한 위치에서는 가장 긴 literal이 잡힌다. 그 접두어인 literal도 그 위치에 있다.
+        self._covering: dict[str, frozenset[str]] = {
+            literal: frozenset(other for other in literals if other.startswith(literal)) for literal in literals
+        }
+        if literals:
+            alternation = "|".join(re.escape(literal) for literal in literals)
+            self._gate = re.compile(alternation)
+            self._scanner = re.compile(f"(?=({alternation}))")
+
+    def __len__(self) -> int:
+        return len(self.plans)
+
+    def __iter__(self):
+        return iter(self.plans)
+
+    def literals_in(self, text: str) -> frozenset[str]:
+        """Longest action literal found at each position of text (see is_candidate)."""
+        if self._gate is None or self._scanner is None:
+            return frozenset()
+        first = self._gate.search(text)
+        if first is None:
+            return frozenset()
+        return frozenset(match.group(1) for match in self._scanner.finditer(text, first.start()))
+
+    def may_match(self, text: str) -> bool:
+        """False only when no action can match text."""
+        return self.has_unconditional or bool(self.literals_in(text))
+
+    def is_candidate(self, plan: ActionPlan, found: frozenset[str]) -> bool:
+        """Whether plan's literal occurs in the text that literals_in() returned found for."""
+        return plan.literal is None or not found.isdisjoint(self._covering[plan.literal])
+
+    def without(self, action_id: int) -> "ActionProgram":
+        return ActionProgram(plan for plan in self.plans if plan.action_id != action_id)
+
+
+def compile_action_plans(rows: Iterable[Sequence[Any]], log: logging.Logger | Any = logger) -> ActionProgram:
+    """Compile rows of get_clipboard_actions() (id, name, pattern, type, params, enabled, priority)."""
+    plans = []
+    for aid, name, pattern, action_type, params_json, enabled, priority in rows:
+        if not enabled or not pattern:
+            continue
+        try:
+            regex = GuardedPattern(pattern)
+        except re.error as exc:
+            log.warning("Invalid regex in action '%s': %s", name, exc)
+            continue
+        literal, literal_only = required_literal(pattern)
+        plans.append(
+            ActionPlan(
+                aid,
+                name,
+                pattern,
+                action_type,
+                parse_action_params(params_json),
+                priority,
+                regex,
+                literal,
+                literal_only,
+            )
+        )
+    return ActionProgram(plans)
+
+
+__all__ = [
+    "ActionPlan",
+    "ActionProgram",
+    "compile_action_plans",
+    "parse_action_params",
+]
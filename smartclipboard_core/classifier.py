@@ -0,0 +1,164 @@
+"""Shared content classifier for capture, the action palette and import.
+
+Everything is decided from one bounded prefix: links and colors share a
+single anchored regex, code indicators are only looked for in the prefix,
+and json.loads only runs when the first character can start a JSON value
+and the text is small enough to parse. Results are cached by content
+digest, so the palette re-reading an item that capture just classified
+costs one hash (of the prefix only, for texts too large to be JSON).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+RE_URL = re.compile(r"^https?://")
+RE_HEX_COLOR = re.compile(r"^#(?:[0-9a-fA-F]{3}){1,2}$")
+RE_RGB_COLOR = re.compile(r"^rgb\s*\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\)$", re.I)
+RE_HSL_COLOR = re.compile(r"^hsl\s*\(\s*\d+\s*,\s*\d+%?\s*,\s*\d+%?\s*\)$", re.I)
+CODE_INDICATORS = frozenset(
+    ["def ", "class ", "function ", "const ", "let ", "var ", "{", "}", "=>", "import ", "from ", "#include", "public ", "private "]
+)
+
+# 코드 표시는 앞부분에서만 찾는다. 1MB 텍스트 끝의 중괄호 하나로 CODE가 되지는 않는다.
+CLASSIFY_PREFIX_CHARS = 16 * 1024
+JSON_DETECT_MAX_CHARS = 256 * 1024
+CLASSIFY_CACHE_SIZE = 512
+
+_RE_LINK_OR_COLOR = re.compile(
+    # 원래 판정처럼 http(s) 스킴만 대소문자를 구분한다.
+    r"(?P<link>(?-i:https?://))"
+    r"|(?P<color>(?:#(?:[0-9a-fA-F]{3}){1,2}"
+    r"|rgb\s*\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\)"
+    r"|hsl\s*\(\s*\d+\s*,\s*\d+%?\s*,\s*\d+%?\s*\))$)",
+    re.I,
+)
+# 한 글자 표시부터 찾는다. CPython 부분 문자열 검색이 14갈래 정규식보다 빠르다 (scripts/bench_classify.py).
+_CODE_INDICATORS_ORDERED = tuple(sorted(CODE_INDICATORS, key=lambda indicator: (len(indicator), indicator)))
+# JSON 값이 시작될 수 있는 첫 글자 (NaN/Infinity 포함). 나머지는 json.loads를 부를 필요가 없다.
+_JSON_START = frozenset('{["-0123456789tfnNI')
+
+
+@dataclass(frozen=True)
+class ContentClass:
+    """Classification of one text: history type tag plus whether it parses as JSON."""
+
+    type_tag: str
+    is_json: bool
+
+
+def _classify_uncached(text: str) -> ContentClass:
+    prefix = text[:CLASSIFY_PREFIX_CHARS]
+    match = _RE_LINK_OR_COLOR.match(prefix)
+    if match is not None and match.lastgroup == "link":
+        type_tag = "LINK"
+    elif match is not None and len(text) <= CLASSIFY_PREFIX_CHARS:
+        # 색상 패턴의 $는 잘린 앞부분의 끝이 아니라 전체 텍스트의 끝이어야 한다.
+        type_tag = "COLOR"
+    elif any(indicator in prefix for indicator in _CODE_INDICATORS_ORDERED):
+        type_tag = "CODE"
+    else:
+        type_tag = "TEXT"
+
+    stripped = prefix.lstrip()
+    is_json = False
+    if stripped and stripped[0] in _JSON_START and len(text) <= JSON_DETECT_MAX_CHARS:
+        try:
+            json.loads(text)
+            is_json = True
+        except (TypeError, ValueError):
+            is_json = False
+    return ContentClass(type_tag, is_json)
+
+
+class _ClassifierCache:
+    def __init__(self, max_entries: int = CLASSIFY_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, ContentClass] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: bytes) -> ContentClass | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: bytes, result: ContentClass) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_cache = _ClassifierCache()
+
+
+def content_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+
+
+def _cache_key(text: str) -> bytes:
+    if len(text) > JSON_DETECT_MAX_CHARS:
+        # JSON 검사를 하지 않는 긴 텍스트는 결과가 앞부분에만 달려 있다.
+        return b"L" + content_digest(text[:CLASSIFY_PREFIX_CHARS])
+    return content_digest(text)
+
+
+def classify_content(text: str) -> ContentClass:
+    """Classify text as given (callers strip it first, as capture does); thread-safe and cached."""
+    text = text or ""
+    key = _cache_key(text)
+    result = _cache.get(key)
+    if result is None:
+        result = _classify_uncached(text)
+        _cache.put(key, result)
+    return result
+
+
+def classify_text(text: str) -> str:
+    """History type tag for already-stripped text: LINK, COLOR, CODE or TEXT."""
+    return classify_content(text).type_tag
+
+
+def classifier_cache_stats() -> dict[str, int]:
+    with _cache._lock:
+        return {"entries": len(_cache._entries), "hits": _cache.hits, "misses": _cache.misses}
+
+
+def clear_classifier_cache() -> None:
+    _cache.clear()
+
+
+__all__ = [
+    "CLASSIFY_CACHE_SIZE",
+    "CLASSIFY_PREFIX_CHARS",
+    "CODE_INDICATORS",
+    "ContentClass",
+    "JSON_DETECT_MAX_CHARS",
+    "RE_HEX_COLOR",
+    "RE_HSL_COLOR",
+    "RE_RGB_COLOR",
+    "RE_URL",
+    "classifier_cache_stats",
+    "classify_content",
+    "classify_text",
+    "clear_classifier_cache",
+    "content_digest",
+]
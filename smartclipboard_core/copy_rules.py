@@ -0,0 +1,225 @@
+"""Compiled copy-rule program with a per-rule cost profile.
+
+Enabled rules are compiled once (when the rule list changes) into a tuple
+of CompiledCopyRule: the pattern is precompiled, and when the pattern has a
+substring every match must contain (a top-level literal run, no
+IGNORECASE) that substring is checked with ``in`` before the regex runs.
+custom_replace does its search and substitution in one subn() call.
+Patterns run through regex_guard.GuardedPattern: a rule whose match exceeds
+the time budget is skipped from then on and reported through on_timeout.
+
+RuleProfile keeps per-rule evaluations, hits and cumulative time across
+recompiles, so the copy rules dialog can point at the rule that costs the
+most; a rule's numbers reset when its pattern, action or replacement change.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Sequence, cast
+
+from .regex_guard import GuardedPattern, RegexBudgetExceeded
+
+try:
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+    from re import _constants as _sre_constants  # type: ignore[attr-defined]
+except ImportError:  # Python < 3.11
+    import sre_constants as _sre_constants  # type: ignore[no-redef]
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+logger = logging.getLogger(__name__)
+
+
+def required_literal(pattern: str, flags: int = 0) -> tuple[str | None, bool]:
+    """(longest top-level literal run every match contains, whether the whole pattern is that literal)."""
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return None, False
+    if parsed.state.flags & re.IGNORECASE:
+        return None, False
+    best = ""
+    run: list[str] = []
+    only_literals = True
+    for op, value in parsed.data:
+        if op is _sre_constants.LITERAL:
+            run.append(chr(cast(int, value)))
+            continue
+        only_literals = False
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(run) > len(best):
+        best = "".join(run)
+    return best or None, only_literals and bool(best)
+
+
+def _transform(action: str, text: str) -> str:
+    if action == "trim":
+        return text.strip()
+    if action == "lowercase":
+        return text.lower()
+    if action == "uppercase":
+        return text.upper()
+    if action == "remove_newlines":
+        return text.replace("\n", " ").replace("\r", "")
+    return text
+
+
+@dataclass(frozen=True)
+class CompiledCopyRule:
+    rule_id: int
+    name: str
+    pattern: str
+    action: str
+    replacement: str
+    regex: Any
+    literal: str | None = None
+    # 패턴 전체가 literal이면 정규식 없이 `in`만으로 적중을 판단한다.
+    literal_only: bool = False
+
+    @property
+    def signature(self) -> tuple[str, str, str]:
+        return self.pattern, self.action, self.replacement
+
+
+class RuleProfile:
+    """Per-rule evaluations, hits and cumulative seconds; safe to record from the capture thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[int, list] = {}
+
+    def sync(self, rules: Iterable[CompiledCopyRule]) -> None:
+        """Drop deleted rules and reset rules whose pattern/action/replacement changed."""
+        with self._lock:
+            current = {rule.rule_id: rule.signature for rule in rules}
+            self._entries = {
+                rule_id: entry
+                for rule_id, entry in self._entries.items()
+                if current.get(rule_id) == entry[0]
+            }
+            for rule_id, signature in current.items():
+                self._entries.setdefault(rule_id, [signature, 0, 0, 0.0])
+
+    def record(self, rule_id: int, hit: bool, seconds: float) -> None:
+        with self._lock:
+            entry = self._entries.get(rule_id)
+            if entry is None:
+                return
+            entry[1] += 1
+            entry[2] += 1 if hit else 0
+            entry[3] += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            for entry in self._entries.values():
+                entry[1:] = [0, 0, 0.0]
+
+    def snapshot(self) -> dict[int, dict[str, float]]:
+        with self._lock:
+            return {
+                rule_id: {
+                    "evaluations": evaluations,
+                    "hits": hits,
+                    "total_ms": seconds * 1000,
+                    "mean_ms": seconds * 1000 / evaluations if evaluations else 0.0,
+                }
+                for rule_id, (_signature, evaluations, hits, seconds) in self._entries.items()
+            }
+
+
+class CopyRuleProgram:
+    """Enabled copy rules (rows of get_copy_rules(), priority order) compiled for repeated apply()."""
+
+    def __init__(
+        self,
+        rules: Iterable[Sequence[Any]],
+        re_module: Any = re,
+        log: logging.Logger | Any = logger,
+        profile: RuleProfile | None = None,
+        on_timeout: Callable[[CompiledCopyRule, RegexBudgetExceeded], None] | None = None,
+    ) -> None:
+        self.log = log
+        self.re_module = re_module
+        self.on_timeout = on_timeout
+        # 시간 제한을 넘은 규칙. DB에서 꺼지기 전까지도 다시 실행하지 않는다.
+        self._tripped: set[int] = set()
+        compiled = []
+        for rule in rules:
+            rid, name, pattern, action, replacement, enabled, _priority = rule
+            if not enabled:
+                continue
+            if not pattern:
+                log.warning(f"Empty pattern in copy rule '{name}' (id={rid}), skipping")
+                continue
+            try:
+                regex = GuardedPattern(pattern) if re_module is re else re_module.compile(pattern)
+                if action == "custom_replace":
+                    # 잘못된 치환 템플릿(없는 그룹 참조 등)도 여기서 걸러 캡처마다 경고하지 않는다.
+                    (regex.compiled if isinstance(regex, GuardedPattern) else regex).sub(replacement or "", "")
+            except re_module.error as regex_exc:
+                log.warning(f"Invalid regex in rule '{name}': {regex_exc}")
+                continue
+            literal, literal_only = required_literal(pattern) if re_module is re else (None, False)
+            compiled.append(
+                CompiledCopyRule(rid, name, pattern, action, replacement or "", regex, literal, literal_only)
+            )
+        self.rules: tuple[CompiledCopyRule, ...] = tuple(compiled)
+        self.profile = profile or RuleProfile()
+        self.profile.sync(self.rules)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def apply(self, text: str) -> str:
+        perf_counter = time.perf_counter
+        for rule in self.rules:
+            if rule.rule_id in self._tripped:
+                continue
+            started = perf_counter()
+            hit = False
+            try:
+                if rule.literal is not None and rule.literal not in text:
+                    pass
+                elif rule.action == "custom_replace":
+                    text, count = rule.regex.subn(rule.replacement, text)
+                    hit = count > 0
+                elif rule.literal_only or rule.regex.search(text):
+                    hit = True
+                    text = _transform(rule.action, text)
+            except self.re_module.error as regex_exc:
+                self.log.warning(f"Invalid regex in rule '{rule.name}': {regex_exc}")
+            except RegexBudgetExceeded as budget_exc:
+                self._tripped.add(rule.rule_id)
+                self.log.warning(f"Copy rule '{rule.name}' exceeded {budget_exc.budget_ms:g}ms, disabling")
+                if self.on_timeout is not None:
+                    self.on_timeout(rule, budget_exc)
+            self.profile.record(rule.rule_id, hit, perf_counter() - started)
+            if hit:
+                self.log.debug("Rule '%s' applied", rule.name)
+        return text
+
+
+def compile_copy_rules(
+    rules: Iterable[Sequence[Any]],
+    re_module: Any = re,
+    log: logging.Logger | Any = logger,
+    previous: CopyRuleProgram | None = None,
+    on_timeout: Callable[[CompiledCopyRule, RegexBudgetExceeded], None] | None = None,
+) -> CopyRuleProgram:
+    """Compile rules, carrying the previous program's profile over to the new one."""
+    return CopyRuleProgram(rules, re_module, log, previous.profile if previous is not None else None, on_timeout)
+
+
+__all__ = [
+    "CompiledCopyRule",
+    "CopyRuleProgram",
+    "RuleProfile",
+    "compile_copy_rules",
+    "required_literal",
+]
@@ -11,6 +11,8 @@ from .db_parts import (
     HistoryOpsMixin,
     RulesSnippetsActionsMixin,
     SchemaSearchMixin,
+    StorageOpsMixin,
+    SyncOpsMixin,
     TagsCollectionsMixin,
     VaultTrashMixin,
 )
@@ -26,6 +28,8 @@ class ClipboardDB(
     RulesSnippetsActionsMixin,
     TagsCollectionsMixin,
     VaultTrashMixin,
+    StorageOpsMixin,
+    SyncOpsMixin,
 ):
     def __init__(self, db_file: Optional[str] = None, app_dir: Optional[str] = None):
         self.app_dir = app_dir or APP_DIR
@@ -34,6 +38,7 @@ class ClipboardDB(
         # v10.6: WAL 모드 활성화 (동시성 및 성능 향상)
         self.conn.execute("PRAGMA journal_mode=WAL")
         self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._configure_wal()
         self.lock = threading.RLock()
         self.add_count = 0  # v10.0: cleanup 최적화를 위한 카운터
         self.cleanup_count = 0  # VACUUM 실행 주기 카운터
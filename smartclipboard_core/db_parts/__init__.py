@@ -3,6 +3,8 @@ from .history_ops import HistoryOpsMixin
 from .rules_snippets_actions import RulesSnippetsActionsMixin
 from .tags_collections import TagsCollectionsMixin
 from .vault_trash import VaultTrashMixin
+from .storage import StorageOpsMixin
+from .sync import SyncOpsMixin
 
 __all__ = [
     "SchemaSearchMixin",
@@ -10,4 +12,6 @@ __all__ = [
     "RulesSnippetsActionsMixin",
     "TagsCollectionsMixin",
     "VaultTrashMixin",
+    "StorageOpsMixin",
+    "SyncOpsMixin",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime
 import sqlite3
 
-from ..shared import history_order_by, logger
+from ..shared import history_order_by, logger, tag_list_sql
 from ..typing_helpers import DBRuntimeMixin
 
 
@@ -194,10 +194,7 @@ class CollectionCatalogMixin(DBRuntimeMixin):
                     FROM history
                     WHERE tags IS NOT NULL
                       AND tags != ''
-                      AND instr(
-                          ',' || REPLACE(REPLACE(REPLACE(tags, '，', ','), ', ', ','), ' ,', ',') || ',',
-                          ',' || ? || ','
-                      ) > 0
+                      AND instr({tag_list_sql()}, ',' || ? || ',') > 0
                     {history_order_by()}
                     """,
                     (normalized_tag,),
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+from .bulk import HistoryBulkWriteMixin
 from .deletion import HistoryDeletionMixin
+from .export_query import HistoryExportQueryMixin
+from .image_hash import HistoryImageHashMixin
+from .image_storage import HistoryImageStorageMixin
+from .large_clips import HistoryLargeClipMixin
 from .maintenance import HistoryMaintenanceMixin
 from .metadata import HistoryMetadataMixin
 from .queries import HistoryQueryMixin
+from .thumbnails import HistoryThumbnailMixin
 from .write import HistoryWriteMixin
 
 
 class HistoryOpsMixin(
     HistoryWriteMixin,
+    HistoryBulkWriteMixin,
+    HistoryLargeClipMixin,
     HistoryQueryMixin,
+    HistoryExportQueryMixin,
+    HistoryImageHashMixin,
+    HistoryThumbnailMixin,
+    HistoryImageStorageMixin,
     HistoryMetadataMixin,
     HistoryDeletionMixin,
     HistoryMaintenanceMixin,
@@ -18,10 +30,16 @@ class HistoryOpsMixin(
 
 
 __all__ = [
+    "HistoryBulkWriteMixin",
     "HistoryDeletionMixin",
+    "HistoryExportQueryMixin",
+    "HistoryImageHashMixin",
+    "HistoryImageStorageMixin",
+    "HistoryLargeClipMixin",
     "HistoryMaintenanceMixin",
     "HistoryMetadataMixin",
     "HistoryOpsMixin",
     "HistoryQueryMixin",
+    "HistoryThumbnailMixin",
     "HistoryWriteMixin",
 ]
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Sequence
+
+from smartclipboard_core.file_paths import (
+    file_content_from_paths,
+    file_paths_from_content,
+    file_signature_from_paths,
+)
+from smartclipboard_core.image_hash import to_db_hash
+from smartclipboard_core.large_text import encode_large_text, is_large_text
+
+from ..typing_helpers import DBRuntimeMixin
+
+BULK_INDEX_FETCH_SIZE = 2000
+
+# _set_item_metadata_locked와 같은 허용 컬럼
+BULK_METADATA_COLUMNS = (
+    "tags",
+    "note",
+    "bookmark",
+    "collection_id",
+    "pinned",
+    "pin_order",
+    "use_count",
+    "timestamp",
+    "url_title",
+)
+# IMAGE 행에만 쓰는 파생 컬럼: 가져오기가 미리 계산했으면 백필 없이 바로 저장한다.
+BULK_IMAGE_COLUMNS = ("image_hash", "thumbnail")
+BULK_INSERT_COLUMNS = (
+    "content",
+    "image_data",
+    "type",
+    "timestamp",
+    "file_path",
+    "file_signature",
+    *(column for column in BULK_METADATA_COLUMNS if column != "timestamp"),
+    *BULK_IMAGE_COLUMNS,
+)
+# 스키마 기본값과 같다.
+BULK_INSERT_DEFAULTS: dict[str, Any] = {
+    "tags": "",
+    "note": "",
+    "bookmark": 0,
+    "collection_id": None,
+    "pinned": 0,
+    "pin_order": 0,
+    "use_count": 0,
+    "url_title": "",
+}
+
+
+def content_digest(content: str) -> bytes:
+    return hashlib.blake2b(content.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+
+
+@dataclass
+class HistoryDedupeIndex:
+    """Newest row id per text digest / file signature, as _add_item_locked would match it."""
+
+    text: dict[bytes, int] = field(default_factory=dict)
+    files: dict[str, int] = field(default_factory=dict)
+
+
+class HistoryBulkWriteMixin(DBRuntimeMixin):
+    def _build_dedupe_index_locked(self, cursor) -> HistoryDedupeIndex:
+        """Scan existing rows once; oldest first so the newest row wins per key."""
+        index = HistoryDedupeIndex()
+        cursor.execute(
+            "SELECT id, content FROM history WHERE type NOT IN ('IMAGE', 'FILE') "
+            "AND COALESCE(large_digest, '') = '' AND content IS NOT NULL "
+            "ORDER BY timestamp ASC, id ASC"
+        )
+        while rows := cursor.fetchmany(BULK_INDEX_FETCH_SIZE):
+            for item_id, content in rows:
+                index.text[content_digest(content)] = int(item_id)
+        cursor.execute(
+            "SELECT id, file_signature FROM history WHERE type = 'FILE' AND COALESCE(file_signature, '') != '' "
+            "ORDER BY timestamp ASC, id ASC"
+        )
+        while rows := cursor.fetchmany(BULK_INDEX_FETCH_SIZE):
+            for item_id, signature in rows:
+                index.files[signature] = int(item_id)
+        return index
+
+    def _add_items_bulk_locked(
+        self,
+        cursor,
+        records: Sequence[tuple[str, bytes | None, str, str, dict[str, Any] | None]],
+        index: HistoryDedupeIndex,
+    ) -> list[tuple[int | bool, bool]]:
+        """Batch counterpart of _add_item_locked + _set_item_metadata_locked.
+
+        records are (content, image_data, type, timestamp, metadata); for IMAGE
+        records metadata may also carry precomputed image_hash (int, or the
+        undecodable marker) and thumbnail, stored on insert. Duplicates
+        are matched through index (kept up to date) instead of a SELECT per
+        record, and metadata is written in the same INSERT/UPDATE so every row
+        touches the FTS index once. Results are (item_id, updated_existing) in
+        record order.
+        """
+        results: list[Any] = [None] * len(records)
+        updates: list[dict[str, Any]] = []
+        inserts: list[dict[str, Any]] = []
+        insert_keys: list[tuple[str, Any] | None] = []
+        pending: dict[tuple[str, Any], int] = {}
+
+        for position, (content, image_data, type_tag, timestamp, metadata) in enumerate(records):
+            key: tuple[str, Any] | None = None
+            existing: int | None = None
+            file_path = signature = ""
+            if type_tag == "FILE":
+                normalized_paths = file_paths_from_content(content)
+                content = file_content_from_paths(normalized_paths)
+                if not content:
+                    results[position] = (False, False)
+                    continue
+                file_path, signature = normalized_paths[0], file_signature_from_paths(normalized_paths)
+                image_data = None
+                key = ("file", signature)
+                existing = index.files.get(signature)
+            elif type_tag != "IMAGE":
+                if is_large_text(content):
+                    item_id, updated_existing = self._add_large_text_locked(
+                        cursor, encode_large_text(content), type_tag, timestamp=timestamp
+                    )
+                    if item_id and metadata:
+                        self._set_item_metadata_locked(cursor, int(item_id), **metadata)
+                    results[position] = (item_id, updated_existing)
+                    continue
+                key = ("text", content_digest(content))
+                existing = index.text.get(key[1])
+
+            values = {
+                "content": content,
+                "image_data": image_data,
+                "type": type_tag,
+                "timestamp": timestamp,
+                "file_path": file_path,
+                "file_signature": signature,
+            }
+            metadata = metadata or {}
+            values.update({column: metadata[column] for column in BULK_METADATA_COLUMNS if column in metadata})
+            if type_tag == "IMAGE":
+                values.update({column: metadata[column] for column in BULK_IMAGE_COLUMNS if column in metadata})
+                if isinstance(values.get("image_hash"), int):
+                    values["image_hash"] = to_db_hash(values["image_hash"])
+            if key is not None and key in pending:
+                # 같은 배치 안의 중복: 아직 삽입 전인 행에 뒤 항목의 값을 덮어쓴다.
+                slot = pending[key]
+                inserts[slot].update(values)
+                results[position] = ("insert", slot, True)
+            elif existing is not None:
+                values["image_data"] = None
+                updates.append({**values, "id": existing})
+                results[position] = (existing, True)
+            else:
+                if key is not None:
+                    pending[key] = len(inserts)
+                inserts.append(values)
+                insert_keys.append(key)
+                results[position] = ("insert", len(inserts) - 1, False)
+
+        self._run_grouped_updates_locked(cursor, updates)
+        new_ids: list[int] = []
+        if inserts:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM history")
+            floor = int(cursor.fetchone()[0])
+            placeholders = ", ".join("?" for _ in BULK_INSERT_COLUMNS)
+            cursor.executemany(
+                f"INSERT INTO history ({', '.join(BULK_INSERT_COLUMNS)}) VALUES ({placeholders})",
+                (
+                    [row.get(column, BULK_INSERT_DEFAULTS.get(column)) for column in BULK_INSERT_COLUMNS]
+                    for row in inserts
+                ),
+            )
+            # 쓰기 트랜잭션 안이라 floor 위의 행은 방금 넣은 행뿐이다.
+            cursor.execute("SELECT id FROM history WHERE id > ? ORDER BY id", (floor,))
+            new_ids = [int(row[0]) for row in cursor.fetchall()]
+            if len(new_ids) != len(inserts):
+                raise sqlite3.Error(f"Bulk insert returned {len(new_ids)} ids for {len(inserts)} rows")
+            for key, item_id in zip(insert_keys, new_ids):
+                if key is None:
+                    continue
+                if key[0] == "file":
+                    index.files[key[1]] = item_id
+                else:
+                    index.text[key[1]] = item_id
+
+        resolved: list[tuple[int | bool, bool]] = []
+        for result in results:
+            if result[0] == "insert":
+                resolved.append((new_ids[result[1]], result[2]))
+            else:
+                resolved.append(result)
+        return resolved
+
+    @staticmethod
+    def _run_grouped_updates_locked(cursor, rows: Iterable[dict[str, Any]]) -> None:
+        """UPDATE rows by "id"; consecutive rows with the same columns share one executemany."""
+        columns: tuple[str, ...] = ()
+        params: list[list[Any]] = []
+
+        def flush() -> None:
+            if columns and params:
+                assignments = ", ".join(f"{column} = ?" for column in columns)
+                cursor.executemany(f"UPDATE history SET {assignments} WHERE id = ?", params)
+
+        for row in rows:
+            row_columns = tuple(column for column in row if column != "id")
+            if not row_columns:
+                continue
+            if row_columns != columns:
+                flush()
+                columns, params = row_columns, []
+            params.append([row[column] for column in row_columns] + [row["id"]])
+        flush()
+
+    def _set_items_metadata_bulk_locked(self, cursor, updates: Iterable[tuple[int, dict[str, Any]]]) -> None:
+        """Bulk _set_item_metadata_locked for (item_id, metadata) pairs."""
+        self._run_grouped_updates_locked(
+            cursor,
+            (
+                {**{column: metadata[column] for column in BULK_METADATA_COLUMNS if column in metadata}, "id": item_id}
+                for item_id, metadata in updates
+            ),
+        )
+
+__all__ = [
+    "BULK_IMAGE_COLUMNS",
+    "BULK_INSERT_COLUMNS",
+    "BULK_METADATA_COLUMNS",
+    "HistoryBulkWriteMixin",
+    "HistoryDedupeIndex",
+    "content_digest",
+]
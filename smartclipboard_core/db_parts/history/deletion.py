@@ -68,6 +68,7 @@ class HistoryDeletionMixin(DBRuntimeMixin):
                         pin_order,
                         use_count,
                         url_title,
+                        large_digest,
                         deleted_at,
                         expires_at
                     )
@@ -85,6 +86,7 @@ class HistoryDeletionMixin(DBRuntimeMixin):
                         COALESCE(pin_order, 0),
                         COALESCE(use_count, 0),
                         COALESCE(url_title, ''),
+                        COALESCE(large_digest, ''),
                         ?,
                         ?
                     FROM history
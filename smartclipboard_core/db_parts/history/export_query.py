@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import datetime
+import json
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from ..shared import history_order_by, logger, tag_list_sql
+from ..typing_helpers import DBRuntimeMixin
+
+EXPORT_QUERY_COLUMNS = (
+    "id, content, type, timestamp, pinned, use_count, pin_order, image_data, "
+    "tags, note, bookmark, collection_id, url_title, large_digest"
+)
+
+
+def _normalize_tag(tag: Any) -> str:
+    # get_items_by_tag와 같은 정규화
+    return str(tag or "").replace("，", ",").strip().strip(",").strip()
+
+
+@dataclass(frozen=True)
+class ExportQuery:
+    """Filters of an export, pushed down to one SELECT on history.
+
+    types/collection_ids/item_ids left as None mean "no restriction"; a None
+    inside collection_ids selects uncategorized items. date_from/date_to are
+    inclusive calendar days. Every tag in tags must be present on the item.
+    bookmarked/pinned filter on the flag when not None.
+    """
+
+    types: frozenset[str] | None = None
+    date_from: datetime.date | None = None
+    date_to: datetime.date | None = None
+    collection_ids: frozenset[int | None] | None = None
+    tags: tuple[str, ...] = ()
+    bookmarked: bool | None = None
+    pinned: bool | None = None
+    item_ids: tuple[int, ...] | None = None
+
+    @classmethod
+    def create(
+        cls,
+        types: Iterable[str] | str | None = None,
+        date_from: datetime.date | None = None,
+        date_to: datetime.date | None = None,
+        collection_ids: Iterable[int | None] | None = None,
+        tags: Iterable[str] | str | None = None,
+        bookmarked: bool | None = None,
+        pinned: bool | None = None,
+        item_ids: Iterable[int] | None = None,
+    ) -> "ExportQuery":
+        """Normalizing constructor; types accepts the exporters' legacy "all"."""
+        if isinstance(types, str):
+            types = None if types in ("", "all") else [types]
+        if isinstance(tags, str):
+            tags = tags.replace("，", ",").split(",")
+        normalized_tags = tuple(dict.fromkeys(tag for tag in map(_normalize_tag, tags or ()) if tag))
+        return cls(
+            types=None if types is None else frozenset(str(value).upper() for value in types),
+            date_from=date_from,
+            date_to=date_to,
+            collection_ids=(
+                None
+                if collection_ids is None
+                else frozenset(None if value is None else int(value) for value in collection_ids)
+            ),
+            tags=normalized_tags,
+            bookmarked=bookmarked,
+            pinned=pinned,
+            item_ids=None if item_ids is None else tuple(sorted({int(item_id) for item_id in item_ids})),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly summary for export reports."""
+        return {
+            "types": sorted(self.types) if self.types is not None else None,
+            "date_from": str(self.date_from) if self.date_from else None,
+            "date_to": str(self.date_to) if self.date_to else None,
+            "collection_ids": (
+                sorted(self.collection_ids, key=lambda value: (value is not None, value or 0))
+                if self.collection_ids is not None
+                else None
+            ),
+            "tags": list(self.tags),
+            "bookmarked": self.bookmarked,
+            "pinned": self.pinned,
+            "item_ids": len(self.item_ids) if self.item_ids is not None else None,
+        }
+
+
+def build_export_where(query: ExportQuery | None) -> tuple[str, list[Any]]:
+    """WHERE clause (without the keyword) and its parameters for query."""
+    query = query or ExportQuery()
+    clauses: list[str] = []
+    params: list[Any] = []
+
+    if query.types is not None:
+        if not query.types:
+            return "0", []
+        ordered_types = sorted(query.types)
+        clauses.append(f"type IN ({', '.join('?' for _ in ordered_types)})")
+        params.extend(ordered_types)
+
+    if query.date_from is not None or query.date_to is not None:
+        # 저장 형식("YYYY-MM-DD HH:MM:SS")은 문자열 비교가 곧 시간 비교라 timestamp 인덱스를 쓴다.
+        if query.date_from is not None:
+            clauses.append("timestamp >= ?")
+            params.append(query.date_from.isoformat())
+        if query.date_to is not None:
+            clauses.append("timestamp < ?")
+            params.append((query.date_to + datetime.timedelta(days=1)).isoformat())
+        clauses.append("date(timestamp) IS NOT NULL")
+
+    if query.collection_ids is not None:
+        ids = sorted(value for value in query.collection_ids if value is not None)
+        parts = [f"collection_id IN ({', '.join('?' for _ in ids)})"] if ids else []
+        params.extend(ids)
+        if None in query.collection_ids:
+            parts.append("collection_id IS NULL")
+        if not parts:
+            return "0", []
+        clauses.append(f"({' OR '.join(parts)})")
+
+    for tag in query.tags:
+        clauses.append(f"instr({tag_list_sql()}, ',' || ? || ',') > 0")
+        params.append(tag)
+
+    if query.bookmarked is not None:
+        clauses.append("bookmark = ?" if query.bookmarked else "COALESCE(bookmark, 0) = ?")
+        params.append(1 if query.bookmarked else 0)
+    if query.pinned is not None:
+        clauses.append("pinned = ?" if query.pinned else "COALESCE(pinned, 0) = ?")
+        params.append(1 if query.pinned else 0)
+
+    if query.item_ids is not None:
+        # id 목록 길이와 무관하게 문장 하나로 끝낸다 (SQLITE_MAX_VARIABLE_NUMBER 회피).
+        clauses.append("id IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(list(query.item_ids)))
+
+    return " AND ".join(clauses) or "1=1", params
+
+
+def build_export_select(query: ExportQuery | None, columns: str = EXPORT_QUERY_COLUMNS) -> tuple[str, list[Any]]:
+    """SELECT for an export: history list order, or id order for an item_ids delta."""
+    where_sql, params = build_export_where(query)
+    order_sql = "ORDER BY id" if query is not None and query.item_ids is not None else history_order_by()
+    return f"SELECT {columns} FROM history WHERE {where_sql} {order_sql}", params
+
+
+class HistoryExportQueryMixin(DBRuntimeMixin):
+    @contextmanager
+    def export_cursor(self, query: ExportQuery | None = None, columns: str = EXPORT_QUERY_COLUMNS) -> Iterator[Any]:
+        """Executed export SELECT on a pooled read connection.
+
+        SQLite steps the statement as rows are fetched, so callers page with
+        fetchmany() and never hold the result set; cursor.connection stays
+        usable for follow-up reads (large-text chunks) while iterating.
+        """
+        sql, params = build_export_select(query, columns)
+        with self.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
+    def count_export_items(self, query: ExportQuery | None = None) -> int:
+        """Number of rows an export with query would read; -1 on error."""
+        where_sql, params = build_export_where(query)
+        try:
+            with self.read_connection() as conn:
+                row = conn.execute(f"SELECT COUNT(*) FROM history WHERE {where_sql}", params).fetchone()
+                return int(row[0]) if row else 0
+        except (sqlite3.Error, TimeoutError) as e:
+            logger.error(f"Count export items error: {e}")
+            return -1
+
+
+__all__ = [
+    "EXPORT_QUERY_COLUMNS",
+    "ExportQuery",
+    "HistoryExportQueryMixin",
+    "build_export_select",
+    "build_export_where",
+]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Iterable
+
+from smartclipboard_core.image_hash import (
+    IMAGE_HASH_UNDECODABLE,
+    IMAGE_SIMILAR_MAX_DISTANCE,
+    BKTree,
+    from_db_hash,
+    to_db_hash,
+)
+
+from ..shared import logger
+from ..typing_helpers import DBRuntimeMixin
+
+
+# image_hash IS NOT NULL만으로는 디코딩 실패 표시(빈 BLOB)도 걸린다.
+_HASHED_IMAGE_WHERE = "image_hash IS NOT NULL AND typeof(image_hash) = 'integer' AND type = 'IMAGE'"
+
+
+class HistoryImageHashMixin(DBRuntimeMixin):
+    """Perceptual-hash lookups over IMAGE rows through a cached BK-tree.
+
+    The tree is rebuilt lazily whenever the history_changes sequence moved
+    (any insert/update/delete of history since the last build), so it never
+    serves ids of rows that are gone; hash backfills invalidate it directly
+    because image_hash is not a tracked change-log column. Rows whose image
+    could not be decoded hold IMAGE_HASH_UNDECODABLE instead of an integer
+    and are skipped by every lookup.
+    """
+
+    _image_hash_tree: BKTree | None = None
+    _image_hash_tree_version: Any = None
+
+    def _image_hash_tree_locked(self, cursor) -> BKTree:
+        cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'history_changes'")
+        row = cursor.fetchone()
+        version = row[0] if row else 0
+        if self._image_hash_tree is None or version != self._image_hash_tree_version:
+            cursor.execute(f"SELECT id, image_hash FROM history WHERE {_HASHED_IMAGE_WHERE}")
+            self._image_hash_tree = BKTree((from_db_hash(image_hash), int(item_id)) for item_id, image_hash in cursor)
+            self._image_hash_tree_version = version
+        return self._image_hash_tree
+
+    def _find_similar_images_locked(self, cursor, image_hash: int, max_distance: int) -> list[tuple[int, int]]:
+        return self._image_hash_tree_locked(cursor).search(image_hash, max_distance)
+
+    def find_similar_images(
+        self, item_id: int, max_distance: int = IMAGE_SIMILAR_MAX_DISTANCE
+    ) -> list[tuple[int, int]]:
+        """(item_id, distance) of other images near item_id, nearest first."""
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute("SELECT image_hash FROM history WHERE id = ? AND type = 'IMAGE'", (item_id,))
+                row = cursor.fetchone()
+                if not row or not isinstance(row[0], int):
+                    return []
+                matches = self._find_similar_images_locked(cursor, from_db_hash(row[0]), max_distance)
+                return [(match_id, distance) for match_id, distance in matches if match_id != item_id]
+            except sqlite3.Error as e:
+                logger.error(f"Find similar images error: {e}")
+                return []
+
+    def find_similar_image_groups(self, max_distance: int = IMAGE_SIMILAR_MAX_DISTANCE) -> list[list[int]]:
+        """Groups (2+ ids, newest first) of images linked by distance <= max_distance."""
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                tree = self._image_hash_tree_locked(cursor)
+                cursor.execute(f"SELECT id, image_hash FROM history WHERE {_HASHED_IMAGE_WHERE}")
+                hashes = {int(item_id): from_db_hash(image_hash) for item_id, image_hash in cursor.fetchall()}
+            except sqlite3.Error as e:
+                logger.error(f"Find similar image groups error: {e}")
+                return []
+
+        parent = {item_id: item_id for item_id in hashes}
+
+        def find(item_id: int) -> int:
+            while parent[item_id] != item_id:
+                parent[item_id] = parent[parent[item_id]]
+                item_id = parent[item_id]
+            return item_id
+
+        for item_id, image_hash in hashes.items():
+            for match_id, _distance in tree.search(image_hash, max_distance):
+                if match_id in parent:
+                    parent[find(match_id)] = find(item_id)
+
+        groups: dict[int, list[int]] = {}
+        for item_id in hashes:
+            groups.setdefault(find(item_id), []).append(item_id)
+        result = [sorted(members, reverse=True) for members in groups.values() if len(members) > 1]
+        return sorted(result, key=lambda members: members[0], reverse=True)
+
+    def get_images_missing_hash(self, limit: int = 50) -> list[tuple[int, bytes]]:
+        """(id, image_data) of IMAGE rows without a perceptual hash yet (imports, restores)."""
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "SELECT id, image_data FROM history WHERE type = 'IMAGE' AND image_hash IS NULL "
+                    "AND image_data IS NOT NULL ORDER BY id DESC LIMIT ?",
+                    (max(int(limit), 1),),
+                )
+                return [(int(item_id), bytes(blob)) for item_id, blob in cursor.fetchall()]
+            except sqlite3.Error as e:
+                logger.error(f"Get images missing hash error: {e}")
+                return []
+
+    def set_image_hashes(self, hashes: Iterable[tuple[int, int | None]]) -> int:
+        """Store (item_id, hash) pairs (None = undecodable, never retried); returns the rows updated."""
+        rows = [
+            (IMAGE_HASH_UNDECODABLE if image_hash is None else to_db_hash(image_hash), int(item_id))
+            for item_id, image_hash in hashes
+        ]
+        if not rows:
+            return 0
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.executemany("UPDATE history SET image_hash = ? WHERE id = ? AND type = 'IMAGE'", rows)
+                self.conn.commit()
+                self._image_hash_tree = None
+                return max(cursor.rowcount or 0, 0)
+            except sqlite3.Error as e:
+                logger.error(f"Set image hashes error: {e}")
+                self.conn.rollback()
+                return 0
+
+
+__all__ = ["HistoryImageHashMixin"]
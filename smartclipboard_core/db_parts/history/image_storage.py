@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Iterable
+
+from ..shared import logger
+from ..typing_helpers import DBRuntimeMixin
+
+
+class HistoryImageStorageMixin(DBRuntimeMixin):
+    """Batch access to stored image blobs for background recompression.
+
+    Blobs are read in id order a batch at a time and written back only if the
+    row still holds exactly the blob that was read, so a capture merging into
+    the same row meanwhile is never overwritten with stale pixels, even when
+    its blob happens to have the same size.
+    """
+
+    def get_image_blobs(self, after_id: int = 0, limit: int = 20) -> list[tuple[int, bytes]]:
+        """(id, image_data) of IMAGE rows with id > after_id, oldest first."""
+        try:
+            with self.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT id, image_data FROM history WHERE type = 'IMAGE' AND image_data IS NOT NULL "
+                    "AND id > ? ORDER BY id LIMIT ?",
+                    (int(after_id), max(int(limit), 1)),
+                )
+                return [(int(item_id), bytes(blob)) for item_id, blob in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"Get image blobs error: {e}")
+            return []
+
+    def replace_image_blobs(self, blobs: Iterable[tuple[int, bytes, bytes]]) -> list[int]:
+        """Store (item_id, previous_data, image_data) rows whose blob is unchanged; returns the updated ids."""
+        rows = [(bytes(data), int(item_id), bytes(previous)) for item_id, previous, data in blobs if data]
+        if not rows:
+            return []
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                updated = []
+                for row in rows:
+                    cursor.execute(
+                        "UPDATE history SET image_data = ? WHERE id = ? AND type = 'IMAGE' AND image_data = ?",
+                        row,
+                    )
+                    if cursor.rowcount and cursor.rowcount > 0:
+                        updated.append(row[1])
+                self.conn.commit()
+                return updated
+            except sqlite3.Error as e:
+                logger.error(f"Replace image blobs error: {e}")
+                self.conn.rollback()
+                return []
+
+    def get_image_storage_stats(self) -> dict[str, int]:
+        """{"count", "bytes"} of stored IMAGE blobs."""
+        try:
+            with self.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(length(image_data)), 0) FROM history "
+                    "WHERE type = 'IMAGE' AND image_data IS NOT NULL"
+                )
+                count, total = cursor.fetchone()
+                return {"count": int(count or 0), "bytes": int(total or 0)}
+        except sqlite3.Error as e:
+            logger.error(f"Get image storage stats error: {e}")
+            return {"count": 0, "bytes": 0}
+
+
+__all__ = ["HistoryImageStorageMixin"]
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import datetime
+import sqlite3
+from typing import Any, Iterator, cast
+
+from smartclipboard_core.large_text import LargeTextPayload, decode_large_chunk, encode_large_text
+
+from ..shared import CLEANUP_INTERVAL, logger
+from ..typing_helpers import DBRuntimeMixin
+
+# 읽기 풀 연결로 한 번에 읽는 청크 수. 이만큼 읽고 연결을 돌려준 뒤에 내보낸다.
+LARGE_CHUNK_READ_BATCH = 8
+
+
+class HistoryLargeClipMixin(DBRuntimeMixin):
+    """Chunked storage for text clips beyond the regular 1MB limit."""
+
+    def _store_large_clip_locked(self, cursor, payload: LargeTextPayload) -> None:
+        """Insert compressed chunks once per digest (content-addressed).
+
+        An existing header is trusted only when all of its chunks are present;
+        otherwise header and chunks are rewritten from payload.
+        """
+        cursor.execute(
+            "INSERT OR IGNORE INTO large_clips (digest, total_chars, total_bytes, chunk_count, codec, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                payload.digest,
+                payload.total_chars,
+                payload.total_bytes,
+                len(payload.chunks),
+                payload.codec,
+                datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            ),
+        )
+        if cursor.rowcount != 1:
+            cursor.execute(
+                "SELECT l.chunk_count, (SELECT COUNT(*) FROM large_clip_chunks c WHERE c.digest = l.digest) "
+                "FROM large_clips l WHERE l.digest = ?",
+                (payload.digest,),
+            )
+            chunk_count, stored_chunks = cursor.fetchone()
+            if stored_chunks == chunk_count:
+                return
+            logger.warning(
+                "대용량 텍스트 청크 누락 복구: digest=%s chunks=%s/%s", payload.digest, stored_chunks, chunk_count
+            )
+            cursor.execute("DELETE FROM large_clip_chunks WHERE digest = ?", (payload.digest,))
+            cursor.execute(
+                "UPDATE large_clips SET total_chars = ?, total_bytes = ?, chunk_count = ?, codec = ? WHERE digest = ?",
+                (payload.total_chars, payload.total_bytes, len(payload.chunks), payload.codec, payload.digest),
+            )
+        cursor.executemany(
+            "INSERT OR REPLACE INTO large_clip_chunks (digest, seq, data) VALUES (?, ?, ?)",
+            ((payload.digest, seq, chunk) for seq, chunk in enumerate(payload.chunks)),
+        )
+
+    def _insert_large_history_row_locked(
+        self,
+        cursor,
+        digest: str,
+        prefix: str,
+        type_tag: str,
+        timestamp: str,
+    ) -> int:
+        cursor.execute(
+            "INSERT INTO history (content, image_data, type, timestamp, file_path, file_signature, large_digest) "
+            "VALUES (?, NULL, ?, ?, '', '', ?)",
+            (prefix, type_tag, timestamp, digest),
+        )
+        item_id = cursor.lastrowid
+        if item_id is None:
+            raise sqlite3.Error("Inserted history row has no id")
+        return int(item_id)
+
+    def _add_large_text_locked(
+        self,
+        cursor,
+        payload: LargeTextPayload,
+        type_tag: str = "TEXT",
+        timestamp: str | None = None,
+    ) -> tuple[int | bool, bool]:
+        """Insert/update a chunked text item without committing. Dedupes by digest."""
+        item_timestamp = timestamp or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        cursor.execute(
+            "SELECT id FROM history WHERE large_digest = ? ORDER BY timestamp DESC, id DESC LIMIT 1",
+            (payload.digest,),
+        )
+        existing = cursor.fetchone()
+        if existing:
+            item_id = int(existing[0])
+            cursor.execute(
+                "UPDATE history SET content = ?, type = ?, timestamp = ? WHERE id = ?",
+                (payload.prefix, type_tag, item_timestamp, item_id),
+            )
+            return item_id, True
+
+        self._store_large_clip_locked(cursor, payload)
+        item_id = self._insert_large_history_row_locked(cursor, payload.digest, payload.prefix, type_tag, item_timestamp)
+        return item_id, False
+
+    def add_large_text_item(self, text_or_payload: str | LargeTextPayload, type_tag: str = "TEXT") -> int | bool:
+        """대용량 텍스트 추가. 문자열이면 잠금 밖에서 먼저 압축한다."""
+        payload = text_or_payload
+        if not isinstance(payload, LargeTextPayload):
+            if not payload:
+                return False
+            payload = encode_large_text(str(payload))
+
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                item_id, updated_existing = self._add_large_text_locked(cursor, payload, type_tag)
+                self.conn.commit()
+                if not updated_existing:
+                    self.add_count += 1
+                    if self.add_count >= CLEANUP_INTERVAL:
+                        cast(Any, self).cleanup()
+                        self.add_count = 0
+                logger.debug(
+                    "대용량 텍스트 저장: id=%s chars=%s stored=%s bytes",
+                    item_id,
+                    payload.total_chars,
+                    payload.stored_bytes,
+                )
+                return item_id
+            except sqlite3.Error:
+                logger.exception("DB Add Large Text Error")
+                self.conn.rollback()
+                return False
+
+    def get_large_clip_info(self, item_id, use_read_pool: bool = False) -> dict[str, Any] | None:
+        """Return chunk metadata for a large text item, or None for regular rows."""
+        if use_read_pool:
+            with self.read_connection() as conn:
+                return self._get_large_clip_info_on_cursor(conn.cursor(), item_id)
+        with self.lock:
+            return self._get_large_clip_info_on_cursor(self.conn.cursor(), item_id)
+
+    def _get_large_clip_info_on_cursor(self, cursor, item_id) -> dict[str, Any] | None:
+        try:
+            cursor.execute(
+                """
+                SELECT l.digest, l.total_chars, l.total_bytes, l.chunk_count, l.codec,
+                       (SELECT COALESCE(SUM(LENGTH(c.data)), 0) FROM large_clip_chunks c WHERE c.digest = l.digest),
+                       h.content, h.type
+                FROM history h
+                JOIN large_clips l ON l.digest = h.large_digest
+                WHERE h.id = ? AND h.large_digest != ''
+                """,
+                (item_id,),
+            )
+            row = cursor.fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Get Large Clip Info Error: {e}")
+            return None
+        if not row:
+            return None
+        return {
+            "digest": row[0],
+            "total_chars": int(row[1] or 0),
+            "total_bytes": int(row[2] or 0),
+            "chunk_count": int(row[3] or 0),
+            "codec": row[4],
+            "stored_bytes": int(row[5] or 0),
+            "prefix": row[6] or "",
+            "type": row[7],
+        }
+
+    def iter_large_text_chunks(self, digest: str, start_seq: int = 0, use_read_pool: bool = False) -> Iterator[str]:
+        """Yield decoded chunks one at a time; the lock is held only per fetch.
+
+        use_read_pool=True이면 LARGE_CHUNK_READ_BATCH개씩 읽기 전용 연결로 읽고,
+        연결을 풀에 돌려준 뒤에 내보낸다: 소비자가 느려도(소켓 쓰기 등) 풀 슬롯을 붙잡지 않는다.
+        """
+        seq = max(int(start_seq), 0)
+        if use_read_pool:
+            while True:
+                with self.read_connection() as conn:
+                    rows = self._fetch_large_chunks(conn.cursor(), digest, seq, LARGE_CHUNK_READ_BATCH)
+                for data, codec in rows:
+                    yield decode_large_chunk(data, codec)
+                if len(rows) < LARGE_CHUNK_READ_BATCH:
+                    return
+                seq += len(rows)
+        while True:
+            with self.lock:
+                row = self._fetch_large_chunk(self.conn.cursor(), digest, seq)
+            if not row:
+                return
+            yield decode_large_chunk(row[0], row[1])
+            seq += 1
+
+    @staticmethod
+    def _fetch_large_chunks(cursor, digest: str, start_seq: int, limit: int) -> list[tuple[Any, str]]:
+        """(data, codec) of up to limit chunks from start_seq on, in order."""
+        try:
+            cursor.execute(
+                "SELECT c.data, l.codec FROM large_clip_chunks c JOIN large_clips l ON l.digest = c.digest "
+                "WHERE c.digest = ? AND c.seq >= ? ORDER BY c.seq ASC LIMIT ?",
+                (digest, start_seq, limit),
+            )
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Large Chunk Read Error: {e}")
+            return []
+
+    @staticmethod
+    def _fetch_large_chunk(cursor, digest: str, seq: int):
+        try:
+            cursor.execute(
+                "SELECT c.data, l.codec FROM large_clip_chunks c JOIN large_clips l ON l.digest = c.digest "
+                "WHERE c.digest = ? AND c.seq = ?",
+                (digest, seq),
+            )
+            return cursor.fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Large Chunk Read Error: {e}")
+            return None
+
+    def _read_large_text_locked(self, cursor, digest: str) -> str | None:
+        cursor.execute("SELECT codec, chunk_count FROM large_clips WHERE digest = ?", (digest,))
+        header = cursor.fetchone()
+        if not header:
+            return None
+        cursor.execute("SELECT data FROM large_clip_chunks WHERE digest = ? ORDER BY seq ASC", (digest,))
+        parts = [decode_large_chunk(row[0], header[0]) for row in cursor.fetchall()]
+        if len(parts) != int(header[1] or 0):
+            logger.warning("Large clip %s is missing chunks (%s/%s)", digest, len(parts), header[1])
+        return "".join(parts)
+
+
+__all__ = ["LARGE_CHUNK_READ_BATCH", "HistoryLargeClipMixin"]
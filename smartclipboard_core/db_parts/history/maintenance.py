@@ -191,6 +191,7 @@ class HistoryMaintenanceMixin(DBRuntimeMixin):
                 return 0
 
     def close(self):
+        self.close_read_pool()
         if self.conn:
             self.conn.close()
             self.conn = None  # type: ignore[assignment]
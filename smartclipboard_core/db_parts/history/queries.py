@@ -47,15 +47,28 @@ class HistoryQueryMixin(DBRuntimeMixin):
                 logger.exception("DB Get Error")
                 return []
 
-    def get_content(self, item_id):
+    def get_content(self, item_id, use_read_pool: bool = False):
+        if use_read_pool:
+            with self.read_connection() as conn:
+                return self._get_content_on_cursor(conn.cursor(), item_id)
         with self.lock:
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute("SELECT content, image_data, type FROM history WHERE id=?", (item_id,))
-                return cursor.fetchone()
-            except sqlite3.Error as e:
-                logger.error(f"DB Get Content Error: {e}")
+            return self._get_content_on_cursor(self.conn.cursor(), item_id)
+
+    def _get_content_on_cursor(self, cursor, item_id):
+        try:
+            cursor.execute("SELECT content, image_data, type, large_digest FROM history WHERE id=?", (item_id,))
+            row = cursor.fetchone()
+            if not row:
                 return None
+            content, image_data, item_type, large_digest = row
+            if large_digest:
+                full_text = self._read_large_text_locked(cursor, large_digest)
+                if full_text is not None:
+                    content = full_text
+            return content, image_data, item_type
+        except sqlite3.Error as e:
+            logger.error(f"DB Get Content Error: {e}")
+            return None
 
     def get_all_text_content(self):
         with self.lock:
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Iterable
+
+from ..shared import logger
+from ..typing_helpers import DBRuntimeMixin
+
+# SQLite 기본 변수 한도(999) 안에서 IN (...) 조회를 나눈다.
+_THUMBNAIL_QUERY_CHUNK = 500
+
+
+class HistoryThumbnailMixin(DBRuntimeMixin):
+    """Small pre-rendered previews of IMAGE rows, so views never decode the full blob.
+
+    An empty thumbnail marks an image the backfill could not decode; it is
+    not retried and reads back as missing.
+    """
+
+    def get_thumbnails(self, item_ids: Iterable[int]) -> dict[int, bytes]:
+        """{item_id: thumbnail bytes} for the given ids that have one."""
+        ids = sorted({int(item_id) for item_id in item_ids})
+        if not ids:
+            return {}
+        result: dict[int, bytes] = {}
+        try:
+            with self.read_connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(ids), _THUMBNAIL_QUERY_CHUNK):
+                    chunk = ids[start : start + _THUMBNAIL_QUERY_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(
+                        f"SELECT id, thumbnail FROM history WHERE id IN ({placeholders}) "
+                        "AND type = 'IMAGE' AND length(thumbnail) > 0",
+                        chunk,
+                    )
+                    result.update((int(item_id), bytes(data)) for item_id, data in cursor.fetchall())
+        except sqlite3.Error as e:
+            logger.error(f"Get thumbnails error: {e}")
+            return {}
+        return result
+
+    def get_images_missing_thumbnail(self, limit: int = 50) -> list[tuple[int, bytes]]:
+        """(id, image_data) of IMAGE rows without a thumbnail yet (imports, restores, older versions)."""
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "SELECT id, image_data FROM history WHERE type = 'IMAGE' AND thumbnail IS NULL "
+                    "AND image_data IS NOT NULL ORDER BY id DESC LIMIT ?",
+                    (max(int(limit), 1),),
+                )
+                return [(int(item_id), bytes(blob)) for item_id, blob in cursor.fetchall()]
+            except sqlite3.Error as e:
+                logger.error(f"Get images missing thumbnail error: {e}")
+                return []
+
+    def set_image_thumbnails(self, thumbnails: Iterable[tuple[int, bytes | None]]) -> int:
+        """Store (item_id, thumbnail) pairs (None/b"" = undecodable); returns the rows updated."""
+        rows = [(bytes(data or b""), int(item_id)) for item_id, data in thumbnails]
+        if not rows:
+            return 0
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.executemany("UPDATE history SET thumbnail = ? WHERE id = ? AND type = 'IMAGE'", rows)
+                self.conn.commit()
+                return max(cursor.rowcount or 0, 0)
+            except sqlite3.Error as e:
+                logger.error(f"Set image thumbnails error: {e}")
+                self.conn.rollback()
+                return 0
+
+
+__all__ = ["HistoryThumbnailMixin"]
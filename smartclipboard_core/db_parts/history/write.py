@@ -10,6 +10,9 @@ from smartclipboard_core.file_paths import (
     file_paths_from_content,
     file_signature_from_paths,
 )
+from smartclipboard_core.image_format import IMAGE_HEADER_BYTES, image_dimensions
+from smartclipboard_core.image_hash import IMAGE_DUPLICATE_MAX_DISTANCE, to_db_hash
+from smartclipboard_core.large_text import encode_large_text, is_large_text
 
 from ..shared import CLEANUP_INTERVAL, DEFAULT_MAX_HISTORY, FILTER_TAG_MAP, history_order_by, logger
 from ..typing_helpers import DBRuntimeMixin
@@ -23,8 +26,15 @@ class HistoryWriteMixin(DBRuntimeMixin):
         image_data: bytes | None,
         type_tag: str,
         timestamp: str | None = None,
+        image_hash: int | None = None,
+        thumbnail: bytes | None = None,
     ) -> tuple[int | bool, bool]:
-        """Insert/update a history item without committing the transaction."""
+        """Insert/update a history item without committing the transaction.
+
+        An IMAGE with a perceptual hash replaces the nearest stored image within
+        IMAGE_DUPLICATE_MAX_DISTANCE (a re-capture) instead of adding a row;
+        its thumbnail is replaced too (NULL lets the backfill regenerate it).
+        """
         item_timestamp = timestamp or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         updated_existing = False
 
@@ -62,8 +72,11 @@ class HistoryWriteMixin(DBRuntimeMixin):
             return item_id, updated_existing
 
         if type_tag != "IMAGE":
+            if is_large_text(content):
+                return self._add_large_text_locked(cursor, encode_large_text(content), type_tag, timestamp=item_timestamp)
             cursor.execute(
                 "SELECT id FROM history WHERE content = ? AND type NOT IN ('IMAGE', 'FILE') "
+                "AND COALESCE(large_digest, '') = '' "
                 "ORDER BY timestamp DESC, id DESC LIMIT 1",
                 (content,),
             )
@@ -87,22 +100,58 @@ class HistoryWriteMixin(DBRuntimeMixin):
                     raise sqlite3.Error("Inserted history row has no id")
             return item_id, updated_existing
 
+        db_hash = None if image_hash is None else to_db_hash(image_hash)
+        if image_hash is not None:
+            item_id = self._find_duplicate_image_locked(cursor, image_hash, image_data)
+            if item_id:
+                cursor.execute(
+                    "UPDATE history SET image_data = ?, image_hash = ?, thumbnail = ?, timestamp = ? WHERE id = ?",
+                    (image_data, db_hash, thumbnail, item_timestamp, item_id),
+                )
+                return item_id, True
         cursor.execute(
-            "INSERT INTO history (content, image_data, type, timestamp, file_path, file_signature) "
-            "VALUES (?, ?, ?, ?, '', '')",
-            (content, image_data, type_tag, item_timestamp),
+            "INSERT INTO history (content, image_data, type, timestamp, file_path, file_signature, image_hash, thumbnail) "
+            "VALUES (?, ?, ?, ?, '', '', ?, ?)",
+            (content, image_data, type_tag, item_timestamp, db_hash, thumbnail),
         )
         item_id = cursor.lastrowid
         if item_id is None:
             raise sqlite3.Error("Inserted history row has no id")
         return item_id, False
 
-    def add_item(self, content: str, image_data: bytes | None, type_tag: str) -> int | bool:
-        """항목 추가. 동일 텍스트는 기존 항목을 최신 상태로 갱신."""
+    def _find_duplicate_image_locked(self, cursor, image_hash: int, image_data: bytes | None) -> int | None:
+        """Nearest image within IMAGE_DUPLICATE_MAX_DISTANCE with the same pixel size, if any."""
+        # 비슷한 화면(같은 편집기의 다른 코드 등)이 해시만으로 합쳐지지 않도록 크기도 같아야 한다.
+        dimensions = image_dimensions(image_data)
+        for item_id, _distance in self._find_similar_images_locked(cursor, image_hash, IMAGE_DUPLICATE_MAX_DISTANCE):
+            cursor.execute("SELECT substr(image_data, 1, ?) FROM history WHERE id = ?", (IMAGE_HEADER_BYTES, item_id))
+            row = cursor.fetchone()
+            if row is None:
+                continue
+            stored = image_dimensions(bytes(row[0]) if row[0] is not None else None)
+            if dimensions is None or stored is None or stored == dimensions:
+                return item_id
+        return None
+
+    def add_item(
+        self,
+        content: str,
+        image_data: bytes | None,
+        type_tag: str,
+        image_hash: int | None = None,
+        thumbnail: bytes | None = None,
+    ) -> int | bool:
+        """항목 추가. 동일 텍스트/거의 같은 이미지(image_hash)는 기존 항목을 최신 상태로 갱신."""
+        if type_tag not in ("IMAGE", "FILE") and is_large_text(content):
+            # 압축은 잠금 밖에서 수행해 다른 읽기를 막지 않는다.
+            return cast(Any, self).add_large_text_item(encode_large_text(content), type_tag)
+
         with self.lock:
             try:
                 cursor = self.conn.cursor()
-                item_id, updated_existing = self._add_item_locked(cursor, content, image_data, type_tag)
+                item_id, updated_existing = self._add_item_locked(
+                    cursor, content, image_data, type_tag, image_hash=image_hash, thumbnail=thumbnail
+                )
                 if not item_id:
                     return False
 
@@ -149,6 +198,7 @@ class HistoryWriteMixin(DBRuntimeMixin):
                     SELECT id, tags, note, bookmark, collection_id, pinned, pin_order, use_count, timestamp, url_title
                     FROM history
                     WHERE id != ? AND content = ? AND type NOT IN ('IMAGE', 'FILE')
+                      AND COALESCE(large_digest, '') = ''
                     ORDER BY timestamp DESC, id DESC
                     LIMIT 1
                     """,
@@ -185,7 +235,8 @@ class HistoryWriteMixin(DBRuntimeMixin):
                 cursor.execute(
                     """
                     UPDATE history
-                    SET content = ?, image_data = NULL, type = ?, file_path = '', file_signature = '', url_title = ''
+                    SET content = ?, image_data = NULL, type = ?, file_path = '', file_signature = '', url_title = '',
+                        large_digest = ''
                     WHERE id = ?
                     """,
                     (content, type_tag, item_id),
@@ -51,7 +51,20 @@ class TrashRetentionMixin(DBRuntimeMixin):
         row = cursor.fetchone()
         return int(row[0] or 0) if row else 0
 
-    def _find_restore_merge_target_locked(self, cursor, content, item_type):
+    def _find_restore_merge_target_locked(self, cursor, content, item_type, large_digest: str = ""):
+        if large_digest:
+            cursor.execute(
+                """
+                SELECT id, tags, note, bookmark, collection_id, pinned, pin_order, use_count, timestamp, url_title
+                FROM history
+                WHERE large_digest = ?
+                ORDER BY timestamp DESC, id DESC
+                LIMIT 1
+                """,
+                (large_digest,),
+            )
+            return cursor.fetchone()
+
         if item_type == "FILE":
             file_signature = file_signature_from_content(content)
             if not file_signature:
@@ -73,7 +86,7 @@ class TrashRetentionMixin(DBRuntimeMixin):
                 """
                 SELECT id, tags, note, bookmark, collection_id, pinned, pin_order, use_count, timestamp, url_title
                 FROM history
-                WHERE content = ? AND type NOT IN ('IMAGE', 'FILE')
+                WHERE content = ? AND type NOT IN ('IMAGE', 'FILE') AND COALESCE(large_digest, '') = ''
                 ORDER BY timestamp DESC, id DESC
                 LIMIT 1
                 """,
@@ -136,42 +149,49 @@ class TrashRetentionMixin(DBRuntimeMixin):
             "url_title": str(deleted_row[11] or ""),
         }
 
+    def _soft_delete_locked(self, cursor, item_id) -> bool:
+        """Move a history row into the trash without committing."""
+        cursor.execute(
+            "SELECT content, image_data, type, timestamp, tags, note, bookmark, collection_id, pinned, pin_order, use_count, url_title, "
+            "COALESCE(large_digest, '') FROM history WHERE id = ?",
+            (item_id,),
+        )
+        item = cursor.fetchone()
+        if not item:
+            return False
+        deleted_at = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        expires_at = (datetime.datetime.now() + datetime.timedelta(days=7)).strftime("%Y-%m-%d %H:%M:%S")
+        cursor.execute(
+            "INSERT INTO deleted_history "
+            "(original_id, content, image_data, type, original_timestamp, tags, note, bookmark, collection_id, pinned, pin_order, use_count, url_title, large_digest, deleted_at, expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                item_id,
+                item[0],
+                item[1],
+                item[2],
+                item[3],
+                item[4] or "",
+                item[5] or "",
+                item[6] or 0,
+                item[7],
+                item[8] or 0,
+                item[9] or 0,
+                item[10] or 0,
+                item[11] or "",
+                item[12],
+                deleted_at,
+                expires_at,
+            ),
+        )
+        cursor.execute("DELETE FROM history WHERE id = ?", (item_id,))
+        return True
+
     def soft_delete(self, item_id):
         with self.lock:
             try:
                 cursor = self.conn.cursor()
-                cursor.execute(
-                    "SELECT content, image_data, type, timestamp, tags, note, bookmark, collection_id, pinned, pin_order, use_count, url_title "
-                    "FROM history WHERE id = ?",
-                    (item_id,),
-                )
-                item = cursor.fetchone()
-                if item:
-                    deleted_at = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    expires_at = (datetime.datetime.now() + datetime.timedelta(days=7)).strftime("%Y-%m-%d %H:%M:%S")
-                    cursor.execute(
-                        "INSERT INTO deleted_history "
-                        "(original_id, content, image_data, type, original_timestamp, tags, note, bookmark, collection_id, pinned, pin_order, use_count, url_title, deleted_at, expires_at) "
-                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                        (
-                            item_id,
-                            item[0],
-                            item[1],
-                            item[2],
-                            item[3],
-                            item[4] or "",
-                            item[5] or "",
-                            item[6] or 0,
-                            item[7],
-                            item[8] or 0,
-                            item[9] or 0,
-                            item[10] or 0,
-                            item[11] or "",
-                            deleted_at,
-                            expires_at,
-                        ),
-                    )
-                    cursor.execute("DELETE FROM history WHERE id = ?", (item_id,))
+                if self._soft_delete_locked(cursor, item_id):
                     self.conn.commit()
                     return True
             except sqlite3.Error as e:
@@ -184,19 +204,22 @@ class TrashRetentionMixin(DBRuntimeMixin):
             try:
                 cursor = self.conn.cursor()
                 cursor.execute(
-                    "SELECT content, image_data, type, original_timestamp, tags, note, bookmark, collection_id, pinned, pin_order, use_count, url_title "
-                    "FROM deleted_history WHERE id = ?",
+                    "SELECT content, image_data, type, original_timestamp, tags, note, bookmark, collection_id, pinned, pin_order, use_count, url_title, "
+                    "COALESCE(large_digest, '') FROM deleted_history WHERE id = ?",
                     (deleted_id,),
                 )
                 item = cursor.fetchone()
                 if item:
-                    existing_row = self._find_restore_merge_target_locked(cursor, item[0], item[2])
+                    existing_row = self._find_restore_merge_target_locked(cursor, item[0], item[2], item[12])
                     if existing_row:
                         item_id = int(existing_row[0])
                         metadata = self._build_merged_restore_metadata_locked(cursor, item_id, existing_row[1:], item)
                     else:
                         timestamp = item[3] or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        item_id, _updated_existing = self._add_item_locked(cursor, item[0], item[1], item[2], timestamp=timestamp)
+                        if item[12]:
+                            item_id = self._insert_large_history_row_locked(cursor, item[12], item[0], item[2], timestamp)
+                        else:
+                            item_id, _updated_existing = self._add_item_locked(cursor, item[0], item[1], item[2], timestamp=timestamp)
                         if not item_id:
                             raise sqlite3.Error("Failed to restore history row")
                         item_id = int(item_id)
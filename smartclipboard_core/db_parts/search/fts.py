@@ -77,6 +77,30 @@ class SearchFtsMixin(DBRuntimeMixin):
                     pass
                 return False
 
+    def rebuild_search_index(self) -> bool:
+        """history_fts를 삭제 후 history 기준으로 다시 생성 (손상/불일치 복구)."""
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute("DROP TABLE IF EXISTS history_fts")
+                cursor.execute(
+                    "CREATE VIRTUAL TABLE history_fts "
+                    "USING fts5(content, tags, note, url_title, tokenize='unicode61')"
+                )
+                self.conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"FTS rebuild error: {e}")
+                try:
+                    self.conn.rollback()
+                except Exception:
+                    pass
+                return False
+        # 트리거 재생성 및 누락 행 채우기는 기존 초기화 경로를 재사용
+        rebuilt = self.ensure_search_index()
+        if rebuilt:
+            logger.info("FTS index rebuilt")
+        return rebuilt
+
     @staticmethod
     def _tokenize_search_query(query: str) -> list[str]:
         import re
@@ -5,6 +5,8 @@ import sqlite3
 from smartclipboard_core.file_paths import file_signature_from_content
 
 from ..shared import logger
+from ..sync.bundles import create_sync_schema
+from ..sync.change_log import create_change_log_schema
 from ..typing_helpers import DBRuntimeMixin
 
 
@@ -66,6 +68,49 @@ class SearchSchemaMixin(DBRuntimeMixin):
             for duplicate_id in snippet_ids[1:]:
                 cursor.execute("UPDATE snippets SET shortcut = '' WHERE id = ?", (duplicate_id,))
 
+    @staticmethod
+    def _create_large_clip_triggers(cursor) -> None:
+        unreferenced = (
+            "DELETE FROM large_clips WHERE digest = old.large_digest "
+            "AND NOT EXISTS (SELECT 1 FROM history WHERE large_digest = old.large_digest) "
+            "AND NOT EXISTS (SELECT 1 FROM deleted_history WHERE large_digest = old.large_digest);"
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS history_large_gc AFTER DELETE ON history
+            WHEN COALESCE(old.large_digest, '') != ''
+            BEGIN
+                {unreferenced}
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS history_large_gc_update AFTER UPDATE OF large_digest ON history
+            WHEN COALESCE(old.large_digest, '') != '' AND old.large_digest IS NOT new.large_digest
+            BEGIN
+                {unreferenced}
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS deleted_history_large_gc AFTER DELETE ON deleted_history
+            WHEN COALESCE(old.large_digest, '') != ''
+            BEGIN
+                {unreferenced}
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS large_clips_ad AFTER DELETE ON large_clips
+            BEGIN
+                DELETE FROM large_clip_chunks WHERE digest = old.digest;
+            END
+            """
+        )
+
     def create_tables(self):
         try:
             cursor = self.conn.cursor()
@@ -153,6 +198,9 @@ class SearchSchemaMixin(DBRuntimeMixin):
                 "ALTER TABLE history ADD COLUMN note TEXT DEFAULT ''",
                 "ALTER TABLE history ADD COLUMN bookmark INTEGER DEFAULT 0",
                 "ALTER TABLE history ADD COLUMN expires_at TEXT DEFAULT NULL",
+                "ALTER TABLE history ADD COLUMN large_digest TEXT DEFAULT ''",
+                "ALTER TABLE history ADD COLUMN image_hash INTEGER DEFAULT NULL",
+                "ALTER TABLE history ADD COLUMN thumbnail BLOB DEFAULT NULL",
             ):
                 _execute_add_column(cursor, sql)
 
@@ -199,9 +247,48 @@ class SearchSchemaMixin(DBRuntimeMixin):
                 "ALTER TABLE deleted_history ADD COLUMN pin_order INTEGER DEFAULT 0",
                 "ALTER TABLE deleted_history ADD COLUMN use_count INTEGER DEFAULT 0",
                 "ALTER TABLE deleted_history ADD COLUMN url_title TEXT DEFAULT ''",
+                "ALTER TABLE deleted_history ADD COLUMN large_digest TEXT DEFAULT ''",
             ):
                 _execute_add_column(cursor, col_sql)
 
+            # 대용량 텍스트 클립: 본문은 압축 청크로, history.content에는 앞부분만 저장
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS large_clips (
+                    digest TEXT PRIMARY KEY,
+                    total_chars INTEGER NOT NULL,
+                    total_bytes INTEGER NOT NULL,
+                    chunk_count INTEGER NOT NULL,
+                    codec TEXT NOT NULL DEFAULT 'zlib',
+                    created_at TEXT
+                )
+                """
+            )
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS large_clip_chunks (
+                    digest TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    PRIMARY KEY (digest, seq)
+                )
+                """
+            )
+            self._create_large_clip_triggers(cursor)
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS maintenance_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    detail TEXT DEFAULT '',
+                    duration_ms REAL DEFAULT 0,
+                    created_at TEXT
+                )
+                """
+            )
+
             try:
                 self._dedupe_collections_for_unique_index(cursor)
                 self._dedupe_snippet_shortcuts_for_unique_index(cursor)
@@ -219,6 +306,16 @@ class SearchSchemaMixin(DBRuntimeMixin):
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history(timestamp)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_bookmark ON history(bookmark)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_file_signature ON history(file_signature)")
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_history_large_digest ON history(large_digest) WHERE large_digest != ''"
+                )
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_history_image_hash ON history(image_hash) WHERE image_hash IS NOT NULL"
+                )
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_deleted_history_large_digest "
+                    "ON deleted_history(large_digest) WHERE large_digest != ''"
+                )
             except sqlite3.OperationalError as e:
                 logger.debug(f"Index creation skipped: {e}")
 
@@ -235,6 +332,9 @@ class SearchSchemaMixin(DBRuntimeMixin):
             except sqlite3.OperationalError as e:
                 logger.debug(f"FILE signature backfill skipped: {e}")
 
+            create_change_log_schema(cursor)
+            create_sync_schema(cursor)
+
             self.conn.commit()
             logger.info("DB 테이블 초기화 완료 (v10.1)")
             self.ensure_search_index()
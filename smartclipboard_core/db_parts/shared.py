@@ -21,6 +21,12 @@ FILTER_TAG_MAP = {
 logger = logging.getLogger(__name__)
 
 
+def tag_list_sql(alias: str = "") -> str:
+    """tags as ',a,b,' (전각 쉼표/구분자 주변 공백 정규화) for instr/LIKE token matching."""
+    column = f"{alias}.tags" if alias else "tags"
+    return f"',' || REPLACE(REPLACE(REPLACE({column}, '，', ','), ', ', ','), ' ,', ',') || ','"
+
+
 def history_order_by(alias: str = "") -> str:
     prefix = f"{alias}." if alias else ""
     return (
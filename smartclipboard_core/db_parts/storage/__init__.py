@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from .integrity import IntegrityCheckMixin
+from .read_pool import ReadConnectionPoolMixin
+from .wal import WalCheckpointMixin
+
+
+class StorageOpsMixin(WalCheckpointMixin, IntegrityCheckMixin, ReadConnectionPoolMixin):
+    """Storage maintenance facade (WAL checkpoints, integrity checks, read pool, diagnostics)."""
+
+
+__all__ = ["IntegrityCheckMixin", "ReadConnectionPoolMixin", "StorageOpsMixin", "WalCheckpointMixin"]
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import datetime
+import json
+import sqlite3
+import time
+from typing import Any
+
+from ..shared import logger
+from ..typing_helpers import DBRuntimeMixin
+
+MAINTENANCE_LOG_KEEP = 200
+INTEGRITY_STATUS_OK = "ok"
+INTEGRITY_STATUS_FTS_CORRUPT = "fts_corrupt"
+INTEGRITY_STATUS_DB_CORRUPT = "db_corrupt"
+
+
+class IntegrityCheckMixin(DBRuntimeMixin):
+    """Background-safe quick_check / FTS integrity checks and their log."""
+
+    def run_integrity_check(self, include_fts: bool = True) -> dict[str, Any]:
+        """quick_check + FTS integrity-check를 별도 연결에서 실행.
+
+        공유 연결/잠금을 쓰지 않으므로 워커 스레드에서 호출해도 된다.
+        """
+        started = time.perf_counter()
+        result: dict[str, Any] = {
+            "status": INTEGRITY_STATUS_OK,
+            "quick_check": [],
+            "fts_ok": None,
+            "fts_error": "",
+            "fts_missing_rows": 0,
+            "fts_orphan_rows": 0,
+            "checked_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        try:
+            conn = sqlite3.connect(self.db_file, timeout=1.0)
+            try:
+                messages = [str(row[0]) for row in conn.execute("PRAGMA quick_check").fetchall()]
+                if messages != ["ok"]:
+                    result["status"] = INTEGRITY_STATUS_DB_CORRUPT
+                    result["quick_check"] = messages[:20]
+                elif include_fts:
+                    self._check_fts_integrity(conn, result)
+            finally:
+                conn.close()
+        except sqlite3.DatabaseError as e:
+            result["status"] = INTEGRITY_STATUS_DB_CORRUPT
+            result["quick_check"] = [str(e)]
+
+        result["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        if result["status"] != INTEGRITY_STATUS_OK:
+            logger.warning("Integrity check failed: %s", result)
+        return result
+
+    @staticmethod
+    def _check_fts_integrity(conn, result: dict[str, Any]) -> None:
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='history_fts'").fetchone()
+        if exists is None:
+            result["fts_ok"] = False
+            result["fts_error"] = "history_fts missing"
+            result["status"] = INTEGRITY_STATUS_FTS_CORRUPT
+            return
+        try:
+            conn.execute("INSERT INTO history_fts(history_fts) VALUES('integrity-check')")
+            conn.rollback()
+            result["fts_missing_rows"] = int(
+                conn.execute(
+                    "SELECT COUNT(*) FROM history h LEFT JOIN history_fts f ON f.rowid = h.id WHERE f.rowid IS NULL"
+                ).fetchone()[0]
+            )
+            result["fts_orphan_rows"] = int(
+                conn.execute(
+                    "SELECT COUNT(*) FROM history_fts WHERE rowid NOT IN (SELECT id FROM history)"
+                ).fetchone()[0]
+            )
+        except sqlite3.DatabaseError as e:
+            conn.rollback()
+            result["fts_ok"] = False
+            result["fts_error"] = str(e)
+            result["status"] = INTEGRITY_STATUS_FTS_CORRUPT
+            return
+        result["fts_ok"] = not (result["fts_missing_rows"] or result["fts_orphan_rows"])
+        if not result["fts_ok"]:
+            result["fts_error"] = "history_fts out of sync"
+            result["status"] = INTEGRITY_STATUS_FTS_CORRUPT
+
+    def record_maintenance_event(self, kind: str, status: str, detail: Any = "", duration_ms: float = 0.0) -> bool:
+        """유지보수 결과 기록 (최근 MAINTENANCE_LOG_KEEP건 유지)."""
+        if not isinstance(detail, str):
+            detail = json.dumps(detail, ensure_ascii=False, default=str)
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "INSERT INTO maintenance_log (kind, status, detail, duration_ms, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (kind, status, detail, float(duration_ms or 0.0), datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                )
+                cursor.execute(
+                    "DELETE FROM maintenance_log WHERE id NOT IN (SELECT id FROM maintenance_log ORDER BY id DESC LIMIT ?)",
+                    (MAINTENANCE_LOG_KEEP,),
+                )
+                self.conn.commit()
+                return True
+            except (sqlite3.Error, AttributeError) as e:
+                logger.error(f"Maintenance Log Error: {e}")
+                try:
+                    self.conn.rollback()
+                except Exception:
+                    pass
+                return False
+
+    def get_maintenance_log(self, limit: int = 20, kind: str | None = None) -> list:
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                sql = "SELECT id, kind, status, detail, duration_ms, created_at FROM maintenance_log"
+                params: list[Any] = []
+                if kind:
+                    sql += " WHERE kind = ?"
+                    params.append(kind)
+                sql += " ORDER BY id DESC LIMIT ?"
+                params.append(int(limit))
+                cursor.execute(sql, params)
+                return cursor.fetchall()
+            except (sqlite3.Error, AttributeError) as e:
+                logger.error(f"Get Maintenance Log Error: {e}")
+                return []
+
+
+__all__ = [
+    "INTEGRITY_STATUS_DB_CORRUPT",
+    "INTEGRITY_STATUS_FTS_CORRUPT",
+    "INTEGRITY_STATUS_OK",
+    "IntegrityCheckMixin",
+    "MAINTENANCE_LOG_KEEP",
+]
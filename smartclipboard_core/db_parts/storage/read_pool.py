@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from ..shared import logger
+from ..typing_helpers import DBRuntimeMixin
+
+READ_POOL_SIZE = 4
+READ_POOL_ACQUIRE_TIMEOUT = 5.0
+
+# 여러 읽기 스레드가 처음 동시에 풀을 찾아도 상태는 한 번만 만든다.
+_READ_POOL_INIT_LOCK = threading.Lock()
+
+
+class ReadPoolClosedError(sqlite3.OperationalError):
+    """Raised when a read connection is requested after close()."""
+
+
+class ReadConnectionPoolMixin(DBRuntimeMixin):
+    """Bounded pool of query-only connections for concurrent WAL readers.
+
+    Readers never take ``self.lock`` and never block the single writer
+    connection, so background services (IPC server, exports) can query
+    while the UI thread keeps writing.
+    """
+
+    def _read_pool_state(self) -> dict[str, Any]:
+        state = getattr(self, "_read_pool", None)
+        if state is not None:
+            return state
+        with _READ_POOL_INIT_LOCK:
+            state = getattr(self, "_read_pool", None)
+            if state is None:
+                state = {
+                    "idle": [],
+                    "created": 0,
+                    "size": READ_POOL_SIZE,
+                    "closed": False,
+                    "cond": threading.Condition(),
+                }
+                self._read_pool = state
+        return state
+
+    def _open_read_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_file, timeout=READ_POOL_ACQUIRE_TIMEOUT, check_same_thread=False)
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def _acquire_read_connection(self, timeout: float) -> sqlite3.Connection:
+        state = self._read_pool_state()
+        cond: threading.Condition = state["cond"]
+        with cond:
+            while True:
+                if state["closed"]:
+                    raise ReadPoolClosedError("read connection pool is closed")
+                if state["idle"]:
+                    return state["idle"].pop()
+                if state["created"] < state["size"]:
+                    state["created"] += 1
+                    break
+                if not cond.wait(timeout):
+                    raise TimeoutError("timed out waiting for a read connection")
+        try:
+            return self._open_read_connection()
+        except sqlite3.Error:
+            with cond:
+                state["created"] -= 1
+                cond.notify()
+            raise
+
+    def _release_read_connection(self, conn: sqlite3.Connection) -> None:
+        state = self._read_pool_state()
+        cond: threading.Condition = state["cond"]
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            pass
+        with cond:
+            if state["closed"]:
+                state["created"] -= 1
+                conn.close()
+            else:
+                state["idle"].append(conn)
+            cond.notify()
+
+    @contextmanager
+    def read_connection(self, timeout: float = READ_POOL_ACQUIRE_TIMEOUT) -> Iterator[sqlite3.Connection]:
+        """Borrow a query-only connection from the pool."""
+        conn = self._acquire_read_connection(timeout)
+        try:
+            yield conn
+        finally:
+            self._release_read_connection(conn)
+
+    def get_read_pool_stats(self) -> dict[str, int]:
+        state = self._read_pool_state()
+        with state["cond"]:
+            return {"size": state["size"], "created": state["created"], "idle": len(state["idle"])}
+
+    def close_read_pool(self) -> None:
+        state = self._read_pool_state()
+        with state["cond"]:
+            state["closed"] = True
+            idle, state["idle"] = state["idle"], []
+            state["created"] -= len(idle)
+            state["cond"].notify_all()
+        for conn in idle:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.debug(f"Read pool close error: {e}")
+
+
+__all__ = [
+    "READ_POOL_ACQUIRE_TIMEOUT",
+    "READ_POOL_SIZE",
+    "ReadConnectionPoolMixin",
+    "ReadPoolClosedError",
+]
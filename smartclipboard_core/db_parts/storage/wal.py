@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import datetime
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, cast
+
+from ..shared import logger
+from ..typing_helpers import DBRuntimeMixin
+
+WAL_CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+WAL_JOURNAL_SIZE_LIMIT_BYTES = 16 * 1024 * 1024
+WAL_IDLE_CHECKPOINT_MIN_BYTES = 1 * 1024 * 1024
+WAL_TRUNCATE_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+_checkpoint_stats_lock = threading.Lock()
+
+
+def _new_checkpoint_stats() -> dict[str, Any]:
+    return {"count": 0, "busy": 0, "total_ms": 0.0, "max_ms": 0.0, "by_mode": {}, "last": None}
+
+
+class WalCheckpointMixin(DBRuntimeMixin):
+    """Explicit WAL checkpoint control and size monitoring."""
+
+    def _configure_wal(self) -> None:
+        # 체크포인트 후 WAL 파일이 무한정 커진 상태로 남지 않도록 상한 지정
+        self.conn.execute(f"PRAGMA journal_size_limit={WAL_JOURNAL_SIZE_LIMIT_BYTES}")
+
+    def get_wal_size(self) -> int:
+        try:
+            return os.path.getsize(f"{self.db_file}-wal")
+        except OSError:
+            return 0
+
+    def _checkpoint_stats(self) -> dict[str, Any]:
+        stats = getattr(self, "_wal_checkpoint_stats", None)
+        if stats is None:
+            stats = _new_checkpoint_stats()
+            self._wal_checkpoint_stats = stats
+        return stats
+
+    def _record_checkpoint(self, result: dict[str, Any]) -> None:
+        with _checkpoint_stats_lock:
+            stats = self._checkpoint_stats()
+            stats["count"] += 1
+            stats["busy"] += 1 if result["busy"] else 0
+            stats["total_ms"] += result["duration_ms"]
+            stats["max_ms"] = max(stats["max_ms"], result["duration_ms"])
+            stats["by_mode"][result["mode"]] = stats["by_mode"].get(result["mode"], 0) + 1
+            stats["last"] = dict(result)
+
+    def checkpoint_wal(self, mode: str = "PASSIVE", dedicated_connection: bool = False) -> dict[str, Any] | None:
+        """WAL 체크포인트 실행 후 소요 시간/페이지 수를 기록.
+
+        dedicated_connection=True면 별도 연결을 사용해 공유 잠금을 잡지 않는다
+        (유휴 시간 PASSIVE 체크포인트용).
+        """
+        normalized_mode = str(mode or "").upper()
+        if normalized_mode not in WAL_CHECKPOINT_MODES:
+            raise ValueError(f"Unsupported checkpoint mode: {mode}")
+
+        wal_before = self.get_wal_size()
+        started = time.perf_counter()
+        try:
+            if dedicated_connection:
+                conn = sqlite3.connect(self.db_file, timeout=0.5)
+                try:
+                    row = conn.execute(f"PRAGMA wal_checkpoint({normalized_mode})").fetchone()
+                finally:
+                    conn.close()
+            else:
+                with self.lock:
+                    if self.conn is None:
+                        return None
+                    row = self.conn.execute(f"PRAGMA wal_checkpoint({normalized_mode})").fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"WAL Checkpoint Error ({normalized_mode}): {e}")
+            return None
+
+        busy, log_pages, checkpointed_pages = (int(value) for value in (row or (0, -1, -1)))
+        result = {
+            "mode": normalized_mode,
+            "busy": bool(busy),
+            "log_pages": log_pages,
+            "checkpointed_pages": checkpointed_pages,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            "wal_bytes_before": wal_before,
+            "wal_bytes_after": self.get_wal_size(),
+            "at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self._record_checkpoint(result)
+        logger.debug(
+            "WAL checkpoint %s: %s/%s pages in %.2fms (busy=%s)",
+            normalized_mode,
+            checkpointed_pages,
+            log_pages,
+            result["duration_ms"],
+            result["busy"],
+        )
+        return result
+
+    def maybe_checkpoint_wal(
+        self,
+        min_bytes: int = WAL_IDLE_CHECKPOINT_MIN_BYTES,
+        truncate_bytes: int = WAL_TRUNCATE_THRESHOLD_BYTES,
+    ) -> dict[str, Any] | None:
+        """유휴 시간용: WAL 크기에 따라 PASSIVE 또는 TRUNCATE 체크포인트."""
+        wal_size = self.get_wal_size()
+        if wal_size < min_bytes:
+            return None
+        mode = "TRUNCATE" if wal_size >= truncate_bytes else "PASSIVE"
+        result = self.checkpoint_wal(mode, dedicated_connection=True)
+        if result is not None and mode == "TRUNCATE" and result["busy"]:
+            # 읽기 작업이 진행 중이면 다음 유휴 주기에 다시 시도
+            logger.info("WAL truncate deferred; readers active (wal=%s bytes)", wal_size)
+        return result
+
+    def vacuum_database(self) -> dict[str, Any] | None:
+        """VACUUM 후 TRUNCATE 체크포인트로 DB/WAL 파일 크기를 회수."""
+        try:
+            db_before = os.path.getsize(self.db_file)
+        except OSError:
+            db_before = 0
+        wal_before = self.get_wal_size()
+        started = time.perf_counter()
+        with self.lock:
+            if self.conn is None:
+                return None
+            try:
+                self.conn.execute("VACUUM")
+            except sqlite3.Error as e:
+                logger.error(f"Vacuum Error: {e}")
+                return None
+        checkpoint = self.checkpoint_wal("TRUNCATE")
+        try:
+            db_after = os.path.getsize(self.db_file)
+        except OSError:
+            db_after = 0
+        result = {
+            "db_bytes_before": db_before,
+            "db_bytes_after": db_after,
+            "wal_bytes_before": wal_before,
+            "wal_bytes_after": self.get_wal_size(),
+            "checkpoint_busy": bool(checkpoint and checkpoint["busy"]),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        logger.info("Database VACUUM completed: %s -> %s bytes", db_before, db_after)
+        return result
+
+    def get_storage_diagnostics(self) -> dict[str, Any]:
+        """DB/WAL 크기와 체크포인트 통계를 진단용으로 반환."""
+        diagnostics: dict[str, Any] = {
+            "db_bytes": 0,
+            "wal_bytes": self.get_wal_size(),
+            "page_size": 0,
+            "page_count": 0,
+            "freelist_count": 0,
+            "journal_mode": "",
+        }
+        try:
+            diagnostics["db_bytes"] = os.path.getsize(self.db_file)
+        except OSError:
+            pass
+        with self.lock:
+            try:
+                if self.conn is None:
+                    raise sqlite3.ProgrammingError("connection closed")
+                for pragma in ("page_size", "page_count", "freelist_count", "journal_mode"):
+                    row = self.conn.execute(f"PRAGMA {pragma}").fetchone()
+                    diagnostics[pragma] = row[0] if row else diagnostics[pragma]
+            except sqlite3.Error as e:
+                logger.debug(f"Storage diagnostics error: {e}")
+        integrity_rows = cast(Any, self).get_maintenance_log(limit=1, kind="integrity_check")
+        if integrity_rows:
+            _row_id, _kind, status, _detail, duration_ms, created_at = integrity_rows[0]
+            diagnostics["last_integrity_check"] = {"status": status, "duration_ms": duration_ms, "at": created_at}
+        else:
+            diagnostics["last_integrity_check"] = None
+        with _checkpoint_stats_lock:
+            stats = self._checkpoint_stats()
+            diagnostics["checkpoints"] = {
+                **stats,
+                "by_mode": dict(stats["by_mode"]),
+                "avg_ms": round(stats["total_ms"] / stats["count"], 2) if stats["count"] else 0.0,
+            }
+        return diagnostics
+
+
+__all__ = [
+    "WAL_CHECKPOINT_MODES",
+    "WAL_IDLE_CHECKPOINT_MIN_BYTES",
+    "WAL_JOURNAL_SIZE_LIMIT_BYTES",
+    "WAL_TRUNCATE_THRESHOLD_BYTES",
+    "WalCheckpointMixin",
+]
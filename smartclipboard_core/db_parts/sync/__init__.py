@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from .bundles import SyncBundleMixin
+from .change_log import ChangeLogMixin
+
+
+class SyncOpsMixin(ChangeLogMixin, SyncBundleMixin):
+    """Change feed and offline bundle sync facade."""
+
+
+__all__ = ["ChangeLogMixin", "SyncBundleMixin", "SyncOpsMixin"]
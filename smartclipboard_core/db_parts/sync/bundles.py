@@ -0,0 +1,689 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import uuid as uuid_module
+from typing import Any
+
+from smartclipboard_core.large_text import encode_large_text, is_large_text
+from smartclipboard_core.sync_bundle import (
+    BundleWriter,
+    SyncBundleError,
+    item_hash,
+    list_bundles,
+    read_bundle,
+    sha256_bytes,
+    sha256_text,
+)
+
+from ..shared import logger
+from ..typing_helpers import DBRuntimeMixin
+
+SYNC_DEVICE_SETTING = "sync_device_id"
+SYNC_EXPORT_SEQ_SETTING = "sync_export_seq"
+SYNC_CLOCK_FILE_SUFFIX = ".clock.json"
+_SYNC_FEED_PAGE = 5000
+# 내보내기는 이만큼의 행마다 쓰기 잠금을 놓아 캡처가 오래 기다리지 않게 한다.
+_SYNC_EXPORT_BATCH = 200
+# 같은 프로세스에서 두 내보내기가 같은 카운터를 쓰지 않게 한다 (DB 쓰기 잠금과 별개).
+_SYNC_EXPORT_LOCK = threading.Lock()
+
+_SYNC_ROW_SQL = """
+    SELECT h.content, h.image_data, h.type, h.timestamp, h.tags, h.note, h.bookmark, c.name,
+           h.pinned, h.use_count, h.url_title, COALESCE(h.large_digest, '')
+    FROM history h
+    LEFT JOIN collections c ON c.id = h.collection_id
+    WHERE h.id = ?
+"""
+
+
+def create_sync_schema(cursor) -> None:
+    """Item identity/version table, uuid aliases and the per-device vector clock."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sync_items (
+            uuid TEXT PRIMARY KEY,
+            row_id INTEGER UNIQUE,
+            device TEXT NOT NULL DEFAULT '',
+            counter INTEGER NOT NULL DEFAULT 0,
+            row_hash TEXT NOT NULL DEFAULT '',
+            deleted INTEGER NOT NULL DEFAULT 0,
+            pending_delete INTEGER NOT NULL DEFAULT 0,
+            vclock TEXT NOT NULL DEFAULT ''
+        )
+        """
+    )
+    try:
+        cursor.execute("ALTER TABLE sync_items ADD COLUMN vclock TEXT NOT NULL DEFAULT ''")
+    except sqlite3.OperationalError as exc:
+        if "duplicate column name" not in str(exc).lower():
+            raise
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sync_aliases (
+            alias TEXT PRIMARY KEY,
+            uuid TEXT NOT NULL
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sync_clock (
+            device TEXT PRIMARY KEY,
+            counter INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    # 삭제된 행의 uuid는 다음 내보내기에서 delete 연산이 되도록 표시만 해 둔다 (행 id 재사용 대비).
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS sync_items_history_ad AFTER DELETE ON history
+        BEGIN
+            UPDATE sync_items SET row_id = NULL, pending_delete = 1 WHERE row_id = old.id;
+        END
+        """
+    )
+
+
+def _stamp_newer(device: str, counter: int, other_device: str, other_counter: int) -> bool:
+    return (int(counter), str(device)) > (int(other_counter), str(other_device))
+
+
+def _version_clock(raw: str, device: str, counter: int) -> dict[str, int]:
+    """Vector clock stored with a version; old rows without one fall back to their own stamp."""
+    try:
+        clock = {str(key): int(value) for key, value in json.loads(raw).items()} if raw else {}
+    except (TypeError, ValueError, AttributeError):
+        clock = {}
+    if device:
+        clock[device] = max(clock.get(device, 0), int(counter))
+    return clock
+
+
+def _clock_covers(clock: dict[str, int], other: dict[str, int]) -> bool:
+    return all(clock.get(device, 0) >= counter for device, counter in other.items())
+
+
+def _upsert_supersedes(
+    device: str,
+    counter: int,
+    incoming_clock: dict[str, int],
+    local_device: str,
+    local_counter: int,
+    local_clock: dict[str, int],
+) -> bool:
+    """Whether an incoming version replaces the local one; every device reaches the same answer.
+
+    A version whose clock has seen the other one wins; two concurrent versions
+    are ordered by their (counter, device) stamp.
+    """
+    if not local_device:
+        return True
+    if _clock_covers(incoming_clock, local_clock):
+        return True
+    if _clock_covers(local_clock, incoming_clock):
+        return False
+    return _stamp_newer(device, counter, local_device, local_counter)
+
+
+class SyncBundleMixin(DBRuntimeMixin):
+    """Offline sync through op-log bundles exchanged in a shared folder."""
+
+    @staticmethod
+    def _read_setting_locked(cursor, key: str, default: str = "") -> str:
+        cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
+        row = cursor.fetchone()
+        return str(row[0]) if row and row[0] is not None else default
+
+    @staticmethod
+    def _write_setting_locked(cursor, key: str, value: str) -> None:
+        cursor.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value))
+
+    def _sync_device_id_locked(self, cursor) -> str:
+        device = self._read_setting_locked(cursor, SYNC_DEVICE_SETTING)
+        if not device:
+            device = uuid_module.uuid4().hex
+            self._write_setting_locked(cursor, SYNC_DEVICE_SETTING, device)
+        return device
+
+    @staticmethod
+    def _read_sync_clock_locked(cursor) -> dict[str, int]:
+        cursor.execute("SELECT device, counter FROM sync_clock")
+        return {str(device): int(counter or 0) for device, counter in cursor.fetchall()}
+
+    @staticmethod
+    def _advance_sync_clock_locked(cursor, device: str, counter: int) -> None:
+        cursor.execute(
+            "INSERT INTO sync_clock (device, counter) VALUES (?, ?) "
+            "ON CONFLICT(device) DO UPDATE SET counter = MAX(counter, excluded.counter)",
+            (device, int(counter)),
+        )
+
+    @staticmethod
+    def _stamp_sync_item_locked(
+        cursor,
+        item_uuid: str,
+        row_id: int | None,
+        device: str,
+        counter: int,
+        row_hash: str,
+        deleted: bool = False,
+        vclock: dict[str, int] | None = None,
+    ) -> None:
+        cursor.execute(
+            """
+            INSERT INTO sync_items (uuid, row_id, device, counter, row_hash, deleted, pending_delete, vclock)
+            VALUES (?, ?, ?, ?, ?, ?, 0, ?)
+            ON CONFLICT(uuid) DO UPDATE SET
+                row_id = excluded.row_id, device = excluded.device, counter = excluded.counter,
+                row_hash = excluded.row_hash, deleted = excluded.deleted, pending_delete = 0,
+                vclock = excluded.vclock
+            """,
+            (
+                item_uuid,
+                row_id,
+                device,
+                int(counter),
+                row_hash,
+                1 if deleted else 0,
+                json.dumps(vclock, sort_keys=True, separators=(",", ":")) if vclock else "",
+            ),
+        )
+
+    def _load_sync_item_locked(self, cursor, row_id: int, with_payload: bool = False) -> dict[str, Any] | None:
+        cursor.execute(_SYNC_ROW_SQL, (row_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        content, image_data, item_type, timestamp, tags, note, bookmark, collection, pinned, use_count, url_title, digest = row
+        item: dict[str, Any] = {
+            "type": item_type,
+            "content_sha": digest or sha256_text(content or ""),
+            "image_sha": sha256_bytes(image_data),
+            "timestamp": timestamp,
+            "tags": str(tags or ""),
+            "note": str(note or ""),
+            "bookmark": 1 if bookmark else 0,
+            "collection": collection or "",
+            "pinned": 1 if pinned else 0,
+            "use_count": int(use_count or 0),
+            "url_title": str(url_title or ""),
+        }
+        if with_payload:
+            if digest:
+                content = self._read_large_text_locked(cursor, digest)
+                if content is None:
+                    return None
+            item["content"] = content or ""
+            if image_data:
+                item["image"] = base64.b64encode(image_data).decode("ascii")
+        return item
+
+    def _sync_row_hash_locked(self, cursor, row_id: int, fallback: dict[str, Any]) -> str:
+        """Hash of the row as stored, so normalisation on write does not echo back on export."""
+        return item_hash(self._load_sync_item_locked(cursor, row_id) or fallback)
+
+    def get_sync_device_id(self) -> str:
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                device = self._sync_device_id_locked(cursor)
+                self.conn.commit()
+                return device
+            except sqlite3.Error as e:
+                logger.error(f"Sync Device Id Error: {e}")
+                self.conn.rollback()
+                return ""
+
+    def get_sync_status(self) -> dict[str, Any]:
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute("SELECT COUNT(*), COALESCE(SUM(pending_delete), 0) FROM sync_items WHERE row_id IS NOT NULL OR pending_delete = 1")
+                tracked, pending_deletes = cursor.fetchone()
+                return {
+                    "device": self._read_setting_locked(cursor, SYNC_DEVICE_SETTING),
+                    "clock": self._read_sync_clock_locked(cursor),
+                    "export_seq": int(self._read_setting_locked(cursor, SYNC_EXPORT_SEQ_SETTING, "0") or 0),
+                    "tracked_items": int(tracked or 0),
+                    "pending_deletes": int(pending_deletes or 0),
+                }
+            except sqlite3.Error as e:
+                logger.error(f"Sync Status Error: {e}")
+                return {}
+
+    # --- export -------------------------------------------------------------
+
+    def _changed_history_rows_locked(self, cursor, watermark: int) -> list[int]:
+        if watermark > 0:
+            row_ids: set[int] = set()
+            seq = watermark
+            while True:
+                feed = self._changes_since_on_cursor(cursor, seq, _SYNC_FEED_PAGE, ("history",))
+                if feed["reset"]:
+                    break
+                row_ids.update(change["id"] for change in feed["changes"] if change["op"] != "delete")
+                seq = feed["last_seq"]
+                if not feed["has_more"]:
+                    return sorted(row_ids)
+        # 첫 내보내기이거나 변경 로그가 정리된 경우: 전체를 다시 비교한다 (해시가 같으면 건너뜀).
+        cursor.execute("SELECT id FROM history ORDER BY id")
+        return [int(row[0]) for row in cursor.fetchall()]
+
+    def export_sync_bundle(self, folder: str) -> dict[str, Any]:
+        """Write local changes since the previous export as one bundle in folder.
+
+        Ops are streamed to the bundle file in batches of _SYNC_EXPORT_BATCH
+        rows and the DB lock is released between batches; the rows are only
+        stamped as exported, in one short transaction, once every op is on disk.
+        """
+        result: dict[str, Any] = {"path": None, "ops": 0, "upserts": 0, "deletes": 0}
+        with _SYNC_EXPORT_LOCK:
+            writer: BundleWriter | None = None
+            try:
+                with self.lock:
+                    cursor = self.conn.cursor()
+                    device = self._sync_device_id_locked(cursor)
+                    cursor.execute("SELECT COALESCE(MAX(seq), 0) FROM history_changes")
+                    latest_seq = int(cursor.fetchone()[0] or 0)
+                    watermark = int(self._read_setting_locked(cursor, SYNC_EXPORT_SEQ_SETTING, "0") or 0)
+                    clock = self._read_sync_clock_locked(cursor)
+                    row_ids = self._changed_history_rows_locked(cursor, watermark)
+                    self.conn.commit()
+                counter = clock.get(device, 0)
+                # 이 번들의 각 버전이 본 다른 기기의 시계. 가져오기 중이 아니므로 내보내는 동안 바뀌지 않는다.
+                seen = {other: value for other, value in clock.items() if other != device}
+                # (uuid, row_id, counter, row_hash): 번들에 쓴 upsert. 본문은 파일에만 있고 메모리에 모으지 않는다.
+                written: list[tuple[str, int, int, str]] = []
+
+                for start in range(0, len(row_ids), _SYNC_EXPORT_BATCH):
+                    with self.lock:
+                        cursor = self.conn.cursor()
+                        batch_ops = []
+                        for row_id in row_ids[start : start + _SYNC_EXPORT_BATCH]:
+                            item = self._load_sync_item_locked(cursor, row_id)
+                            if item is None:
+                                continue
+                            row_hash = item_hash(item)
+                            cursor.execute("SELECT uuid, row_hash FROM sync_items WHERE row_id = ?", (row_id,))
+                            known = cursor.fetchone()
+                            if known and known[1] == row_hash:
+                                continue  # 가져온 그대로이거나 이미 내보낸 상태
+                            payload = self._load_sync_item_locked(cursor, row_id, with_payload=True)
+                            if payload is None:
+                                continue
+                            counter += 1
+                            item_uuid = known[0] if known else uuid_module.uuid4().hex
+                            written.append((item_uuid, row_id, counter, row_hash))
+                            batch_ops.append({"c": counter, "op": "upsert", "uuid": item_uuid, "item": payload})
+                    if batch_ops:
+                        writer = writer or BundleWriter(folder, device)
+                        for op in batch_ops:
+                            writer.write(op)
+
+                with self.lock:
+                    cursor = self.conn.cursor()
+                    try:
+                        for item_uuid, row_id, op_counter, row_hash in written:
+                            vclock = {**seen, device: op_counter}
+                            cursor.execute("SELECT 1 FROM history WHERE id = ?", (row_id,))
+                            if cursor.fetchone():
+                                self._stamp_sync_item_locked(cursor, item_uuid, row_id, device, op_counter, row_hash, vclock=vclock)
+                            else:
+                                # 내보내는 사이 삭제된 행: 다음 내보내기에서 delete가 나가게 한다.
+                                self._stamp_sync_item_locked(cursor, item_uuid, None, device, op_counter, row_hash, vclock=vclock)
+                                cursor.execute("UPDATE sync_items SET pending_delete = 1 WHERE uuid = ?", (item_uuid,))
+                            result["upserts"] += 1
+
+                        cursor.execute("SELECT uuid FROM sync_items WHERE pending_delete = 1 ORDER BY uuid")
+                        for (item_uuid,) in cursor.fetchall():
+                            counter += 1
+                            writer = writer or BundleWriter(folder, device)
+                            writer.write({"c": counter, "op": "delete", "uuid": item_uuid})
+                            self._stamp_sync_item_locked(cursor, item_uuid, None, device, counter, "", deleted=True)
+                            result["deletes"] += 1
+
+                        self._write_setting_locked(cursor, SYNC_EXPORT_SEQ_SETTING, str(latest_seq))
+                        if writer is not None:
+                            self._advance_sync_clock_locked(cursor, device, counter)
+                            result["path"] = writer.commit({**seen, device: counter})
+                            result["ops"] = writer.count
+                            writer = None
+                        self.conn.commit()
+                    except BaseException:
+                        self.conn.rollback()
+                        raise
+                if result["ops"]:
+                    logger.info(f"동기화 번들 내보내기: {result['ops']}건 -> {result['path']}")
+                return result
+            except (sqlite3.Error, OSError, SyncBundleError) as e:
+                logger.error(f"Sync Export Error: {e}")
+                with self.lock:
+                    self.conn.rollback()
+                result["error"] = str(e)
+                return result
+            finally:
+                if writer is not None:
+                    writer.abort()
+
+    # --- import -------------------------------------------------------------
+
+    def _resolve_sync_item_locked(self, cursor, item_uuid: str):
+        cursor.execute("SELECT uuid FROM sync_aliases WHERE alias = ?", (item_uuid,))
+        alias = cursor.fetchone()
+        if alias:
+            item_uuid = alias[0]
+        cursor.execute(
+            "SELECT uuid, row_id, device, counter, row_hash, deleted, pending_delete, vclock FROM sync_items WHERE uuid = ?",
+            (item_uuid,),
+        )
+        return cursor.fetchone()
+
+    def _sync_collection_id_locked(self, cursor, name: str) -> int | None:
+        normalized = self._normalize_collection_name(name)
+        if not normalized:
+            return None
+        existing = self._get_collection_by_name_locked(cursor, normalized)
+        if existing:
+            return int(existing[0])
+        created = self._add_collection_locked(cursor, normalized, "📁", "#6366f1")
+        return int(created) if created else None
+
+    @staticmethod
+    def _decode_sync_image(item: dict[str, Any]) -> bytes | None:
+        encoded = item.get("image")
+        if not encoded:
+            return None
+        try:
+            return base64.b64decode(encoded, validate=True)
+        except (binascii.Error, ValueError) as exc:
+            raise SyncBundleError(f"invalid image payload: {exc}") from exc
+
+    def _insert_sync_item_locked(self, cursor, item: dict[str, Any]) -> int:
+        content = str(item.get("content") or "")
+        item_type = str(item.get("type") or "TEXT")
+        timestamp = item.get("timestamp") or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if item_type not in ("IMAGE", "FILE") and is_large_text(content):
+            item_id, _updated = self._add_large_text_locked(cursor, encode_large_text(content), item_type, timestamp=timestamp)
+        else:
+            item_id, _updated = self._add_item_locked(cursor, content, self._decode_sync_image(item), item_type, timestamp=timestamp)
+        if not item_id:
+            raise sqlite3.Error("Failed to insert synced history row")
+        item_id = int(item_id)
+        pinned = 1 if item.get("pinned") else 0
+        self._set_item_metadata_locked(
+            cursor,
+            item_id,
+            tags=str(item.get("tags") or ""),
+            note=str(item.get("note") or ""),
+            bookmark=1 if item.get("bookmark") else 0,
+            collection_id=self._sync_collection_id_locked(cursor, item.get("collection") or ""),
+            pinned=pinned,
+            pin_order=self._next_pin_order_locked(cursor, exclude_item_id=item_id) if pinned else 0,
+            use_count=int(item.get("use_count") or 0),
+            url_title=str(item.get("url_title") or ""),
+        )
+        return item_id
+
+    def _overwrite_sync_item_locked(self, cursor, row_id: int, item: dict[str, Any], local: dict[str, Any]) -> None:
+        item_type = str(item.get("type") or local["type"])
+        content = item.get("content")
+        if (
+            item.get("content_sha") != local["content_sha"]
+            and isinstance(content, str)
+            and item_type not in ("IMAGE", "FILE")
+            and not is_large_text(content)
+        ):
+            cursor.execute("UPDATE history SET content = ?, type = ? WHERE id = ?", (content, item_type, row_id))
+        elif item_type != local["type"]:
+            cursor.execute("UPDATE history SET type = ? WHERE id = ?", (item_type, row_id))
+        pinned = 1 if item.get("pinned") else 0
+        if pinned and not local["pinned"]:
+            pin_order = self._next_pin_order_locked(cursor, exclude_item_id=row_id)
+        else:
+            cursor.execute("SELECT pin_order FROM history WHERE id = ?", (row_id,))
+            pin_order = int(cursor.fetchone()[0] or 0) if pinned else 0
+        self._set_item_metadata_locked(
+            cursor,
+            row_id,
+            tags=str(item.get("tags") or ""),
+            note=str(item.get("note") or ""),
+            bookmark=1 if item.get("bookmark") else 0,
+            collection_id=self._sync_collection_id_locked(cursor, item.get("collection") or ""),
+            pinned=pinned,
+            pin_order=pin_order,
+            use_count=int(item.get("use_count") or 0),
+            url_title=str(item.get("url_title") or ""),
+        )
+
+    def _merge_sync_item_locked(self, cursor, row_id: int, item: dict[str, Any]) -> None:
+        """Concurrent edits: same rules as restoring a trashed duplicate (local row is the active one)."""
+        cursor.execute(
+            "SELECT tags, note, bookmark, collection_id, pinned, pin_order, use_count, timestamp, url_title "
+            "FROM history WHERE id = ?",
+            (row_id,),
+        )
+        active_row = cursor.fetchone()
+        incoming_row = (
+            None,
+            None,
+            item.get("type"),
+            item.get("timestamp"),
+            item.get("tags") or "",
+            item.get("note") or "",
+            1 if item.get("bookmark") else 0,
+            self._sync_collection_id_locked(cursor, item.get("collection") or ""),
+            1 if item.get("pinned") else 0,
+            0,
+            int(item.get("use_count") or 0),
+            item.get("url_title") or "",
+        )
+        metadata = self._build_merged_restore_metadata_locked(cursor, row_id, active_row, incoming_row)
+        # 복원과 달리 두 기기의 사용 횟수는 같은 이력을 공유하므로 합산하지 않고 큰 값을 쓴다 (재적용해도 동일).
+        metadata["use_count"] = max(int(active_row[6] or 0), int(item.get("use_count") or 0))
+        self._set_item_metadata_locked(cursor, row_id, **metadata)
+
+    def _apply_sync_upsert_locked(self, cursor, device: str, counter: int, item_uuid: str, item, clock) -> str:
+        if not isinstance(item, dict):
+            raise SyncBundleError(f"upsert without item: {item_uuid}")
+        remote_hash = item_hash(item)
+        # 이 버전의 벡터 시계: 보낸 기기가 내보낼 때 본 다른 기기의 카운터 + 이 연산의 카운터
+        incoming_clock = {**clock, device: int(counter)}
+        known = self._resolve_sync_item_locked(cursor, item_uuid)
+        if known and known[1] is not None:
+            canonical_uuid, row_id, local_device, local_counter, row_hash, _deleted, _pending, raw_clock = known
+            local = self._load_sync_item_locked(cursor, row_id)
+            if local is None:
+                return "skipped"
+            local_clock = _version_clock(raw_clock, local_device, local_counter)
+            if item_hash(local) == row_hash:
+                if not _upsert_supersedes(device, counter, incoming_clock, local_device, local_counter, local_clock):
+                    return "skipped"  # 이미 본 버전이거나, 동시 수정에서 진 쪽
+                self._overwrite_sync_item_locked(cursor, row_id, item, local)
+                outcome = "updated"
+                stored_hash = self._sync_row_hash_locked(cursor, row_id, item)
+                stored_clock = incoming_clock
+            else:
+                # 아직 내보내지 않은 로컬 수정이 있다: 병합하고, 결과가 다르면 다음 내보내기로 전파된다.
+                self._merge_sync_item_locked(cursor, row_id, item)
+                outcome = "merged"
+                stored_hash = remote_hash
+                stored_clock = {
+                    key: max(local_clock.get(key, 0), incoming_clock.get(key, 0)) for key in {*local_clock, *incoming_clock}
+                }
+            self._stamp_sync_item_locked(cursor, canonical_uuid, row_id, device, counter, stored_hash, vclock=stored_clock)
+            return outcome
+
+        if known and (known[5] or known[6]):
+            canonical_uuid, _row_id, deleted_device, deleted_counter, _hash, _deleted, pending_delete, _clock = known
+            if pending_delete or int(clock.get(deleted_device, 0)) < int(deleted_counter):
+                return "skipped"  # 삭제와 동시에 일어난 수정: 삭제가 이긴다
+            row_id = self._insert_sync_item_locked(cursor, item)
+            self._stamp_sync_item_locked(
+                cursor, canonical_uuid, row_id, device, counter, self._sync_row_hash_locked(cursor, row_id, item), vclock=incoming_clock
+            )
+            return "inserted"
+
+        content = str(item.get("content") or "")
+        item_type = str(item.get("type") or "TEXT")
+        large_digest = str(item.get("content_sha") or "") if item_type not in ("IMAGE", "FILE") and is_large_text(content) else ""
+        existing = self._find_restore_merge_target_locked(cursor, content, item_type, large_digest)
+        if existing:
+            row_id = int(existing[0])
+            cursor.execute("SELECT uuid FROM sync_items WHERE row_id = ?", (row_id,))
+            local_uuid = cursor.fetchone()
+            self._merge_sync_item_locked(cursor, row_id, item)
+            if local_uuid:
+                # 두 기기에서 따로 생긴 같은 항목: 원격 uuid를 로컬 uuid의 별칭으로 기록한다.
+                cursor.execute(
+                    "INSERT OR REPLACE INTO sync_aliases (alias, uuid) VALUES (?, ?)",
+                    (item_uuid, local_uuid[0]),
+                )
+            else:
+                self._stamp_sync_item_locked(cursor, item_uuid, row_id, device, counter, remote_hash, vclock=incoming_clock)
+            return "merged"
+
+        row_id = self._insert_sync_item_locked(cursor, item)
+        self._stamp_sync_item_locked(
+            cursor, item_uuid, row_id, device, counter, self._sync_row_hash_locked(cursor, row_id, item), vclock=incoming_clock
+        )
+        return "inserted"
+
+    def _apply_sync_delete_locked(self, cursor, device: str, counter: int, item_uuid: str) -> str:
+        known = self._resolve_sync_item_locked(cursor, item_uuid)
+        canonical_uuid = known[0] if known else item_uuid
+        outcome = "skipped"
+        if known and known[1] is not None:
+            if self._soft_delete_locked(cursor, int(known[1])):
+                outcome = "deleted"
+        elif known and known[5] and not _stamp_newer(device, counter, known[2], known[3]):
+            return outcome
+        # 모르는 uuid도 기록해 두어 늦게 도착한 수정이 항목을 되살리지 않게 한다.
+        self._stamp_sync_item_locked(cursor, canonical_uuid, None, device, counter, "", deleted=True)
+        return outcome
+
+    def import_sync_bundles(self, folder: str) -> dict[str, Any]:
+        """Apply bundles from other devices that are newer than the local vector clock."""
+        report: dict[str, Any] = {
+            "bundles": 0,
+            "inserted": 0,
+            "updated": 0,
+            "merged": 0,
+            "deleted": 0,
+            "skipped": 0,
+            "gaps": [],
+            "errors": [],
+        }
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                device_id = self._sync_device_id_locked(cursor)
+                clock = self._read_sync_clock_locked(cursor)
+                self.conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Sync Import Error: {e}")
+                self.conn.rollback()
+                report["errors"].append(str(e))
+                return report
+
+            blocked: set[str] = set()
+            for ref in list_bundles(folder):
+                if ref.device == device_id or ref.device in blocked:
+                    continue
+                seen = clock.get(ref.device, 0)
+                if ref.last <= seen:
+                    continue  # 이미 적용한 번들: 열지 않는다
+                if ref.first > seen + 1:
+                    # 앞선 번들이 아직 도착하지 않았다 (폴더 동기화 지연). 순서를 지키기 위해 기다린다.
+                    report["gaps"].append({"device": ref.device, "expected": seen + 1, "found": ref.first})
+                    blocked.add(ref.device)
+                    continue
+                try:
+                    header, ops = read_bundle(ref.path)
+                    header_clock = {str(k): int(v) for k, v in (header.get("clock") or {}).items()}
+                    cursor = self.conn.cursor()
+                    for op in ops:
+                        counter = int(op.get("c") or 0)
+                        if counter <= seen:
+                            continue
+                        item_uuid = str(op.get("uuid") or "")
+                        if not item_uuid:
+                            raise SyncBundleError("operation without uuid")
+                        if op.get("op") == "delete":
+                            outcome = self._apply_sync_delete_locked(cursor, ref.device, counter, item_uuid)
+                        else:
+                            outcome = self._apply_sync_upsert_locked(
+                                cursor, ref.device, counter, item_uuid, op.get("item"), header_clock
+                            )
+                        report[outcome] += 1
+                    self._advance_sync_clock_locked(cursor, ref.device, ref.last)
+                    self.conn.commit()
+                    clock[ref.device] = ref.last
+                    report["bundles"] += 1
+                except (sqlite3.Error, SyncBundleError, TypeError, ValueError) as e:
+                    self.conn.rollback()
+                    logger.error(f"Sync Bundle Error ({os.path.basename(ref.path)}): {e}")
+                    report["errors"].append(f"{os.path.basename(ref.path)}: {e}")
+                    blocked.add(ref.device)
+        if report["bundles"]:
+            logger.info(
+                f"동기화 번들 가져오기: {report['bundles']}개 "
+                f"(추가 {report['inserted']}, 갱신 {report['updated']}, 병합 {report['merged']}, 삭제 {report['deleted']})"
+            )
+        return report
+
+    # --- shared folder ------------------------------------------------------
+
+    def _prune_acknowledged_bundles(self, folder: str, device_id: str, clock: dict[str, int]) -> int:
+        """Delete own bundles every known peer has already applied."""
+        clock_path = os.path.join(folder, f"{device_id}{SYNC_CLOCK_FILE_SUFFIX}")
+        tmp_path = f"{clock_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"device": device_id, "clock": clock}, fh)
+        os.replace(tmp_path, clock_path)
+
+        acknowledged: int | None = None
+        for name in os.listdir(folder):
+            if not name.endswith(SYNC_CLOCK_FILE_SUFFIX) or name == os.path.basename(clock_path):
+                continue
+            try:
+                with open(os.path.join(folder, name), "r", encoding="utf-8") as fh:
+                    peer_seen = int((json.load(fh).get("clock") or {}).get(device_id, 0))
+            except (OSError, ValueError, AttributeError):
+                continue
+            acknowledged = peer_seen if acknowledged is None else min(acknowledged, peer_seen)
+        if not acknowledged:
+            return 0
+        removed = 0
+        for ref in list_bundles(folder):
+            if ref.device == device_id and ref.last <= acknowledged:
+                try:
+                    os.remove(ref.path)
+                    removed += 1
+                except OSError as e:
+                    logger.debug(f"Sync bundle prune skipped: {e}")
+        return removed
+
+    def sync_with_folder(self, folder: str) -> dict[str, Any]:
+        """Import peers' bundles, export local changes, then prune acknowledged bundles."""
+        imported = self.import_sync_bundles(folder)
+        exported = self.export_sync_bundle(folder)
+        pruned = 0
+        try:
+            with self.lock:
+                cursor = self.conn.cursor()
+                device_id = self._sync_device_id_locked(cursor)
+                clock = self._read_sync_clock_locked(cursor)
+                self.conn.commit()
+            pruned = self._prune_acknowledged_bundles(folder, device_id, clock)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Sync folder bookkeeping failed: {e}")
+        return {"imported": imported, "exported": exported, "pruned": pruned}
+
+
+__all__ = ["SyncBundleMixin", "create_sync_schema"]
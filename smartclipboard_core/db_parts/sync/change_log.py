@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import itertools
+import sqlite3
+from typing import Any
+
+from ..shared import logger
+from ..typing_helpers import DBRuntimeMixin
+
+CHANGE_LOG_TRIGGER_VERSION = 1
+CHANGE_LOG_MAX_ROWS = 50_000
+CHANGE_LOG_FLOOR_SETTING = "change_log_floor"
+CHANGES_SINCE_DEFAULT_LIMIT = 1000
+
+# 태그는 별도 테이블이 아니라 history.tags 컬럼이므로 history 업데이트로 기록된다.
+CHANGE_LOG_TRACKED_COLUMNS: dict[str, tuple[str, ...]] = {
+    "history": (
+        "content",
+        "image_data",
+        "type",
+        "timestamp",
+        "pinned",
+        "use_count",
+        "category",
+        "tags",
+        "pin_order",
+        "file_path",
+        "file_signature",
+        "url_title",
+        "collection_id",
+        "note",
+        "bookmark",
+        "expires_at",
+        "large_digest",
+    ),
+    "deleted_history": (
+        "original_id",
+        "content",
+        "image_data",
+        "type",
+        "original_timestamp",
+        "tags",
+        "note",
+        "bookmark",
+        "collection_id",
+        "pinned",
+        "pin_order",
+        "use_count",
+        "url_title",
+        "deleted_at",
+        "expires_at",
+        "large_digest",
+    ),
+    "collections": ("name", "icon", "color", "created_at"),
+}
+
+_NOW_SQL = "strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')"
+
+
+def _changed_columns_sql(columns: tuple[str, ...]) -> str:
+    parts = " || ".join(f"CASE WHEN old.{col} IS NOT new.{col} THEN '{col},' ELSE '' END" for col in columns)
+    return f"rtrim({parts}, ',')"
+
+
+def create_change_log_schema(cursor) -> None:
+    """history_changes 테이블과 추적 트리거 생성.
+
+    트리거 이름에 버전을 붙여 두고, 추적 컬럼이 바뀌면 버전을 올려 교체한다
+    (매 실행마다 DROP/CREATE하면 다른 연결의 준비된 문장이 무효화된다).
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS history_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity TEXT NOT NULL,
+            op TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            changed TEXT NOT NULL DEFAULT '',
+            changed_at TEXT
+        )
+        """
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_changes_row ON history_changes(entity, row_id)")
+
+    suffix = f"_v{CHANGE_LOG_TRIGGER_VERSION}"
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'changes\\_%' ESCAPE '\\'")
+    for (name,) in cursor.fetchall():
+        if not name.endswith(suffix):
+            cursor.execute(f'DROP TRIGGER IF EXISTS "{name}"')
+
+    for entity, columns in CHANGE_LOG_TRACKED_COLUMNS.items():
+        changed_sql = _changed_columns_sql(columns)
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS changes_{entity}_ai{suffix} AFTER INSERT ON {entity}
+            BEGIN
+                INSERT INTO history_changes (entity, op, row_id, changed, changed_at)
+                VALUES ('{entity}', 'insert', new.id, '', {_NOW_SQL});
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS changes_{entity}_au{suffix} AFTER UPDATE ON {entity}
+            WHEN {changed_sql} != ''
+            BEGIN
+                INSERT INTO history_changes (entity, op, row_id, changed, changed_at)
+                VALUES ('{entity}', 'update', new.id, {changed_sql}, {_NOW_SQL});
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS changes_{entity}_ad{suffix} AFTER DELETE ON {entity}
+            BEGIN
+                INSERT INTO history_changes (entity, op, row_id, changed, changed_at)
+                VALUES ('{entity}', 'delete', old.id, '', {_NOW_SQL});
+            END
+            """
+        )
+
+
+def _merge_change_group(rows: list[tuple[int, str, str]]) -> tuple[str, str]:
+    """Collapse (seq, op, changed) rows for one entity row into a single op."""
+    first_op = rows[0][1]
+    last_op = rows[-1][1]
+    if last_op == "delete":
+        return "delete", ""
+    if first_op == "insert" or any(op == "insert" for _seq, op, _changed in rows):
+        return "insert", ""
+    columns: list[str] = []
+    for _seq, _op, changed in rows:
+        for column in (changed or "").split(","):
+            if column and column not in columns:
+                columns.append(column)
+    return "update", ",".join(columns)
+
+
+class ChangeLogMixin(DBRuntimeMixin):
+    """Append-only change feed (history_changes) for incremental consumers."""
+
+    def get_latest_change_seq(self) -> int:
+        with self.lock:
+            try:
+                row = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM history_changes").fetchone()
+                return int(row[0] or 0)
+            except sqlite3.Error as e:
+                logger.debug(f"Change seq lookup error: {e}")
+                return 0
+
+    def _get_change_floor_locked(self, cursor) -> int:
+        cursor.execute("SELECT value FROM settings WHERE key = ?", (CHANGE_LOG_FLOOR_SETTING,))
+        row = cursor.fetchone()
+        try:
+            return int(row[0]) if row else 0
+        except (TypeError, ValueError):
+            return 0
+
+    def _changes_since_on_cursor(self, cursor, seq: int, limit: int, entities) -> dict[str, Any]:
+        floor = self._get_change_floor_locked(cursor)
+        if seq < floor:
+            # 압축으로 잘려 나간 구간: 소비자는 전체를 다시 읽어야 한다.
+            return {"changes": [], "last_seq": floor, "has_more": True, "reset": True}
+
+        sql = "SELECT seq, entity, op, row_id, changed, changed_at FROM history_changes WHERE seq > ?"
+        params: list[Any] = [seq]
+        if entities:
+            sql += f" AND entity IN ({','.join('?' for _ in entities)})"
+            params.extend(entities)
+        sql += " ORDER BY seq ASC LIMIT ?"
+        params.append(limit + 1)
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        changes = [
+            {
+                "seq": row_seq,
+                "entity": entity,
+                "op": op,
+                "id": row_id,
+                "changed": [column for column in (changed or "").split(",") if column],
+                "at": changed_at,
+            }
+            for row_seq, entity, op, row_id, changed, changed_at in rows
+        ]
+        last_seq = changes[-1]["seq"] if changes else seq
+        return {"changes": changes, "last_seq": last_seq, "has_more": has_more, "reset": False}
+
+    def changes_since(
+        self,
+        seq: int = 0,
+        limit: int = CHANGES_SINCE_DEFAULT_LIMIT,
+        entities: tuple[str, ...] | list[str] | None = None,
+        use_read_pool: bool = False,
+    ) -> dict[str, Any]:
+        """seq 이후의 변경 목록. reset=True면 소비자가 전체 재조회해야 한다."""
+        seq = max(int(seq or 0), 0)
+        limit = max(int(limit), 1)
+        try:
+            if use_read_pool:
+                with self.read_connection() as conn:
+                    return self._changes_since_on_cursor(conn.cursor(), seq, limit, entities)
+            with self.lock:
+                return self._changes_since_on_cursor(self.conn.cursor(), seq, limit, entities)
+        except sqlite3.Error as e:
+            logger.error(f"Changes Since Error: {e}")
+            return {"changes": [], "last_seq": seq, "has_more": False, "reset": False}
+
+    def compact_changes(self, max_rows: int = CHANGE_LOG_MAX_ROWS, merge_before_seq: int | None = None) -> dict[str, int]:
+        """같은 행의 연속 변경을 하나로 합치고, 그래도 많으면 오래된 구간을 잘라낸다.
+
+        병합은 변경 컬럼을 합집합으로 남기므로 어떤 seq에서 읽던 소비자도 놓치는 변경이 없다.
+        잘라낸 구간보다 오래된 seq로 조회하면 changes_since()가 reset을 알려준다.
+        """
+        result = {"merged": 0, "trimmed": 0, "floor": 0}
+        with self.lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute("SELECT COALESCE(MAX(seq), 0) FROM history_changes")
+                cutoff = int(cursor.fetchone()[0] or 0) if merge_before_seq is None else int(merge_before_seq)
+                # 합칠 그룹의 행을 한 번에 (그룹, seq) 순서로 읽는다: 그룹마다 SELECT를 다시 하지 않는다.
+                cursor.execute(
+                    """
+                    SELECT c.entity, c.row_id, c.seq, c.op, c.changed
+                    FROM history_changes c
+                    JOIN (
+                        SELECT entity, row_id FROM history_changes
+                        WHERE seq <= ?
+                        GROUP BY entity, row_id
+                        HAVING COUNT(*) > 1
+                    ) g ON g.entity = c.entity AND g.row_id = c.row_id
+                    WHERE c.seq <= ?
+                    ORDER BY c.entity, c.row_id, c.seq
+                    """,
+                    (cutoff, cutoff),
+                )
+                updates: list[tuple[str, str, int]] = []
+                for _key, group in itertools.groupby(cursor.fetchall(), key=lambda row: (row[0], row[1])):
+                    rows = [row[2:] for row in group]
+                    op, changed = _merge_change_group(rows)
+                    updates.append((op, changed, rows[-1][0]))
+                cursor.executemany("UPDATE history_changes SET op = ?, changed = ? WHERE seq = ?", updates)
+                cursor.execute(
+                    """
+                    DELETE FROM history_changes
+                    WHERE seq <= ? AND seq NOT IN (
+                        SELECT MAX(seq) FROM history_changes WHERE seq <= ? GROUP BY entity, row_id
+                    )
+                    """,
+                    (cutoff, cutoff),
+                )
+                result["merged"] = max(cursor.rowcount or 0, 0)
+
+                cursor.execute("SELECT COUNT(*) FROM history_changes")
+                excess = int(cursor.fetchone()[0] or 0) - max(int(max_rows), 0)
+                floor = self._get_change_floor_locked(cursor)
+                if excess > 0:
+                    cursor.execute(
+                        "SELECT seq FROM history_changes ORDER BY seq ASC LIMIT 1 OFFSET ?",
+                        (excess - 1,),
+                    )
+                    floor = int(cursor.fetchone()[0])
+                    cursor.execute("DELETE FROM history_changes WHERE seq <= ?", (floor,))
+                    result["trimmed"] = max(cursor.rowcount or 0, 0)
+                    cursor.execute(
+                        "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                        (CHANGE_LOG_FLOOR_SETTING, str(floor)),
+                    )
+                result["floor"] = floor
+                self.conn.commit()
+                if result["merged"] or result["trimmed"]:
+                    logger.info(f"변경 로그 압축: 병합 {result['merged']}건, 정리 {result['trimmed']}건")
+                return result
+            except sqlite3.Error as e:
+                logger.error(f"Change Log Compaction Error: {e}")
+                self.conn.rollback()
+                return result
+
+
+__all__ = [
+    "CHANGE_LOG_MAX_ROWS",
+    "CHANGE_LOG_TRACKED_COLUMNS",
+    "ChangeLogMixin",
+    "create_change_log_schema",
+]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sqlite3
 import threading
+from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING, Any
 
 
@@ -38,9 +39,33 @@ class DBRuntimeMixin:
             image_data: bytes | None,
             type_tag: str,
             timestamp: str | None = None,
+            image_hash: int | None = None,
         ) -> tuple[int | bool, bool]: ...
+        def _find_similar_images_locked(self, cursor: Any, image_hash: int, max_distance: int) -> list[tuple[int, int]]: ...
+        def _add_large_text_locked(
+            self,
+            cursor: Any,
+            payload: Any,
+            type_tag: str = "TEXT",
+            timestamp: str | None = None,
+        ) -> tuple[int | bool, bool]: ...
+        def _insert_large_history_row_locked(
+            self,
+            cursor: Any,
+            digest: str,
+            prefix: str,
+            type_tag: str,
+            timestamp: str,
+        ) -> int: ...
+        def _read_large_text_locked(self, cursor: Any, digest: str) -> str | None: ...
         @classmethod
         def _build_fts_match(cls, query: str) -> str: ...
+        def _next_pin_order_locked(self, cursor: Any, exclude_item_id: int | None = None) -> int: ...
+        def _find_restore_merge_target_locked(self, cursor: Any, content: Any, item_type: Any, large_digest: str = "") -> Any: ...
+        def _soft_delete_locked(self, cursor: Any, item_id: Any) -> bool: ...
+        def _changes_since_on_cursor(self, cursor: Any, seq: int, limit: int, entities: Any) -> dict[str, Any]: ...
+        def read_connection(self, timeout: float = 5.0) -> AbstractContextManager[sqlite3.Connection]: ...
+        def close_read_pool(self) -> None: ...
 
 
 __all__ = ["DBRuntimeMixin"]
@@ -0,0 +1,97 @@
+"""Header sniffing for stored image blobs (PNG, JPEG, WebP, GIF, BMP).
+
+Only the first IMAGE_HEADER_BYTES are needed, so the DB can compare image
+sizes with substr(image_data, ...) instead of loading whole blobs; nothing
+here decodes pixels.
+"""
+
+from __future__ import annotations
+
+import struct
+
+from .image_hash import PNG_SIGNATURE, png_dimensions
+
+# JPEG SOF는 JFIF/양자화 테이블 뒤에 오므로 PNG(24바이트)보다 넉넉히 읽는다.
+IMAGE_HEADER_BYTES = 1024
+
+IMAGE_FILE_EXTENSIONS = {
+    "png": ".png",
+    "jpeg": ".jpg",
+    "webp": ".webp",
+    "gif": ".gif",
+    "bmp": ".bmp",
+}
+
+# SOF0..SOF15 중 DHT(C4)/JPG(C8)/DAC(CC)를 뺀 프레임 헤더 마커
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def sniff_image_format(data: bytes | None) -> str | None:
+    """"png", "jpeg", "webp", "gif" or "bmp" from the magic bytes; None if unknown."""
+    if not data:
+        return None
+    if data.startswith(PNG_SIGNATURE):
+        return "png"
+    if data.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    if data.startswith(b"GIF8"):
+        return "gif"
+    if data.startswith(b"BM"):
+        return "bmp"
+    return None
+
+
+def _webp_dimensions(data: bytes) -> tuple[int, int] | None:
+    chunk = data[12:16]
+    if chunk == b"VP8L" and len(data) >= 25 and data[20] == 0x2F:
+        bits = int.from_bytes(data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8 " and len(data) >= 30 and data[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8X" and len(data) >= 30:
+        return int.from_bytes(data[24:27], "little") + 1, int.from_bytes(data[27:30], "little") + 1
+    return None
+
+
+def _jpeg_dimensions(data: bytes) -> tuple[int, int] | None:
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            if pos + 9 > len(data):
+                return None
+            height, width = struct.unpack(">HH", data[pos + 5 : pos + 9])
+            return width, height
+        (length,) = struct.unpack(">H", data[pos + 2 : pos + 4])
+        pos += 2 + length
+    return None
+
+
+def image_dimensions(data: bytes | None) -> tuple[int, int] | None:
+    """(width, height) from a PNG/WebP/JPEG header; None if unknown or cut off."""
+    image_format = sniff_image_format(data)
+    if data is None or image_format is None:
+        return None
+    if image_format == "png":
+        return png_dimensions(data)
+    if image_format == "webp":
+        return _webp_dimensions(data)
+    if image_format == "jpeg":
+        return _jpeg_dimensions(data)
+    return None
+
+
+__all__ = [
+    "IMAGE_FILE_EXTENSIONS",
+    "IMAGE_HEADER_BYTES",
+    "image_dimensions",
+    "sniff_image_format",
+]
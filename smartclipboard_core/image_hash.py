@@ -0,0 +1,139 @@
+"""Perceptual image hashes (dHash) and a Hamming-distance BK-tree.
+
+The hash itself is computed from a 9x8 grayscale thumbnail, which needs an
+image decoder; this module stays decoder-free (the Qt side produces the
+pixels, see smartclipboard_app.features.clipboard.image_hash) so the core and
+the CLI never import Qt.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Iterable, Iterator, Sequence
+
+DHASH_WIDTH = 9
+DHASH_HEIGHT = 8
+IMAGE_HASH_BITS = (DHASH_WIDTH - 1) * DHASH_HEIGHT
+
+# 캡처 시 이 거리 이하면 같은 이미지(재캡처/재인코딩)로 보고 기존 항목을 갱신한다.
+IMAGE_DUPLICATE_MAX_DISTANCE = 4
+# "비슷한 이미지 찾기" 기본 거리
+IMAGE_SIMILAR_MAX_DISTANCE = 10
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# PNG 시그니처(8) + IHDR 길이/타입(8) + 너비/높이(8)
+PNG_HEADER_BYTES = 24
+
+# 디코딩할 수 없는 이미지의 image_hash 표시. 64비트 정수는 모두 유효한 해시라
+# 정수가 아닌 빈 BLOB으로 저장해 다시 백필하지 않고 유사도 검색에서도 빠지게 한다.
+IMAGE_HASH_UNDECODABLE = b""
+
+_SIGN_BIT = 1 << (IMAGE_HASH_BITS - 1)
+_MASK = (1 << IMAGE_HASH_BITS) - 1
+
+
+def dhash_from_gray(pixels: Sequence[int] | bytes, width: int = DHASH_WIDTH, height: int = DHASH_HEIGHT) -> int:
+    """Difference hash of a row-major width x height grayscale thumbnail."""
+    if width != DHASH_WIDTH or height != DHASH_HEIGHT or len(pixels) < width * height:
+        raise ValueError(f"dHash needs {DHASH_WIDTH}x{DHASH_HEIGHT} grayscale pixels")
+    value = 0
+    for row in range(height):
+        offset = row * width
+        for col in range(width - 1):
+            value = (value << 1) | (pixels[offset + col] < pixels[offset + col + 1])
+    return value
+
+
+def png_dimensions(data: bytes | None) -> tuple[int, int] | None:
+    """(width, height) from a PNG IHDR header; None for anything else."""
+    if not data or len(data) < PNG_HEADER_BYTES or not data.startswith(PNG_SIGNATURE) or data[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", data[16:24])
+    return int(width), int(height)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return ((a ^ b) & _MASK).bit_count()
+
+
+def to_db_hash(value: int) -> int:
+    """Unsigned 64-bit hash -> signed value that fits a SQLite INTEGER."""
+    value &= _MASK
+    return value - (1 << IMAGE_HASH_BITS) if value & _SIGN_BIT else value
+
+
+def from_db_hash(value: int) -> int:
+    return int(value) & _MASK
+
+
+class BKTree:
+    """Burkhard-Keller tree over hashes; each node keeps the item ids sharing its hash.
+
+    A query at radius r only descends into children whose edge distance d
+    satisfies |d - dist(query, node)| <= r (triangle inequality), so lookups
+    touch a small part of the tree instead of every stored hash.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, entries: Iterable[tuple[int, int]] = ()):
+        # node = [hash, ids, {distance: child}]
+        self._root: list | None = None
+        self._size = 0
+        for value, item_id in entries:
+            self.add(value, item_id)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: int, item_id: int) -> None:
+        self._size += 1
+        if self._root is None:
+            self._root = [value, [item_id], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming_distance(value, node[0])
+            if distance == 0:
+                node[1].append(item_id)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [item_id], {}]
+                return
+            node = child
+
+    def search(self, value: int, max_distance: int) -> list[tuple[int, int]]:
+        """(item_id, distance) pairs within max_distance, nearest first."""
+        return sorted(self._iter_within(value, max_distance), key=lambda pair: (pair[1], -pair[0]))
+
+    def _iter_within(self, value: int, max_distance: int) -> Iterator[tuple[int, int]]:
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(value, node[0])
+            if distance <= max_distance:
+                for item_id in node[1]:
+                    yield item_id, distance
+            for edge, child in node[2].items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+
+
+__all__ = [
+    "BKTree",
+    "DHASH_HEIGHT",
+    "DHASH_WIDTH",
+    "IMAGE_DUPLICATE_MAX_DISTANCE",
+    "IMAGE_HASH_BITS",
+    "IMAGE_HASH_UNDECODABLE",
+    "IMAGE_SIMILAR_MAX_DISTANCE",
+    "PNG_HEADER_BYTES",
+    "dhash_from_gray",
+    "from_db_hash",
+    "hamming_distance",
+    "png_dimensions",
+    "to_db_hash",
+]
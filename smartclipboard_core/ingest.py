@@ -0,0 +1,293 @@
+"""Qt-free clipboard ingest: size limits, copy rules, classification and storage.
+
+The Qt layer (smartclipboard_app.features.clipboard.pipeline) reads the
+clipboard, renders images and does the UI work; it hands plain payloads to
+ClipboardIngestor and acts on the returned IngestResult. Nothing here
+imports Qt, so ingest can run on any thread and be measured headlessly
+(scripts/bench_ingest.py).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Sequence
+
+from .classifier import classify_text
+from .copy_rules import CopyRuleProgram, compile_copy_rules
+from .file_paths import file_content_from_paths
+from .large_text import encode_large_text
+from .limits import IMAGE_CLIPBOARD_MAX_BYTES, LARGE_TEXT_CLIPBOARD_MAX_BYTES, TEXT_CLIPBOARD_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+INGEST_STORED = "stored"
+INGEST_EMPTY = "empty"
+INGEST_TOO_LARGE = "too_large"
+INGEST_DUPLICATE = "duplicate"
+INGEST_FAILED = "failed"
+
+# route_text() 결과: 일반 텍스트 / 대용량 클립 / 저장 불가
+TEXT_ROUTE_EMPTY = "empty"
+TEXT_ROUTE_TEXT = "text"
+TEXT_ROUTE_LARGE = "large"
+TEXT_ROUTE_TOO_LARGE = "too_large"
+
+_FALSE_SETTING_VALUES = {"0", "false", "no", "off"}
+
+
+def apply_copy_rules(
+    text: str,
+    rules: Iterable[Sequence[Any]],
+    re_module: Any = re,
+    log: logging.Logger | Any = logger,
+) -> str:
+    """Apply enabled copy rules (rows of get_copy_rules()) to text once; repeated use should keep a CopyRuleProgram."""
+    return CopyRuleProgram(rules, re_module, log).apply(text)
+
+
+@dataclass
+class IngestResult:
+    """What happened to one clipboard payload; size is the raw byte size checked against the limits."""
+
+    status: str
+    item_id: int | None = None
+    type_tag: str = ""
+    text: str = ""
+    size: int = 0
+    stored_size: int = 0
+    action_results: list = field(default_factory=list)
+    replaced_text: str | None = None
+
+    @property
+    def stored(self) -> bool:
+        return self.status == INGEST_STORED
+
+
+class ClipboardIngestor:
+    """Turns clipboard payloads into history rows.
+
+    classify and copy_rules default to classify_text and the DB's copy rules
+    (cached until invalidate_copy_rules()); actions is anything with
+    process(text, item_id) -> [(name, result)], i.e. ClipboardActionManager.
+    The text stage methods (normalize_text, classify, store_text,
+    run_actions) are what the staged capture pipeline runs one by one;
+    ingest_text() runs them in a row.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        *,
+        classify: Callable[[str], str] | None = None,
+        copy_rules: Callable[[str], str] | None = None,
+        actions: Any = None,
+        max_text_bytes: int = TEXT_CLIPBOARD_MAX_BYTES,
+        max_large_text_bytes: int = LARGE_TEXT_CLIPBOARD_MAX_BYTES,
+        max_image_bytes: int = IMAGE_CLIPBOARD_MAX_BYTES,
+    ) -> None:
+        self.db = db
+        self.actions = actions
+        self.max_text_bytes = int(max_text_bytes)
+        self.max_large_text_bytes = int(max_large_text_bytes)
+        self.max_image_bytes = int(max_image_bytes)
+        self._classify = classify or classify_text
+        self._copy_rules = copy_rules or self._apply_db_copy_rules
+        # 무효화는 세대를 올리고, 컴파일 결과에는 컴파일을 시작할 때의 세대를 붙인다.
+        # 컴파일 도중 들어온 무효화는 세대가 달라 다음 적용에서 다시 컴파일된다.
+        self._rules_lock = threading.Lock()
+        self._rules_program: CopyRuleProgram | None = None
+        self._rules_generation = 0
+        self._rules_compiled_generation = -1
+        # 직전 이미지 md5. 이미지는 캡처 스레드 하나에서만 들어온다.
+        self._last_image_digest: str | None = None
+
+    # -- text -------------------------------------------------------------
+
+    def invalidate_copy_rules(self) -> None:
+        with self._rules_lock:
+            self._rules_generation += 1
+
+    def _apply_db_copy_rules(self, text: str) -> str:
+        with self._rules_lock:
+            generation = self._rules_generation
+            program = self._rules_program
+            stale = program is None or self._rules_compiled_generation != generation
+        if stale or program is None:
+            # 규칙은 잠금 밖에서 읽고 컴파일해 무효화(UI 스레드)를 막지 않는다.
+            program = compile_copy_rules(
+                self.db.get_copy_rules(), previous=program, on_timeout=self._disable_slow_rule
+            )
+            with self._rules_lock:
+                if generation >= self._rules_compiled_generation:
+                    self._rules_program = program
+                    self._rules_compiled_generation = generation
+        return program.apply(text)
+
+    def _disable_slow_rule(self, rule, _exc) -> None:
+        # 시간 제한을 넘은 규칙은 DB에서 꺼서 다음 실행에서도 다시 돌지 않게 한다.
+        toggle = getattr(self.db, "toggle_copy_rule", None)
+        if callable(toggle):
+            toggle(rule.rule_id, 0)
+
+    def large_text_limit(self) -> int:
+        """대용량 클립 모드 상한. 비활성화/미지원 DB면 0."""
+        if not callable(getattr(self.db, "add_large_text_item", None)):
+            return 0
+        get_setting = getattr(self.db, "get_setting", None)
+        if callable(get_setting):
+            raw_value = str(get_setting("large_clip_mode", "true") or "true").strip().lower()
+            if raw_value in _FALSE_SETTING_VALUES:
+                return 0
+        return self.max_large_text_bytes
+
+    def text_limit(self) -> int:
+        return max(self.large_text_limit(), self.max_text_bytes)
+
+    def route_text(self, raw_text: str) -> tuple[str, int]:
+        """(route, utf-8 size): TEXT_ROUTE_TEXT, _LARGE (chunked storage), _TOO_LARGE or _EMPTY."""
+        if not raw_text:
+            return TEXT_ROUTE_EMPTY, 0
+        raw_size = len(raw_text.encode("utf-8", errors="surrogatepass"))
+        if raw_size <= self.max_text_bytes:
+            return TEXT_ROUTE_TEXT, raw_size
+        if raw_size <= self.large_text_limit():
+            return TEXT_ROUTE_LARGE, raw_size
+        return TEXT_ROUTE_TOO_LARGE, raw_size
+
+    def normalize_text(self, raw_text: str) -> tuple[str, str]:
+        """(text to store, stripped text used for classification and actions)."""
+        text = self._copy_rules(raw_text)
+        return text, text.strip()
+
+    def classify(self, normalized_text: str) -> str:
+        return self._classify(normalized_text)
+
+    def store_text(self, text: str, type_tag: str) -> int | None:
+        return self.db.add_item(text, None, type_tag) or None
+
+    def replace_text(self, item_id: int, new_text: str) -> bool:
+        """Store an action's replacement text in place of item_id (merging into a duplicate if needed)."""
+        normalized_text = str(new_text or "")
+        if not normalized_text:
+            return False
+
+        item_type = self.classify(normalized_text.strip()) if normalized_text.strip() else "TEXT"
+        # 항목 존재 확인과 병합은 DB 메서드가 자기 잠금 안에서 한다.
+        return bool(self.db.replace_text_item_or_merge(item_id, normalized_text, item_type))
+
+    def run_actions(self, text: str, item_id: int) -> tuple[list, str | None]:
+        """(action_results, replaced_text); replaced_text is set only if the stored item was updated."""
+        if self.actions is None:
+            return [], None
+        # automation 패키지를 불러오면 Qt 액션 매니저도 함께 로드되므로 액션이 있을 때만 가져온다.
+        from .automation.formatters import replacement_text_from_result
+
+        try:
+            action_results = self.actions.process(text, item_id)
+            updated_text = text
+            updated_by_actions: list[str] = []
+            for action_name, result in action_results:
+                if not isinstance(result, dict) or result.get("type") != "replace_text":
+                    continue
+                replacement_text = replacement_text_from_result(result)
+                if replacement_text is None or replacement_text == updated_text:
+                    continue
+                updated_text = replacement_text
+                updated_by_actions.append(action_name)
+
+            if updated_by_actions and updated_text != text:
+                if self.replace_text(item_id, updated_text):
+                    logger.info("Applied clipboard action text replacement: %s", ", ".join(updated_by_actions))
+                    return action_results, updated_text
+                logger.warning("Clipboard action text replacement skipped; item %s is unavailable", item_id)
+            return action_results, None
+        except Exception as action_err:
+            logger.debug(f"Action processing error: {action_err}")
+            return [], None
+
+    def ingest_text(self, raw_text: str, run_actions: bool = True) -> IngestResult:
+        route, raw_size = self.route_text(raw_text)
+        if route == TEXT_ROUTE_EMPTY:
+            return IngestResult(INGEST_EMPTY)
+        if route == TEXT_ROUTE_TOO_LARGE:
+            return IngestResult(INGEST_TOO_LARGE, size=raw_size)
+        if route == TEXT_ROUTE_LARGE:
+            return self.ingest_large_text(raw_text)
+
+        text, normalized = self.normalize_text(raw_text)
+        if not normalized:
+            return IngestResult(INGEST_EMPTY, size=raw_size)
+        type_tag = self.classify(normalized)
+        item_id = self.store_text(text, type_tag)
+        if not item_id:
+            return IngestResult(INGEST_FAILED, type_tag=type_tag, text=text, size=raw_size)
+        result = IngestResult(INGEST_STORED, item_id, type_tag, text, raw_size, raw_size)
+        if run_actions:
+            result.action_results, result.replaced_text = self.run_actions(normalized, item_id)
+        return result
+
+    def ingest_large_text(self, raw_text: str) -> IngestResult:
+        """Compress into chunks and store; copy rules and actions do not apply to large clips."""
+        payload = encode_large_text(raw_text)
+        item_id = self.db.add_large_text_item(payload, "TEXT")
+        return IngestResult(
+            INGEST_STORED if item_id else INGEST_FAILED,
+            item_id or None,
+            "TEXT",
+            size=payload.total_bytes,
+            stored_size=payload.stored_bytes,
+        )
+
+    # -- files / images ---------------------------------------------------
+
+    def ingest_files(self, file_paths: Sequence[str]) -> IngestResult:
+        content = file_content_from_paths(list(file_paths)) if file_paths else ""
+        if not content:
+            return IngestResult(INGEST_EMPTY)
+        item_id = self.db.add_item(content, None, "FILE")
+        return IngestResult(INGEST_STORED if item_id else INGEST_FAILED, item_id or None, "FILE", content)
+
+    def check_image(self, blob: bytes) -> IngestResult | None:
+        """too_large or duplicate-of-previous result for an encoded image; None if it should be stored."""
+        if len(blob) > self.max_image_bytes:
+            return IngestResult(INGEST_TOO_LARGE, type_tag="IMAGE", size=len(blob))
+        digest = hashlib.md5(blob).hexdigest()
+        if self._last_image_digest == digest:
+            return IngestResult(INGEST_DUPLICATE, type_tag="IMAGE", size=len(blob))
+        self._last_image_digest = digest
+        return None
+
+    def store_image(self, blob: bytes, image_hash: int | None = None, thumbnail: bytes | None = None) -> IngestResult:
+        item_id = self.db.add_item("[이미지 캡처]", blob, "IMAGE", image_hash=image_hash, thumbnail=thumbnail)
+        return IngestResult(
+            INGEST_STORED if item_id else INGEST_FAILED,
+            item_id or None,
+            "IMAGE",
+            size=len(blob),
+            stored_size=len(blob),
+        )
+
+    def ingest_image(self, blob: bytes, image_hash: int | None = None, thumbnail: bytes | None = None) -> IngestResult:
+        if not blob:
+            return IngestResult(INGEST_FAILED, type_tag="IMAGE")
+        return self.check_image(blob) or self.store_image(blob, image_hash, thumbnail)
+
+
+__all__ = [
+    "ClipboardIngestor",
+    "INGEST_DUPLICATE",
+    "INGEST_EMPTY",
+    "INGEST_FAILED",
+    "INGEST_STORED",
+    "INGEST_TOO_LARGE",
+    "IngestResult",
+    "TEXT_ROUTE_EMPTY",
+    "TEXT_ROUTE_LARGE",
+    "TEXT_ROUTE_TEXT",
+    "TEXT_ROUTE_TOO_LARGE",
+    "apply_copy_rules",
+]
@@ -0,0 +1,491 @@
+"""Opt-in local JSON-RPC server exposing clipboard history to other tools.
+
+Protocol: newline-delimited JSON-RPC 2.0 over loopback TCP or a Unix socket.
+Each connection must first call ``auth`` with the token from the endpoint
+file (``ipc_endpoint.json`` in the app directory). A line holding a JSON
+array is a batch. Large ``get_content`` results are streamed as
+``stream.chunk`` notifications followed by the final response (single
+requests only; batches always return inline results).
+
+Reads go through ``ClipboardDB.read_connection()`` so they never wait on
+the UI thread's write lock; ``add`` uses the regular single writer.
+"""
+
+from __future__ import annotations
+
+import base64
+import hmac
+import itertools
+import json
+import logging
+import os
+import secrets
+import socket
+import socketserver
+import threading
+from typing import Any, Callable, Iterable, Iterator
+
+from .db_parts.shared import FILTER_TAG_MAP
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT_FILE_NAME = "ipc_endpoint.json"
+DEFAULT_HOST = "127.0.0.1"
+MAX_REQUEST_BYTES = 8 * 1024 * 1024
+MAX_BATCH_SIZE = 100
+MAX_RESULT_LIMIT = 500
+STREAM_CHUNK_CHARS = 64 * 1024
+CONNECTION_IDLE_TIMEOUT = 300.0
+# 인증 전 연결이 받을 수 있는 parse error 응답 수. 넘으면 연결을 닫는다.
+MAX_UNAUTHENTICATED_ERRORS = 3
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+UNAUTHORIZED = -32001
+
+_TYPE_FILTER_LABELS = {type_tag: label for label, type_tag in FILTER_TAG_MAP.items()}
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _error_response(request_id: Any, code: int, message: str) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _int_param(params: dict[str, Any], key: str, default: int, minimum: int = 0, maximum: int | None = None) -> int:
+    value = params.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise RpcError(INVALID_PARAMS, f"{key} must be an integer")
+    if value < minimum or (maximum is not None and value > maximum):
+        raise RpcError(INVALID_PARAMS, f"{key} out of range")
+    return value
+
+
+def _type_filter(params: dict[str, Any]) -> str:
+    item_type = params.get("type")
+    if not item_type:
+        return "전체"
+    if item_type not in _TYPE_FILTER_LABELS:
+        raise RpcError(INVALID_PARAMS, f"unknown type: {item_type}")
+    return _TYPE_FILTER_LABELS[item_type]
+
+
+class HistoryRpcService:
+    """Transport-independent method table (usable without sockets)."""
+
+    def __init__(self, db, on_write: Callable[[int], None] | None = None):
+        self.db = db
+        self.on_write = on_write
+        self.methods: dict[str, Callable[[dict[str, Any], Callable[[str], None] | None], Any]] = {
+            "ping": self.ping,
+            "search": self.search,
+            "recent": self.recent,
+            "get_content": self.get_content,
+            "add": self.add,
+            "changes_since": self.changes_since,
+        }
+
+    @staticmethod
+    def _rows(rows: Iterable, preview: int) -> list[dict[str, Any]]:
+        items = []
+        for item_id, content, item_type, timestamp, pinned, use_count, _pin_order in rows:
+            text = content or ""
+            items.append(
+                {
+                    "id": item_id,
+                    "type": item_type,
+                    "timestamp": timestamp,
+                    "pinned": bool(pinned),
+                    "use_count": use_count,
+                    "preview": text[:preview] if preview else text,
+                }
+            )
+        return items
+
+    def ping(self, params, _emit=None):
+        return {"pong": True}
+
+    def search(self, params, _emit=None):
+        query = params.get("query", "")
+        if not isinstance(query, str):
+            raise RpcError(INVALID_PARAMS, "query must be a string")
+        limit = _int_param(params, "limit", 50, 1, MAX_RESULT_LIMIT)
+        preview = _int_param(params, "preview", 200)
+        rows = self.db.search_items(
+            query,
+            type_filter=_type_filter(params),
+            tag_filter=params.get("tag") or None,
+            limit=limit,
+            use_read_pool=True,
+        )
+        return {"count": len(rows), "items": self._rows(rows, preview)}
+
+    def recent(self, params, _emit=None):
+        limit = _int_param(params, "limit", 20, 1, MAX_RESULT_LIMIT)
+        preview = _int_param(params, "preview", 200)
+        rows = self.db.search_items("", type_filter=_type_filter(params), limit=limit, use_read_pool=True)
+        return {"count": len(rows), "items": self._rows(rows, preview)}
+
+    def get_content(self, params, emit=None):
+        item_id = _int_param(params, "id", 0, 1)
+        if params.get("stream", True) is False:
+            emit = None
+        large_info = (
+            self.db.get_large_clip_info(item_id, use_read_pool=True) if hasattr(self.db, "get_large_clip_info") else None
+        )
+        if large_info and emit is not None:
+            # 청크 저장된 대용량 텍스트는 전체를 메모리에 올리지 않고 그대로 흘려보낸다.
+            count = 0
+            for chunk in self.db.iter_large_text_chunks(large_info["digest"], use_read_pool=True):
+                emit(chunk)
+                count += 1
+            return {
+                "id": item_id,
+                "type": large_info["type"],
+                "streamed": True,
+                "chunks": count,
+                "total_chars": large_info["total_chars"],
+            }
+
+        data = self.db.get_content(item_id, use_read_pool=True)
+        if not data:
+            raise RpcError(INVALID_PARAMS, f"item not found: {item_id}")
+        content, image_data, item_type = data
+        result: dict[str, Any] = {"id": item_id, "type": item_type, "image_bytes": len(image_data) if image_data else 0}
+        if image_data and params.get("include_image"):
+            result["image_b64"] = base64.b64encode(image_data).decode("ascii")
+        text = content or ""
+        if emit is not None and len(text) > STREAM_CHUNK_CHARS:
+            count = 0
+            for start in range(0, len(text), STREAM_CHUNK_CHARS):
+                emit(text[start:start + STREAM_CHUNK_CHARS])
+                count += 1
+            result.update({"streamed": True, "chunks": count, "total_chars": len(text)})
+            return result
+        result.update({"streamed": False, "content": text})
+        return result
+
+    def changes_since(self, params, _emit=None):
+        seq = _int_param(params, "seq", 0)
+        limit = _int_param(params, "limit", 500, 1, MAX_RESULT_LIMIT)
+        entities = params.get("entities")
+        if entities is not None and (
+            not isinstance(entities, list) or not all(isinstance(entity, str) for entity in entities)
+        ):
+            raise RpcError(INVALID_PARAMS, "entities must be a list of strings")
+        return self.db.changes_since(seq, limit=limit, entities=entities or None, use_read_pool=True)
+
+    def add(self, params, _emit=None):
+        text = params.get("text")
+        if not isinstance(text, str) or not text:
+            raise RpcError(INVALID_PARAMS, "text must be a non-empty string")
+        item_type = params.get("type") or "TEXT"
+        if item_type not in _TYPE_FILTER_LABELS or item_type in {"IMAGE", "FILE"}:
+            raise RpcError(INVALID_PARAMS, f"unsupported type: {item_type}")
+        item_id = self.db.add_item(text, None, item_type)
+        if not item_id:
+            raise RpcError(INTERNAL_ERROR, "failed to add item")
+        tags = params.get("tags")
+        if isinstance(tags, str) and tags:
+            self.db.set_item_tags(item_id, tags)
+        if self.on_write is not None:
+            try:
+                self.on_write(int(item_id))
+            except Exception:
+                logger.exception("IPC on_write callback failed")
+        return {"id": item_id}
+
+    def dispatch(self, request: Any, emit: Callable[[str], None] | None = None) -> dict[str, Any] | None:
+        """Run one request object. Returns None for notifications."""
+        if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" or not isinstance(request.get("method"), str):
+            return _error_response(None, INVALID_REQUEST, "invalid request")
+        request_id = request.get("id")
+        is_notification = "id" not in request
+        params = request.get("params", {})
+        if not isinstance(params, dict):
+            return None if is_notification else _error_response(request_id, INVALID_PARAMS, "params must be an object")
+        handler = self.methods.get(request["method"])
+        if handler is None:
+            return None if is_notification else _error_response(request_id, METHOD_NOT_FOUND, "method not found")
+        try:
+            result = handler(params, None if is_notification else emit)
+        except RpcError as exc:
+            return None if is_notification else _error_response(request_id, exc.code, exc.message)
+        except Exception as exc:
+            logger.exception("IPC method %s failed", request["method"])
+            return None if is_notification else _error_response(request_id, INTERNAL_ERROR, str(exc))
+        if is_notification:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+class _RpcRequestHandler(socketserver.StreamRequestHandler):
+    timeout = CONNECTION_IDLE_TIMEOUT
+    server: Any
+
+    def _send(self, payload: Any) -> None:
+        self.wfile.write(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def _authenticate(self, request: Any) -> bool:
+        if not isinstance(request, dict) or request.get("method") != "auth":
+            self._send(_error_response(request.get("id") if isinstance(request, dict) else None, UNAUTHORIZED, "auth required"))
+            return False
+        params = request.get("params") or {}
+        token = params.get("token") if isinstance(params, dict) else None
+        if not isinstance(token, str) or not hmac.compare_digest(token.encode(), self.server.token.encode()):
+            self._send(_error_response(request.get("id"), UNAUTHORIZED, "invalid token"))
+            return False
+        self._send({"jsonrpc": "2.0", "id": request.get("id"), "result": {"authenticated": True}})
+        return True
+
+    def handle(self) -> None:
+        service: HistoryRpcService = self.server.service
+        authenticated = False
+        unauthenticated_errors = 0
+        while True:
+            try:
+                line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            except (OSError, socket.timeout):
+                return
+            if not line:
+                return
+            if len(line) > MAX_REQUEST_BYTES:
+                self._send(_error_response(None, INVALID_REQUEST, "request too large"))
+                return
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except (ValueError, UnicodeDecodeError):
+                self._send(_error_response(None, PARSE_ERROR, "parse error"))
+                if not authenticated:
+                    unauthenticated_errors += 1
+                    if unauthenticated_errors >= MAX_UNAUTHENTICATED_ERRORS:
+                        return
+                continue
+
+            if not authenticated:
+                if not self._authenticate(request):
+                    return
+                authenticated = True
+                continue
+
+            if isinstance(request, list):
+                if not request or len(request) > MAX_BATCH_SIZE:
+                    self._send(_error_response(None, INVALID_REQUEST, "invalid batch size"))
+                    continue
+                responses = [response for response in (service.dispatch(item) for item in request) if response]
+                if responses:
+                    self._send(responses)
+                continue
+
+            request_id = request.get("id") if isinstance(request, dict) else None
+            sequence = itertools.count()
+
+            def emit(data: str) -> None:
+                self._send(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": "stream.chunk",
+                        "params": {"request_id": request_id, "seq": next(sequence), "data": data},
+                    }
+                )
+
+            response = service.dispatch(request, emit)
+            if response is not None:
+                self._send(response)
+
+
+class _ThreadingTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = False
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):  # type: ignore[name-defined]
+        daemon_threads = True
+
+
+def _write_private_json(path: str, payload: dict[str, Any]) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(payload, fh)
+
+
+class HistoryRpcServer:
+    """Background JSON-RPC server bound to loopback or a Unix socket."""
+
+    def __init__(
+        self,
+        db,
+        app_dir: str | None = None,
+        transport: str = "auto",
+        host: str = DEFAULT_HOST,
+        port: int = 0,
+        socket_path: str | None = None,
+        token: str | None = None,
+        on_write: Callable[[int], None] | None = None,
+    ):
+        if transport == "auto":
+            transport = "unix" if os.name != "nt" and hasattr(socketserver, "UnixStreamServer") else "tcp"
+        if transport not in {"tcp", "unix"}:
+            raise ValueError(f"Unsupported transport: {transport}")
+        if transport == "tcp" and host not in {"127.0.0.1", "::1", "localhost"}:
+            raise ValueError("IPC server only binds to loopback")
+        self.app_dir = app_dir or db.app_dir
+        self.transport = transport
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path or os.path.join(self.app_dir, "ipc.sock")
+        self.token = token or secrets.token_urlsafe(32)
+        self.service = HistoryRpcService(db, on_write=on_write)
+        self.endpoint_file = os.path.join(self.app_dir, ENDPOINT_FILE_NAME)
+        self._server: socketserver.BaseServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def endpoint(self) -> dict[str, Any]:
+        if self.transport == "unix":
+            return {"transport": "unix", "path": self.socket_path, "token": self.token, "pid": os.getpid()}
+        return {"transport": "tcp", "host": self.host, "port": self.port, "token": self.token, "pid": os.getpid()}
+
+    def start(self) -> dict[str, Any]:
+        if self.running:
+            return self.endpoint
+        if self.transport == "unix":
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+            server: socketserver.BaseServer = _ThreadingUnixServer(self.socket_path, _RpcRequestHandler)
+            os.chmod(self.socket_path, 0o600)
+        else:
+            server = _ThreadingTCPServer((self.host, self.port), _RpcRequestHandler)
+            self.port = int(server.server_address[1])
+        server.token = self.token  # type: ignore[attr-defined]
+        server.service = self.service  # type: ignore[attr-defined]
+        self._server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.1}, daemon=True, name="HistoryRpcServer"
+        )
+        self._thread.start()
+        _write_private_json(self.endpoint_file, self.endpoint)
+        logger.info("IPC server listening (%s)", self.transport)
+        return self.endpoint
+
+    def stop(self, timeout: float = 2.0) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+        server.shutdown()
+        server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        for path in (self.endpoint_file, self.socket_path if self.transport == "unix" else None):
+            if path and os.path.exists(path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        logger.info("IPC server stopped")
+
+
+class HistoryRpcClient:
+    """Minimal blocking client for scripts, tests and benchmarks."""
+
+    def __init__(self, endpoint: dict[str, Any] | str, timeout: float = 10.0):
+        if isinstance(endpoint, str):
+            with open(endpoint, "r", encoding="utf-8") as fh:
+                endpoint = json.load(fh)
+        assert isinstance(endpoint, dict)
+        if endpoint["transport"] == "unix":
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # type: ignore[attr-defined]
+            sock.settimeout(timeout)
+            sock.connect(endpoint["path"])
+        else:
+            sock = socket.create_connection((endpoint["host"], endpoint["port"]), timeout=timeout)
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+        self._next_id = 0
+        self._last_response: dict[str, Any] = {}
+        auth = self._roundtrip({"jsonrpc": "2.0", "id": 0, "method": "auth", "params": {"token": endpoint["token"]}})
+        if "error" in auth:
+            self.close()
+            raise PermissionError(auth["error"]["message"])
+
+    def _send(self, payload: Any) -> None:
+        self._sock.sendall(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def _read(self) -> Any:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("connection closed by server")
+        return json.loads(line)
+
+    def _roundtrip(self, payload: Any) -> Any:
+        self._send(payload)
+        return self._read()
+
+    def _request(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        self._next_id += 1
+        return {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}
+
+    def call(self, method: str, **params: Any) -> Any:
+        """Call a method; streamed results are reassembled into ``content``."""
+        self._send(self._request(method, params))
+        chunks = list(self._iter_stream())
+        response = self._last_response
+        if "error" in response:
+            raise RuntimeError(response["error"]["message"])
+        result = response["result"]
+        if isinstance(result, dict) and result.get("streamed"):
+            result = {**result, "content": "".join(chunks)}
+        return result
+
+    def _iter_stream(self) -> Iterator[str]:
+        while True:
+            message = self._read()
+            if isinstance(message, dict) and message.get("method") == "stream.chunk":
+                yield message["params"]["data"]
+                continue
+            self._last_response = message
+            return
+
+    def batch(self, calls: Iterable[tuple[str, dict[str, Any]]]) -> list[Any]:
+        requests = [self._request(method, params) for method, params in calls]
+        responses = self._roundtrip(requests)
+        by_id = {response.get("id"): response for response in responses}
+        return [by_id.get(request["id"]) for request in requests]
+
+    def close(self) -> None:
+        try:
+            self._reader.close()
+        finally:
+            self._sock.close()
+
+    def __enter__(self) -> "HistoryRpcClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+__all__ = [
+    "ENDPOINT_FILE_NAME",
+    "HistoryRpcClient",
+    "HistoryRpcServer",
+    "HistoryRpcService",
+    "RpcError",
+]
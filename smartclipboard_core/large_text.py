@@ -0,0 +1,88 @@
+"""Chunked storage helpers for very large text clips."""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from .limits import LARGE_TEXT_CHUNK_CHARS, LARGE_TEXT_INDEX_PREFIX_CHARS, TEXT_CLIPBOARD_MAX_BYTES
+
+LARGE_TEXT_CODEC = "zlib"
+_ZLIB_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class LargeTextPayload:
+    """Pre-encoded large text ready to be written by a single DB transaction."""
+
+    digest: str
+    prefix: str
+    total_chars: int
+    total_bytes: int
+    chunks: tuple[bytes, ...]
+    codec: str = LARGE_TEXT_CODEC
+
+    @property
+    def stored_bytes(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks)
+
+
+def text_byte_size(text: str) -> int:
+    return len(text.encode("utf-8", errors="surrogatepass"))
+
+
+def is_large_text(text: str, threshold: int = TEXT_CLIPBOARD_MAX_BYTES) -> bool:
+    """UTF-8 기준으로 threshold를 넘는 텍스트인지 확인 (짧은 텍스트는 인코딩 생략)."""
+    if not isinstance(text, str) or len(text) * 4 <= threshold:
+        return False
+    if len(text) > threshold:
+        return True
+    return text_byte_size(text) > threshold
+
+
+def encode_large_text(
+    text: str,
+    chunk_chars: int = LARGE_TEXT_CHUNK_CHARS,
+    prefix_chars: int = LARGE_TEXT_INDEX_PREFIX_CHARS,
+) -> LargeTextPayload:
+    """Split text into zlib-compressed chunks. CPU heavy; call off the UI thread."""
+    chunk_chars = max(int(chunk_chars), 1)
+    hasher = hashlib.sha256()
+    total_bytes = 0
+    chunks: list[bytes] = []
+    for start in range(0, len(text), chunk_chars):
+        raw = text[start:start + chunk_chars].encode("utf-8", errors="surrogatepass")
+        hasher.update(raw)
+        total_bytes += len(raw)
+        chunks.append(zlib.compress(raw, _ZLIB_LEVEL))
+    return LargeTextPayload(
+        digest=hasher.hexdigest(),
+        prefix=text[: max(int(prefix_chars), 0)],
+        total_chars=len(text),
+        total_bytes=total_bytes,
+        chunks=tuple(chunks),
+    )
+
+
+def decode_large_chunk(blob: bytes, codec: str = LARGE_TEXT_CODEC) -> str:
+    if codec != LARGE_TEXT_CODEC:
+        raise ValueError(f"Unsupported large text codec: {codec}")
+    return zlib.decompress(blob).decode("utf-8", errors="surrogatepass")
+
+
+def iter_decoded_chunks(blobs: Iterable[bytes], codec: str = LARGE_TEXT_CODEC) -> Iterator[str]:
+    for blob in blobs:
+        yield decode_large_chunk(blob, codec)
+
+
+__all__ = [
+    "LARGE_TEXT_CODEC",
+    "LargeTextPayload",
+    "decode_large_chunk",
+    "encode_large_text",
+    "is_large_text",
+    "iter_decoded_chunks",
+    "text_byte_size",
+]
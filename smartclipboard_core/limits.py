@@ -3,5 +3,19 @@
 from __future__ import annotations
 
 IMAGE_CLIPBOARD_MAX_BYTES = 5 * 1024 * 1024
+TEXT_CLIPBOARD_MAX_BYTES = 1 * 1024 * 1024
 
-__all__ = ["IMAGE_CLIPBOARD_MAX_BYTES"]
+# v10.7: 1MB를 넘는 텍스트는 압축 청크로 저장 (대용량 클립 모드)
+LARGE_TEXT_CLIPBOARD_MAX_BYTES = 64 * 1024 * 1024
+LARGE_TEXT_CHUNK_CHARS = 256 * 1024
+LARGE_TEXT_INDEX_PREFIX_CHARS = 32 * 1024
+LARGE_TEXT_PREVIEW_MAX_CHARS = 2 * 1024 * 1024
+
+__all__ = [
+    "IMAGE_CLIPBOARD_MAX_BYTES",
+    "LARGE_TEXT_CHUNK_CHARS",
+    "LARGE_TEXT_CLIPBOARD_MAX_BYTES",
+    "LARGE_TEXT_INDEX_PREFIX_CHARS",
+    "LARGE_TEXT_PREVIEW_MAX_CHARS",
+    "TEXT_CLIPBOARD_MAX_BYTES",
+]
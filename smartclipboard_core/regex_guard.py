@@ -0,0 +1,332 @@
+"""Time budget for user-supplied regexes (copy rules, clipboard actions).
+
+Python's re cannot be interrupted once a match starts, so one
+catastrophic-backtracking pattern would stall capture on every copy. Each
+pattern is therefore run by the cheapest engine that is still safe:
+
+* "re"      - patterns whose work per start position is provably bounded
+              (no unbounded repeat, or only a single-character one at the
+              very end such as ``https?://\\S+`` or ``.*``) run in-process;
+* "re2"     - otherwise the linear-time RE2 engine when google-re2 is
+              installed and supports the pattern;
+* "sandbox" - otherwise a spawned worker process that is killed (and
+              restarted on the next call) when a call exceeds the budget.
+
+A call over budget raises RegexBudgetExceeded; callers disable the rule.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import multiprocessing
+import re
+import threading
+from typing import Any
+
+try:
+    from re import _constants as _sre_constants  # type: ignore[attr-defined]
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:  # Python < 3.11
+    import sre_constants as _sre_constants  # type: ignore[no-redef]
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+re2: Any
+
+try:
+    import re2 as _re2  # type: ignore[import-not-found]  # google-re2: 선형 시간 엔진 (선택 의존성)
+except ImportError:
+    re2 = None
+    HAS_RE2 = False
+else:
+    re2 = _re2
+    HAS_RE2 = True
+
+logger = logging.getLogger(__name__)
+
+REGEX_BUDGET_MS = 200
+# 시작 위치 하나에서 허용하는 최대 시도 수 추정치. 넘으면 "유한하지만 위험"으로 본다.
+REGEX_BOUNDED_WORK_LIMIT = 10_000
+SANDBOX_START_TIMEOUT_S = 15.0
+
+ENGINE_RE = "re"
+ENGINE_RE2 = "re2"
+ENGINE_SANDBOX = "sandbox"
+
+_SINGLE_CHAR_OPS = {
+    _sre_constants.LITERAL,
+    _sre_constants.NOT_LITERAL,
+    _sre_constants.ANY,
+    _sre_constants.IN,
+    _sre_constants.CATEGORY,
+}
+_REPEAT_OPS = {
+    _sre_constants.MAX_REPEAT,
+    _sre_constants.MIN_REPEAT,
+    *( [_sre_constants.POSSESSIVE_REPEAT] if hasattr(_sre_constants, "POSSESSIVE_REPEAT") else [] ),
+}
+_ASSERT_OPS = {_sre_constants.ASSERT, _sre_constants.ASSERT_NOT}
+_ATOMIC_GROUP = getattr(_sre_constants, "ATOMIC_GROUP", None)
+
+
+class RegexBudgetExceeded(RuntimeError):
+    """A guarded regex call ran longer than its budget and was killed."""
+
+    def __init__(self, pattern: str, budget_ms: float) -> None:
+        super().__init__(f"regex exceeded {budget_ms:g}ms budget: {pattern!r}")
+        self.pattern = pattern
+        self.budget_ms = budget_ms
+
+
+def _bounded_work(items: Any) -> int | None:
+    """Upper estimate of backtracking steps per start position; None if unbounded."""
+    work = 1
+    for op, value in items:
+        if op in _SINGLE_CHAR_OPS or op is _sre_constants.AT:
+            cost: int | None = 1
+        elif op is _sre_constants.SUBPATTERN:
+            cost = _bounded_work(value[-1])
+        elif _ATOMIC_GROUP is not None and op is _ATOMIC_GROUP:
+            cost = _bounded_work(value)
+        elif op is _sre_constants.BRANCH:
+            costs = [_bounded_work(alternative) for alternative in value[1]]
+            cost = None if any(item is None for item in costs) else sum(costs)  # type: ignore[arg-type]
+        elif op in _REPEAT_OPS:
+            _min, max_count, body = value
+            if max_count is _sre_constants.MAXREPEAT:
+                return None
+            inner = _bounded_work(body)
+            if inner is None:
+                return None
+            # 몸체가 되돌아갈 수 있으면(분기, 가변 폭, 중첩 반복) 반복마다 선택지가 곱해진다: (a|a){0,22}
+            cost = max(int(max_count), 1)
+            if inner > 1:
+                for _ in range(int(max_count)):
+                    cost *= inner
+                    if cost > REGEX_BOUNDED_WORK_LIMIT:
+                        return None
+        elif op in _ASSERT_OPS:
+            cost = _bounded_work(value[1])
+        else:
+            # 역참조, 조건부 그룹 등
+            return None
+        if cost is None:
+            return None
+        work *= max(cost, 1)
+        if work > REGEX_BOUNDED_WORK_LIMIT:
+            return None
+    return work
+
+
+def _linear_items(items: list) -> bool:
+    if _bounded_work(items) is not None:
+        return True
+    if not items:
+        return True
+    *head, (op, value) = items
+    if op in _REPEAT_OPS and value[1] is _sre_constants.MAXREPEAT:
+        body = list(value[2])
+        # 끝에 오는 한 글자 단위 무한 반복은 최소 횟수만 채우면 바로 성공하므로 되돌아가지 않는다.
+        return len(body) == 1 and body[0][0] in _SINGLE_CHAR_OPS and _bounded_work(head) is not None
+    if not head and op is _sre_constants.BRANCH:
+        return all(_linear_items(list(alternative)) for alternative in value[1])
+    if not head and op is _sre_constants.SUBPATTERN:
+        return _linear_items(list(value[-1]))
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def is_linear_pattern(pattern: str, flags: int = 0) -> bool:
+    """True when pattern cannot backtrack catastrophically, so it may run unguarded."""
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return False
+    return _linear_items(list(parsed.data))
+
+
+# -- sandbox process ------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=128)
+def _sandbox_compile(pattern: str, flags: int):
+    return re.compile(pattern, flags)
+
+
+def _sandbox_main(conn) -> None:
+    conn.send("ready")
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        op, pattern, flags, text, repl = request
+        try:
+            compiled = _sandbox_compile(pattern, flags)
+            if op == "search":
+                result: Any = compiled.search(text) is not None
+            else:
+                result = compiled.subn(repl, text)
+            conn.send(("ok", result))
+        except Exception as exc:
+            conn.send(("error", str(exc)))
+
+
+class RegexSandbox:
+    """One spawned worker process that runs guarded regex calls; killed and restarted on a timeout."""
+
+    def __init__(self, start_timeout_s: float = SANDBOX_START_TIMEOUT_S) -> None:
+        self.start_timeout_s = start_timeout_s
+        self._lock = threading.Lock()
+        self._process: Any = None
+        self._conn: Any = None
+        self.available = True
+        self.stats = {"calls": 0, "timeouts": 0, "starts": 0}
+
+    def _start_locked(self) -> None:
+        # Qt/SQLite 스레드가 있는 프로세스를 fork하지 않도록 spawn을 쓴다.
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(target=_sandbox_main, args=(child_conn,), daemon=True, name="RegexSandbox")
+        process.start()
+        child_conn.close()
+        if not parent_conn.poll(self.start_timeout_s):
+            process.kill()
+            parent_conn.close()
+            raise OSError("regex sandbox did not start")
+        parent_conn.recv()
+        self._process, self._conn = process, parent_conn
+        self.stats["starts"] += 1
+
+    def _stop_locked(self, kill: bool) -> None:
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if process is None:
+            return
+        try:
+            if kill:
+                process.kill()
+            else:
+                conn.send(None)
+            process.join(1.0)
+            if process.is_alive():
+                process.kill()
+                process.join(1.0)
+        except (OSError, ValueError):
+            pass
+        finally:
+            conn.close()
+
+    def run(self, op: str, pattern: str, flags: int, text: str, repl: str | None, budget_s: float) -> Any:
+        """search -> bool, subn -> (text, count); raises RegexBudgetExceeded, or OSError if no process."""
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                self._stop_locked(kill=True)
+                self._start_locked()
+            self.stats["calls"] += 1
+            self._conn.send((op, pattern, flags, text, repl))
+            if not self._conn.poll(budget_s):
+                self.stats["timeouts"] += 1
+                self._stop_locked(kill=True)
+                raise RegexBudgetExceeded(pattern, budget_s * 1000)
+            status, value = self._conn.recv()
+        if status == "error":
+            raise re.error(value)
+        return value
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._stop_locked(kill=False)
+
+
+_sandbox: RegexSandbox | None = None
+_sandbox_lock = threading.Lock()
+
+
+def get_regex_sandbox() -> RegexSandbox:
+    global _sandbox
+    with _sandbox_lock:
+        if _sandbox is None:
+            _sandbox = RegexSandbox()
+        return _sandbox
+
+
+def shutdown_regex_sandbox() -> None:
+    with _sandbox_lock:
+        sandbox = _sandbox
+    if sandbox is not None:
+        sandbox.shutdown()
+
+
+class GuardedPattern:
+    """A compiled user regex whose search/subn stay within budget_ms (see module docstring)."""
+
+    def __init__(
+        self,
+        pattern: str,
+        flags: int = 0,
+        budget_ms: float = REGEX_BUDGET_MS,
+        sandbox: RegexSandbox | None = None,
+    ) -> None:
+        self.pattern = pattern
+        self.flags = flags
+        self.budget_ms = budget_ms
+        # 잘못된 패턴은 여기서 re.error로 드러난다.
+        self.compiled = re.compile(pattern, flags)
+        self._sandbox = sandbox
+        self._re2: Any = None
+        if is_linear_pattern(pattern, flags):
+            self.engine = ENGINE_RE
+        else:
+            self.engine = ENGINE_SANDBOX
+            if HAS_RE2 and not flags:
+                try:
+                    self._re2 = re2.compile(pattern)
+                    self.engine = ENGINE_RE2
+                except Exception:
+                    self._re2 = None
+
+    def __repr__(self) -> str:
+        return f"GuardedPattern({self.pattern!r}, engine={self.engine!r})"
+
+    def search(self, text: str) -> bool:
+        if self.engine == ENGINE_RE:
+            return self.compiled.search(text) is not None
+        if self.engine == ENGINE_RE2:
+            return self._re2.search(text) is not None
+        return self._run_sandboxed("search", text, None, lambda: self.compiled.search(text) is not None)
+
+    def subn(self, repl: str, text: str) -> tuple[str, int]:
+        if self.engine == ENGINE_RE:
+            return self.compiled.subn(repl, text)
+        if self.engine == ENGINE_RE2:
+            return self._re2.subn(repl, text)
+        return self._run_sandboxed("subn", text, repl, lambda: self.compiled.subn(repl, text))
+
+    def _run_sandboxed(self, op: str, text: str, repl: str | None, inline):
+        sandbox = self._sandbox or get_regex_sandbox()
+        if sandbox.available:
+            try:
+                return sandbox.run(op, self.pattern, self.flags, text, repl, self.budget_ms / 1000)
+            except (OSError, EOFError, BrokenPipeError) as exc:
+                # 작업 프로세스를 띄울 수 없는 환경: 보호 없이라도 규칙은 계속 동작하게 한다.
+                logger.warning("Regex sandbox unavailable, running patterns unguarded: %s", exc)
+                sandbox.available = False
+        return inline()
+
+
+__all__ = [
+    "ENGINE_RE",
+    "ENGINE_RE2",
+    "ENGINE_SANDBOX",
+    "GuardedPattern",
+    "HAS_RE2",
+    "REGEX_BUDGET_MS",
+    "RegexBudgetExceeded",
+    "RegexSandbox",
+    "get_regex_sandbox",
+    "is_linear_pattern",
+    "shutdown_regex_sandbox",
+]
@@ -0,0 +1,242 @@
+"""Ordered multi-stage worker pipeline with bounded queues and latency histograms.
+
+Every stage runs on its own daemon thread and hands jobs to the next stage
+through a bounded queue, so a burst overlaps across stages while each job
+still passes every stage in submission order. A full downstream queue
+blocks the stage feeding it (backpressure); only submit() refuses work
+instead of blocking, so the submitting (UI) thread never waits.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷 상한 (ms). 마지막 버킷은 그 이상 전부.
+LATENCY_BUCKETS_MS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0, 512.0, 1024.0, 4096.0)
+STAGE_QUEUE_SIZE = 64
+
+_STOP = object()
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds; safe to record from any thread."""
+
+    def __init__(self, bounds_ms: Iterable[float] = LATENCY_BUCKETS_MS) -> None:
+        self.bounds_ms = tuple(float(bound) for bound in bounds_ms)
+        self._buckets = [0] * (len(self.bounds_ms) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        elapsed_ms = max(float(elapsed_ms), 0.0)
+        index = bisect.bisect_left(self.bounds_ms, elapsed_ms)
+        with self._lock:
+            self._buckets[index] += 1
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the fraction-th sample (the maximum for the overflow bucket)."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, int(round(self.count * min(max(fraction, 0.0), 1.0))))
+            seen = 0
+            for index, bucket in enumerate(self._buckets):
+                seen += bucket
+                if seen >= rank:
+                    return min(self.bounds_ms[index], self.max_ms) if index < len(self.bounds_ms) else self.max_ms
+            return self.max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            count, total_ms, max_ms = self.count, self.total_ms, self.max_ms
+            buckets = {
+                (f"<={bound:g}ms" if index < len(self.bounds_ms) else f">{self.bounds_ms[-1]:g}ms"): value
+                for index, (bound, value) in enumerate(zip((*self.bounds_ms, float("inf")), self._buckets))
+                if value
+            }
+        return {
+            "count": count,
+            "mean_ms": total_ms / count if count else 0.0,
+            "max_ms": max_ms,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+class StagedPipeline:
+    """Runs jobs through named stages, one thread and one bounded input queue per stage.
+
+    A stage function returns the job to pass it on, or None to finish it
+    early (nothing to store, duplicate, ...). on_done gets completed jobs on
+    the last stage's thread; on_error(stage, job, exc) gets stage failures;
+    on_idle runs after the last in-flight job finishes, whatever its outcome.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[tuple[str, Callable[[Any], Any]]],
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[str, Any, BaseException], None] | None = None,
+        on_idle: Callable[[], None] | None = None,
+        queue_size: int = STAGE_QUEUE_SIZE,
+        name: str = "StagedPipeline",
+    ) -> None:
+        if not stages:
+            raise ValueError("StagedPipeline needs at least one stage")
+        self.name = name
+        self._stages = list(stages)
+        self._on_done = on_done
+        self._on_error = on_error
+        self._on_idle = on_idle
+        self._queues: list[queue.Queue] = [queue.Queue(maxsize=max(int(queue_size), 1)) for _ in self._stages]
+        self._threads: list[threading.Thread] = []
+        self._state = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+        self.histograms: dict[str, LatencyHistogram] = {stage_name: LatencyHistogram() for stage_name, _fn in stages}
+        self.counters = {"submitted": 0, "completed": 0, "filtered": 0, "failed": 0, "dropped": 0}
+
+    @property
+    def in_flight(self) -> int:
+        with self._state:
+            return self._in_flight
+
+    def record(self, stage_name: str, elapsed_ms: float) -> None:
+        """Record a stage measured outside the pipeline (e.g. the UI-thread read or notify)."""
+        histogram = self.histograms.get(stage_name)
+        if histogram is None:
+            histogram = self.histograms.setdefault(stage_name, LatencyHistogram())
+        histogram.record(elapsed_ms)
+
+    def submit(self, job: Any) -> bool:
+        """Queue job without blocking; False (counted as dropped) if the first queue is full or closed."""
+        with self._state:
+            if self._closed:
+                self.counters["dropped"] += 1
+                return False
+            self._start_locked()
+            try:
+                self._queues[0].put_nowait(job)
+            except queue.Full:
+                self.counters["dropped"] += 1
+                return False
+            self.counters["submitted"] += 1
+            self._in_flight += 1
+        return True
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted job has finished; False on timeout."""
+        with self._state:
+            return self._state.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Finish queued jobs (up to timeout), then stop the stage threads."""
+        with self._state:
+            if self._closed:
+                return
+            self._closed = True
+        deadline = time.monotonic() + timeout
+        self.drain(timeout)
+        if self._threads:
+            try:
+                self._queues[0].put(_STOP, timeout=max(deadline - time.monotonic(), 0.01))
+            except queue.Full:
+                return
+            for thread in self._threads:
+                thread.join(max(deadline - time.monotonic(), 0.0))
+
+    def metrics(self) -> dict[str, Any]:
+        with self._state:
+            counters = dict(self.counters, in_flight=self._in_flight)
+        return {
+            "stages": {stage_name: histogram.snapshot() for stage_name, histogram in list(self.histograms.items())},
+            "queues": [stage_queue.qsize() for stage_queue in self._queues],
+            **counters,
+        }
+
+    def _start_locked(self) -> None:
+        if self._threads:
+            return
+        for index, (stage_name, _fn) in enumerate(self._stages):
+            thread = threading.Thread(
+                target=self._run_stage,
+                args=(index,),
+                daemon=True,
+                name=f"{self.name}-{stage_name}",
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _finish(self, counter: str) -> None:
+        with self._state:
+            self.counters[counter] += 1
+            idle = self._in_flight == 1
+        # drain()이 돌아올 때는 on_idle도 이미 호출된 상태가 되도록 콜백 뒤에 줄인다.
+        if idle and self._on_idle is not None:
+            try:
+                self._on_idle()
+            except Exception:
+                logger.exception("%s idle callback failed", self.name)
+        with self._state:
+            self._in_flight -= 1
+            self._state.notify_all()
+
+    def _run_stage(self, index: int) -> None:
+        stage_name, fn = self._stages[index]
+        histogram = self.histograms[stage_name]
+        inbox = self._queues[index]
+        outbox = self._queues[index + 1] if index + 1 < len(self._queues) else None
+        while True:
+            job = inbox.get()
+            if job is _STOP:
+                if outbox is not None:
+                    outbox.put(_STOP)
+                return
+            started = time.perf_counter()
+            try:
+                result = fn(job)
+            except Exception as exc:
+                histogram.record((time.perf_counter() - started) * 1000)
+                logger.warning("%s stage %s failed: %s", self.name, stage_name, exc)
+                if self._on_error is not None:
+                    try:
+                        self._on_error(stage_name, job, exc)
+                    except Exception:
+                        logger.exception("%s error callback failed", self.name)
+                self._finish("failed")
+                continue
+            histogram.record((time.perf_counter() - started) * 1000)
+            if result is None:
+                self._finish("filtered")
+            elif outbox is not None:
+                # 다음 단계 큐가 가득 차면 여기서 기다린다 (백프레셔).
+                outbox.put(result)
+            else:
+                if self._on_done is not None:
+                    try:
+                        self._on_done(result)
+                    except Exception:
+                        logger.exception("%s completion callback failed", self.name)
+                self._finish("completed")
+
+
+__all__ = [
+    "LATENCY_BUCKETS_MS",
+    "LatencyHistogram",
+    "STAGE_QUEUE_SIZE",
+    "StagedPipeline",
+]
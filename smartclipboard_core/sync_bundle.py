@@ -0,0 +1,216 @@
+"""File format helpers for offline sync bundles.
+
+A bundle is a gzip-compressed JSON-lines file written by one device:
+the first line is a header (device id, vector clock, counter range) and
+every following line is one operation stamped with that device's counter.
+File names carry the device and counter range so readers can skip bundles
+they have already applied without opening them.
+
+BundleWriter streams operations to disk as they are produced; the header
+(whose clock and counter range are only known at the end) is written as a
+separate leading gzip member on commit, which gzip readers join back into
+one stream.
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+BUNDLE_FORMAT = "smartclipboard-sync"
+BUNDLE_VERSION = 1
+BUNDLE_SUFFIX = ".scsync"
+_BUNDLE_NAME_RE = re.compile(r"^(?P<device>[0-9a-f]{8,64})-(?P<first>\d{10})-(?P<last>\d{10})\.scsync$")
+
+# 해시에 들어가는 필드 (timestamp, pin_order 같은 기기별 값은 제외)
+SYNC_HASH_FIELDS = (
+    "type",
+    "content_sha",
+    "image_sha",
+    "tags",
+    "note",
+    "bookmark",
+    "collection",
+    "pinned",
+    "use_count",
+    "url_title",
+)
+
+
+class SyncBundleError(ValueError):
+    """Raised for unreadable or incompatible bundle files."""
+
+
+@dataclass(frozen=True)
+class BundleRef:
+    path: str
+    device: str
+    first: int
+    last: int
+
+
+def sha256_text(text: str) -> str:
+    """Same digest as ``encode_large_text`` so chunked rows hash identically."""
+    return hashlib.sha256((text or "").encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def sha256_bytes(data: bytes | None) -> str:
+    return hashlib.sha256(data).hexdigest() if data else ""
+
+
+def item_hash(item: dict[str, Any]) -> str:
+    payload = json.dumps([item.get(field) for field in SYNC_HASH_FIELDS], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def bundle_file_name(device: str, first: int, last: int) -> str:
+    return f"{device}-{int(first):010d}-{int(last):010d}{BUNDLE_SUFFIX}"
+
+
+def list_bundles(folder: str) -> list[BundleRef]:
+    """Bundles in folder ordered by (device, first counter)."""
+    refs: list[BundleRef] = []
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return refs
+    for name in names:
+        match = _BUNDLE_NAME_RE.match(name)
+        if not match:
+            continue
+        refs.append(
+            BundleRef(
+                path=os.path.join(folder, name),
+                device=match.group("device"),
+                first=int(match.group("first")),
+                last=int(match.group("last")),
+            )
+        )
+    refs.sort(key=lambda ref: (ref.device, ref.first))
+    return refs
+
+
+class BundleWriter:
+    """Stream one bundle's ops to a temp file; commit() adds the header and publishes it atomically."""
+
+    def __init__(self, folder: str, device: str) -> None:
+        self.folder = folder
+        self.device = device
+        self.first: int | None = None
+        self.last: int | None = None
+        self.count = 0
+        os.makedirs(folder, exist_ok=True)
+        self._ops_path = os.path.join(folder, f".{device}-{os.getpid()}-{id(self):x}.ops.tmp")
+        self._fh = gzip.open(self._ops_path, "wt", encoding="utf-8", compresslevel=6)
+
+    def write(self, op: dict[str, Any]) -> None:
+        counter = int(op["c"])
+        if self.last is not None and counter <= self.last:
+            raise SyncBundleError("operation counters must increase")
+        if self.first is None:
+            self.first = counter
+        self.last = counter
+        self.count += 1
+        self._fh.write(json.dumps(op, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def commit(self, clock: dict[str, int]) -> str:
+        """Prepend the header and rename into place; returns the bundle path."""
+        if self.first is None or self.last is None:
+            self.abort()
+            raise SyncBundleError("empty bundle")
+        self._fh.close()
+        header = {
+            "format": BUNDLE_FORMAT,
+            "version": BUNDLE_VERSION,
+            "device": self.device,
+            "first": self.first,
+            "last": self.last,
+            "clock": clock,
+            "created_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        path = os.path.join(self.folder, bundle_file_name(self.device, self.first, self.last))
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as out:
+                out.write(gzip.compress((json.dumps(header, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")))
+                with open(self._ops_path, "rb") as ops_fh:
+                    shutil.copyfileobj(ops_fh, out)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            self._remove_ops_file()
+        return path
+
+    def abort(self) -> None:
+        try:
+            self._fh.close()
+        except OSError:
+            pass
+        self._remove_ops_file()
+
+    def _remove_ops_file(self) -> None:
+        try:
+            os.remove(self._ops_path)
+        except OSError:
+            pass
+
+
+def write_bundle(folder: str, device: str, clock: dict[str, int], ops: list[dict[str, Any]]) -> str:
+    """Write ops atomically (temp file + rename) and return the bundle path."""
+    if not ops:
+        raise SyncBundleError("empty bundle")
+    writer = BundleWriter(folder, device)
+    try:
+        for op in ops:
+            writer.write(op)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.commit(clock)
+
+
+def read_bundle(path: str) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            lines = [line for line in fh if line.strip()]
+    except (OSError, EOFError, UnicodeDecodeError) as exc:
+        raise SyncBundleError(f"cannot read bundle {os.path.basename(path)}: {exc}") from exc
+    if not lines:
+        raise SyncBundleError(f"empty bundle {os.path.basename(path)}")
+    try:
+        header = json.loads(lines[0])
+        ops = [json.loads(line) for line in lines[1:]]
+    except json.JSONDecodeError as exc:
+        raise SyncBundleError(f"corrupt bundle {os.path.basename(path)}: {exc}") from exc
+    if header.get("format") != BUNDLE_FORMAT:
+        raise SyncBundleError(f"not a sync bundle: {os.path.basename(path)}")
+    if int(header.get("version") or 0) > BUNDLE_VERSION:
+        raise SyncBundleError(f"unsupported bundle version {header.get('version')}")
+    return header, ops
+
+
+__all__ = [
+    "BUNDLE_FORMAT",
+    "BUNDLE_SUFFIX",
+    "BUNDLE_VERSION",
+    "BundleRef",
+    "BundleWriter",
+    "SyncBundleError",
+    "bundle_file_name",
+    "item_hash",
+    "list_bundles",
+    "read_bundle",
+    "sha256_bytes",
+    "sha256_text",
+    "write_bundle",
+]
@@ -0,0 +1,137 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from smartclipboard_app import cli
+from smartclipboard_core.database import ClipboardDB
+
+TEST_TMP_ROOT = os.path.join(os.getcwd(), ".tmp-unittest")
+os.makedirs(TEST_TMP_ROOT, exist_ok=True)
+
+
+class HeadlessCliTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory(dir=TEST_TMP_ROOT)
+        self.db_path = os.path.join(self.tmpdir.name, "clipboard_history_v6.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _run(self, *argv, stdin_text=None):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            if stdin_text is not None:
+                original_stdin = sys.stdin
+                sys.stdin = io.StringIO(stdin_text)
+                try:
+                    code = cli.main(["--db", self.db_path, *argv])
+                finally:
+                    sys.stdin = original_stdin
+            else:
+                code = cli.main(["--db", self.db_path, *argv])
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_add_search_get_round_trip_outputs_json(self):
+        code, out, _err = self._run("add", "cli alpha snippet", "--tags", "work")
+        self.assertEqual(code, 0)
+        item_id = json.loads(out)["id"]
+        self.assertEqual(self._run("add", "--type", "CODE", stdin_text="def beta(): pass")[0], 0)
+
+        code, out, _err = self._run("search", "alpha")
+        self.assertEqual(code, 0)
+        payload = json.loads(out)
+        self.assertEqual(payload["count"], 1)
+        self.assertEqual(payload["items"][0]["id"], item_id)
+
+        code, out, _err = self._run("search", "--type", "CODE")
+        self.assertEqual([item["type"] for item in json.loads(out)["items"]], ["CODE"])
+
+        code, out, _err = self._run("get", str(item_id))
+        detail = json.loads(out)
+        self.assertEqual((detail["content"], detail["tags"]), ("cli alpha snippet", "work"))
+        self.assertEqual(self._run("get", str(item_id), "--raw")[1], "cli alpha snippet")
+
+    def test_missing_item_and_missing_database_report_json_errors(self):
+        code, out, err = self._run("stats")
+        self.assertEqual(code, 1)
+        self.assertEqual(out, "")
+        self.assertIn("database not found", json.loads(err)["error"])
+        self.assertFalse(os.path.exists(self.db_path))
+
+        self._run("add", "seed")
+        code, _out, err = self._run("get", "999")
+        self.assertEqual(code, 1)
+        self.assertIn("item not found", json.loads(err)["error"])
+
+    def test_export_import_stats_and_vacuum(self):
+        for i in range(5):
+            self._run("add", f"export item {i}")
+        export_path = os.path.join(self.tmpdir.name, "out.json")
+        code, out, _err = self._run("export", export_path, "--metadata")
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(out)["exported"], 5)
+
+        other_db = os.path.join(self.tmpdir.name, "other.db")
+        code, out, _err = self._run("--db", other_db, "import", export_path, "--dry-run")
+        report = json.loads(out)
+        self.assertEqual((code, report["imported"], report["dry_run"]["would_insert"]), (0, 0, 5))
+        code, out, _err = self._run("--db", other_db, "import", export_path)
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(out)["imported"], 5)
+
+        code, out, _err = self._run("stats")
+        stats = json.loads(out)
+        self.assertEqual(stats["total"], 5)
+        self.assertEqual(stats["storage"]["journal_mode"], "wal")
+
+        code, out, _err = self._run("vacuum")
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(out)["wal_bytes_after"], 0)
+
+    def test_incremental_jsonl_export_appends_deltas(self):
+        self._run("add", "nightly one")
+        archive = os.path.join(self.tmpdir.name, "nightly.jsonl")
+        self.assertEqual(self._run("export", archive)[0], 1)  # jsonl requires --incremental
+        code, out, _err = self._run("export", archive, "--incremental")
+        self.assertEqual((code, json.loads(out)["exported"]), (0, 1))
+
+        self._run("add", "nightly two")
+        code, out, _err = self._run("export", archive, "--incremental")
+        report = json.loads(out)
+        self.assertEqual((report["exported"], report["incremental"]["appended"]), (1, True))
+        with open(archive, "r", encoding="utf-8") as fh:
+            self.assertEqual([json.loads(line)["content"] for line in fh], ["nightly one", "nightly two"])
+
+        other_db = os.path.join(self.tmpdir.name, "restored.db")
+        code, out, _err = self._run("--db", other_db, "import", archive)
+        self.assertEqual((code, json.loads(out)["imported"]), (0, 2))
+
+    def test_cli_reads_live_database_while_another_connection_is_open(self):
+        live_db = ClipboardDB(db_file=self.db_path, app_dir=self.tmpdir.name)
+        try:
+            live_db.add_item("written by the running app", None, "TEXT")
+            code, out, _err = self._run("search", "running")
+            self.assertEqual(code, 0)
+            self.assertEqual(json.loads(out)["count"], 1)
+        finally:
+            live_db.close()
+
+    def test_cli_does_not_import_qt(self):
+        ClipboardDB(db_file=self.db_path, app_dir=self.tmpdir.name).close()
+        probe = (
+            "import sys; from smartclipboard_app import cli; "
+            f"code = cli.main(['--db', {self.db_path!r}, 'stats']); "
+            "sys.exit(2 if any(name.startswith('PyQt6') for name in sys.modules) else code)"
+        )
+        completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, timeout=60)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,12 @@ import csv
 import datetime
 import json
 import os
+import shutil
 import sqlite3
 import tempfile
+import time
 import unittest
+import zipfile
 from pathlib import Path
 from typing import Any, cast
 from unittest import mock
@@ -13,7 +16,9 @@ from unittest import mock
 from PyQt6.QtWidgets import QApplication
 
 from smartclipboard_app.features.import_export.backup import (
+    find_latest_good_backup,
     inspect_restore_database,
+    preserve_corrupt_database,
     replace_database_from_backup,
     validate_restore_database,
 )
@@ -21,6 +26,7 @@ from smartclipboard_app.managers.export_import import ExportImportManager
 from smartclipboard_app.managers.secure_vault import HAS_CRYPTO, SecureVaultManager
 from smartclipboard_core.actions import HAS_WEB, ClipboardActionManager, extract_first_url
 from smartclipboard_core.database import ClipboardDB
+from smartclipboard_core.db_parts.history.export_query import ExportQuery
 from smartclipboard_core.app_paths import get_app_directory as get_core_app_directory
 from smartclipboard_core.file_paths import (
     build_file_paths_detail_text,
@@ -30,6 +36,7 @@ from smartclipboard_core.file_paths import (
     file_signature_from_paths,
 )
 from smartclipboard_core.limits import IMAGE_CLIPBOARD_MAX_BYTES
+from smartclipboard_core.large_text import encode_large_text
 from smartclipboard_core.db_parts.search.schema import _execute_add_column
 
 
@@ -57,6 +64,9 @@ class FakeActionDB:
     def get_content(self, item_id):
         return self.contents.get(item_id)
 
+    def toggle_clipboard_action(self, action_id, enabled):
+        self.toggled = getattr(self, "toggled", []) + [(action_id, enabled)]
+
 
 class _FakeHTMLResponse:
     def __init__(self, body, content_type="text/html; charset=utf-8", status_code=200, headers=None):
@@ -136,6 +146,61 @@ class CoreActionTests(unittest.TestCase):
         self.assertEqual(results[1][1]["type"], "notify")
         self.assertEqual(results[1][1]["message"], "lowered")
 
+    def test_reload_actions_precompiles_enabled_plans_with_literal_prefilter(self):
+        db = FakeActionDB(
+            [
+                (1, "phone", r"010-\d{4}-\d{4}", "format_phone", "", 1, 3),
+                (2, "off", r"TODO", "notify", '{"message":"off"}', 0, 2),
+                (3, "todo", r"TODO", "notify", '{"message":"todo"}', 1, 1),
+                (4, "bad-params", r"FIXME", "notify", "{not json", 1, 0),
+            ]
+        )
+        manager = ClipboardActionManager(db)
+
+        plans = manager.actions_cache
+        self.assertEqual([plan.action_id for plan in plans], [1, 3, 4])
+        self.assertEqual(plans[1].params["message"], "todo")
+        self.assertEqual(dict(plans[2].params), {})
+        with self.assertRaises(TypeError):
+            cast(Any, plans[1].params)["message"] = "changed"
+        self.assertEqual((plans[0].literal, plans[1].literal_only), ("010-", True))
+        # 레거시 하위 클래스가 쓰는 dict 방식 조회
+        self.assertEqual((plans[1].get("type"), plans[1]["name"], plans[1].get("enabled")), ("notify", "todo", 1))
+
+        with mock.patch.object(plans[0].regex, "search", side_effect=AssertionError("regex ran")):
+            self.assertFalse(manager._program.may_match("아무 액션과도 맞지 않는 글"))
+            self.assertEqual(manager.process("아무 액션과도 맞지 않는 글"), [])
+            self.assertEqual(manager.process("TODO: 정리"), [("todo", {"type": "notify", "message": "todo"})])
+
+        from smartclipboard_core.automation.plans import compile_action_plans
+
+        # 같은 위치에서 겹치는 literal(짧은 쪽이 긴 쪽의 접두어)도 후보로 남는다.
+        program = compile_action_plans(
+            [(1, "short", "ID-1", "notify", "", 1, 2), (2, "long", "ID-10", "notify", "", 1, 1), (3, "x", "XY", "notify", "", 1, 0)]
+        )
+        found = program.literals_in("see ID-10 only")
+        self.assertEqual([program.is_candidate(plan, found) for plan in program], [True, True, False])
+
+    def test_process_disables_action_whose_pattern_exceeds_regex_budget(self):
+        from smartclipboard_core.regex_guard import shutdown_regex_sandbox
+
+        self.addCleanup(shutdown_regex_sandbox)
+        db = FakeActionDB(
+            [
+                (1, "evil", r"(a+)+$", "notify", '{"message":"never"}', 1, 1),
+                (2, "notify", r"a", "notify", '{"message":"ok"}', 1, 0),
+            ]
+        )
+        manager = ClipboardActionManager(db)
+
+        results = manager.process("a" * 40 + "!", item_id=3)
+
+        self.assertEqual(db.toggled, [(1, 0)])
+        self.assertEqual([plan.action_id for plan in manager.actions_cache], [2])
+        self.assertEqual(results[0][0], "evil")
+        self.assertIn("시간 제한", results[0][1]["message"])
+        self.assertEqual(results[1][1]["message"], "ok")
+
     def test_handle_title_result_ignores_updates_after_shutdown(self):
         db = FakeActionDB([(1, "fetch", r".*", "fetch_title", "{}", 1, 0)])
         manager = ClipboardActionManager(db)
@@ -247,6 +312,38 @@ class CoreActionTests(unittest.TestCase):
         self.assertEqual(db.updated_titles, [(3, "Cached Title")])
         self.assertEqual(emitted[0][1]["title"], "Cached Title")
 
+    def test_fetch_title_from_capture_stage_thread_delivers_result_on_manager_thread(self):
+        import threading
+
+        from smartclipboard_app.features.clipboard.pipeline import _TextCapture, _TextCaptureJob
+        from smartclipboard_core.automation import manager as manager_module
+        from smartclipboard_core.ingest import ClipboardIngestor
+
+        url = "https://example.com/stage"
+        db = FakeActionDB([(1, "fetch", r"https?://", "fetch_title", "{}", 1, 0)])
+        db.contents[5] = (f"see {url}", None, "LINK")
+        manager = ClipboardActionManager(db)
+        emitted = []
+        manager.action_completed.connect(lambda action_name, result: emitted.append((action_name, result)))
+        job = _TextCaptureJob(ClipboardIngestor(db, actions=manager), f"see {url}")
+        job.normalized, job.item_id = job.raw_text, 5
+
+        with mock.patch.object(manager_module, "HAS_WEB", True), mock.patch.object(
+            manager_module, "validate_title_fetch_url", return_value=(True, "")
+        ), mock.patch.object(manager_module, "fetch_title_logic", return_value={"url": url, "title": "Stage Title"}):
+            stage = threading.Thread(target=_TextCapture._post_actions, args=(job,))
+            stage.start()
+            stage.join(5)
+            deadline = time.monotonic() + 5
+            while not emitted and time.monotonic() < deadline:
+                self.app.processEvents()
+                time.sleep(0.01)
+        manager.shutdown()
+
+        self.assertEqual(emitted, [("fetch", {"type": "title", "title": "Stage Title"})])
+        self.assertEqual(db.updated_titles, [(5, "Stage Title")])
+        self.assertEqual((manager._pending_by_url, manager._pending_action_name_by_url), ({}, {}))
+
     def test_title_cache_expires_and_evicts_lru_entries(self):
         manager = ClipboardActionManager(FakeActionDB([]))
         now = {"value": 1000.0}
@@ -399,6 +496,32 @@ class CoreDatabaseTests(unittest.TestCase):
             conn.close()
         self.assertEqual(value, "source")
 
+    def test_preserve_corrupt_database_copies_wal_sidecars_or_nothing(self):
+        db_path = os.path.join(self.tmpdir.name, "damaged.db")
+        app_dir = os.path.join(self.tmpdir.name, "app")
+        for suffix, payload in (("", b"db"), ("-wal", b"wal"), ("-shm", b"shm")):
+            with open(f"{db_path}{suffix}", "wb") as fh:
+                fh.write(payload)
+
+        preserved = preserve_corrupt_database(db_path, app_dir)
+        assert preserved is not None
+        for suffix, payload in (("", b"db"), ("-wal", b"wal"), ("-shm", b"shm")):
+            with open(f"{preserved}{suffix}", "rb") as fh:
+                self.assertEqual(fh.read(), payload)
+
+        for path in os.listdir(os.path.join(app_dir, "backups")):
+            os.remove(os.path.join(app_dir, "backups", path))
+        real_copy2 = shutil.copy2
+
+        def failing_copy2(src, dst):
+            if str(src).endswith("-shm"):
+                raise OSError("disk full")
+            return real_copy2(src, dst)
+
+        with mock.patch("smartclipboard_app.features.import_export.backup.shutil.copy2", side_effect=failing_copy2):
+            self.assertIsNone(preserve_corrupt_database(db_path, app_dir))
+        self.assertEqual(os.listdir(os.path.join(app_dir, "backups")), [])
+
     def test_missing_row_updates_return_false(self):
         self.assertFalse(self.db.set_item_metadata(999999, use_count=1))
         self.assertFalse(self.db.set_item_tags(999999, "tag"))
@@ -812,6 +935,55 @@ class CoreDatabaseTests(unittest.TestCase):
                 dst_db.close()
             dst_tmp.cleanup()
 
+    def test_import_image_stage_hashes_images_on_workers_and_keeps_file_order(self):
+        from PyQt6.QtCore import QBuffer, QByteArray
+        from PyQt6.QtGui import QColor, QImage
+
+        from smartclipboard_app.features.import_export.image_prepare import ImagePrepareStage
+
+        def png_bytes(color):
+            image = QImage(64, 48, QImage.Format.Format_RGB32)
+            image.fill(QColor(color))
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QBuffer.OpenModeFlag.WriteOnly)
+            image.save(buffer, "PNG")
+            return data.data()
+
+        items = [
+            {"type": "TEXT", "content": "first"},
+            {"type": "IMAGE", "image_data_b64": base64.b64encode(png_bytes("red")).decode("ascii")},
+            {"type": "TEXT", "content": "between"},
+            {"type": "IMAGE", "image_data_b64": base64.b64encode(b"not an image").decode("ascii")},
+            {"type": "IMAGE", "image_data_b64": base64.b64encode(png_bytes("blue")).decode("ascii")},
+            {"type": "TEXT", "content": "last"},
+        ]
+        import_path = os.path.join(self.tmpdir.name, "images.jsonl")
+        with open(import_path, "w", encoding="utf-8") as fh:
+            fh.writelines(json.dumps(item) + "\n" for item in items)
+
+        manager = ExportImportManager(self.db, image_stage_factory=lambda: ImagePrepareStage(workers=2, window=1))
+        self.assertEqual(manager.import_jsonl(import_path), 6)
+
+        rows = self.db.conn.execute(
+            "SELECT type, content, typeof(image_hash), length(thumbnail) FROM history ORDER BY id"
+        ).fetchall()
+        self.assertEqual([row[:2] for row in rows], [
+            ("TEXT", "first"),
+            ("IMAGE", "[이미지 캡처]"),
+            ("TEXT", "between"),
+            ("IMAGE", "[이미지 캡처]"),
+            ("IMAGE", "[이미지 캡처]"),
+            ("TEXT", "last"),
+        ])
+        # 디코딩되는 이미지는 해시·썸네일이 바로 저장되고, 손상된 이미지는 빈 표시로 남아 백필 대상이 아니다.
+        red, broken, blue = [row[2:] for row in rows if row[0] == "IMAGE"]
+        self.assertEqual((red[0], blue[0]), ("integer", "integer"))
+        self.assertGreater(min(red[1], blue[1]), 0)
+        self.assertEqual(broken, ("blob", 0))
+        self.assertEqual(self.db.get_images_missing_hash(), [])
+        self.assertEqual(self.db.get_images_missing_thumbnail(), [])
+
     def test_import_json_skips_oversized_image_item(self):
         import_path = os.path.join(self.tmpdir.name, "oversized-image.json")
         image_bytes = b"x" * (IMAGE_CLIPBOARD_MAX_BYTES + 1)
@@ -1059,16 +1231,18 @@ class CoreDatabaseTests(unittest.TestCase):
             json.dump(payload, fh, ensure_ascii=False)
 
         manager = ExportImportManager(self.db)
-        original_add_item_locked = self.db._add_item_locked
+        original_add_items_bulk_locked = self.db._add_items_bulk_locked
         call_count = {"value": 0}
 
-        def failing_add_item_locked(cursor, content, image_data, type_tag, timestamp=None):
+        def failing_add_items_bulk_locked(cursor, records, index):
             call_count["value"] += 1
             if call_count["value"] == 2:
                 raise RuntimeError("simulated import failure")
-            return original_add_item_locked(cursor, content, image_data, type_tag, timestamp=timestamp)
+            return original_add_items_bulk_locked(cursor, records, index)
 
-        with mock.patch.object(self.db, "_add_item_locked", side_effect=failing_add_item_locked):
+        with mock.patch("smartclipboard_app.features.import_export.bulk_import.IMPORT_BATCH_SIZE", 1), mock.patch.object(
+            self.db, "_add_items_bulk_locked", side_effect=failing_add_items_bulk_locked
+        ):
             imported = manager.import_json(import_path)
 
         self.assertEqual(imported, -1)
@@ -1221,6 +1395,623 @@ class CoreDatabaseTests(unittest.TestCase):
         self.assertNotIn("visible-text", csv_text)
         self.assertNotIn("visible-text", md_text)
 
+    def test_export_query_pushes_type_date_collection_tag_and_flag_filters_into_sql(self):
+        work_id = self.db.add_collection("업무")
+        ids = {
+            "match": self.db.add_item("q1 report", None, "TEXT"),
+            "late": self.db.add_item("q2 report", None, "TEXT"),
+            "link": self.db.add_item("https://example.com/q1", None, "LINK"),
+            "untagged": self.db.add_item("q1 draft", None, "TEXT"),
+            "loose": self.db.add_item("q1 loose", None, "TEXT"),
+        }
+        for key, item_id in ids.items():
+            self.assertTrue(
+                self.db.set_item_metadata(
+                    item_id,
+                    timestamp="2026-04-20 08:00:00" if key == "late" else "2026-03-31 23:59:59",
+                    tags="" if key == "untagged" else "work， q1, urgent",
+                    bookmark=0 if key == "loose" else 1,
+                    collection_id=None if key == "loose" else work_id,
+                )
+            )
+
+        query = ExportQuery.create(
+            "TEXT",
+            date_from=datetime.date(2026, 3, 1),
+            date_to=datetime.date(2026, 3, 31),
+            collection_ids=[work_id],
+            tags="q1, work",
+            bookmarked=True,
+        )
+        self.assertEqual(self.db.count_export_items(query), 1)
+        with self.db.export_cursor(query, "id") as cursor:
+            self.assertEqual([row[0] for row in cursor.fetchall()], [ids["match"]])
+        self.assertEqual(self.db.count_export_items(ExportQuery.create(tags="urgent")), 4)
+        self.assertEqual(self.db.count_export_items(ExportQuery.create(tags="urg")), 0)
+        self.assertEqual(self.db.count_export_items(ExportQuery.create(collection_ids=[None])), 1)
+        self.assertEqual(self.db.count_export_items(ExportQuery.create(bookmarked=False)), 1)
+        self.assertEqual(self.db.count_export_items(ExportQuery.create(types=[])), 0)
+        delta = ExportQuery.create(item_ids=[ids["loose"], ids["match"], 10**9])
+        with self.db.export_cursor(delta, "id") as cursor:
+            self.assertEqual([row[0] for row in cursor.fetchall()], [ids["match"], ids["loose"]])
+
+        manager = ExportImportManager(self.db)
+        self.assertEqual(manager.count_export_items(query=query), 1)
+        json_path = os.path.join(self.tmpdir.name, "query.json")
+        self.assertEqual(manager.export_json(json_path, query=query), 1)
+        self.assertEqual(manager.last_export_report["filters"]["tags"], ["q1", "work"])
+        with open(json_path, "r", encoding="utf-8") as fh:
+            self.assertEqual([item["content"] for item in json.load(fh)["items"]], ["q1 report"])
+
+    def test_incremental_export_appends_only_changed_items_per_target(self):
+        first_id = self.db.add_item("archive one", None, "TEXT")
+        self.db.add_item("archive two", None, "TEXT")
+        manager = ExportImportManager(self.db)
+        jsonl_path = os.path.join(self.tmpdir.name, "archive.jsonl")
+        csv_path = os.path.join(self.tmpdir.name, "archive.csv")
+
+        self.assertEqual(manager.export_incremental(jsonl_path, "jsonl"), 2)
+        self.assertTrue(manager.last_export_report["incremental"]["full"])
+        self.assertEqual(manager.export_incremental(csv_path, "csv"), 2)
+        self.assertEqual(manager.export_incremental(jsonl_path, "jsonl"), 0)
+
+        self.db.add_item("archive three", None, "TEXT")
+        self.db.set_item_tags(first_id, "edited")
+        self.assertEqual(manager.export_incremental(jsonl_path, "jsonl", include_metadata=True), 2)
+        report = manager.last_export_report["incremental"]
+        self.assertEqual((report["full"], report["appended"]), (False, True))
+        with open(jsonl_path, "r", encoding="utf-8") as fh:
+            lines = [json.loads(line) for line in fh]
+        self.assertEqual([line["content"] for line in lines[2:]], ["archive one", "archive three"])
+        self.assertEqual(lines[2]["id"], first_id)
+        self.assertEqual(lines[2]["tags"], "edited")
+
+        # CSV 대상은 자기 워터마크를 따로 가진다: 헤더 없이 변경분만 덧붙는다.
+        self.assertEqual(manager.export_incremental(csv_path, "csv"), 2)
+        with open(csv_path, "r", encoding="utf-8-sig", newline="") as fh:
+            rows = list(csv.reader(fh))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(sum(1 for row in rows if row[0] == "내용"), 1)
+
+        os.remove(csv_path)
+        self.assertEqual(manager.export_incremental(csv_path, "csv"), 3)
+        self.assertTrue(manager.last_export_report["incremental"]["full"])
+
+    def test_streaming_json_export_writes_large_text_and_images_in_chunks(self):
+        large_text = "".join(f"line {i} \"quoted\"\t한글 payload\n" for i in range(40000))
+        image_blob = bytes(range(256)) * 400
+        large_id = self.db.add_item(large_text, None, "TEXT")
+        image_id = self.db.add_item("[이미지 캡처]", image_blob, "IMAGE")
+        self.db.set_item_tags(image_id, "shots")
+        self.assertIsNotNone(self.db.get_large_clip_info(large_id))
+
+        manager = ExportImportManager(self.db)
+        json_path = os.path.join(self.tmpdir.name, "streamed.json")
+        with mock.patch("smartclipboard_app.features.import_export.streaming.BASE64_CHUNK_BYTES", 999):
+            with mock.patch.object(self.db, "get_content", side_effect=AssertionError("N+1 query")):
+                self.assertEqual(manager.export_json(json_path, include_metadata=True), 2)
+
+        with open(json_path, "r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        items = {item["type"]: item for item in payload["items"]}
+        self.assertEqual(items["TEXT"]["content"], large_text)
+        self.assertEqual(base64.b64decode(items["IMAGE"]["image_data_b64"]), image_blob)
+        self.assertEqual(items["IMAGE"]["tags"], "shots")
+        self.assertEqual(payload["collections"], [])
+
+        # 빈 결과도 올바른 JSON 문서여야 한다.
+        empty_path = os.path.join(self.tmpdir.name, "empty.json")
+        self.assertEqual(manager.export_json(empty_path, filter_type="CODE"), 0)
+        with open(empty_path, "r", encoding="utf-8") as fh:
+            self.assertEqual(json.load(fh)["items"], [])
+
+    def test_streaming_json_import_batches_dedupes_and_links_trailing_collections(self):
+        existing_id = self.db.add_item("existing text", None, "TEXT")
+        payload = {
+            "items": [
+                {"content": "existing text", "timestamp": "2026-05-01 10:00:00", "tags": "kept"},
+                {"content": "dup", "type": "TEXT"},
+                {"content": "dup", "type": "CODE", "use_count": 3},
+                {"content": "[이미지 캡처]", "type": "IMAGE", "image_data_b64": base64.b64encode(b"png").decode()},
+                {"content": "linked", "collection_id": 7},
+                "not-an-object",
+            ],
+            # 예전 내보내기 파일처럼 collections가 items 뒤에 온다.
+            "collections": [{"legacy_id": 7, "name": "Later"}],
+        }
+        import_path = os.path.join(self.tmpdir.name, "streamed-import.json")
+        with open(import_path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, ensure_ascii=False)
+
+        manager = ExportImportManager(self.db)
+        with mock.patch("smartclipboard_app.features.import_export.bulk_import.IMPORT_BATCH_SIZE", 2), mock.patch(
+            "smartclipboard_app.features.import_export.json_stream.READ_CHUNK_CHARS", 16
+        ):
+            self.assertEqual(manager.import_json(import_path), 5)
+        self.assertEqual(manager.last_import_report["skipped"], 1)
+
+        rows = {row[1]: row for row in self.db.get_items("", "전체")}
+        self.assertEqual(sorted(rows), ["[이미지 캡처]", "dup", "existing text", "linked"])
+        self.assertEqual(rows["existing text"][0], existing_id)
+        self.assertEqual(rows["existing text"][3], "2026-05-01 10:00:00")
+        self.assertEqual(self.db.get_item_tags(existing_id), "kept")
+        self.assertEqual((rows["dup"][2], rows["dup"][5]), ("CODE", 3))
+        collection = self.db.get_collection_by_name("Later")
+        assert collection is not None
+        self.assertEqual([row[0] for row in self.db.get_items_by_collection(collection[0])], [rows["linked"][0]])
+        self.assertEqual(manager.last_import_report["collection_summary"]["remapped"], 1)
+
+        jsonl_path = os.path.join(self.tmpdir.name, "archive.jsonl")
+        with open(jsonl_path, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps({"content": "dup", "type": "CODE", "collection_id": 7}) + "\n\n")
+            fh.write(json.dumps({"content": "from jsonl", "pinned": True, "pin_order": 0}) + "\n")
+        self.assertEqual(manager.import_jsonl(jsonl_path), 2)
+        self.assertEqual(len(self.db.get_items("", "전체")), 5)
+        self.assertEqual(manager.last_import_report["collection_summary"]["cleared"], 1)
+
+    def test_archive_export_stores_raw_images_and_round_trips_metadata(self):
+        png_blob = b"\x89PNG\r\n\x1a\n" + os.urandom(3000)
+        collection_id = self.db.add_collection("Shots")
+        image_id = self.db.add_item("[이미지 캡처]", png_blob, "IMAGE")
+        text_id = self.db.add_item("archived text", None, "TEXT")
+        self.assertTrue(self.db.set_item_metadata(image_id, tags="screen", collection_id=collection_id, bookmark=1))
+        self.assertTrue(self.db.set_item_metadata(text_id, note="memo", timestamp="2026-02-02 02:02:02"))
+
+        manager = ExportImportManager(self.db)
+        archive_path = os.path.join(self.tmpdir.name, "backup.zip")
+        self.assertEqual(manager.export_archive(archive_path, include_metadata=True), 2)
+        with zipfile.ZipFile(archive_path) as zf:
+            manifest = json.loads(zf.read("manifest.json"))
+            image_name = f"images/{image_id:08d}.png"
+            self.assertEqual(zf.read(image_name), png_blob)
+            self.assertEqual(zf.getinfo(image_name).compress_type, zipfile.ZIP_STORED)
+            lines = [json.loads(line) for line in zf.read("items.jsonl").decode("utf-8").splitlines()]
+        self.assertEqual((manifest["item_count"], manifest["image_count"]), (2, 1))
+        self.assertEqual(manifest["collections"][0]["name"], "Shots")
+        image_line = next(line for line in lines if line["type"] == "IMAGE")
+        self.assertEqual(image_line["image_entry"], image_name)
+        self.assertNotIn("image_data_b64", image_line)
+
+        dst_tmp = tempfile.TemporaryDirectory()
+        dst_db = None
+        try:
+            dst_db = ClipboardDB(db_file=os.path.join(dst_tmp.name, "dst.db"), app_dir=dst_tmp.name)
+            dst_manager = ExportImportManager(dst_db)
+            self.assertEqual(dst_manager.import_archive(archive_path), 2)
+            rows = {row[2]: row for row in dst_db.get_items("", "전체")}
+            self.assertEqual(cast(Any, dst_db.get_content(rows["IMAGE"][0]))[1], png_blob)
+            self.assertEqual(dst_db.get_item_tags(rows["IMAGE"][0]), "screen")
+            collection = dst_db.get_collection_by_name("Shots")
+            assert collection is not None
+            self.assertEqual([row[0] for row in dst_db.get_items_by_collection(collection[0])], [rows["IMAGE"][0]])
+            self.assertEqual(rows["TEXT"][3], "2026-02-02 02:02:02")
+
+            # 이미지 항목이 빠진 아카이브는 그 항목만 건너뛴다.
+            broken_path = os.path.join(self.tmpdir.name, "broken.zip")
+            with zipfile.ZipFile(archive_path) as src, zipfile.ZipFile(broken_path, "w") as dst:
+                for info in src.infolist():
+                    if not info.filename.startswith("images/"):
+                        dst.writestr(info, src.read(info))
+            self.assertEqual(dst_manager.import_archive(broken_path), 1)
+            self.assertEqual(dst_manager.last_import_report["skipped"], 1)
+
+            not_archive = os.path.join(self.tmpdir.name, "plain.zip")
+            with zipfile.ZipFile(not_archive, "w") as zf:
+                zf.writestr("manifest.json", json.dumps({"format": "other"}))
+            self.assertEqual(dst_manager.import_archive(not_archive), -1)
+            self.assertIn("not a SmartClipboard archive", dst_manager.last_import_report["error"])
+            self.assertIsNone(dst_manager.last_import_report["backup_path"])
+        finally:
+            if dst_db is not None:
+                dst_db.close()
+            dst_tmp.cleanup()
+
+    def test_dry_run_import_predicts_counts_without_writing(self):
+        self.db.add_item("existing text", None, "TEXT")
+        self.db.add_collection("Kept")
+        payload = {
+            "items": [
+                {"content": "existing text"},
+                {"content": "dup", "type": "TEXT"},
+                {"content": "dup", "type": "CODE"},
+                {"content": "[이미지 캡처]", "type": "IMAGE", "image_data_b64": base64.b64encode(b"png").decode()},
+                {"content": "[이미지 캡처]", "type": "IMAGE", "image_data_b64": "not*base64"},
+                {"content": "relative", "type": "FILE", "file_paths": ["relative/path.txt"]},
+                {"content": "linked", "collection_id": 7},
+                {"content": "kept", "collection_id": 8},
+            ],
+            "collections": [{"legacy_id": 7, "name": "Later"}, {"legacy_id": 8, "name": "Kept"}],
+        }
+        import_path = os.path.join(self.tmpdir.name, "dry-run.json")
+        with open(import_path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, ensure_ascii=False)
+
+        manager = ExportImportManager(self.db)
+        self.assertEqual(manager.import_json(import_path, dry_run=True), 6)
+        report = manager.last_import_report
+        self.assertTrue(report["success"])
+        self.assertEqual(report["dry_run"], {"would_insert": 4, "would_merge": 2})
+        self.assertEqual((report["imported"], report["skipped"]), (0, 2))
+        self.assertIsNone(report["backup_path"])
+        self.assertEqual(report["collection_summary"], {"created": 1, "reused": 1, "remapped": 2, "cleared": 0})
+        self.assertEqual(len(self.db.get_items("", "전체")), 1)
+        self.assertIsNone(self.db.get_collection_by_name("Later"))
+
+        # 실제 가져오기 결과가 dry run 예측과 같아야 한다.
+        self.assertEqual(manager.import_json(import_path), 6)
+        self.assertEqual(manager.last_import_report["skipped"], 2)
+        self.assertEqual(manager.last_import_report["collection_summary"], report["collection_summary"])
+        self.assertEqual(len(self.db.get_items("", "전체")), 5)
+
+        csv_path = os.path.join(self.tmpdir.name, "dry-run.csv")
+        with open(csv_path, "w", encoding="utf-8-sig", newline="") as fh:
+            fh.write("내용,유형,시간,고정,사용횟수\n")
+            fh.write("dup,TEXT,2026-04-01 10:00:00,아니오,0\n")
+            fh.write("fresh csv row,TEXT,2026-04-01 10:00:00,예,2\n")
+            fh.write('"[이미지 항목 - 바이너리 제외]",IMAGE,2026-04-01 10:00:00,아니오,0\n')
+        self.assertEqual(manager.import_csv(csv_path, dry_run=True), 2)
+        self.assertEqual(manager.last_import_report["dry_run"], {"would_insert": 1, "would_merge": 1})
+        self.assertEqual(manager.last_import_report["skipped"], 1)
+        self.assertEqual(len(self.db.get_items("", "전체")), 5)
+
+    def test_image_hash_bk_tree_and_capture_merge_near_duplicates(self):
+        import random
+        import struct
+
+        from smartclipboard_core.image_hash import BKTree, hamming_distance
+
+        rng = random.Random(7)
+        hashes = [rng.getrandbits(64) for _ in range(300)]
+        hashes += [value ^ (1 << bit) for value, bit in zip(hashes[:50], range(50))]
+        tree = BKTree((value, index) for index, value in enumerate(hashes))
+        probe = hashes[3] ^ 0b101
+        brute_force = [(index, hamming_distance(probe, value)) for index, value in enumerate(hashes)]
+        expected = sorted(
+            (pair for pair in brute_force if pair[1] <= 12),
+            key=lambda pair: (pair[1], -pair[0]),
+        )
+        self.assertEqual(tree.search(probe, 12), expected)
+        self.assertEqual(len(tree), len(hashes))
+
+        def png(width, height, tail=b""):
+            return b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + struct.pack(">II", width, height) + tail
+
+        base_hash = 0xF0F0_0F0F_AAAA_5555
+        first_id = self.db.add_item("[이미지 캡처]", png(800, 600, b"a"), "IMAGE", image_hash=base_hash)
+        # 1비트 다른 재캡처는 기존 항목을 갱신, 크기가 다르면 (해시가 같아도) 새 항목
+        self.assertEqual(self.db.add_item("[이미지 캡처]", png(800, 600, b"b"), "IMAGE", image_hash=base_hash ^ 1), first_id)
+        first_content = self.db.get_content(first_id)
+        assert first_content is not None
+        self.assertEqual(first_content[1], png(800, 600, b"b"))
+        other_size_id = self.db.add_item("[이미지 캡처]", png(640, 480), "IMAGE", image_hash=base_hash)
+        far_id = self.db.add_item("[이미지 캡처]", png(800, 600), "IMAGE", image_hash=base_hash ^ 0xFFFF)
+        self.assertNotIn(other_size_id, (first_id, far_id))
+        self.assertEqual(len([row for row in self.db.get_items("", "전체") if row[2] == "IMAGE"]), 3)
+
+        self.assertEqual(self.db.find_similar_images(first_id, 4), [(other_size_id, 1)])
+        self.assertEqual(self.db.find_similar_image_groups(4), [[other_size_id, first_id]])
+        self.assertEqual(self.db.find_similar_image_groups(16), [[far_id, other_size_id, first_id]])
+
+        # 해시 없이 들어온 이미지(가져오기 등)는 백필 대상이고, 백필 후 바로 검색된다.
+        imported_id = self.db.add_item("[이미지 캡처]", png(1, 1), "IMAGE")
+        self.assertEqual([item_id for item_id, _blob in self.db.get_images_missing_hash()], [imported_id])
+        self.assertEqual(self.db.set_image_hashes([(imported_id, base_hash)]), 1)
+        self.assertEqual(self.db.get_images_missing_hash(), [])
+        self.assertIn((imported_id, 0), self.db.find_similar_images(other_size_id, 0))
+
+        # 디코딩할 수 없는 이미지는 표시만 남겨 다시 백필하지 않고, 유사도 검색에서도 빠진다.
+        broken_id = self.db.add_item("[이미지 캡처]", png(2, 2), "IMAGE")
+        self.assertEqual(self.db.set_image_hashes([(broken_id, None)]), 1)
+        self.assertEqual(self.db.get_images_missing_hash(), [])
+        self.assertEqual(self.db.find_similar_images(broken_id, 64), [])
+        self.assertNotIn(broken_id, [item_id for item_id, _distance in self.db.find_similar_images(first_id, 64)])
+
+        self.assertTrue(self.db.soft_delete(other_size_id))
+        self.assertEqual(self.db.find_similar_images(first_id, 4), [(imported_id, 1)])
+
+    def test_image_thumbnails_are_stored_replaced_on_merge_and_backfilled(self):
+        import struct
+
+        def png(width, height, tail=b""):
+            return b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + struct.pack(">II", width, height) + tail
+
+        base_hash = 0x0123_4567_89AB_CDEF
+        first_id = self.db.add_item("[이미지 캡처]", png(800, 600), "IMAGE", image_hash=base_hash, thumbnail=b"thumb-1")
+        imported_id = self.db.add_item("[이미지 캡처]", png(10, 10), "IMAGE")
+        text_id = self.db.add_item("plain", None, "TEXT")
+        self.assertEqual(self.db.get_thumbnails([first_id, imported_id, text_id, 999]), {first_id: b"thumb-1"})
+
+        # 거의 같은 이미지로 합쳐지면 썸네일도 새 캡처 것으로 바뀐다.
+        merged_id = self.db.add_item(
+            "[이미지 캡처]", png(800, 600, b"x"), "IMAGE", image_hash=base_hash ^ 1, thumbnail=b"thumb-2"
+        )
+        self.assertEqual(merged_id, first_id)
+        self.assertEqual(self.db.get_thumbnails([first_id]), {first_id: b"thumb-2"})
+
+        self.assertEqual([item_id for item_id, _blob in self.db.get_images_missing_thumbnail()], [imported_id])
+        # 디코딩할 수 없는 이미지는 빈 값으로 표시해 다시 시도하지 않고, 썸네일 없음으로 읽힌다.
+        self.assertEqual(self.db.set_image_thumbnails([(imported_id, None), (text_id, b"ignored")]), 1)
+        self.assertEqual(self.db.get_images_missing_thumbnail(), [])
+        self.assertEqual(self.db.get_thumbnails([imported_id, text_id]), {})
+
+    def test_image_blobs_in_any_codec_are_sized_merged_and_recompressed_safely(self):
+        import struct
+
+        from smartclipboard_core.image_format import image_dimensions, sniff_image_format
+
+        def webp(width, height, tail=b""):
+            bits = (width - 1) | ((height - 1) << 14)
+            return b"RIFF\x00\x00\x00\x00WEBPVP8L\x00\x00\x00\x00\x2f" + bits.to_bytes(4, "little") + tail
+
+        app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + bytes(9)
+        jpeg = b"\xff\xd8" + app0 + b"\xff\xc0" + struct.pack(">HBHH", 17, 8, 600, 800) + bytes(12)
+        self.assertEqual(sniff_image_format(jpeg), "jpeg")
+        self.assertEqual(image_dimensions(jpeg), (800, 600))
+        self.assertEqual(image_dimensions(webp(800, 600)), (800, 600))
+        self.assertIsNone(image_dimensions(jpeg[:20]))
+        self.assertIsNone(sniff_image_format(b"not an image"))
+
+        # 같은 크기의 WebP 캡처끼리도 근사 중복으로 합쳐진다.
+        base_hash = 0x0123_4567_89AB_CDEF
+        first_id = self.db.add_item("[이미지 캡처]", webp(800, 600), "IMAGE", image_hash=base_hash)
+        self.assertEqual(self.db.add_item("[이미지 캡처]", webp(800, 600, b"b"), "IMAGE", image_hash=base_hash ^ 1), first_id)
+        self.assertNotEqual(self.db.add_item("[이미지 캡처]", webp(640, 480), "IMAGE", image_hash=base_hash), first_id)
+
+        blobs = self.db.get_image_blobs(0, 1)
+        self.assertEqual(blobs, [(first_id, webp(800, 600, b"b"))])
+        stats = self.db.get_image_storage_stats()
+        self.assertEqual(stats["count"], 2)
+        # 읽은 뒤 바뀐 행(새 캡처가 합쳐짐)은 크기가 같아도 덮어쓰지 않는다.
+        self.assertEqual(self.db.replace_image_blobs([(first_id, webp(800, 600, b"c"), b"smaller")]), [])
+        self.assertEqual(self.db.replace_image_blobs([(first_id, blobs[0][1], b"smaller")]), [first_id])
+        first_content = self.db.get_content(first_id)
+        assert first_content is not None
+        self.assertEqual(first_content[1], b"smaller")
+        self.assertEqual(self.db.get_image_storage_stats()["bytes"], stats["bytes"] - len(blobs[0][1]) + len(b"smaller"))
+
+    def test_staged_pipeline_keeps_order_applies_backpressure_and_records_latency(self):
+        import threading
+        import time
+
+        from smartclipboard_core.staged_pipeline import LatencyHistogram, StagedPipeline
+
+        release = threading.Event()
+        stored, idle_calls = [], []
+
+        def persist(job):
+            release.wait(5)
+            if job == 3:
+                raise RuntimeError("disk full")
+            stored.append(job)
+            return job
+
+        pipeline = StagedPipeline(
+            [("normalize", lambda job: None if job % 5 == 0 else job), ("persist", persist)],
+            on_idle=lambda: idle_calls.append(True),
+            queue_size=1,
+        )
+        accepted = []
+        for job in range(1, 50):
+            if not pipeline.submit(job):
+                break
+            accepted.append(job)
+            time.sleep(0.01)
+        # 막힌 단계 뒤로 큐가 차면 submit은 기다리지 않고 거절한다.
+        self.assertLess(len(accepted), 49)
+        release.set()
+        self.assertTrue(pipeline.drain(5))
+        pipeline.shutdown(1)
+
+        self.assertEqual(stored, [job for job in accepted if job % 5 and job != 3])
+        metrics = pipeline.metrics()
+        self.assertEqual(metrics["dropped"], 1)
+        self.assertEqual(metrics["failed"], 1)
+        self.assertEqual(metrics["filtered"], len([job for job in accepted if job % 5 == 0]))
+        self.assertEqual(metrics["stages"]["persist"]["count"], len(stored) + 1)
+        self.assertTrue(idle_calls)
+        self.assertFalse(pipeline.submit(99))
+
+        histogram = LatencyHistogram((1.0, 10.0))
+        for elapsed in (0.5, 0.7, 5.0, 50.0):
+            histogram.record(elapsed)
+        self.assertEqual((histogram.percentile(0.5), histogram.percentile(0.75), histogram.percentile(1.0)), (1.0, 10.0, 50.0))
+        self.assertEqual(histogram.snapshot()["buckets"], {"<=1ms": 2, "<=10ms": 1, ">10ms": 1})
+
+    def test_clipboard_ingestor_stores_payloads_without_qt(self):
+        from smartclipboard_core.ingest import (
+            INGEST_DUPLICATE,
+            INGEST_EMPTY,
+            INGEST_TOO_LARGE,
+            TEXT_ROUTE_LARGE,
+            TEXT_ROUTE_TOO_LARGE,
+            ClipboardIngestor,
+        )
+
+        class UppercaseLinks:
+            def process(self, text, item_id):
+                return [("upper", {"type": "replace_text", "text": text.upper()})]
+
+        self.db.add_copy_rule("trim", r".*", "trim")
+        ingestor = ClipboardIngestor(self.db, max_text_bytes=64, max_large_text_bytes=128, max_image_bytes=16)
+
+        link = ingestor.ingest_text("  https://example.com/a  ")
+        self.assertTrue(link.stored)
+        self.assertEqual((link.type_tag, link.text), ("LINK", "https://example.com/a"))
+        self.assertEqual(ingestor.ingest_text("   ").status, INGEST_EMPTY)
+        self.assertEqual(ingestor.route_text("x" * 100), (TEXT_ROUTE_LARGE, 100))
+        self.assertEqual(ingestor.ingest_text("x" * 200).status, INGEST_TOO_LARGE)
+        self.db.set_setting("large_clip_mode", "false")
+        self.assertEqual(ingestor.route_text("x" * 100)[0], TEXT_ROUTE_TOO_LARGE)
+
+        # 규칙 캐시는 invalidate_copy_rules() 전까지 유지된다.
+        self.db.add_copy_rule("upper", r"hello", "uppercase")
+        self.assertEqual(ingestor.ingest_text("hello").text, "hello")
+        ingestor.invalidate_copy_rules()
+        self.assertEqual(ingestor.ingest_text("hello").text, "HELLO")
+
+        # 컴파일 도중(규칙을 읽은 뒤) 들어온 무효화는 잃지 않고 다음 캡처에서 다시 컴파일한다.
+        real_get_copy_rules = self.db.get_copy_rules
+
+        def get_rules_then_invalidate():
+            rules = real_get_copy_rules()
+            self.db.add_copy_rule("lower", r"WORLD", "lowercase")
+            ingestor.invalidate_copy_rules()
+            return rules
+
+        with mock.patch.object(self.db, "get_copy_rules", side_effect=get_rules_then_invalidate):
+            ingestor.invalidate_copy_rules()
+            self.assertEqual(ingestor.ingest_text("bye WORLD").text, "bye WORLD")
+        self.assertEqual(ingestor.ingest_text("bye WORLD again").text, "bye world again")
+
+        file_path = os.path.join(self.tmpdir.name, "note.txt")
+        Path(file_path).write_text("x", encoding="utf-8")
+        self.assertEqual(ingestor.ingest_files([file_path]).type_tag, "FILE")
+
+        self.assertEqual(ingestor.ingest_image(b"\x89PNG" + b"0" * 32).status, INGEST_TOO_LARGE)
+        self.assertTrue(ingestor.ingest_image(b"\x89PNG0").stored)
+        self.assertEqual(ingestor.ingest_image(b"\x89PNG0").status, INGEST_DUPLICATE)
+
+        acting = ClipboardIngestor(self.db, actions=UppercaseLinks())
+        result = acting.ingest_text("https://example.com/b")
+        assert result.item_id is not None
+        self.assertEqual(result.replaced_text, "HTTPS://EXAMPLE.COM/B")
+        self.assertEqual(cast(Any, self.db.get_content(result.item_id))[0], "HTTPS://EXAMPLE.COM/B")
+        self.assertFalse(acting.replace_text(result.item_id + 1000, "gone"))
+
+    def test_content_classifier_bounds_work_caches_and_types_untyped_imports(self):
+        from smartclipboard_core.classifier import (
+            CLASSIFY_PREFIX_CHARS,
+            JSON_DETECT_MAX_CHARS,
+            classifier_cache_stats,
+            classify_content,
+            classify_text,
+            clear_classifier_cache,
+        )
+
+        samples = {
+            "https://example.com": "LINK",
+            "HTTPS://example.com": "TEXT",
+            "#a1b2c3": "COLOR",
+            "RGB(1, 2, 3)": "COLOR",
+            "hsl(10, 50%, 50%)": "COLOR",
+            "rgb(1, 2, 3) and more": "TEXT",
+            "const x = 1": "CODE",
+            "x => y": "CODE",
+            "plain words": "TEXT",
+        }
+        for text, expected in samples.items():
+            self.assertEqual(classify_text(text), expected, text)
+
+        self.assertEqual(classify_text("a" * CLASSIFY_PREFIX_CHARS + "{"), "TEXT")
+        self.assertEqual(classify_text("a" * 10 + "{"), "CODE")
+        self.assertTrue(classify_content("NaN").is_json)
+        self.assertTrue(classify_content('{"a": [1]}').is_json)
+        self.assertFalse(classify_content("{not json").is_json)
+        self.assertFalse(classify_content("[" + "1," * JSON_DETECT_MAX_CHARS + "1]").is_json)
+
+        clear_classifier_cache()
+        large = "word " * (JSON_DETECT_MAX_CHARS // 2)
+        classify_content(large)
+        classify_content(large + "tail")
+        self.assertEqual(classifier_cache_stats(), {"entries": 1, "hits": 1, "misses": 1})
+
+        csv_path = os.path.join(self.tmpdir.name, "untyped.csv")
+        with open(csv_path, "w", encoding="utf-8-sig", newline="") as fh:
+            fh.write("내용,유형,시간,고정,사용횟수\n")
+            fh.write("https://example.com/imported,,2026-04-01 10:00:00,아니오,0\n")
+        self.assertEqual(ExportImportManager(self.db).import_csv(csv_path), 1)
+        self.assertEqual(self.db.get_items("", "전체")[0][2], "LINK")
+
+    def test_copy_rule_program_prefilters_literals_and_profiles_rules(self):
+        from smartclipboard_core.copy_rules import CopyRuleProgram, required_literal
+
+        self.assertEqual(required_literal(r"\.com"), (".com", True))
+        self.assertEqual(required_literal(r"https?://x"), ("http", False))
+        self.assertEqual(required_literal(r"(?i)foo"), (None, False))
+        self.assertEqual(required_literal(r"ab|cd"), (None, False))
+
+        log = mock.Mock()
+        program = CopyRuleProgram(
+            [
+                (1, "domain", r"\.com", "uppercase", "", 1, 4),
+                (2, "bad-template", r"x", "custom_replace", r"\9", 1, 3),
+                (3, "digits", r"id-(\d+)", "custom_replace", r"#\1", 1, 2),
+                (4, "off", r"never", "lowercase", "", 0, 1),
+            ],
+            log=log,
+        )
+        self.assertEqual([rule.rule_id for rule in program.rules], [1, 3])
+        self.assertEqual(log.warning.call_count, 1)
+
+        # "id-"가 없는 텍스트는 정규식을 돌리지 않고 건너뛴다.
+        self.assertEqual(program.rules[1].literal, "id-")
+        self.assertEqual(program.apply("plain text"), "plain text")
+        self.assertEqual(program.apply("see example.com id-42"), "SEE EXAMPLE.COM ID-42")
+        self.assertEqual(program.apply("ref id-7"), "ref #7")
+
+        stats = program.profile.snapshot()
+        self.assertEqual((stats[1]["evaluations"], stats[1]["hits"]), (3, 1))
+        self.assertEqual((stats[3]["evaluations"], stats[3]["hits"]), (3, 1))
+        program.profile.reset()
+        self.assertEqual(program.profile.snapshot()[1]["evaluations"], 0)
+
+    def test_regex_guard_kills_pathological_patterns_and_disables_copy_rules(self):
+        from smartclipboard_core.copy_rules import CopyRuleProgram
+        from smartclipboard_core.regex_guard import (
+            ENGINE_RE,
+            GuardedPattern,
+            RegexBudgetExceeded,
+            RegexSandbox,
+            is_linear_pattern,
+            shutdown_regex_sandbox,
+        )
+
+        for pattern in (r".*", r"https?://\S+", r"\d{3}-\d{4}", r"foo|bar", r"(?i)hello", r"[A-Z]+"):
+            self.assertTrue(is_linear_pattern(pattern), pattern)
+            self.assertEqual(GuardedPattern(pattern).engine, ENGINE_RE)
+
+        sandbox = RegexSandbox()
+        self.addCleanup(sandbox.shutdown)
+        self.addCleanup(shutdown_regex_sandbox)
+        pathological = {
+            r"(a+)+$": "a" * 40 + "!",
+            r"(a|aa)+$": "a" * 60 + "!",
+            r"(\w+\s?)+$": "word " * 12 + "!",
+            r"^(([a-z])+.)+[A-Z]([a-z])+$": "a" * 40,
+            # 유한 반복이라도 몸체가 분기면 선택지가 반복마다 곱해진다.
+            r"(a|a){0,22}b": "a" * 40,
+            r"(a|aa){1,40}b": "a" * 40,
+        }
+        for pattern, evil in pathological.items():
+            self.assertFalse(is_linear_pattern(pattern), pattern)
+            guarded = GuardedPattern(pattern, budget_ms=200, sandbox=sandbox)
+            started = time.monotonic()
+            with self.assertRaises(RegexBudgetExceeded):
+                guarded.search(evil)
+            self.assertLess(time.monotonic() - started, 5)
+        # 죽인 뒤에도 다음 호출에서 작업 프로세스를 다시 띄워 정상 결과를 낸다.
+        guarded = GuardedPattern(r"(a+)+$", sandbox=sandbox)
+        self.assertTrue(guarded.search("aaa"))
+        self.assertEqual(guarded.subn("x", "baa"), ("bx", 1))
+        self.assertEqual(sandbox.stats["timeouts"], len(pathological))
+
+        self.db.add_copy_rule("evil", r"(x+x+)+y", "uppercase")
+        self.db.add_copy_rule("trim", r"^\s", "trim")
+        tripped = []
+        program = CopyRuleProgram(self.db.get_copy_rules(), on_timeout=lambda rule, exc: tripped.append(rule.name))
+        # 리터럴 "y"가 있어 사전 필터를 통과하지만 x 묶음 뒤가 y가 아니라 역추적이 폭발한다.
+        evil_text = " " + "x" * 40 + "!y"
+        self.assertEqual(program.apply(evil_text), evil_text.strip())
+        self.assertEqual(program.apply(evil_text), evil_text.strip())
+        self.assertEqual(tripped, ["evil"])
+
+        from smartclipboard_core.ingest import ClipboardIngestor
+
+        ingestor = ClipboardIngestor(self.db)
+        self.assertEqual(ingestor.normalize_text(evil_text)[0], evil_text.strip())
+        enabled = {rule[1]: rule[5] for rule in self.db.get_copy_rules()}
+        self.assertEqual(enabled, {"evil": 0, "trim": 1})
+
     def test_import_csv_skips_image_placeholder_rows(self):
         csv_path = os.path.join(self.tmpdir.name, "image-placeholder.csv")
         with open(csv_path, "w", encoding="utf-8-sig", newline="") as fh:
@@ -1417,6 +2208,266 @@ class CoreDatabaseTests(unittest.TestCase):
         self.assertIsNone(self.db.get_setting("vault_verification"))
 
 
+    def test_large_text_is_stored_as_compressed_chunks_with_indexed_prefix(self):
+        large_text = "".join(f"line {i} large clip payload\n" for i in range(60000))
+        self.assertGreater(len(large_text.encode("utf-8")), 1024 * 1024)
+
+        item_id = self.db.add_item(large_text, None, "TEXT")
+        self.assertTrue(item_id)
+        self.assertEqual(self.db.add_item(large_text, None, "TEXT"), item_id)
+
+        info = self.db.get_large_clip_info(item_id)
+        assert info is not None
+        self.assertEqual(info["total_chars"], len(large_text))
+        self.assertGreater(info["chunk_count"], 1)
+        self.assertLess(info["stored_bytes"], info["total_bytes"])
+        self.assertEqual(info["prefix"], large_text[: len(info["prefix"])])
+        self.assertEqual("".join(self.db.iter_large_text_chunks(info["digest"])), large_text)
+        # 읽기 풀로 읽을 때는 묶음마다 연결을 돌려준 뒤에 청크를 내보낸다.
+        pooled_chunks = []
+        with mock.patch("smartclipboard_core.db_parts.history.large_clips.LARGE_CHUNK_READ_BATCH", 1):
+            for chunk in self.db.iter_large_text_chunks(info["digest"], use_read_pool=True):
+                stats = self.db.get_read_pool_stats()
+                self.assertEqual(stats["idle"], stats["created"])
+                pooled_chunks.append(chunk)
+        self.assertEqual("".join(pooled_chunks), large_text)
+
+        content, image_data, item_type = cast(Any, self.db.get_content(item_id))
+        self.assertEqual(content, large_text)
+        self.assertIsNone(image_data)
+        self.assertEqual(item_type, "TEXT")
+        self.assertTrue(any(row[0] == item_id for row in self.db.search_items("line 5 large")))
+        self.assertIsNone(self.db.get_large_clip_info(self.db.add_item("small", None, "TEXT")))
+
+    def test_regular_text_equal_to_large_prefix_is_not_merged(self):
+        large_text = "x" * (2 * 1024 * 1024)
+        large_id = self.db.add_item(large_text, None, "TEXT")
+        info = self.db.get_large_clip_info(large_id)
+        assert info is not None
+
+        prefix_id = self.db.add_item(info["prefix"], None, "TEXT")
+
+        self.assertNotEqual(prefix_id, large_id)
+        self.assertEqual(cast(Any, self.db.get_content(large_id))[0], large_text)
+        self.assertEqual(cast(Any, self.db.get_content(prefix_id))[0], info["prefix"])
+
+    def test_large_text_survives_trash_roundtrip_and_chunks_are_collected(self):
+        large_text = "가나다라 " * 300000
+        item_id = self.db.add_large_text_item(large_text)
+        info = self.db.get_large_clip_info(item_id)
+        assert info is not None
+        digest = info["digest"]
+
+        self.assertTrue(self.db.soft_delete(item_id))
+        deleted_id = self.db.get_deleted_items()[0][0]
+        self.assertTrue(self.db.restore_item(deleted_id))
+        restored_id = self.db.get_items("", "전체")[0][0]
+        self.assertEqual(cast(Any, self.db.get_content(restored_id))[0], large_text)
+
+        self.db.delete_item(restored_id)
+        with self.db.lock:
+            cursor = self.db.conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM large_clips WHERE digest = ?", (digest,))
+            clip_count = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM large_clip_chunks WHERE digest = ?", (digest,))
+            chunk_count = cursor.fetchone()[0]
+        self.assertEqual((clip_count, chunk_count), (0, 0))
+
+    def test_large_text_rewrites_chunks_missing_behind_an_existing_header(self):
+        large_text = "청크 복구 " * 300000
+        payload = encode_large_text(large_text)
+        with self.db.lock:
+            # 청크 없이 남은 헤더 (예: 중간에 끊긴 이전 저장)
+            self.db.conn.execute(
+                "INSERT INTO large_clips (digest, total_chars, total_bytes, chunk_count, codec) VALUES (?, ?, ?, ?, ?)",
+                (payload.digest, payload.total_chars, payload.total_bytes, len(payload.chunks), payload.codec),
+            )
+            self.db.conn.execute(
+                "INSERT INTO large_clip_chunks (digest, seq, data) VALUES (?, 0, ?)", (payload.digest, payload.chunks[0])
+            )
+            self.db.conn.commit()
+
+        item_id = self.db.add_large_text_item(payload)
+
+        info = self.db.get_large_clip_info(item_id)
+        assert info is not None
+        self.assertEqual(info["chunk_count"], len(payload.chunks))
+        self.assertEqual(cast(Any, self.db.get_content(item_id))[0], large_text)
+
+    def test_checkpoint_wal_reports_pages_duration_and_truncates(self):
+        for i in range(50):
+            self.db.add_item(f"wal-item-{i}", None, "TEXT")
+        self.assertGreater(self.db.get_wal_size(), 0)
+
+        passive = self.db.checkpoint_wal("passive", dedicated_connection=True)
+        assert passive is not None
+        self.assertEqual(passive["mode"], "PASSIVE")
+        self.assertGreaterEqual(passive["checkpointed_pages"], 0)
+        self.assertGreaterEqual(passive["duration_ms"], 0.0)
+
+        truncate = self.db.checkpoint_wal("TRUNCATE")
+        assert truncate is not None
+        self.assertFalse(truncate["busy"])
+        self.assertEqual(truncate["wal_bytes_after"], 0)
+
+        diagnostics = self.db.get_storage_diagnostics()
+        self.assertEqual(diagnostics["journal_mode"], "wal")
+        self.assertEqual(diagnostics["checkpoints"]["count"], 2)
+        self.assertEqual(diagnostics["checkpoints"]["by_mode"], {"PASSIVE": 1, "TRUNCATE": 1})
+        self.assertEqual(diagnostics["checkpoints"]["last"]["mode"], "TRUNCATE")
+
+        with self.assertRaises(ValueError):
+            self.db.checkpoint_wal("VACUUM")
+
+    def test_maybe_checkpoint_wal_skips_small_wal_and_escalates_large_wal(self):
+        self.db.checkpoint_wal("TRUNCATE")
+        self.assertIsNone(self.db.maybe_checkpoint_wal(min_bytes=1024 * 1024))
+
+        self.db.add_item("grow the wal", None, "TEXT")
+        result = self.db.maybe_checkpoint_wal(min_bytes=1, truncate_bytes=1)
+        assert result is not None
+        self.assertEqual(result["mode"], "TRUNCATE")
+
+    def test_integrity_check_detects_fts_drift_and_rebuild_repairs_it(self):
+        self.db.add_item("integrity alpha", None, "TEXT")
+        self.db.add_item("integrity beta", None, "TEXT")
+        self.assertEqual(self.db.run_integrity_check()["status"], "ok")
+
+        with self.db.lock:
+            self.db.conn.execute("DELETE FROM history_fts")
+            self.db.conn.commit()
+        broken = self.db.run_integrity_check()
+        self.assertEqual(broken["status"], "fts_corrupt")
+        self.assertEqual(broken["fts_missing_rows"], 2)
+
+        self.assertTrue(self.db.rebuild_search_index())
+        self.assertEqual(self.db.run_integrity_check()["status"], "ok")
+        self.assertEqual(len(self.db.search_items("alpha")), 1)
+
+    def test_integrity_check_reports_unreadable_database_as_corrupt(self):
+        garbage_path = os.path.join(self.tmpdir.name, "garbage.db")
+        with open(garbage_path, "wb") as handle:
+            handle.write(b"not a sqlite database" * 256)
+        original_path = self.db.db_file
+        self.db.db_file = garbage_path
+        try:
+            result = self.db.run_integrity_check()
+        finally:
+            self.db.db_file = original_path
+        self.assertEqual(result["status"], "db_corrupt")
+        self.assertTrue(result["quick_check"])
+
+    def test_maintenance_log_records_events_and_feeds_diagnostics(self):
+        self.assertTrue(self.db.record_maintenance_event("integrity_check", "ok", {"fts_ok": True}, 12.5))
+        self.assertTrue(self.db.record_maintenance_event("fts_rebuild", "ok"))
+
+        rows = self.db.get_maintenance_log()
+        self.assertEqual([row[1] for row in rows], ["fts_rebuild", "integrity_check"])
+        self.assertEqual(json.loads(rows[1][3]), {"fts_ok": True})
+        self.assertEqual(len(self.db.get_maintenance_log(kind="integrity_check")), 1)
+
+        last = self.db.get_storage_diagnostics()["last_integrity_check"]
+        self.assertEqual(last["status"], "ok")
+        self.assertEqual(last["duration_ms"], 12.5)
+
+    def test_read_connection_pool_is_bounded_query_only_and_closed_with_db(self):
+        self.db.add_item("pool row", None, "TEXT")
+        with self.db.read_connection() as first:
+            self.assertEqual(first.execute("SELECT COUNT(*) FROM history").fetchone()[0], 1)
+            with self.assertRaises(sqlite3.OperationalError):
+                first.execute("DELETE FROM history")
+            with self.db.read_connection() as second:
+                self.assertIsNot(first, second)
+        self.assertEqual(self.db.get_read_pool_stats(), {"size": 4, "created": 2, "idle": 2})
+        self.assertEqual(len(self.db.search_items("pool", use_read_pool=True)), 1)
+        self.assertEqual(cast(Any, self.db.get_content(1, use_read_pool=True))[0], "pool row")
+
+        self.db.close_read_pool()
+        self.assertEqual(self.db.get_read_pool_stats()["created"], 0)
+        with self.assertRaises(sqlite3.OperationalError):
+            with self.db.read_connection():
+                pass
+
+    def test_find_latest_good_backup_skips_unreadable_files(self):
+        self.db.add_item("backup me", None, "TEXT")
+        self.assertTrue(self.db.backup_db(force=True))
+        backup_dir = os.path.join(self.tmpdir.name, "backups")
+        garbage_path = os.path.join(backup_dir, "pre_import_99999999_000000.db")
+        with open(garbage_path, "wb") as handle:
+            handle.write(b"garbage")
+        os.utime(garbage_path, None)
+
+        candidate = find_latest_good_backup(self.tmpdir.name)
+        assert candidate is not None
+        path, profile = candidate
+        self.assertTrue(os.path.basename(path).startswith("clipboard_history_"))
+        self.assertEqual(profile, "full")
+        self.assertIsNone(find_latest_good_backup(os.path.join(self.tmpdir.name, "missing")))
+
+    def test_change_log_records_inserts_updates_and_deletes(self):
+        start = self.db.get_latest_change_seq()
+        item_id = self.db.add_item("change feed", None, "TEXT")
+        self.db.set_item_tags(item_id, "feed")
+        self.db.toggle_pin(item_id)
+        self.db.add_collection("Feed")
+        self.db.delete_item(item_id)
+
+        feed = self.db.changes_since(start)
+        ops = [(c["entity"], c["op"], c["changed"]) for c in feed["changes"] if c["entity"] != "deleted_history"]
+        self.assertEqual(ops[0], ("history", "insert", []))
+        self.assertIn(("history", "update", ["tags"]), ops)
+        self.assertIn(("history", "update", ["pinned"]), ops)
+        self.assertIn(("collections", "insert", []), ops)
+        self.assertEqual(ops[-1], ("history", "delete", []))
+        self.assertEqual(feed["last_seq"], self.db.get_latest_change_seq())
+        self.assertFalse(feed["reset"])
+
+        paged = self.db.changes_since(start, limit=2, entities=["history"])
+        self.assertEqual(len(paged["changes"]), 2)
+        self.assertTrue(paged["has_more"])
+        self.assertEqual(self.db.changes_since(feed["last_seq"])["changes"], [])
+
+    def test_change_log_compaction_merges_rows_and_signals_reset(self):
+        first = self.db.add_item("compact me", None, "TEXT")
+        self.db.set_item_tags(first, "a")
+        self.db.set_note(first, "n")
+        second = self.db.add_item("then delete", None, "TEXT")
+        self.db.set_item_tags(second, "b")
+        self.db.delete_item(second)
+        latest = self.db.get_latest_change_seq()
+
+        result = self.db.compact_changes(max_rows=10)
+        self.assertGreater(result["merged"], 0)
+        ops = {(c["entity"], c["id"]): c["op"] for c in self.db.changes_since(0)["changes"]}
+        self.assertEqual(ops[("history", first)], "insert")
+        self.assertEqual(ops[("history", second)], "delete")
+        self.assertEqual(self.db.get_latest_change_seq(), latest)
+
+        for i in range(5):
+            self.db.add_item(f"filler {i}", None, "TEXT")
+        result = self.db.compact_changes(max_rows=3)
+        self.assertGreater(result["trimmed"], 0)
+        self.assertTrue(self.db.changes_since(0)["reset"])
+        tail = self.db.changes_since(result["floor"])
+        self.assertFalse(tail["reset"])
+        self.assertEqual(len(tail["changes"]), 3)
+
+    def test_change_log_compaction_merges_only_up_to_cutoff(self):
+        item_id = self.db.add_item("columns", None, "TEXT")
+        self.db.set_item_tags(item_id, "a")
+        self.db.set_note(item_id, "n")
+        self.db.set_item_tags(item_id, "b")
+        cutoff = self.db.get_latest_change_seq()
+        self.db.set_note(item_id, "after cutoff")
+
+        result = self.db.compact_changes(max_rows=100, merge_before_seq=cutoff)
+
+        # insert + 업데이트 3건이 insert 하나로 합쳐지고, cutoff 뒤의 변경은 그대로 남는다.
+        self.assertEqual(result["merged"], 3)
+        changes = self.db.changes_since(0)["changes"]
+        self.assertEqual([(c["op"], c["seq"] <= cutoff) for c in changes], [("insert", True), ("update", False)])
+
+
 class CoreDatabaseSearchTests(unittest.TestCase):
     def setUp(self):
         self.tmpdir = _workspace_tempdir()
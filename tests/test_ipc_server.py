@@ -0,0 +1,220 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from typing import Any, cast
+
+from smartclipboard_core.database import ClipboardDB
+from smartclipboard_core.ipc_server import (
+    MAX_UNAUTHENTICATED_ERRORS,
+    STREAM_CHUNK_CHARS,
+    HistoryRpcClient,
+    HistoryRpcServer,
+    HistoryRpcService,
+)
+from smartclipboard_core.limits import TEXT_CLIPBOARD_MAX_BYTES
+
+TEST_TMP_ROOT = os.path.join(os.getcwd(), ".tmp-unittest")
+os.makedirs(TEST_TMP_ROOT, exist_ok=True)
+
+
+class _RawClient:
+    """Line-level stand-in for a third-party tool speaking the protocol by hand."""
+
+    def __init__(self, endpoint):
+        if endpoint["transport"] == "unix":
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(endpoint["path"])
+        else:
+            self.sock = socket.create_connection((endpoint["host"], endpoint["port"]))
+        self.sock.settimeout(5)
+        self.reader = self.sock.makefile("rb")
+
+    def send_line(self, payload):
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.sock.sendall(data + b"\n")
+
+    def read(self) -> Any:
+        line = self.reader.readline()
+        return json.loads(line) if line else None
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+
+class HistoryRpcServerTests(unittest.TestCase):
+    transport = "tcp"
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory(dir=TEST_TMP_ROOT)
+        self.db = ClipboardDB(db_file=os.path.join(self.tmpdir.name, "clipboard_history_v6.db"), app_dir=self.tmpdir.name)
+        self.writes = []
+        self.server = HistoryRpcServer(
+            self.db,
+            transport=self.transport,
+            socket_path=os.path.join(tempfile.gettempdir(), f"sc-ipc-{os.getpid()}-{id(self)}.sock"),
+            on_write=self.writes.append,
+        )
+        self.endpoint = self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_endpoint_file_is_written_and_removed(self):
+        endpoint_file = os.path.join(self.tmpdir.name, "ipc_endpoint.json")
+        with open(endpoint_file, "r", encoding="utf-8") as fh:
+            self.assertEqual(json.load(fh)["token"], self.server.token)
+        if os.name != "nt":
+            self.assertEqual(os.stat(endpoint_file).st_mode & 0o777, 0o600)
+        self.server.stop()
+        self.assertFalse(os.path.exists(endpoint_file))
+
+    def test_requests_require_valid_token(self):
+        raw = _RawClient(self.endpoint)
+        try:
+            raw.send_line({"jsonrpc": "2.0", "id": 1, "method": "recent", "params": {}})
+            self.assertEqual(raw.read()["error"]["code"], -32001)
+            self.assertIsNone(raw.read())  # server closed the connection
+        finally:
+            raw.close()
+
+        with self.assertRaises(PermissionError):
+            HistoryRpcClient({**self.endpoint, "token": "wrong"})
+
+    def test_unauthenticated_parse_errors_are_capped(self):
+        raw = _RawClient(self.endpoint)
+        try:
+            for _ in range(MAX_UNAUTHENTICATED_ERRORS + 2):
+                try:
+                    raw.send_line(b"{not json")
+                except OSError:
+                    break
+            for _ in range(MAX_UNAUTHENTICATED_ERRORS):
+                self.assertEqual(raw.read()["error"]["code"], -32700)
+            self.assertIsNone(raw.read())  # server closed the connection
+        finally:
+            raw.close()
+
+    def test_search_recent_add_and_get_content(self):
+        self.db.add_item("ipc alpha note", None, "TEXT")
+        with HistoryRpcClient(self.server.endpoint_file) as client:
+            added = client.call("add", text="ipc beta snippet", type="CODE", tags="ipc")
+            self.assertEqual(self.writes, [added["id"]])
+
+            found = client.call("search", query="beta")
+            self.assertEqual([item["id"] for item in found["items"]], [added["id"]])
+            self.assertEqual(client.call("recent", limit=1)["count"], 1)
+
+            content = client.call("get_content", id=added["id"])
+            self.assertEqual((content["content"], content["type"], content["streamed"]), ("ipc beta snippet", "CODE", False))
+            with self.assertRaises(RuntimeError):
+                client.call("get_content", id=9999)
+        self.assertEqual(self.db.get_item_tags(added["id"]), "ipc")
+
+    def test_changes_since_returns_deltas(self):
+        with HistoryRpcClient(self.endpoint) as client:
+            start = client.call("changes_since")["last_seq"]
+            added = client.call("add", text="delta item")
+            delta = client.call("changes_since", seq=start, entities=["history"])
+        self.assertEqual([(c["op"], c["id"]) for c in delta["changes"]][0], ("insert", added["id"]))
+        self.assertFalse(delta["reset"])
+
+    def test_batch_returns_inline_results_and_errors(self):
+        big_id = self.db.add_item("b" * (STREAM_CHUNK_CHARS * 2 + 10), None, "TEXT")
+        raw = _RawClient(self.endpoint)
+        try:
+            raw.send_line({"jsonrpc": "2.0", "id": 0, "method": "auth", "params": {"token": self.server.token}})
+            self.assertTrue(raw.read()["result"]["authenticated"])
+            raw.send_line(
+                [
+                    {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+                    {"jsonrpc": "2.0", "id": 2, "method": "nope"},
+                    {"jsonrpc": "2.0", "method": "ping"},
+                    {"jsonrpc": "2.0", "id": 3, "method": "get_content", "params": {"id": big_id}},
+                ]
+            )
+            responses = {response["id"]: response for response in raw.read()}
+            self.assertEqual(sorted(responses), [1, 2, 3])
+            self.assertEqual(responses[2]["error"]["code"], -32601)
+            self.assertFalse(responses[3]["result"]["streamed"])
+
+            raw.send_line(b"{not json")
+            self.assertEqual(raw.read()["error"]["code"], -32700)
+        finally:
+            raw.close()
+
+    def test_large_results_are_streamed_in_chunks(self):
+        big_text = "0123456789" * (STREAM_CHUNK_CHARS // 4)
+        large_text = "가" * (TEXT_CLIPBOARD_MAX_BYTES // 2)
+        big_id = self.db.add_item(big_text, None, "TEXT")
+        large_id = self.db.add_large_text_item(large_text)
+
+        raw = _RawClient(self.endpoint)
+        try:
+            raw.send_line({"jsonrpc": "2.0", "id": 0, "method": "auth", "params": {"token": self.server.token}})
+            raw.read()
+            raw.send_line({"jsonrpc": "2.0", "id": 7, "method": "get_content", "params": {"id": big_id}})
+            chunks = []
+            while True:
+                message = raw.read()
+                if message.get("method") == "stream.chunk":
+                    self.assertEqual(message["params"]["request_id"], 7)
+                    self.assertEqual(message["params"]["seq"], len(chunks))
+                    chunks.append(message["params"]["data"])
+                    continue
+                break
+            self.assertEqual(message["result"]["chunks"], len(chunks))
+            self.assertGreater(len(chunks), 1)
+            self.assertEqual("".join(chunks), big_text)
+        finally:
+            raw.close()
+
+        with HistoryRpcClient(self.endpoint) as client:
+            streamed = client.call("get_content", id=large_id)
+        self.assertTrue(streamed["streamed"])
+        self.assertEqual(streamed["total_chars"], len(large_text))
+        self.assertEqual(streamed["content"], large_text)
+
+    def test_reads_use_pool_while_writer_lock_is_held(self):
+        self.db.add_item("pooled read", None, "TEXT")
+        large_text = "나" * (TEXT_CLIPBOARD_MAX_BYTES // 2)
+        large_id = self.db.add_large_text_item(large_text)
+        result = {}
+        with self.db.lock:
+            # UI 스레드가 쓰기 잠금을 잡고 있어도 읽기 요청은 풀 연결로 처리된다.
+            def reader():
+                with HistoryRpcClient(self.endpoint) as client:
+                    result["search"] = client.call("search", query="pooled")
+                    result["large"] = client.call("get_content", id=large_id)
+
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(5)
+        self.assertEqual(result["search"]["count"], 1)
+        self.assertEqual(result["large"]["content"], large_text)
+        self.assertGreaterEqual(self.db.get_read_pool_stats()["created"], 1)
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX") and os.name != "nt", "Unix sockets unavailable")
+class HistoryRpcUnixServerTests(HistoryRpcServerTests):
+    transport = "unix"
+
+
+class HistoryRpcServiceTests(unittest.TestCase):
+    def test_dispatch_validates_params_without_sockets(self):
+        service = HistoryRpcService(db=None)
+        response: Any = service.dispatch({"jsonrpc": "2.0", "id": 1, "method": "search", "params": {"limit": 0}})
+        self.assertEqual(response["error"]["code"], -32602)
+        response = service.dispatch({"jsonrpc": "2.0", "id": 2, "method": "add", "params": {"text": "x", "type": "IMAGE"}})
+        self.assertEqual(response["error"]["code"], -32602)
+        self.assertEqual(cast(Any, service.dispatch({"id": 3, "method": "ping"}))["error"]["code"], -32600)
+        self.assertIsNone(service.dispatch({"jsonrpc": "2.0", "method": "ping"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+import gzip
+import itertools
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Any, cast
+from unittest import mock
+
+from smartclipboard_core.database import ClipboardDB
+from smartclipboard_core.sync_bundle import bundle_file_name, list_bundles, read_bundle
+
+TEST_TMP_ROOT = os.path.join(os.getcwd(), ".tmp-unittest")
+os.makedirs(TEST_TMP_ROOT, exist_ok=True)
+
+
+class SyncBundleTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory(dir=TEST_TMP_ROOT)
+        self.shared = os.path.join(self.tmpdir.name, "shared")
+        self.a = self._open("a")
+        self.b = self._open("b")
+
+    def tearDown(self):
+        self.a.close()
+        self.b.close()
+        self.tmpdir.cleanup()
+
+    def _open(self, name):
+        app_dir = os.path.join(self.tmpdir.name, name)
+        os.makedirs(app_dir, exist_ok=True)
+        return ClipboardDB(db_file=os.path.join(app_dir, "clipboard_history_v6.db"), app_dir=app_dir)
+
+    @staticmethod
+    def _find(db, text):
+        return next(row[0] for row in db.search_items("") if row[1] == text)
+
+    def test_round_trip_exports_only_the_delta(self):
+        item_id = self.a.add_item("sync alpha", None, "TEXT")
+        self.a.set_item_tags(item_id, "work")
+        collection_id = self.a.add_collection("Proj")
+        self.a.assign_to_collection(item_id, collection_id)
+        self.a.add_item("", b"\x89PNG fake image", "IMAGE")
+        exported = self.a.export_sync_bundle(self.shared)
+        self.assertEqual(exported["upserts"], 2)
+
+        report = self.b.import_sync_bundles(self.shared)
+        self.assertEqual((report["bundles"], report["inserted"]), (1, 2))
+        b_id = self._find(self.b, "sync alpha")
+        self.assertEqual(self.b.get_item_tags(b_id), "work")
+        self.assertEqual(self.b.get_collection_by_name("Proj") is not None, True)
+        self.assertEqual(cast(Any, self.b.get_content(self._find(self.b, "")))[1], b"\x89PNG fake image")
+
+        # 가져온 항목은 다시 내보내지 않고, 이미 적용한 번들은 건너뛴다.
+        self.assertEqual(self.b.export_sync_bundle(self.shared)["ops"], 0)
+        self.assertEqual(self.b.import_sync_bundles(self.shared)["bundles"], 0)
+
+        self.a.add_item("sync beta", None, "TEXT")
+        delta = self.a.export_sync_bundle(self.shared)
+        self.assertEqual(delta["ops"], 1)
+        _header, ops = read_bundle(delta["path"])
+        self.assertEqual(ops[0]["item"]["content"], "sync beta")
+        self.assertEqual(self.b.import_sync_bundles(self.shared)["inserted"], 1)
+
+    def test_concurrent_edits_merge_like_restore_and_converge(self):
+        a_id = self.a.add_item("shared snippet", None, "TEXT")
+        self.a.sync_with_folder(self.shared)
+        self.b.sync_with_folder(self.shared)
+        b_id = self._find(self.b, "shared snippet")
+
+        self.a.set_item_tags(a_id, "work")
+        self.a.set_note(a_id, "note from a")
+        self.b.set_item_tags(b_id, "home")
+        self.b.set_note(b_id, "note from b")
+        self.b.toggle_bookmark(b_id)
+        self.b.sync_with_folder(self.shared)
+
+        report = self.a.sync_with_folder(self.shared)
+        self.assertEqual(report["imported"]["merged"], 1)
+        self.assertEqual(report["exported"]["upserts"], 1)
+        self.assertEqual(self.a.get_item_tags(a_id), "work, home")
+        self.assertEqual(cast(Any, self.a.get_item_annotations(a_id))[1], "note from a")
+
+        self.b.sync_with_folder(self.shared)
+        self.assertEqual(self.b.get_item_tags(b_id), "work, home")
+        self.assertEqual(cast(Any, self.b.get_item_annotations(b_id))[1], "note from a")
+        self.assertEqual(self.b.export_sync_bundle(self.shared)["ops"], 0)
+        self.assertEqual(self.a.export_sync_bundle(self.shared)["ops"], 0)
+
+    def test_concurrent_edits_on_three_devices_converge_to_one_version(self):
+        c = self._open("c")
+        self.addCleanup(c.close)
+        devices = {"a": self.a, "b": self.b, "c": c}
+        self.a.add_item("three way", None, "TEXT")
+        for _round in range(2):
+            for db in devices.values():
+                db.sync_with_folder(self.shared)
+
+        # B와 C가 서로의 수정을 보기 전에 각자 내보낸다: 두 버전은 동시 수정이다.
+        self.b.set_item_tags(self._find(self.b, "three way"), "from-b")
+        c.set_item_tags(self._find(c, "three way"), "from-c")
+        self.b.export_sync_bundle(self.shared)
+        c.export_sync_bundle(self.shared)
+        for _round in range(3):
+            for first, second in itertools.permutations(devices, 2):
+                devices[first].sync_with_folder(self.shared)
+                devices[second].sync_with_folder(self.shared)
+
+        tags = {name: db.get_item_tags(self._find(db, "three way")) for name, db in devices.items()}
+        self.assertEqual(len(set(tags.values())), 1, tags)
+        self.assertIn(tags["a"], ("from-b", "from-c"))
+
+        # 다른 기기의 버전을 본 뒤의 수정은 카운터가 작아도 이긴다.
+        self.a.set_item_tags(self._find(self.a, "three way"), "after")
+        self.a.sync_with_folder(self.shared)
+        for db in devices.values():
+            db.sync_with_folder(self.shared)
+        self.assertEqual({db.get_item_tags(self._find(db, "three way")) for db in devices.values()}, {"after"})
+
+    def test_export_streams_ops_in_batches_and_releases_the_lock_between_them(self):
+        for index in range(5):
+            self.a.add_item(f"batched {index}", None, "TEXT")
+        acquisitions = []
+        real_lock = self.a.lock
+
+        class CountingLock:
+            def __enter__(self):
+                acquisitions.append(1)
+                return real_lock.__enter__()
+
+            def __exit__(self, *exc_info):
+                return real_lock.__exit__(*exc_info)
+
+        with mock.patch("smartclipboard_core.db_parts.sync.bundles._SYNC_EXPORT_BATCH", 2), mock.patch.object(
+            self.a, "lock", CountingLock()
+        ):
+            exported = self.a.export_sync_bundle(self.shared)
+
+        # 준비 1회 + 2행씩 3묶음 + 마무리 1회
+        self.assertEqual(len(acquisitions), 5)
+        header, ops = read_bundle(exported["path"])
+        self.assertEqual((header["first"], header["last"], exported["ops"]), (1, 5, 5))
+        self.assertEqual([op["c"] for op in ops], [1, 2, 3, 4, 5])
+        self.assertEqual(sorted(name for name in os.listdir(self.shared) if name.endswith(".tmp")), [])
+        self.assertEqual(self.b.import_sync_bundles(self.shared)["inserted"], 5)
+
+    def test_delete_wins_over_concurrent_edit(self):
+        a_id = self.a.add_item("short lived", None, "TEXT")
+        self.a.sync_with_folder(self.shared)
+        self.b.sync_with_folder(self.shared)
+        b_id = self._find(self.b, "short lived")
+
+        self.b.soft_delete(b_id)
+        self.a.set_item_tags(a_id, "edited")
+        self.a.export_sync_bundle(self.shared)
+
+        # B는 자신의 삭제를 보지 못한 A의 수정을 받는다: 동시 변경이므로 삭제가 유지된다.
+        report = self.b.sync_with_folder(self.shared)
+        self.assertEqual((report["imported"]["skipped"], report["exported"]["deletes"]), (1, 1))
+        self.assertEqual(self.b.search_items(""), [])
+
+        self.a.sync_with_folder(self.shared)
+        self.assertEqual(self.a.search_items(""), [])
+        self.assertEqual(len(self.a.get_deleted_items()), 1)
+
+    def test_independent_duplicates_are_aliased_not_duplicated(self):
+        self.a.add_item("same text", None, "TEXT")
+        self.b.add_item("same text", None, "TEXT")
+        self.a.sync_with_folder(self.shared)
+        self.b.sync_with_folder(self.shared)
+        self.a.sync_with_folder(self.shared)
+        self.assertEqual(len(self.a.search_items("")), 1)
+        self.assertEqual(len(self.b.search_items("")), 1)
+
+    def test_missing_bundle_blocks_later_ones_and_corrupt_bundle_is_reported(self):
+        self.a.add_item("first", None, "TEXT")
+        first = self.a.export_sync_bundle(self.shared)["path"]
+        self.a.add_item("second", None, "TEXT")
+        self.a.export_sync_bundle(self.shared)
+        parked = os.path.join(self.tmpdir.name, os.path.basename(first))
+        shutil.move(first, parked)
+
+        report = self.b.import_sync_bundles(self.shared)
+        self.assertEqual(report["bundles"], 0)
+        self.assertEqual(report["gaps"][0]["expected"], 1)
+
+        shutil.move(parked, first)
+        self.assertEqual(self.b.import_sync_bundles(self.shared)["bundles"], 2)
+
+        device = list_bundles(self.shared)[0].device
+        with gzip.open(os.path.join(self.shared, bundle_file_name(device, 3, 3)), "wt", encoding="utf-8") as fh:
+            fh.write("{broken\n")
+        self.assertEqual(len(self.b.import_sync_bundles(self.shared)["errors"]), 1)
+
+    def test_acknowledged_bundles_are_pruned(self):
+        self.a.add_item("prune me", None, "TEXT")
+        self.a.sync_with_folder(self.shared)
+        self.b.sync_with_folder(self.shared)
+        self.assertEqual(self.a.sync_with_folder(self.shared)["pruned"], 1)
+        self.assertEqual(list_bundles(self.shared), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
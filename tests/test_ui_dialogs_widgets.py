@@ -2,31 +2,38 @@ import json
 import os
 import re
 import tempfile
+import time
 import unittest
 from contextlib import contextmanager
+from types import SimpleNamespace
 from typing import Any, cast
 from unittest import mock
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QBuffer, QByteArray, Qt
+from PyQt6.QtGui import QColor, QImage
 from PyQt6.QtWidgets import QApplication, QListWidgetItem, QMainWindow, QMessageBox, QPushButton, QTableWidget, QWidget
 
 import smartclipboard_app.legacy_main_src as legacy_main_src
 import smartclipboard_app.ui.mainwindow_parts.menu_ops as menu_ops
+from smartclipboard_app.features.ipc import IpcServerController
+from smartclipboard_app.features.maintenance import MaintenanceController
 from smartclipboard_core.file_paths import file_content_from_paths
 from smartclipboard_core.database import ClipboardDB
 from smartclipboard_app.ui.dialogs.clipboard_actions import ClipboardActionsDialog
 from smartclipboard_app.ui.dialogs.collections import CollectionManagerDialog
-from smartclipboard_app.ui.dialogs.copy_rules import CopyRuleEditDialog
+from smartclipboard_app.ui.dialogs.copy_rules import CopyRuleEditDialog, CopyRulesDialog
 from smartclipboard_app.ui.dialogs.export_dialog import ExportDialog
 from smartclipboard_app.ui.dialogs.hotkeys import DEFAULT_HOTKEYS, HotkeySettingsDialog
 from smartclipboard_app.ui.dialogs.import_dialog import ImportDialog
 from smartclipboard_app.ui.dialogs.secure_vault import SecureVaultDialog
 from smartclipboard_app.ui.dialogs.settings import FALLBACK_THEMES, SettingsDialog
+from smartclipboard_app.ui.dialogs.similar_images import SimilarImagesDialog
 from smartclipboard_app.ui.mainwindow_parts.clipboard_runtime_ops import (
     apply_copy_rules_impl,
     on_clipboard_change_impl,
     process_actions_impl,
     process_clipboard_impl,
+    process_image_clipboard_impl,
     process_text_clipboard_impl,
 )
 from smartclipboard_app.ui.mainwindow_parts.status_lifecycle_ops import quit_app_impl, run_periodic_cleanup_impl
@@ -80,7 +87,7 @@ class _FakeImportExportManager:
         self.last_import_report = {}
         self.last_export_report = {}
 
-    def import_json(self, path):
+    def import_json(self, path, dry_run=False):
         self.last_import_report = {
             "success": True,
             "format": "json",
@@ -93,17 +100,20 @@ class _FakeImportExportManager:
         }
         return 2
 
-    def import_csv(self, path):
+    def import_csv(self, path, dry_run=False):
         self.last_import_report = {
             "success": True,
             "format": "csv",
             "path": path,
-            "imported": 1,
+            "imported": 0 if dry_run else 1,
             "skipped": 2,
             "warnings": ["CSV import warning"],
-            "backup_path": os.path.join(os.getcwd(), "backups", "pre_import_20260412_120001.db"),
+            "backup_path": None if dry_run else os.path.join(os.getcwd(), "backups", "pre_import_20260412_120001.db"),
             "collection_summary": {"created": 0, "reused": 0, "remapped": 0, "cleared": 1},
         }
+        if dry_run:
+            self.last_import_report["dry_run"] = {"would_insert": 1, "would_merge": 3}
+            return 4
         return 1
 
     def export_json(self, path, *_args, **_kwargs):
@@ -599,12 +609,34 @@ class _FakeStatusBar:
 class _FakeTextCaptureDB:
     def __init__(self):
         self.added = []
+        self.thumbnails = []
 
-    def add_item(self, content, image_data, type_tag):
+    def add_item(self, content, image_data, type_tag, image_hash=None, thumbnail=None):
         self.added.append((content, image_data, type_tag))
+        self.thumbnails.append(thumbnail)
         return 101
 
 
+class _FakeLargeTextCaptureDB(_FakeTextCaptureDB):
+    def __init__(self, large_clip_mode="true"):
+        super().__init__()
+        self.conn = object()
+        self.large_added = []
+        self.settings = {"large_clip_mode": large_clip_mode}
+
+    def get_setting(self, key, default=None):
+        return self.settings.get(key, default)
+
+    def add_large_text_item(self, payload, type_tag="TEXT"):
+        self.large_added.append((payload, type_tag))
+        return 202
+
+
+class _ImmediateThreadPool:
+    def start(self, worker):
+        worker.run()
+
+
 class _FakeTextCaptureWindow:
     def __init__(self, max_bytes=1024 * 1024):
         self.max_text_clipboard_bytes = max_bytes
@@ -637,6 +669,27 @@ class _FakeTextCaptureWindow:
         return self.status_bar
 
 
+class _QueuedThreadPool:
+    def __init__(self):
+        self.workers = []
+
+    def start(self, worker):
+        self.workers.append(worker)
+
+    def run_all(self):
+        workers, self.workers = self.workers, []
+        for worker in workers:
+            worker.run()
+
+
+class _FakeImageCaptureWindow(_FakeTextCaptureWindow):
+    def __init__(self, image, max_bytes=1024 * 1024):
+        super().__init__()
+        self.max_image_clipboard_bytes = max_bytes
+        self.clipboard = SimpleNamespace(image=lambda: image)
+        cast(Any, self.db).conn = object()
+
+
 class _FakeClipboardRuntimeWindow:
     def __init__(self, mime_data):
         self.is_monitoring_paused = False
@@ -1215,6 +1268,7 @@ class UiDialogsWidgetsTests(unittest.TestCase):
             self.assertEqual(db.values["mini_window_enabled"], "false")
             self.assertEqual(db.values["max_history"], 222)
             self.assertEqual(db.values["log_level"], "DEBUG")
+            self.assertEqual(db.values["clipboard_debounce_ms"], 100)
             self.assertEqual(parent.register_calls, 2)
             self.assertTrue(warning_mock.called)
             self.assertIn("미니 창", warning_mock.call_args[0][2])
@@ -1396,6 +1450,147 @@ class UiDialogsWidgetsTests(unittest.TestCase):
         finally:
             dialog.close()
 
+    def test_similar_images_dialog_backfills_hashes_groups_and_deletes(self):
+        def png_blob(color, dot=False, gradient=False):
+            image = QImage(120, 80, QImage.Format.Format_RGB32)
+            image.fill(QColor("white"))
+            for x in range(10, 60):
+                for y in range(10, 40):
+                    image.setPixelColor(x, y, QColor(color))
+            if gradient:
+                for x in range(120):
+                    for y in range(80):
+                        image.setPixelColor(x, y, QColor(x * 2, x * 2, x * 2))
+            if dot:
+                image.setPixelColor(100, 70, QColor("red"))
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QBuffer.OpenModeFlag.WriteOnly)
+            image.save(buffer, "PNG")
+            return data.data()
+
+        with _workspace_tempdir() as tmpdir:
+            db = ClipboardDB(db_file=os.path.join(tmpdir, "clipboard_history_v6.db"), app_dir=tmpdir)
+            try:
+                # 해시 없이 저장된 이미지(가져오기분)도 대화상자가 열릴 때 해시를 채운다.
+                first = db.add_item("[이미지 캡처]", png_blob("black"), "IMAGE")
+                second = db.add_item("[이미지 캡처]", png_blob("black", dot=True), "IMAGE")
+                other = db.add_item("[이미지 캡처]", png_blob("black", gradient=True), "IMAGE")
+                dialog = SimilarImagesDialog(None, db)
+                try:
+                    self.assertEqual(db.get_images_missing_hash(), [])
+                    root = cast(Any, dialog.tree.invisibleRootItem())
+                    self.assertEqual(root.childCount(), 1)
+                    group = root.child(0)
+                    self.assertEqual(
+                        [group.child(i).data(0, Qt.ItemDataRole.UserRole) for i in range(group.childCount())],
+                        [second, first],
+                    )
+                    self.assertIsNotNone(group.child(0).icon(0))
+
+                    group.child(0).setSelected(True)
+                    dialog.delete_selected()
+                    self.assertEqual(dialog.deleted_count, 1)
+                    self.assertIsNone(db.get_content(second))
+                    self.assertIn("없습니다", cast(Any, dialog.tree.invisibleRootItem()).child(0).text(0))
+                finally:
+                    dialog.close()
+
+                item_dialog = SimilarImagesDialog(None, db, item_id=first)
+                try:
+                    group = cast(Any, item_dialog.tree.invisibleRootItem()).child(0)
+                    self.assertIn("없습니다", group.text(0))
+                    self.assertIsNotNone(db.get_content(other))
+                finally:
+                    item_dialog.close()
+            finally:
+                db.close()
+
+    def test_table_and_cache_serve_image_thumbnails_without_decoding_full_blobs(self):
+        from smartclipboard_app.features.clipboard.thumbnails import (
+            THUMBNAIL_ICON_SIZE,
+            THUMBNAIL_MAX_SIDE,
+            ThumbnailCache,
+            qimage_thumbnail,
+        )
+
+        image = QImage(1000, 500, QImage.Format.Format_RGB32)
+        image.fill(QColor("navy"))
+        thumbnail = qimage_thumbnail(image)
+        assert thumbnail is not None
+        self.assertEqual(QImage.fromData(thumbnail).size().width(), THUMBNAIL_MAX_SIDE)
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QBuffer.OpenModeFlag.WriteOnly)
+        image.save(buffer, "PNG")
+        blob = data.data()
+
+        class _FakeThumbnailWindow:
+            def __init__(self, db):
+                self.db = db
+                self.table = QTableWidget()
+                self.table.setColumnCount(5)
+                self.load_calls = 0
+
+            def isVisible(self):
+                return True
+
+            def load_data(self):
+                self.load_calls += 1
+
+        with _workspace_tempdir() as tmpdir:
+            db = ClipboardDB(db_file=os.path.join(tmpdir, "clipboard_history_v6.db"), app_dir=tmpdir)
+            try:
+                captured = db.add_item("[이미지 캡처]", blob, "IMAGE", thumbnail=thumbnail)
+                imported = db.add_item("[이미지 캡처]", blob + b"imported", "IMAGE")
+                window = _FakeThumbnailWindow(db)
+                rows = [
+                    (item_id, "[이미지 캡처]", "IMAGE", "2026-04-01 10:00:00", 0, 0, 0) for item_id in (captured, imported)
+                ]
+                with mock.patch.object(db, "get_content", side_effect=AssertionError("full blob loaded")), mock.patch(
+                    "smartclipboard_app.features.clipboard.pipeline._get_capture_threadpool",
+                    return_value=_ImmediateThreadPool(),
+                ):
+                    populate_table_impl(window, rows, FALLBACK_THEMES["dark"], {"IMAGE": "🖼️"})
+
+                icon = cast(Any, window.table.item(0, 2)).icon()
+                self.assertFalse(icon.isNull())
+                self.assertEqual(window.table.iconSize().width(), THUMBNAIL_ICON_SIZE)
+                # 썸네일이 없던 항목은 캡처 스레드에서 채운 뒤 한 번만 다시 그린다.
+                self.assertEqual(db.get_images_missing_thumbnail(), [])
+                self.assertIn(imported, db.get_thumbnails([imported]))
+                self.assertEqual(window.load_calls, 1)
+
+                cache = ThumbnailCache(db)
+                with mock.patch.object(db, "get_thumbnails", wraps=db.get_thumbnails) as fetch:
+                    icons = cache.pixmaps([captured, imported], THUMBNAIL_ICON_SIZE)
+                    self.assertEqual(max(icons[captured].width(), icons[captured].height()), THUMBNAIL_ICON_SIZE)
+                    self.assertEqual(cast(Any, cache.pixmap(captured)).width(), THUMBNAIL_MAX_SIDE)
+                    cache.pixmaps([captured, imported], THUMBNAIL_ICON_SIZE)
+                    self.assertEqual(fetch.call_count, 1)
+                    cache.invalidate(captured)
+                    cache.pixmap(captured, THUMBNAIL_ICON_SIZE)
+                    self.assertEqual(fetch.call_args[0][0], [captured])
+            finally:
+                db.close()
+
+    def test_import_dialog_dry_run_shows_counts_without_confirm_or_accept(self):
+        dialog = ImportDialog(None, _FakeImportExportManager())
+        try:
+            dialog.file_path.setText("sample.csv")
+            with mock.patch.object(QMessageBox, "question") as question_mock, mock.patch.object(
+                QMessageBox, "information"
+            ) as info_mock:
+                dialog.do_dry_run()
+            question_mock.assert_not_called()
+            summary = info_mock.call_args[0][2]
+            self.assertIn("추가될 항목: 1개", summary)
+            self.assertIn("병합될 항목(중복): 3개", summary)
+            self.assertNotIn("사전 백업", summary)
+            self.assertFalse(dialog.result())
+        finally:
+            dialog.close()
+
     def test_show_import_dialog_refreshes_collection_filters_before_reload(self):
         window = _FakeShowImportWindow()
 
@@ -1426,6 +1621,47 @@ class UiDialogsWidgetsTests(unittest.TestCase):
         finally:
             dialog.close()
 
+    def test_export_dialog_preview_count_and_export_use_the_filter_query(self):
+        class _CountingManager(_FakeImportExportManager):
+            def __init__(self):
+                super().__init__()
+                self.queries = []
+
+            def count_export_items(self, filter_type="all", date_from=None, query=None):
+                self.queries.append(query)
+                return 7
+
+            def export_csv(self, path, *_args, **kwargs):
+                self.queries.append(kwargs.get("query"))
+                return super().export_csv(path)
+
+        manager = _CountingManager()
+        dialog = ExportDialog(None, manager)
+        try:
+            self.assertEqual(dialog.preview_label.text(), "7개 항목")
+            dialog.type_combo.setCurrentText("링크만")
+            dialog.collection_combo.setCurrentIndex(1)
+            dialog.tags_input.setText("work, q1")
+            dialog.bookmark_only.setChecked(True)
+            dialog.update_preview_count()
+            query = manager.queries[-1]
+            self.assertEqual(query.types, frozenset({"LINK"}))
+            self.assertEqual(query.collection_ids, frozenset({None}))
+            self.assertEqual(query.tags, ("work", "q1"))
+            self.assertTrue(query.bookmarked)
+            self.assertIsNone(query.pinned)
+
+            dialog.format_json.setChecked(False)
+            dialog.format_csv.setChecked(True)
+            with mock.patch(
+                "PyQt6.QtWidgets.QFileDialog.getSaveFileName",
+                return_value=("out.csv", "CSV"),
+            ), mock.patch.object(QMessageBox, "information"):
+                dialog.do_export()
+            self.assertEqual(manager.queries[-1], query)
+        finally:
+            dialog.close()
+
     def test_hotkey_dialog_recovers_from_invalid_json(self):
         db = _FakeSettingsDB({"hotkeys": "{bad-json"})
         dialog = HotkeySettingsDialog(None, db, default_hotkeys=DEFAULT_HOTKEYS)
@@ -1488,6 +1724,52 @@ class UiDialogsWidgetsTests(unittest.TestCase):
         window.db.get_copy_rules.assert_called_once()
         self.assertEqual(logger.warning.call_count, 2)
 
+        # 규칙을 읽은 뒤 UI 스레드가 다시 세운 무효화 표시는 컴파일이 지우지 않는다.
+        rules = window.db.get_copy_rules.return_value
+
+        def get_rules_then_invalidate():
+            window._rules_cache_dirty = True
+            return rules
+
+        window._rules_cache_dirty = True
+        window.db.get_copy_rules.side_effect = get_rules_then_invalidate
+        apply_copy_rules_impl(window, "foo", logger, re)
+        self.assertTrue(window._rules_cache_dirty)
+
+    def test_copy_rules_dialog_shows_per_rule_hits_and_keeps_them_across_recompiles(self):
+        rules = [
+            (1, "upper", r"foo", "uppercase", None, 1, 2),
+            (2, "replace", r"B\w+", "custom_replace", "X", 1, 1),
+        ]
+        parent = cast(Any, QWidget())
+        parent.db = mock.Mock()
+        parent.db.get_copy_rules.side_effect = lambda: list(rules)
+        parent._rules_cache = None
+        parent._rules_cache_dirty = True
+        parent.invalidate_rules_cache = lambda: setattr(parent, "_rules_cache_dirty", True)
+        logger = mock.Mock()
+
+        self.assertEqual(apply_copy_rules_impl(parent, "foo bar", logger, re), "FOO X")
+        self.assertEqual(apply_copy_rules_impl(parent, "plain", logger, re), "plain")
+        # 패턴이 바뀐 규칙만 통계가 초기화되고 나머지는 재컴파일 뒤에도 이어진다.
+        rules[1] = (2, "replace", r"p\w+", "custom_replace", "X", 1, 1)
+        parent.invalidate_rules_cache()
+        self.assertEqual(apply_copy_rules_impl(parent, "plain", logger, re), "X")
+
+        dialog = CopyRulesDialog(parent, parent.db)
+        try:
+            self.assertEqual(dialog.table.columnCount(), 8)
+            self.assertEqual(cast(Any, dialog.table.item(0, 5)).text(), "1")
+            self.assertIn("평가 3회", cast(Any, dialog.table.item(0, 5)).toolTip())
+            self.assertEqual(cast(Any, dialog.table.item(1, 5)).text(), "1")
+            self.assertIn("평가 1회", cast(Any, dialog.table.item(1, 6)).toolTip())
+            dialog.reset_stats()
+            self.assertEqual(cast(Any, dialog.table.item(0, 5)).text(), "0")
+            self.assertEqual(cast(Any, dialog.table.item(1, 7)).text(), "2")
+        finally:
+            dialog.close()
+            parent.deleteLater()
+
     def test_generate_qr_without_optional_dependency_warns_and_returns(self):
         window = mock.Mock()
 
@@ -1676,6 +1958,38 @@ class UiDialogsWidgetsTests(unittest.TestCase):
         self.assertEqual(window.image_calls, 0)
         self.assertEqual(window.text_calls, 0)
 
+    def test_process_text_clipboard_runs_stages_off_ui_thread_and_refreshes_once_per_burst(self):
+        import threading
+
+        window = cast(Any, _FakeTextCaptureWindow())
+        window.db.conn = object()
+        stage_threads = set()
+        analyze = window.analyze_text
+        window.analyze_text = lambda text: stage_threads.add(threading.current_thread().name) or analyze(text)
+        gate = threading.Event()
+        add_item = window.db.add_item
+        window.db.add_item = lambda *args, **kwargs: gate.wait(5) and add_item(*args, **kwargs)
+
+        for text in ("first", "   ", "second", "third"):
+            process_text_clipboard_impl(window, _FakeTextMimeData(text), mock.Mock())
+        # UI 스레드에서는 읽기만 하고 저장은 아직 일어나지 않았다.
+        self.assertEqual(window.db.added, [])
+        gate.set()
+        capture = window._text_capture
+        self.assertTrue(capture.pipeline.drain(5))
+        QApplication.processEvents()
+
+        self.assertEqual([row[0] for row in window.db.added], ["first", "second", "third"])
+        self.assertNotIn(threading.current_thread().name, stage_threads)
+        self.assertEqual(window.load_calls, 1)
+        metrics = capture.metrics()
+        self.assertEqual(list(metrics["stages"])[:2], ["read", "normalize"])
+        self.assertEqual(metrics["stages"]["read"]["count"], 4)
+        self.assertEqual(metrics["stages"]["persist"]["count"], 3)
+        self.assertEqual(metrics["stages"]["notify"]["count"], 3)
+        self.assertEqual((metrics["completed"], metrics["filtered"]), (3, 1))
+        capture.pipeline.shutdown(1)
+
     def test_process_text_clipboard_skips_oversized_text_and_reports(self):
         window = _FakeTextCaptureWindow(max_bytes=8)
         mime_data = _FakeTextMimeData("0123456789")
@@ -1688,6 +2002,144 @@ class UiDialogsWidgetsTests(unittest.TestCase):
         self.assertIn("텍스트가 너무 큽니다", window.status_bar.messages[0][0])
         self.assertTrue(toast_mock.called)
 
+    def test_process_text_clipboard_stores_oversized_text_as_large_clip_off_ui_thread(self):
+        window = _FakeTextCaptureWindow(max_bytes=8)
+        window.db = _FakeLargeTextCaptureDB()
+        cast(Any, window).max_large_text_clipboard_bytes = 1024
+        text = "0123456789" * 3
+
+        with mock.patch(
+            "smartclipboard_app.features.clipboard.pipeline._get_capture_threadpool",
+            return_value=_ImmediateThreadPool(),
+        ):
+            process_text_clipboard_impl(window, _FakeTextMimeData(text), mock.Mock())
+
+        self.assertEqual(window.db.added, [])
+        payload, type_tag = window.db.large_added[0]
+        self.assertEqual((payload.total_chars, type_tag), (len(text), "TEXT"))
+        self.assertEqual(window.action_calls, [])
+        self.assertEqual(window.load_calls, 1)
+        self.assertIn("대용량 텍스트 저장됨", window.status_bar.messages[-1][0])
+
+    def test_process_image_clipboard_encodes_and_stores_on_capture_thread(self):
+        image = QImage(32, 16, QImage.Format.Format_RGB32)
+        image.fill(QColor("#336699"))
+        window = _FakeImageCaptureWindow(image)
+        pool = _QueuedThreadPool()
+        toast = mock.Mock()
+
+        with mock.patch("smartclipboard_app.features.clipboard.pipeline._get_capture_threadpool", return_value=pool):
+            process_image_clipboard_impl(window, None, mock.Mock(), QByteArray, QBuffer, toast)
+            process_image_clipboard_impl(window, None, mock.Mock(), QByteArray, QBuffer, toast)
+            # UI 스레드에서는 이미지만 가져오고 인코딩/저장은 하지 않는다.
+            self.assertEqual((len(pool.workers), window.db.added), (2, []))
+            pool.run_all()
+
+        self.assertEqual(len(window.db.added), 1)
+        content, blob, type_tag = window.db.added[0]
+        self.assertEqual((content, type_tag), ("[이미지 캡처]", "IMAGE"))
+        self.assertEqual(QImage.fromData(blob).size(), image.size())
+        self.assertTrue(window.db.thumbnails[0].startswith(b"\x89PNG"))
+        self.assertEqual(window.load_calls, 1)
+
+        small_window = _FakeImageCaptureWindow(image, max_bytes=8)
+        with mock.patch(
+            "smartclipboard_app.features.clipboard.pipeline._get_capture_threadpool",
+            return_value=_ImmediateThreadPool(),
+        ):
+            process_image_clipboard_impl(small_window, None, mock.Mock(), QByteArray, QBuffer, toast)
+        self.assertEqual(small_window.db.added, [])
+        self.assertIn("이미지가 너무 큽니다", toast.show_toast.call_args[0][1])
+
+    def test_image_codec_follows_setting_and_content_and_recompresses_losslessly(self):
+        import random
+
+        from smartclipboard_app.features.clipboard.image_codec import encode_image, recompress_images, webp_supported
+        from smartclipboard_core.image_format import image_dimensions, sniff_image_format
+
+        def pixels(image):
+            converted = image.convertToFormat(QImage.Format.Format_ARGB32)
+            return [converted.pixel(x, y) for y in range(converted.height()) for x in range(converted.width())]
+
+        screenshot = QImage(120, 80, QImage.Format.Format_ARGB32)
+        screenshot.fill(QColor("#1e1e1e"))
+        for y in range(10, 70, 6):
+            for x in range(10, 110):
+                if (x * 7 + y) % 5 < 2:
+                    screenshot.setPixelColor(x, y, QColor("#d4d4d4"))
+        rng = random.Random(3)
+        photo = QImage(120, 80, QImage.Format.Format_RGB32)
+        for y in range(80):
+            for x in range(120):
+                photo.setPixelColor(x, y, QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+        translucent = QImage(40, 40, QImage.Format.Format_ARGB32)
+        translucent.fill(QColor(255, 0, 0, 128))
+
+        lossless = "webp" if webp_supported() else "png"
+        auto_shot = encode_image(screenshot, "auto")
+        assert auto_shot is not None
+        self.assertEqual(sniff_image_format(auto_shot), lossless)
+        self.assertEqual(pixels(QImage.fromData(auto_shot)), pixels(screenshot))
+        self.assertEqual(sniff_image_format(encode_image(photo, "auto")), "jpeg")
+        # 기본 형식은 무손실이다: 사진도 JPEG로 바꾸지 않는다 (auto/jpeg는 직접 골라야 한다).
+        default_photo = encode_image(photo)
+        assert default_photo is not None
+        self.assertEqual(sniff_image_format(default_photo), lossless)
+        self.assertEqual(pixels(QImage.fromData(default_photo)), pixels(photo))
+        png_shot = encode_image(screenshot, "png")
+        self.assertEqual(sniff_image_format(png_shot), "png")
+        self.assertEqual(image_dimensions(png_shot), (120, 80))
+        self.assertEqual(image_dimensions(encode_image(photo, "jpeg")), (120, 80))
+        self.assertEqual(image_dimensions(auto_shot), (120, 80))
+        # JPEG는 알파를 잃으므로 반투명 이미지는 설정이 JPEG여도 무손실로 저장한다.
+        self.assertNotEqual(sniff_image_format(encode_image(translucent, "jpeg")), "jpeg")
+
+        window = _FakeImageCaptureWindow(screenshot)
+        cast(Any, window.db).get_setting = lambda key, default=None: "png" if key == "image_codec" else default
+        with mock.patch(
+            "smartclipboard_app.features.clipboard.pipeline._get_capture_threadpool",
+            return_value=_ImmediateThreadPool(),
+        ):
+            process_image_clipboard_impl(window, None, mock.Mock(), QByteArray, QBuffer, mock.Mock())
+        self.assertEqual(sniff_image_format(window.db.added[0][1]), "png")
+
+        def default_png(image):
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QBuffer.OpenModeFlag.WriteOnly)
+            image.save(buffer, "PNG")
+            return data.data()
+
+        with _workspace_tempdir() as tmpdir:
+            db = ClipboardDB(db_file=os.path.join(tmpdir, "clipboard_history_v6.db"), app_dir=tmpdir)
+            try:
+                shot_id = db.add_item("[이미지 캡처]", default_png(screenshot), "IMAGE")
+                jpeg_id = db.add_item("[이미지 캡처]", encode_image(photo, "jpeg"), "IMAGE")
+                before = db.get_image_storage_stats()
+                report = recompress_images(db, "auto", batch_size=1)
+                after = db.get_image_storage_stats()
+
+                self.assertEqual((report["scanned"], report["recompressed"], report["skipped"]), (2, 1, 1))
+                self.assertEqual(report["bytes_before"], before["bytes"])
+                self.assertEqual(report["bytes_after"], after["bytes"])
+                self.assertGreater(report["bytes_saved"], 0)
+                stored_shot = cast(Any, db.get_content(shot_id))[1]
+                self.assertEqual(sniff_image_format(stored_shot), lossless)
+                self.assertEqual(pixels(QImage.fromData(stored_shot)), pixels(screenshot))
+                self.assertEqual(sniff_image_format(cast(Any, db.get_content(jpeg_id))[1]), "jpeg")
+            finally:
+                db.close()
+
+    def test_process_text_clipboard_skips_oversized_text_when_large_clip_mode_disabled(self):
+        window = _FakeTextCaptureWindow(max_bytes=8)
+        window.db = _FakeLargeTextCaptureDB(large_clip_mode="false")
+
+        with mock.patch("smartclipboard_app.features.clipboard.pipeline.ToastNotification.show_toast"):
+            process_text_clipboard_impl(window, _FakeTextMimeData("0123456789"), mock.Mock())
+
+        self.assertEqual(window.db.large_added, [])
+        self.assertIn("텍스트가 너무 큽니다", window.status_bar.messages[0][0])
+
     def test_process_actions_impl_updates_history_and_clipboard_for_replace_text(self):
         with _workspace_tempdir() as tmpdir:
             db = ClipboardDB(
@@ -1866,22 +2318,142 @@ class UiDialogsWidgetsTests(unittest.TestCase):
             dialog.close()
             parent.close()
 
-    def test_clipboard_change_clears_pending_debounce_before_internal_copy_return(self):
-        old_timer = _FakeDebounceTimer(parent=None)
+    def test_clipboard_change_drops_pending_burst_before_internal_copy_return(self):
         _FakeDebounceTimer.instances = []
         window = mock.Mock()
         window.is_privacy_mode = False
-        window.is_internal_copy = True
-        window._clipboard_debounce_timer = old_timer
-        window.process_clipboard = object()
+        window.is_internal_copy = False
+        window.db.get_setting.return_value = "40"
 
+        on_clipboard_change_impl(window, _FakeDebounceTimer)
+        timer = _FakeDebounceTimer.instances[0]
+        self.assertEqual(timer.started_ms, 40)
+        window.is_internal_copy = True
         on_clipboard_change_impl(window, _FakeDebounceTimer)
 
-        self.assertTrue(old_timer.stopped)
-        self.assertTrue(old_timer.deleted)
-        self.assertIsNone(window._clipboard_debounce_timer)
+        # 타이머는 하나를 재사용하고, 대기 중이던 캡처는 내부 복사와 함께 버려진다.
+        self.assertEqual(_FakeDebounceTimer.instances, [timer])
+        self.assertTrue(timer.stopped)
+        self.assertFalse(timer.deleted)
         self.assertFalse(window.is_internal_copy)
-        self.assertEqual(_FakeDebounceTimer.instances, [])
+        self.assertFalse(window._clipboard_coalescer.pending)
+        self.assertEqual(window._clipboard_coalescer.stats["dropped"], 2)
+
+    def test_clipboard_coalescer_bounds_bursts_and_skips_unchanged_payloads(self):
+        from PyQt6.QtCore import QMimeData
+
+        from smartclipboard_app.features.clipboard.coalescer import (
+            CLIPBOARD_FINGERPRINT_EDGE_BYTES,
+            ClipboardEventCoalescer,
+        )
+
+        now = [0.0]
+        captures = []
+        _FakeDebounceTimer.instances = []
+        coalescer = ClipboardEventCoalescer(
+            None,
+            lambda: captures.append(now[0]),
+            debounce_ms=100,
+            max_wait_ms=250,
+            timer_cls=_FakeDebounceTimer,
+            clock=lambda: now[0],
+        )
+        timer = _FakeDebounceTimer.instances[0]
+        for step in range(4):
+            now[0] = step * 0.08
+            coalescer.notify()
+        # 4번째 이벤트(240ms)는 첫 이벤트 기준 최대 대기(250ms)까지 10ms만 남았다.
+        self.assertEqual(timer.started_ms, 10)
+        timer.timeout.connected[0]()
+        self.assertEqual(captures, [0.24])
+        self.assertEqual(coalescer.stats, {"events": 4, "coalesced": 3, "dropped": 0, "unchanged": 0, "flushed": 1})
+
+        mime = QMimeData()
+        mime.setText("same")
+        fingerprint = coalescer.fingerprint(mime)
+        self.assertFalse(coalescer.is_repeat(fingerprint))
+        coalescer.remember(fingerprint)
+        now[0] += 0.3
+        self.assertTrue(coalescer.is_repeat(coalescer.fingerprint(mime)))
+        # 건너뛴 반복은 창을 늘리지 않는다: 캡처 후 한 묶음이 지나면 의도한 재복사로 본다.
+        now[0] += 0.3
+        self.assertFalse(coalescer.is_repeat(coalescer.fingerprint(mime)))
+        mime.setText("changed")
+        self.assertFalse(coalescer.is_repeat(coalescer.fingerprint(mime)))
+        self.assertEqual(coalescer.stats["unchanged"], 1)
+
+        # 앞뒤 조각만 해시하지만 크기와 끝부분이 바뀌면 다른 지문이다.
+        big = "x" * (CLIPBOARD_FINGERPRINT_EDGE_BYTES * 4)
+        mime.setText(big)
+        big_fingerprint = coalescer.fingerprint(mime)
+        mime.setText(big[:-1] + "y")
+        self.assertNotEqual(coalescer.fingerprint(mime), big_fingerprint)
+        mime.setText(big + "x")
+        self.assertNotEqual(coalescer.fingerprint(mime), big_fingerprint)
+
+        # 이미지는 어떤 형식이든 읽으면 UI 스레드에서 전체 인코딩이 일어나므로 반복 검사를 건너뛴다.
+        image_mime = mock.Mock()
+        image_mime.formats.return_value = ["image/png", "application/x-qt-image"]
+        image_mime.hasUrls.return_value = False
+        image_mime.hasImage.return_value = True
+        self.assertIsNone(coalescer.fingerprint(image_mime))
+        image_mime.data.assert_not_called()
+        image_mime.imageData.assert_not_called()
+
+    def test_ingestor_calls_shared_classifier_unless_analyze_text_is_overridden(self):
+        from smartclipboard_app.features.clipboard import pipeline as clipboard_pipeline
+        from smartclipboard_app.legacy_main_src import MainWindow
+        from smartclipboard_core.classifier import classify_text
+
+        class DefaultWindow:
+            db = None
+            action_manager = None
+            analyze_text = MainWindow.analyze_text
+
+            def apply_copy_rules(self, text):
+                return text
+
+        class OverridingWindow(DefaultWindow):
+            def analyze_text(self, text):
+                return "CODE"
+
+        class LookalikeWindow(DefaultWindow):
+            def analyze_text(self, text):
+                return "COLOR"
+
+        # 이름이 같아도 MainWindow의 함수 객체가 아니면 재정의로 본다.
+        LookalikeWindow.analyze_text.__qualname__ = "MainWindow.analyze_text"
+
+        self.assertIs(clipboard_pipeline._get_ingestor(DefaultWindow())._classify, classify_text)
+        self.assertEqual(clipboard_pipeline._get_ingestor(OverridingWindow()).classify("https://example.com"), "CODE")
+        self.assertEqual(clipboard_pipeline._get_ingestor(LookalikeWindow()).classify("https://example.com"), "COLOR")
+
+    def test_process_clipboard_remembers_only_started_captures(self):
+        from PyQt6.QtCore import QMimeData
+
+        from smartclipboard_app.features.clipboard import pipeline as clipboard_pipeline
+        from smartclipboard_app.features.clipboard.coalescer import ClipboardEventCoalescer
+
+        now = [0.0]
+        mime = QMimeData()
+        mime.setText("copied twice")
+        window = cast(Any, _FakeClipboardRuntimeWindow(mime))
+        started = [False, True, True, True]
+        window._process_text_clipboard = lambda _mime_data: started.pop(0)
+        window._clipboard_coalescer = ClipboardEventCoalescer(
+            None, lambda: None, timer_cls=_FakeDebounceTimer, clock=lambda: now[0]
+        )
+
+        clipboard_pipeline.process_clipboard_impl(window, mock.Mock())  # 저장되지 않음 (예: 큐가 가득 참)
+        now[0] += 0.1
+        clipboard_pipeline.process_clipboard_impl(window, mock.Mock())  # 반복으로 막지 않는다
+        now[0] += 0.1
+        clipboard_pipeline.process_clipboard_impl(window, mock.Mock())  # 같은 묶음의 반복
+        now[0] += 1.0
+        clipboard_pipeline.process_clipboard_impl(window, mock.Mock())  # 나중의 재복사는 다시 캡처
+
+        self.assertEqual(started, [True])
+        self.assertEqual(window._clipboard_coalescer.stats["unchanged"], 1)
 
     def test_enabling_privacy_mode_cancels_pending_debounce_timer(self):
         old_timer = _FakeDebounceTimer(parent=None)
@@ -2096,6 +2668,168 @@ class UiDialogsWidgetsTests(unittest.TestCase):
         self.assertTrue(window.db.closed)
         self.assertIsNone(window._vault_clipboard_expected_text)
 
+    def test_quit_app_impl_truncates_wal_before_closing_db(self):
+        _FakeQuitApp.clipboard_instance = _FakeClipboardWriter()
+        window = cast(Any, _FakeQuitWindow(None))
+        calls = []
+        window.db.checkpoint_wal = lambda mode: calls.append((mode, window.db.closed)) or {
+            "checkpointed_pages": 3,
+            "duration_ms": 1.0,
+        }
+        window.maintenance_controller = mock.Mock()
+
+        quit_app_impl(window, mock.Mock(), _FakeQuitKeyboard(), _FakeQuitApp)
+
+        self.assertEqual(calls, [("TRUNCATE", False)])
+        window.maintenance_controller.shutdown.assert_called_once()
+        self.assertTrue(window.db.closed)
+
+    def test_maintenance_controller_checkpoints_only_when_clipboard_is_idle(self):
+        db = mock.Mock()
+        window = SimpleNamespace(db=db, _last_clipboard_activity=time.monotonic())
+        controller = MaintenanceController(window)
+
+        controller.run_idle_maintenance()
+        controller.shutdown()
+        db.maybe_checkpoint_wal.assert_not_called()
+
+        window._last_clipboard_activity = time.monotonic() - 3600
+        controller.run_idle_maintenance()
+        controller.shutdown()
+        db.maybe_checkpoint_wal.assert_called_once_with()
+
+    def test_maintenance_controller_restore_closes_db_first_and_aborts_when_preserve_fails(self):
+        events = []
+        db = SimpleNamespace(db_file="/data/clipboard.db", app_dir="/data", close=lambda: events.append("close"))
+        window = SimpleNamespace(db=db, quit_app=lambda: events.append("quit"))
+        controller = MaintenanceController(window)
+        module = "smartclipboard_app.features.maintenance.controller"
+
+        with mock.patch(
+            f"{module}.preserve_corrupt_database", side_effect=lambda *_args: events.append("preserve")
+        ), mock.patch(f"{module}.replace_database_from_backup") as replace, mock.patch(
+            f"{module}.QMessageBox.critical"
+        ) as critical:
+            self.assertFalse(controller.restore_from_backup(db, "/data/backups/clipboard_history_1.db"))
+
+        self.assertEqual(events, ["close", "preserve", "quit"])
+        replace.assert_not_called()
+        critical.assert_called_once()
+        controller.shutdown()
+
+    def test_maintenance_controller_backfills_image_hashes_once_per_session(self):
+        db = mock.Mock()
+        db.get_images_missing_hash.return_value = [(1, b"not an image")]
+        db.set_image_hashes.return_value = 1
+        controller = MaintenanceController(SimpleNamespace(db=db))
+
+        self.assertTrue(controller.start_image_hash_backfill())
+        controller.shutdown()
+        self.assertFalse(controller.start_image_hash_backfill())
+        controller.shutdown()
+
+        db.get_images_missing_hash.assert_called_once()
+        db.set_image_hashes.assert_called_once_with([(1, None)])
+
+    def test_maintenance_controller_runs_folder_sync_and_marks_window_dirty(self):
+        db = mock.Mock()
+        db.get_setting.side_effect = lambda key, default=None: {"sync_folder": "/shared/sc"}.get(key, default)
+        db.sync_with_folder.return_value = {"imported": {"inserted": 2, "errors": []}, "exported": {"ops": 0}}
+        window = SimpleNamespace(db=db, is_data_dirty=False, isVisible=lambda: False)
+        controller = MaintenanceController(window)
+
+        self.assertTrue(controller.start_folder_sync())
+        controller.shutdown()
+        db.sync_with_folder.assert_called_once_with("/shared/sc")
+        self.assertFalse(controller.start_folder_sync())  # interval not elapsed
+
+        controller._on_folder_synced(db.sync_with_folder.return_value)
+        self.assertTrue(window.is_data_dirty)
+
+    def test_maintenance_controller_recompresses_images_and_reports_space_saved(self):
+        db = mock.Mock()
+        db.get_setting.side_effect = lambda key, default=None: {"image_codec": "webp"}.get(key, default)
+        status_bar = mock.Mock()
+        controller = MaintenanceController(SimpleNamespace(db=db, statusBar=lambda: status_bar))
+        report = {"scanned": 3, "recompressed": 2, "skipped": 1, "bytes_before": 3 << 20, "bytes_after": 1 << 20}
+        report["bytes_saved"] = 2 << 20
+
+        with mock.patch(
+            "smartclipboard_app.features.maintenance.controller.recompress_images", return_value=dict(report)
+        ) as recompress:
+            self.assertTrue(controller.start_image_recompression())
+            controller.shutdown()
+        self.assertEqual(recompress.call_args.args[:2], (db, "webp"))
+
+        controller._on_images_recompressed({**report, "codec": "webp", "duration_ms": 5.0})
+        db.record_maintenance_event.assert_called_once_with("image_recompress", "ok", mock.ANY, 5.0)
+        self.assertIn("2.0MB 절약", status_bar.showMessage.call_args.args[0])
+
+    def test_ipc_controller_follows_setting_and_refreshes_window_on_remote_add(self):
+        settings = {"ipc_server_enabled": "false"}
+        db = mock.Mock()
+        db.get_setting.side_effect = lambda key, default=None: settings.get(key, default)
+        window = SimpleNamespace(db=db, is_data_dirty=False, isVisible=lambda: False)
+        servers = []
+
+        def factory(db_arg, on_write):
+            server = mock.Mock(running=True)
+            server.on_write = on_write
+            servers.append(server)
+            return server
+
+        controller = IpcServerController(window, server_factory=factory)
+        self.assertFalse(controller.apply_setting())
+        self.assertEqual(servers, [])
+
+        settings["ipc_server_enabled"] = "true"
+        self.assertTrue(controller.apply_setting())
+        servers[0].start.assert_called_once_with()
+        servers[0].on_write(7)
+        self.assertTrue(window.is_data_dirty)
+
+        settings["ipc_server_enabled"] = "false"
+        self.assertFalse(controller.apply_setting())
+        servers[0].stop.assert_called_once_with()
+
+    def test_maintenance_controller_rebuilds_search_index_on_fts_corruption(self):
+        db = mock.Mock()
+        db.rebuild_search_index.return_value = True
+        controller = MaintenanceController(SimpleNamespace(db=db))
+
+        controller._on_integrity_checked({"status": "fts_corrupt", "fts_error": "drift", "duration_ms": 4.0})
+
+        db.rebuild_search_index.assert_called_once_with()
+        recorded = [call.args[:2] for call in db.record_maintenance_event.call_args_list]
+        self.assertEqual(recorded, [("integrity_check", "fts_corrupt"), ("fts_rebuild", "ok")])
+
+    def test_maintenance_controller_runs_integrity_check_early_after_search_fallback(self):
+        db = mock.Mock()
+        db._search_fallback_count = 0
+        db.run_integrity_check.return_value = {"status": "ok", "duration_ms": 1.0}
+        controller = MaintenanceController(SimpleNamespace(db=db))
+
+        self.assertFalse(controller.start_integrity_check())
+        db._search_fallback_count = 1
+        self.assertTrue(controller.start_integrity_check())
+        controller.shutdown()
+        db.run_integrity_check.assert_called_once_with()
+
+    def test_maintenance_controller_reports_db_corruption_without_backup(self):
+        db = mock.Mock()
+        db.app_dir = "D:/runtime"
+        controller = MaintenanceController(SimpleNamespace(db=db))
+
+        with mock.patch(
+            "smartclipboard_app.features.maintenance.controller.find_latest_good_backup", return_value=None
+        ), mock.patch("smartclipboard_app.features.maintenance.controller.QMessageBox.critical") as critical:
+            controller._on_integrity_checked({"status": "db_corrupt", "quick_check": ["page 3 corrupt"]})
+            controller._on_integrity_checked({"status": "db_corrupt", "quick_check": ["page 3 corrupt"]})
+
+        critical.assert_called_once()
+        self.assertIn(mock.call("restore", "no_backup", mock.ANY), db.record_maintenance_event.call_args_list)
+        db.close.assert_not_called()
+
     def test_run_periodic_cleanup_refreshes_visible_window_when_history_rows_deleted(self):
         window = _FakeCleanupWindow(_FakeCleanupDB(expired_count=0, history_deleted=2), visible=True)
 